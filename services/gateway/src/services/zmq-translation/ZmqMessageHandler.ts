@@ -14,6 +14,8 @@ import type {
   ZMQEvent,
   TranslationCompletedEvent,
   TranslationErrorEvent,
+  TranslationExpiredEvent,
+  TranslatorOverloadedEvent,
   AudioProcessCompletedEvent,
   AudioProcessErrorEvent,
   VoiceAPISuccessEvent,
@@ -44,6 +46,7 @@ export interface MessageHandlerStats {
   messagesProcessed: number;
   translationCompleted: number;
   translationErrors: number;
+  translationExpired: number;
   audioCompleted: number;
   audioErrors: number;
   voiceEvents: number;
@@ -53,6 +56,7 @@ export interface MessageHandlerStats {
   voiceTranslationCompleted: number;
   voiceTranslationFailed: number;
   storyTextObjectTranslationCompleted: number;
+  overloaded: number;
 }
 
 export class ZmqMessageHandler extends EventEmitter {
@@ -62,6 +66,7 @@ export class ZmqMessageHandler extends EventEmitter {
     messagesProcessed: 0,
     translationCompleted: 0,
     translationErrors: 0,
+    translationExpired: 0,
     audioCompleted: 0,
     audioErrors: 0,
     voiceEvents: 0,
@@ -71,6 +76,7 @@ export class ZmqMessageHandler extends EventEmitter {
     voiceTranslationCompleted: 0,
     voiceTranslationFailed: 0,
     storyTextObjectTranslationCompleted: 0,
+    overloaded: 0,
   };
 
   /**
@@ -127,6 +133,14 @@ export class ZmqMessageHandler extends EventEmitter {
         this.handleTranslationError(event as TranslationErrorEvent);
         break;
 
+      case 'translation_expired':
+        this.handleTranslationExpired(event as TranslationExpiredEvent);
+        break;
+
+      case 'overloaded':
+        this.handleOverloaded(event as TranslatorOverloadedEvent);
+        break;
+
       case 'audio_process_completed':
         this.handleAudioProcessCompleted(event as unknown as AudioProcessCompletedEvent, binaryFrames);
         break;
@@ -298,6 +312,47 @@ export class ZmqMessageHandler extends EventEmitter {
     });
   }
 
+  /**
+   * Gère une tâche de traduction abandonnée par le translator (échéance
+   * dépassée avant inférence)
+   */
+  private handleTranslationExpired(event: TranslationExpiredEvent): void {
+    this.stats.translationExpired++;
+
+    logger.warn(`⌛ Traduction expirée: ${event.taskId} pour ${event.messageId} (+${event.lateByMs}ms)`);
+
+    this.emit('translationExpired', {
+      taskId: event.taskId,
+      messageId: event.messageId,
+      conversationId: event.conversationId,
+      targetLanguages: event.targetLanguages || [],
+      deadline: event.deadline,
+      lateByMs: event.lateByMs
+    });
+  }
+
+  /**
+   * Gère un refus du contrôle d'admission du translator (surcharge)
+   *
+   * La requête n'a pas été exécutée et ne le sera pas : le client la renvoie
+   * après `retryAfterMs` au lieu d'attendre son deadman.
+   */
+  private handleOverloaded(event: TranslatorOverloadedEvent): void {
+    this.stats.overloaded++;
+
+    logger.warn(`⛔ Translator surchargé: ${event.requestType} ${event.taskId ?? event.messageId} refusée (file=${event.queueDepth}, retry dans ${event.retryAfterMs}ms)`);
+
+    this.emit('translatorOverloaded', {
+      requestType: event.requestType,
+      taskId: event.taskId ?? undefined,
+      messageId: event.messageId ?? undefined,
+      attachmentId: event.attachmentId ?? undefined,
+      conversationId: event.conversationId ?? undefined,
+      queueDepth: event.queueDepth,
+      retryAfterMs: event.retryAfterMs
+    });
+  }
+
   /**
    * Gère un événement de processing audio terminé (MULTIPART)
    */
@@ -786,6 +841,7 @@ export class ZmqMessageHandler extends EventEmitter {
       messagesProcessed: 0,
       translationCompleted: 0,
       translationErrors: 0,
+      translationExpired: 0,
       audioCompleted: 0,
       audioErrors: 0,
       voiceEvents: 0,
@@ -795,6 +851,7 @@ export class ZmqMessageHandler extends EventEmitter {
       voiceTranslationCompleted: 0,
       voiceTranslationFailed: 0,
       storyTextObjectTranslationCompleted: 0,
+      overloaded: 0,
     };
   }
 
@@ -477,6 +477,42 @@ export class ZmqRequestSender {
     this.pendingRequests.set(taskId, { ...entry, timeoutId, onTimeout });
   }
 
+  /**
+   * Avance le timeout d'une requête en cours : son `onTimeout` (retry avec le
+   * même taskId, ou erreur finale) tombera dans `delayMs`.
+   *
+   * Utilisé quand le translator refuse la requête (`overloaded`) : il ne
+   * répondra jamais, inutile d'attendre le deadman complet. Rend `false` si le
+   * taskId n'est pas en cours ou n'a pas de timeout armé.
+   */
+  rescheduleTimeout(taskId: string, delayMs: number): boolean {
+    const entry = this.pendingRequests.get(taskId);
+    if (!entry?.onTimeout) return false;
+
+    if (entry.timeoutId) {
+      clearTimeout(entry.timeoutId);
+    }
+    this.registerTimeout(taskId, Math.max(0, delayMs), entry.onTimeout);
+    return true;
+  }
+
+  /**
+   * Retire une requête abandonnée par le translator (échéance `deadlineMs`
+   * dépassée avant inférence) et annule son timeout.
+   *
+   * Une tentative envoyée à ou après cette échéance est un renvoi du même
+   * taskId, avec sa propre échéance : elle reste en cours. Rend `true` si la
+   * requête a été retirée.
+   */
+  expirePendingRequest(taskId: string, deadlineMs?: number): boolean {
+    const entry = this.pendingRequests.get(taskId);
+    if (!entry) return false;
+    if (deadlineMs !== undefined && entry.timestamp >= deadlineMs) return false;
+
+    this.removePendingRequest(taskId);
+    return true;
+  }
+
   /**
    * Solde UNE langue d'une requête de traduction.
    *
@@ -44,6 +44,7 @@ export interface ZMQClientStats {
   results_received: number;
   errors_received: number;
   pool_full_rejections: number;
+  overloaded_rejections: number;
   avg_response_time: number;
   uptime_seconds: number;
   memory_usage_mb: number;
@@ -118,6 +119,7 @@ export class ZmqTranslationClient extends EventEmitter {
     results_received: 0,
     errors_received: 0,
     pool_full_rejections: 0,
+    overloaded_rejections: 0,
     avg_response_time: 0,
     uptime_seconds: 0,
     memory_usage_mb: 0
@@ -328,6 +330,43 @@ export class ZmqTranslationClient extends EventEmitter {
       this.emit('translationError', event);
     });
 
+    // Tâche abandonnée par le translator, échéance dépassée avant inférence :
+    // la requête échoue tout de suite au lieu d'attendre deadman et retries.
+    // Un événement visant une tentative déjà renvoyée est ignoré (le renvoi
+    // porte sa propre échéance). Pas d'erreur pour le circuit breaker : un
+    // translator qui abandonne du travail périmé est vivant.
+    this.messageHandler.on('translationExpired', (event) => {
+      this.emit('translationExpired', event);
+      if (!this.requestSender.expirePendingRequest(event.taskId, event.deadline)) {
+        return;
+      }
+      this.retryCount.delete(event.taskId);
+      this.stats.errors_received++;
+      this.emit('translationError', {
+        taskId: event.taskId,
+        messageId: event.messageId,
+        error: 'translation expired: deadline exceeded before inference',
+        conversationId: event.conversationId,
+        metadata: { expired: true, lateByMs: event.lateByMs, targetLanguages: event.targetLanguages }
+      });
+    });
+
+    // Refus d'admission du translator : la requête ne sera pas exécutée. On
+    // n'attend pas son deadman — le timeout est avancé à `retryAfterMs`, ce
+    // qui déclenche le retry habituel (même taskId, borné par ZMQ_MAX_RETRIES)
+    // ou, pour les pipelines longs sans retry, l'erreur finale. Pas d'erreur
+    // pour le circuit breaker : un translator qui refuse est vivant.
+    this.messageHandler.on('translatorOverloaded', (event) => {
+      this.stats.overloaded_rejections++;
+      const rescheduled = event.taskId
+        ? this.requestSender.rescheduleTimeout(event.taskId, event.retryAfterMs)
+        : false;
+      if (rescheduled) {
+        logger.warn(`⛔ Translator surchargé, taskId=${event.taskId} relancé dans ${event.retryAfterMs}ms`);
+      }
+      this.emit('translatorOverloaded', event);
+    });
+
     // Audio events
     this.messageHandler.on('audioProcessCompleted', (event) => {
       this.retryCount.delete(event.taskId);
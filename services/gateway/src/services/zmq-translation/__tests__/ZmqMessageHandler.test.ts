@@ -1076,6 +1076,55 @@ describe('ZmqMessageHandler', () => {
     });
   });
 
+  // ── translation_expired ──────────────────────────────────────────────────────
+
+  describe('translation_expired', () => {
+    it('emits translationExpired and increments stat', async () => {
+      const received: any[] = [];
+      handler.on('translationExpired', (p) => received.push(p));
+      await handler.handleMessage(makeBuffer({
+        type: 'translation_expired',
+        taskId: 'task-late',
+        messageId: 'msg-late',
+        conversationId: 'conv-001',
+        targetLanguages: ['fr', 'de'],
+        deadline: 1_700_000_000_000,
+        lateByMs: 2500,
+        timestamp: Date.now(),
+      }));
+      expect(received).toHaveLength(1);
+      expect(received[0].taskId).toBe('task-late');
+      expect(received[0].targetLanguages).toEqual(['fr', 'de']);
+      expect(received[0].lateByMs).toBe(2500);
+      expect(handler.getStats().translationExpired).toBe(1);
+    });
+  });
+
+  // ── overloaded ───────────────────────────────────────────────────────────────
+
+  describe('overloaded', () => {
+    it('emits translatorOverloaded with retry hint and increments stat', async () => {
+      const received: any[] = [];
+      handler.on('translatorOverloaded', (p) => received.push(p));
+      await handler.handleMessage(makeBuffer({
+        type: 'overloaded',
+        requestType: 'translation',
+        taskId: 'task-busy',
+        messageId: 'msg-busy',
+        attachmentId: null,
+        conversationId: 'conv-001',
+        queueDepth: 32,
+        retryAfterMs: 5000,
+        timestamp: Date.now(),
+      }));
+      expect(received).toHaveLength(1);
+      expect(received[0].taskId).toBe('task-busy');
+      expect(received[0].retryAfterMs).toBe(5000);
+      expect(received[0].attachmentId).toBeUndefined();
+      expect(handler.getStats().overloaded).toBe(1);
+    });
+  });
+
   // ── getStats / resetStats / clear ─────────────────────────────────────────────
 
   describe('getStats', () => {
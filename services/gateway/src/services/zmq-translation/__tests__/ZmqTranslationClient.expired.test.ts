@@ -0,0 +1,124 @@
+/**
+ * Le translator abandonne avant inférence une tâche dont l'échéance est
+ * dépassée, et publie `translation_expired`. Sans handler, l'événement tombait
+ * dans « Type d'événement inconnu » : la requête attendait encore son deadman,
+ * puis jusqu'à ZMQ_MAX_RETRIES renvois, avant que l'appelant apprenne l'échec.
+ *
+ * Le client solde désormais la requête tout de suite par un `translationError`
+ * (`metadata.expired`). Un événement qui vise une tentative déjà renvoyée est
+ * ignoré : le renvoi porte sa propre échéance et peut encore aboutir.
+ */
+
+import { describe, it, expect, jest, beforeEach, afterEach } from '@jest/globals';
+import type { EventEmitter } from 'events';
+
+jest.mock('../../../utils/logger-enhanced', () => ({
+  enhancedLogger: {
+    child: () => ({
+      info: jest.fn(),
+      debug: jest.fn(),
+      warn: jest.fn(),
+      error: jest.fn(),
+    }),
+  },
+}));
+
+import { ZmqTranslationClient } from '../ZmqTranslationClient';
+
+type SentMessage = Record<string, any>;
+
+function buildClient() {
+  const sent: SentMessage[] = [];
+  const client = new ZmqTranslationClient();
+
+  (client as any).connectionManager = {
+    send: jest.fn(async (message: SentMessage) => {
+      sent.push(message);
+    }),
+  };
+  (client as any).requestSender.connectionManager = (client as any).connectionManager;
+
+  return { client, sent };
+}
+
+const handlerOf = (client: ZmqTranslationClient): EventEmitter =>
+  (client as unknown as { messageHandler: EventEmitter }).messageHandler;
+
+const pendingCount = (client: ZmqTranslationClient): number =>
+  (client as any).requestSender.getPendingRequestsCount();
+
+const expired = (taskId: string, deadline: number) => ({
+  taskId,
+  messageId: 'msg-late',
+  conversationId: 'conv-1',
+  targetLanguages: ['en', 'es'],
+  deadline,
+  lateByMs: 1500,
+});
+
+const sendRequest = async (client: ZmqTranslationClient) =>
+  client.sendTranslationRequest({
+    messageId: 'msg-late',
+    text: 'le texte',
+    sourceLanguage: 'fr',
+    targetLanguages: ['en', 'es'],
+    conversationId: 'conv-1',
+    modelType: 'basic',
+  } as any);
+
+beforeEach(() => {
+  jest.useFakeTimers();
+});
+
+afterEach(() => {
+  jest.useRealTimers();
+});
+
+describe('Une tâche expirée chez le translator échoue sans attendre son deadman', () => {
+  it('émet translationError tout de suite et ne renvoie rien', async () => {
+    const { client, sent } = buildClient();
+    const failures: any[] = [];
+    client.on('translationError', (e) => failures.push(e));
+    const taskId = await sendRequest(client);
+
+    handlerOf(client).emit('translationExpired', expired(taskId, sent[0].timestamp + 30_000));
+
+    expect(failures).toHaveLength(1);
+    expect(failures[0].messageId).toBe('msg-late');
+    expect(failures[0].metadata.expired).toBe(true);
+    expect(pendingCount(client)).toBe(0);
+
+    await jest.advanceTimersByTimeAsync(10 * 60_000);
+    expect(sent).toHaveLength(1);
+    expect(failures).toHaveLength(1);
+  });
+
+  it("ignore l'expiration d'une tentative déjà renvoyée", async () => {
+    const { client, sent } = buildClient();
+    const failures: any[] = [];
+    client.on('translationError', (e) => failures.push(e));
+    const taskId = await sendRequest(client);
+    const firstDeadline = sent[0].timestamp + 30_000;
+
+    // Deadman de la première tentative : renvoi du même taskId
+    await jest.advanceTimersByTimeAsync(30_000);
+    expect(sent).toHaveLength(2);
+
+    handlerOf(client).emit('translationExpired', expired(taskId, firstDeadline));
+
+    expect(failures).toHaveLength(0);
+    expect(pendingCount(client)).toBe(1);
+  });
+
+  it("n'ouvre pas le circuit breaker", async () => {
+    const { client, sent } = buildClient();
+    client.on('translationError', () => undefined);
+
+    for (let i = 0; i < 10; i++) {
+      const taskId = await sendRequest(client);
+      handlerOf(client).emit('translationExpired', expired(taskId, sent[sent.length - 1].timestamp + 30_000));
+    }
+
+    expect((client as any)._cbIsOpen()).toBe(false);
+  });
+});
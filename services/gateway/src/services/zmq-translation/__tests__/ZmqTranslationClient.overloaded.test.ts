@@ -0,0 +1,120 @@
+/**
+ * Le translator refuse une requête quand le budget et la file de sa classe
+ * sont pleins (contrôle d'admission) et publie `overloaded` avec un
+ * `retryAfterMs`. Sans handler, l'événement tombait dans « Type d'événement
+ * inconnu » : la requête refusée attendait son deadman complet (30 s pour le
+ * texte, 15 min pour un pipeline voix) avant le moindre retry ou la moindre
+ * erreur.
+ *
+ * Le client avance désormais le timeout de la requête à `retryAfterMs` : le
+ * retry habituel (même taskId, borné) part dès que le translator a de la
+ * place, et l'erreur finale tombe sans attendre quand les retries sont épuisés.
+ */
+
+import { describe, it, expect, jest, beforeEach, afterEach } from '@jest/globals';
+import type { EventEmitter } from 'events';
+
+jest.mock('../../../utils/logger-enhanced', () => ({
+  enhancedLogger: {
+    child: () => ({
+      info: jest.fn(),
+      debug: jest.fn(),
+      warn: jest.fn(),
+      error: jest.fn(),
+    }),
+  },
+}));
+
+import { ZmqTranslationClient } from '../ZmqTranslationClient';
+
+type SentMessage = Record<string, any>;
+
+function buildClient() {
+  const sent: SentMessage[] = [];
+  const client = new ZmqTranslationClient();
+
+  (client as any).connectionManager = {
+    send: jest.fn(async (message: SentMessage) => {
+      sent.push(message);
+    }),
+  };
+  (client as any).requestSender.connectionManager = (client as any).connectionManager;
+
+  return { client, sent };
+}
+
+const handlerOf = (client: ZmqTranslationClient): EventEmitter =>
+  (client as unknown as { messageHandler: EventEmitter }).messageHandler;
+
+const overloaded = (taskId: string | null, retryAfterMs = 2000) => ({
+  requestType: 'translation',
+  taskId,
+  messageId: 'msg-busy',
+  conversationId: 'conv-1',
+  queueDepth: 32,
+  retryAfterMs,
+});
+
+const sendRequest = async (client: ZmqTranslationClient) =>
+  client.sendTranslationRequest({
+    messageId: 'msg-busy',
+    text: 'le texte',
+    sourceLanguage: 'fr',
+    targetLanguages: ['en'],
+    conversationId: 'conv-1',
+    modelType: 'basic',
+  } as any);
+
+beforeEach(() => {
+  jest.useFakeTimers();
+});
+
+afterEach(() => {
+  jest.useRealTimers();
+});
+
+describe('Une requête refusée pour surcharge est relancée sans attendre son deadman', () => {
+  it('renvoie le même taskId après retryAfterMs', async () => {
+    const { client, sent } = buildClient();
+    const taskId = await sendRequest(client);
+
+    handlerOf(client).emit('translatorOverloaded', overloaded(taskId, 2000));
+    await jest.advanceTimersByTimeAsync(1999);
+    expect(sent).toHaveLength(1);
+
+    await jest.advanceTimersByTimeAsync(1);
+    expect(sent).toHaveLength(2);
+    expect(sent[1].taskId).toBe(taskId);
+  });
+
+  it('signale une erreur dès que les retries sont épuisés par des refus', async () => {
+    const { client } = buildClient();
+    const failures: any[] = [];
+    client.on('translationError', (e) => failures.push(e));
+    const taskId = await sendRequest(client);
+
+    for (let attempt = 0; attempt < 20 && failures.length === 0; attempt++) {
+      handlerOf(client).emit('translatorOverloaded', overloaded(taskId, 1000));
+      await jest.advanceTimersByTimeAsync(1000);
+    }
+
+    expect(failures).toHaveLength(1);
+    expect(failures[0].messageId).toBe('msg-busy');
+    expect((client as any).requestSender.getPendingRequestsCount()).toBe(0);
+  });
+
+  it("n'ouvre pas le circuit breaker et transmet l'événement", async () => {
+    const { client } = buildClient();
+    const forwarded: any[] = [];
+    client.on('translatorOverloaded', (e) => forwarded.push(e));
+    await sendRequest(client);
+
+    for (let i = 0; i < 10; i++) {
+      handlerOf(client).emit('translatorOverloaded', overloaded(null));
+    }
+
+    expect(forwarded).toHaveLength(10);
+    expect((client as any)._cbIsOpen()).toBe(false);
+    expect((client as any).requestSender.getPendingRequestsCount()).toBe(1);
+  });
+});
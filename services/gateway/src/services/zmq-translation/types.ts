@@ -67,9 +67,43 @@ export interface PongEvent {
   audio_pipeline_available?: boolean;
 }
 
+/**
+ * Requête refusée par le contrôle d'admission du translator (budget et file
+ * de sa classe pleins). Le translator n'exécutera pas la requête : elle peut
+ * être renvoyée, avec le même taskId, après `retryAfterMs`.
+ */
+export interface TranslatorOverloadedEvent {
+  type: 'overloaded';
+  requestType: string;
+  taskId?: string | null;
+  messageId?: string | null;
+  attachmentId?: string | null;
+  conversationId?: string | null;
+  queueDepth: number;
+  retryAfterMs: number;
+  timestamp: number;
+}
+
+/**
+ * Tâche de traduction abandonnée par le translator avant inférence : son
+ * échéance (`deadline`, epoch ms) était dépassée de `lateByMs`.
+ */
+export interface TranslationExpiredEvent {
+  type: 'translation_expired';
+  taskId: string;
+  messageId: string;
+  conversationId: string;
+  targetLanguages: string[];
+  deadline?: number;
+  lateByMs: number;
+  timestamp: number;
+}
+
 export type TranslationEvent =
   | TranslationCompletedEvent
   | TranslationErrorEvent
+  | TranslationExpiredEvent
+  | TranslatorOverloadedEvent
   | TranslationReadyEvent
   | AudioTranslationReadyEvent
   | AudioTranslationsProgressiveEvent
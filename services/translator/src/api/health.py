@@ -17,19 +17,22 @@ logger = logging.getLogger(__name__)
 translation_service = None
 database_service = None
 zmq_server = None
+warmup_manager = None
 
 # Temps de démarrage
 startup_time = time.time()
 
-def set_services(trans_service=None, db_service=None, zmq_srv=None):
+def set_services(trans_service=None, db_service=None, zmq_srv=None, warmup_srv=None):
     """Configure les références vers les services pour le monitoring"""
-    global translation_service, database_service, zmq_server
+    global translation_service, database_service, zmq_server, warmup_manager
     if trans_service:
         translation_service = trans_service
     if db_service:
         database_service = db_service
     if zmq_srv:
         zmq_server = zmq_srv
+    if warmup_srv:
+        warmup_manager = warmup_srv
 
 async def check_database_health() -> Dict[str, Any]:
     """Vérifie l'état de santé de la base de données"""
@@ -264,14 +267,17 @@ async def readiness_check() -> Dict[str, Any]:
         
         db_ready = db_health.get("connected", False) or db_health.get("status") == "degraded_mode"
         zmq_ready = zmq_health.get("running", False)
+        # Sans gestionnaire de préchauffage configuré, rien à attendre
+        warmup_ready = warmup_manager is None or warmup_manager.is_ready
         
-        if not (db_ready and zmq_ready):
+        if not (db_ready and zmq_ready and warmup_ready):
             raise HTTPException(
                 status_code=503, 
                 detail={
                     "message": "Service not ready",
                     "database_ready": db_ready,
-                    "zmq_ready": zmq_ready
+                    "zmq_ready": zmq_ready,
+                    "warmup_ready": warmup_ready
                 }
             )
         
@@ -279,7 +285,8 @@ async def readiness_check() -> Dict[str, Any]:
             "status": "ready",
             "message": "Service ready to handle translation requests",
             "database_ready": db_ready,
-            "zmq_ready": zmq_ready
+            "zmq_ready": zmq_ready,
+            "warmup_ready": warmup_ready
         }
         
     except HTTPException:
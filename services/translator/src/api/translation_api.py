@@ -13,6 +13,7 @@ import asyncio
 # Import du health router
 from api.health import health_router, set_services
 from config.message_limits import can_translate_message, MessageLimits
+from utils.l1_cache import get_l1_translation_cache
 
 # Import du audio router (lazy loading)
 try:
@@ -28,6 +29,8 @@ logger = logging.getLogger(__name__)
 class DetectLanguageRequest(BaseModel):
     """Requête de détection de langue"""
     text: str = Field(..., min_length=1, max_length=10000)
+    conversation_id: Optional[str] = Field(default=None, description="Conversation (prior de langue pour les textes courts)")
+    sender_id: Optional[str] = Field(default=None, description="Expéditeur dans la conversation")
 
 class TranslationRequest(BaseModel):
     """Requête de traduction"""
@@ -135,18 +138,20 @@ class TranslationAPI:
         self.start_time = None
     
     def _register_detect_language_route(self):
-        """Route de détection de langue via langdetect"""
-        from langdetect import detect, LangDetectException, DetectorFactory
-        DetectorFactory.seed = 0
+        """Route de détection de langue (détecteur partagé: écriture, fastText/langdetect, priors)"""
+        from services.translation_ml.language_detector import get_language_detector
 
         @self.app.post("/detect-language")
         async def detect_language(request: DetectLanguageRequest):
-            try:
-                detected = detect(request.text)
-                return {"language": detected, "confidence": 0.9}
-            except LangDetectException as e:
-                logger.warning(f"[TRANSLATOR] Language detection failed: {e}")
-                return {"language": "unknown", "confidence": 0.0}
+            context_key = request.conversation_id
+            if context_key and request.sender_id:
+                context_key = f"{context_key}:{request.sender_id}"
+
+            result = get_language_detector().detect_with_confidence(request.text, context_key=context_key)
+            if result.language is None:
+                logger.warning("[TRANSLATOR] Language detection failed: no confident result")
+                return {"language": "unknown", "confidence": 0.0, "method": result.method}
+            return {"language": result.language, "confidence": round(result.confidence, 4), "method": result.method}
 
     def _register_routes(self):
         """Enregistre toutes les routes de l'API"""
@@ -305,15 +310,20 @@ class TranslationAPI:
         
         @self.app.get("/debug/cache")
         async def get_cache_stats():
-            """Statistiques du cache (debug)"""
+            """Statistiques du cache (debug) — dont le L1 en mémoire (hit/miss/évictions)"""
+            l1_cache = get_l1_translation_cache()
+            l1_stats = l1_cache.get_stats() if l1_cache is not None else None
             if hasattr(self.translation_service, 'cache_service'):
                 stats = await self.translation_service.cache_service.get_stats()
-                return {"cache_stats": stats}
-            return {"message": "Cache service not available"}
+                return {"cache_stats": stats, "l1_cache": l1_stats}
+            return {"message": "Cache service not available", "l1_cache": l1_stats}
         
         @self.app.post("/debug/clear-cache")
         async def clear_cache():
             """Vide le cache (debug)"""
+            l1_cache = get_l1_translation_cache()
+            if l1_cache is not None:
+                l1_cache.clear()
             if hasattr(self.translation_service, 'cache_service'):
                 await self.translation_service.cache_service.clear_all()
                 return {"message": "Cache cleared"}
@@ -121,6 +121,9 @@ class Settings:
         self.premium_model = os.getenv("PREMIUM_MODEL", "facebook/nllb-200-distilled-1.3B")
         # Alias pour compatibilité (medium = basic)
         self.medium_model = self.basic_model
+        # Modèle distillé optionnel pour les messages courts (fast_pool) —
+        # famille NLLB (mêmes codes de langue). Vide = désactivé
+        self.fast_model = os.getenv("FAST_MODEL", "")
         
         # Configuration des performances
         self.translation_timeout = int(os.getenv("TRANSLATION_TIMEOUT", "20"))  # 20 secondes pour multicore AMD
@@ -60,11 +60,14 @@ from services.zmq_server import ZMQTranslationServer
 from services.translation_ml_service import TranslationMLService
 
 from api.translation_api import TranslationAPI
+from api.health import set_services as set_health_services
+from services.translation_ml.warmup import WarmupManager, STATE_FILENAME
+from utils.performance import PerformanceConfig
 
 # Import du service Redis (cache avec fallback mémoire)
 REDIS_AVAILABLE = False
 try:
-    from services.redis_service import get_redis_service, get_audio_cache_service
+    from services.redis_service import get_redis_service, get_audio_cache_service, get_translation_cache_redis
     REDIS_AVAILABLE = True
 except ImportError as e:
     pass  # Will be logged later
@@ -132,7 +135,9 @@ class MeeshyTranslationServer:
         self.zmq_server = None
         self.translation_api = None
         self.redis_service = None
+        self.translation_cache_redis = None
         self.audio_cache_service = None
+        self.warmup_manager = None
         self.is_initialized = False
     
     async def initialize(self) -> bool:
@@ -148,6 +153,19 @@ class MeeshyTranslationServer:
             self.translation_service = TranslationMLService(self.settings, model_type="all", max_workers=max_workers, quantization_level=quantization_level)
             
             logger.info(f"[TRANSLATOR] ✅ Service ML unifié créé (modèles seront chargés en arrière-plan)")
+
+            # 1.1 Préchauffage: /ready attend la fin du préchauffage des paires chaudes
+            perf_config = PerformanceConfig()
+            warmup_state_path = perf_config.warmup_state_path or os.path.join(self.settings.models_path, STATE_FILENAME)
+            # Service interne (pas le moteur local): paires comptées à l'entrée,
+            # préchauffage envoyé aux réplicas quand ils servent l'inférence
+            self.warmup_manager = WarmupManager(
+                self.translation_service.translation_service,
+                self.translation_service.translation_cache,
+                warmup_state_path,
+                perf_config
+            )
+            set_health_services(warmup_srv=self.warmup_manager)
             logger.info(f"[TRANSLATOR] 📚 Le chargement des modèles ML démarrera après le serveur FastAPI...")
 
             # 1.5 Initialiser le service Redis (cache avec fallback mémoire)
@@ -158,6 +176,12 @@ class MeeshyTranslationServer:
                     await self.redis_service.initialize()
                     self.audio_cache_service = get_audio_cache_service(self.settings)
 
+                    # Cache de traduction shardé sur ses propres nœuds si configuré
+                    translation_cache_redis = get_translation_cache_redis()
+                    if translation_cache_redis is not self.redis_service:
+                        self.translation_cache_redis = translation_cache_redis
+                        await self.translation_cache_redis.initialize()
+
                     stats = self.redis_service.get_stats()
                     logger.info(f"[TRANSLATOR] ✅ Service Redis initialisé (mode: {stats['mode']})")
                 except Exception as e:
@@ -397,12 +421,23 @@ class MeeshyTranslationServer:
                 stats = await self.translation_service.get_stats()
                 available_models = list(stats.get('models_loaded', {}).keys())
                 logger.info(f"[TRANSLATOR] ✅ Modèles ML chargés avec succès: {available_models}")
+
+                # Préchauffer les paires chaudes de la session précédente avant /ready
+                if self.warmup_manager:
+                    await self.warmup_manager.run()
+                    self.warmup_manager.start_snapshots()
+
                 logger.info(f"[TRANSLATOR] 🎯 Service de traduction maintenant pleinement opérationnel")
             else:
+                if self.warmup_manager:
+                    self.warmup_manager.status = 'failed'
                 logger.error("[TRANSLATOR] ❌ Échec du chargement des modèles ML")
                 logger.warning("[TRANSLATOR] ⚠️ Le serveur continue de fonctionner mais les traductions ML ne seront pas disponibles")
                 
         except Exception as e:
+            # Sans statut final, /ready resterait bloqué sur un préchauffage qui n'aura jamais lieu
+            if self.warmup_manager and not self.warmup_manager.is_ready:
+                self.warmup_manager.status = 'failed'
             logger.error(f"[TRANSLATOR] ❌ Erreur lors du chargement des modèles ML: {e}")
             import traceback
             traceback.print_exc()
@@ -513,9 +548,15 @@ class MeeshyTranslationServer:
             if self.zmq_server:
                 await self.zmq_server.stop()
 
+            if self.warmup_manager:
+                await self.warmup_manager.stop()
+
             if self.translation_service:
                 await self.translation_service.close()
 
+            if self.translation_cache_redis:
+                await self.translation_cache_redis.close()
+
             if self.redis_service:
                 await self.redis_service.close()
 
@@ -30,7 +30,8 @@ from typing import Optional, List, Dict, Any, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 
-from utils.audio_format_converter import convert_to_wav_if_needed
+from utils.artifact_store import get_artifact_store
+from utils.audio_format_converter import convert_to_wav_if_needed_async
 
 # Import stages
 from .transcription_guards import is_blank_transcription
@@ -322,7 +323,8 @@ class AudioMessagePipeline:
         use_original_voice: bool = True,
         cloning_params: Optional[Dict[str, Any]] = None,
         on_transcription_ready: Optional[Callable] = None,
-        on_translation_ready: Optional[Callable] = None
+        on_translation_ready: Optional[Callable] = None,
+        audio_hash: Optional[str] = None
     ) -> AudioMessageResult:
         """
         Process complete audio message through pipeline.
@@ -356,6 +358,8 @@ class AudioMessagePipeline:
                                    (before translation starts)
             on_translation_ready: Callback called when each translation is ready
                                  (called per language, allows progressive updates)
+            audio_hash: Content hash of the original audio bytes (ZMQ frame),
+                        computed before the file was written to disk
 
         Returns:
             AudioMessageResult with transcription + translations
@@ -366,282 +370,303 @@ class AudioMessagePipeline:
         # (m4a/mp3 non supportés par soundfile/pyannote)
         original_path = audio_path
         try:
-            audio_path = convert_to_wav_if_needed(audio_path)
+            audio_path = await convert_to_wav_if_needed_async(audio_path)
             if audio_path != original_path:
                 logger.info(f"[PIPELINE] Converti {Path(original_path).suffix} -> WAV: {audio_path}")
         except Exception as e:
             logger.warning(f"[PIPELINE] Conversion WAV echouee, utilisation du fichier original: {e}")
             audio_path = original_path
 
-        logger.info("=" * 80)
-        logger.info(f"[PIPELINE] 🎵 Processing audio message START")
-        logger.info(f"[PIPELINE]    Message ID: {message_id}")
-        logger.info(f"[PIPELINE]    Attachment ID: {attachment_id}")
-        logger.info(f"[PIPELINE]    Conversation ID: {conversation_id}")
-        logger.info(f"[PIPELINE]    Sender ID: {sender_id}")
-        logger.info(f"[PIPELINE]    Duration: {audio_duration_ms}ms")
-        logger.info(f"[PIPELINE]    📝 User Language (defined by sender): {user_language or 'None'}")
-        logger.info(f"[PIPELINE]    🌍 Target Languages (from Gateway): {target_languages or 'None (will auto-detect)'}")
-        logger.info(f"[PIPELINE]    🎤 Generate Voice Clone: {generate_voice_clone}")
-        logger.info(f"[PIPELINE]    🔊 Use Original Voice: {use_original_voice}")
-        logger.info(f"[PIPELINE]    📊 Model Type: {model_type}")
-        logger.info(f"[PIPELINE]    👤 Existing Voice Profile: {'YES' if existing_voice_profile else 'NO'}")
-        logger.info("=" * 80)
-
-        # Ensure initialized
-        if not self.is_initialized:
-            await self.initialize()
-
-        # ═══════════════════════════════════════════════════════════════
-        # STAGE 1: TRANSCRIPTION
-        # ═══════════════════════════════════════════════════════════════
-        logger.info("[PIPELINE] Stage 1: Transcription")
-
-        transcription = await self.transcription_stage.process(
-            audio_path=audio_path,
-            attachment_id=attachment_id,
-            audio_duration_ms=audio_duration_ms,
-            user_language=user_language,
-            metadata=metadata,
-            use_cache=True
-        )
-
-        logger.info(
-            f"[PIPELINE] Transcribed: '{transcription.text[:50]}...' "
-            f"(lang={transcription.language}, source={transcription.source})"
-        )
+        # Le WAV du magasin d'artefacts reste épinglé (non évincé) jusqu'à la fin du pipeline
+        with get_artifact_store().pinned(audio_path):
+            logger.info("=" * 80)
+            logger.info(f"[PIPELINE] 🎵 Processing audio message START")
+            logger.info(f"[PIPELINE]    Message ID: {message_id}")
+            logger.info(f"[PIPELINE]    Attachment ID: {attachment_id}")
+            logger.info(f"[PIPELINE]    Conversation ID: {conversation_id}")
+            logger.info(f"[PIPELINE]    Sender ID: {sender_id}")
+            logger.info(f"[PIPELINE]    Duration: {audio_duration_ms}ms")
+            logger.info(f"[PIPELINE]    📝 User Language (defined by sender): {user_language or 'None'}")
+            logger.info(f"[PIPELINE]    🌍 Target Languages (from Gateway): {target_languages or 'None (will auto-detect)'}")
+            logger.info(f"[PIPELINE]    🎤 Generate Voice Clone: {generate_voice_clone}")
+            logger.info(f"[PIPELINE]    🔊 Use Original Voice: {use_original_voice}")
+            logger.info(f"[PIPELINE]    📊 Model Type: {model_type}")
+            logger.info(f"[PIPELINE]    👤 Existing Voice Profile: {'YES' if existing_voice_profile else 'NO'}")
+            logger.info("=" * 80)
+
+            # Ensure initialized
+            if not self.is_initialized:
+                await self.initialize()
+
+            # ═══════════════════════════════════════════════════════════════
+            # STAGE 1: TRANSCRIPTION
+            # ═══════════════════════════════════════════════════════════════
+            logger.info("[PIPELINE] Stage 1: Transcription")
+
+            transcription = await self.transcription_stage.process(
+                audio_path=audio_path,
+                attachment_id=attachment_id,
+                audio_duration_ms=audio_duration_ms,
+                user_language=user_language,
+                metadata=metadata,
+                use_cache=True,
+                audio_hash=audio_hash
+            )
 
-        # ═══════════════════════════════════════════════════════════════
-        # GARDE: transcription vide ("no speech" — VAD a tout retiré ou
-        # hallucinations toutes filtrées). On NE déclenche PAS le callback
-        # (sinon la gateway stocke une transcription `undefined`), ni la
-        # traduction NLLB / le TTS (clonage vocal de rien). On renvoie un
-        # résultat transcription-only à confidence 0.0.
-        # ═══════════════════════════════════════════════════════════════
-        if is_blank_transcription(transcription.text):
             logger.info(
-                "[PIPELINE] 🔇 Transcription vide (no speech) — skip callback, traduction et TTS"
-            )
-            return self._build_transcription_only_result(
-                message_id=message_id,
-                attachment_id=attachment_id,
-                audio_path=audio_path,
-                audio_url=audio_url,
-                transcription=transcription,
-                sender_id=sender_id,
-                start_time=start_time,
+                f"[PIPELINE] Transcribed: '{transcription.text[:50]}...' "
+                f"(lang={transcription.language}, source={transcription.source})"
             )
 
-        # ═══════════════════════════════════════════════════════════════
-        # CALLBACK: Notify transcription ready (before translation)
-        # Permet à la gateway de recevoir la transcription immédiatement
-        # ═══════════════════════════════════════════════════════════════
-        if on_transcription_ready:
-            try:
-                transcription_time = int((time.time() - start_time) * 1000)
-                logger.info(f"[PIPELINE] 📤 Calling on_transcription_ready callback ({transcription_time}ms)")
-
-                # Préparer les données de transcription pour le callback
-                transcription_data = {
-                    'message_id': message_id,
-                    'attachment_id': attachment_id,
-                    'audio_path': audio_path,
-                    'audio_url': audio_url,
-                    'transcription': transcription,
-                    'processing_time_ms': transcription_time
-                }
+            # ═══════════════════════════════════════════════════════════════
+            # GARDE: transcription vide ("no speech" — VAD a tout retiré ou
+            # hallucinations toutes filtrées). On NE déclenche PAS le callback
+            # (sinon la gateway stocke une transcription `undefined`), ni la
+            # traduction NLLB / le TTS (clonage vocal de rien). On renvoie un
+            # résultat transcription-only à confidence 0.0.
+            # ═══════════════════════════════════════════════════════════════
+            if is_blank_transcription(transcription.text):
+                logger.info(
+                    "[PIPELINE] 🔇 Transcription vide (no speech) — skip callback, traduction et TTS"
+                )
+                return self._build_transcription_only_result(
+                    message_id=message_id,
+                    attachment_id=attachment_id,
+                    audio_path=audio_path,
+                    audio_url=audio_url,
+                    transcription=transcription,
+                    sender_id=sender_id,
+                    start_time=start_time,
+                )
 
-                # Appeler le callback (peut être async)
-                if asyncio.iscoroutinefunction(on_transcription_ready):
-                    await on_transcription_ready(transcription_data)
-                else:
-                    on_transcription_ready(transcription_data)
+            # ═══════════════════════════════════════════════════════════════
+            # CALLBACK: Notify transcription ready (before translation)
+            # Permet à la gateway de recevoir la transcription immédiatement
+            # ═══════════════════════════════════════════════════════════════
+            if on_transcription_ready:
+                try:
+                    transcription_time = int((time.time() - start_time) * 1000)
+                    logger.info(f"[PIPELINE] 📤 Calling on_transcription_ready callback ({transcription_time}ms)")
+
+                    # Préparer les données de transcription pour le callback
+                    transcription_data = {
+                        'message_id': message_id,
+                        'attachment_id': attachment_id,
+                        'audio_path': audio_path,
+                        'audio_url': audio_url,
+                        'transcription': transcription,
+                        'processing_time_ms': transcription_time
+                    }
+
+                    # Appeler le callback (peut être async)
+                    if asyncio.iscoroutinefunction(on_transcription_ready):
+                        await on_transcription_ready(transcription_data)
+                    else:
+                        on_transcription_ready(transcription_data)
+
+                    logger.info(f"[PIPELINE] ✅ Transcription callback completed")
+                except Exception as e:
+                    logger.warning(f"[PIPELINE] ⚠️ Transcription callback error: {e}")
+
+            # ═══════════════════════════════════════════════════════════════
+            # STAGE 2: DETERMINE TARGET LANGUAGES
+            # ═══════════════════════════════════════════════════════════════
+            logger.info("[PIPELINE] Stage 2: Target languages")
+
+            if not target_languages:
+                target_languages = await self._get_target_languages(
+                    conversation_id=conversation_id,
+                    source_language=transcription.language,
+                    sender_id=sender_id
+                )
 
-                logger.info(f"[PIPELINE] ✅ Transcription callback completed")
-            except Exception as e:
-                logger.warning(f"[PIPELINE] ⚠️ Transcription callback error: {e}")
-
-        # ═══════════════════════════════════════════════════════════════
-        # STAGE 2: DETERMINE TARGET LANGUAGES
-        # ═══════════════════════════════════════════════════════════════
-        logger.info("[PIPELINE] Stage 2: Target languages")
-
-        if not target_languages:
-            target_languages = await self._get_target_languages(
-                conversation_id=conversation_id,
-                source_language=transcription.language,
-                sender_id=sender_id
+            logger.info(f"[PIPELINE] Initial target languages: {target_languages}")
+
+            # Filter out source language (no need to translate to same language)
+            source_language = transcription.language
+            target_languages = [
+                lang for lang in target_languages
+                if lang != source_language
+            ]
+
+            logger.info(f"[PIPELINE] Filtered target languages: {target_languages}")
+
+            # Bandwidth lever #5 — eager vs on-demand TTS (OBSERVABILITY ONLY for now).
+            # We compute which languages COULD be deferred and log the potential
+            # saving, but we do NOT drop them from generation here: text + audio are
+            # produced together in this pipeline, so bounding `target_languages` would
+            # also drop the TEXT translation of deferred languages — a regression.
+            # Actually bounding generation must wait for the on-demand path that
+            # synthesizes audio (and, if needed, text) on first request. Until then
+            # this stays a no-op measurement so the default behaviour is unchanged.
+            from .tts_language_policy import select_eager_tts_languages
+            _tts_selection = select_eager_tts_languages(
+                target_languages,
+                mode=os.getenv("TTS_GENERATION_MODE", "all"),
+                max_eager=int(os.getenv("TTS_MAX_EAGER_LANGUAGES", "0")) or None,
             )
+            if _tts_selection.deferred:
+                logger.info(
+                    "[PIPELINE] TTS on-demand candidates (NOT yet deferred — needs the "
+                    f"on-demand fetch path): {_tts_selection.deferred}"
+                )
 
-        logger.info(f"[PIPELINE] Initial target languages: {target_languages}")
-
-        # Filter out source language (no need to translate to same language)
-        source_language = transcription.language
-        target_languages = [
-            lang for lang in target_languages
-            if lang != source_language
-        ]
-
-        logger.info(f"[PIPELINE] Filtered target languages: {target_languages}")
-
-        # Bandwidth lever #5 — eager vs on-demand TTS (OBSERVABILITY ONLY for now).
-        # We compute which languages COULD be deferred and log the potential
-        # saving, but we do NOT drop them from generation here: text + audio are
-        # produced together in this pipeline, so bounding `target_languages` would
-        # also drop the TEXT translation of deferred languages — a regression.
-        # Actually bounding generation must wait for the on-demand path that
-        # synthesizes audio (and, if needed, text) on first request. Until then
-        # this stays a no-op measurement so the default behaviour is unchanged.
-        from .tts_language_policy import select_eager_tts_languages
-        _tts_selection = select_eager_tts_languages(
-            target_languages,
-            mode=os.getenv("TTS_GENERATION_MODE", "all"),
-            max_eager=int(os.getenv("TTS_MAX_EAGER_LANGUAGES", "0")) or None,
-        )
-        if _tts_selection.deferred:
-            logger.info(
-                "[PIPELINE] TTS on-demand candidates (NOT yet deferred — needs the "
-                f"on-demand fetch path): {_tts_selection.deferred}"
-            )
+            # Early return if no translations needed
+            if not target_languages:
+                logger.info("[PIPELINE] No translations needed, returning transcription only")
+                return self._build_transcription_only_result(
+                    message_id=message_id,
+                    attachment_id=attachment_id,
+                    audio_path=audio_path,
+                    audio_url=audio_url,
+                    transcription=transcription,
+                    sender_id=sender_id,
+                    start_time=start_time
+                )
 
-        # Early return if no translations needed
-        if not target_languages:
-            logger.info("[PIPELINE] No translations needed, returning transcription only")
-            return self._build_transcription_only_result(
-                message_id=message_id,
-                attachment_id=attachment_id,
-                audio_path=audio_path,
-                audio_url=audio_url,
-                transcription=transcription,
-                sender_id=sender_id,
-                start_time=start_time
-            )
+            # ═══════════════════════════════════════════════════════════════
+            # STAGE 3: VOICE MODEL CREATION
+            # ═══════════════════════════════════════════════════════════════
+            logger.info("[PIPELINE] Stage 3: Voice model creation")
 
-        # ═══════════════════════════════════════════════════════════════
-        # STAGE 3: VOICE MODEL CREATION
-        # ═══════════════════════════════════════════════════════════════
-        logger.info("[PIPELINE] Stage 3: Voice model creation")
+            # En mode multi-speaker, le clonage vocal est géré par speaker individuellement
+            final_generate_voice_clone = generate_voice_clone
+            if transcription.speaker_count and transcription.speaker_count > 1:
+                logger.info(
+                    f"[PIPELINE] 🎭 Mode multi-speaker détecté: "
+                    f"{transcription.speaker_count} locuteurs → clonage vocal par speaker activé"
+                )
+            elif generate_voice_clone:
+                logger.info("[PIPELINE] 🎤 Clonage vocal activé: locuteur unique détecté")
 
-        # En mode multi-speaker, le clonage vocal est géré par speaker individuellement
-        final_generate_voice_clone = generate_voice_clone
-        if transcription.speaker_count and transcription.speaker_count > 1:
-            logger.info(
-                f"[PIPELINE] 🎭 Mode multi-speaker détecté: "
-                f"{transcription.speaker_count} locuteurs → clonage vocal par speaker activé"
+            voice_model, voice_model_user_id = await self.translation_stage.create_voice_model(
+                sender_id=sender_id,
+                audio_path=audio_path,
+                audio_duration_ms=audio_duration_ms or transcription.duration_ms,
+                original_sender_id=original_sender_id,
+                existing_voice_profile=existing_voice_profile,
+                use_original_voice=use_original_voice,
+                generate_voice_clone=final_generate_voice_clone
             )
-        elif generate_voice_clone:
-            logger.info("[PIPELINE] 🎤 Clonage vocal activé: locuteur unique détecté")
-
-        voice_model, voice_model_user_id = await self.translation_stage.create_voice_model(
-            sender_id=sender_id,
-            audio_path=audio_path,
-            audio_duration_ms=audio_duration_ms or transcription.duration_ms,
-            original_sender_id=original_sender_id,
-            existing_voice_profile=existing_voice_profile,
-            use_original_voice=use_original_voice,
-            generate_voice_clone=final_generate_voice_clone
-        )
 
-        # ═══════════════════════════════════════════════════════════════
-        # STAGE 4: TRANSLATION + TTS (PARALLEL)
-        # ═══════════════════════════════════════════════════════════════
-        logger.info("[PIPELINE] Stage 4: Translation + TTS")
+            # ═══════════════════════════════════════════════════════════════
+            # STAGE 4: TRANSLATION + TTS (PARALLEL)
+            # ═══════════════════════════════════════════════════════════════
+            logger.info("[PIPELINE] Stage 4: Translation + TTS")
 
-        max_workers = min(
-            len(target_languages),
-            int(os.getenv("TTS_MAX_WORKERS", "4"))
-        )
-
-        # Préparer les segments pour le mode multi-speaker
-        source_segments = None
-        if transcription.segments:
-            # Convertir les segments en format dict si nécessaire
-            if isinstance(transcription.segments, list):
-                source_segments = []
-                for seg in transcription.segments:
-                    # Déterminer si c'est un dict ou un dataclass
-                    is_dict = isinstance(seg, dict)
-
-                    if is_dict:
-                        # Segment déjà en format dict (ex: depuis cache Redis)
-                        source_segments.append({
-                            'text': seg.get('text', ''),
-                            'start_ms': seg.get('start_ms', seg.get('startMs', 0)),
-                            'end_ms': seg.get('end_ms', seg.get('endMs', 0)),
-                            'speaker_id': seg.get('speaker_id', seg.get('speakerId')),
-                            'confidence': seg.get('confidence'),
-                            'voice_similarity_score': seg.get('voice_similarity_score', seg.get('voiceSimilarityScore')),
-                            'language': seg.get('language')
-                        })
-                    else:
-                        # Segment dataclass (TranscriptionSegment)
-                        source_segments.append({
-                            'text': seg.text if hasattr(seg, 'text') else '',
-                            'start_ms': seg.start_ms if hasattr(seg, 'start_ms') else 0,
-                            'end_ms': seg.end_ms if hasattr(seg, 'end_ms') else 0,
-                            'speaker_id': seg.speaker_id if hasattr(seg, 'speaker_id') else None,
-                            'confidence': seg.confidence if hasattr(seg, 'confidence') else None,
-                            'voice_similarity_score': seg.voice_similarity_score if hasattr(seg, 'voice_similarity_score') else None,
-                            'language': seg.language if hasattr(seg, 'language') else None
-                        })
-            else:
-                source_segments = transcription.segments
-
-        logger.info(
-            f"[PIPELINE] 🎭 Mode: "
-            f"segments={len(source_segments) if source_segments else 0}, "
-            f"speakers={transcription.speaker_count if transcription.speaker_count else 'unknown'}"
-        )
+            max_workers = min(
+                len(target_languages),
+                int(os.getenv("TTS_MAX_WORKERS", "4"))
+            )
 
-        # ═══════════════════════════════════════════════════════════════
-        # CHOIX DE LA MÉTHODE: Multi-speaker ou simple
-        # ═══════════════════════════════════════════════════════════════
-        is_multi_speaker = (
-            transcription.speaker_count is not None and
-            transcription.speaker_count > 1 and
-            source_segments and
-            len(source_segments) > 0
-        )
+            # Préparer les segments pour le mode multi-speaker
+            source_segments = None
+            if transcription.segments:
+                # Convertir les segments en format dict si nécessaire
+                if isinstance(transcription.segments, list):
+                    source_segments = []
+                    for seg in transcription.segments:
+                        # Déterminer si c'est un dict ou un dataclass
+                        is_dict = isinstance(seg, dict)
+
+                        if is_dict:
+                            # Segment déjà en format dict (ex: depuis cache Redis)
+                            source_segments.append({
+                                'text': seg.get('text', ''),
+                                'start_ms': seg.get('start_ms', seg.get('startMs', 0)),
+                                'end_ms': seg.get('end_ms', seg.get('endMs', 0)),
+                                'speaker_id': seg.get('speaker_id', seg.get('speakerId')),
+                                'confidence': seg.get('confidence'),
+                                'voice_similarity_score': seg.get('voice_similarity_score', seg.get('voiceSimilarityScore')),
+                                'language': seg.get('language')
+                            })
+                        else:
+                            # Segment dataclass (TranscriptionSegment)
+                            source_segments.append({
+                                'text': seg.text if hasattr(seg, 'text') else '',
+                                'start_ms': seg.start_ms if hasattr(seg, 'start_ms') else 0,
+                                'end_ms': seg.end_ms if hasattr(seg, 'end_ms') else 0,
+                                'speaker_id': seg.speaker_id if hasattr(seg, 'speaker_id') else None,
+                                'confidence': seg.confidence if hasattr(seg, 'confidence') else None,
+                                'voice_similarity_score': seg.voice_similarity_score if hasattr(seg, 'voice_similarity_score') else None,
+                                'language': seg.language if hasattr(seg, 'language') else None
+                            })
+                else:
+                    source_segments = transcription.segments
 
-        if is_multi_speaker:
             logger.info(
-                f"[PIPELINE] 🎤 Mode MULTI-SPEAKER activé: "
-                f"{transcription.speaker_count} speakers, "
-                f"{len(source_segments)} segments"
+                f"[PIPELINE] 🎭 Mode: "
+                f"segments={len(source_segments) if source_segments else 0}, "
+                f"speakers={transcription.speaker_count if transcription.speaker_count else 'unknown'}"
             )
-            logger.info(
-                f"[PIPELINE] Architecture: "
-                f"Extraction audio par speaker → "
-                f"Voice model par speaker → "
-                f"Chaîne mono-locuteur par speaker → "
-                f"Réassemblage"
+
+            # ═══════════════════════════════════════════════════════════════
+            # CHOIX DE LA MÉTHODE: Multi-speaker ou simple
+            # ═══════════════════════════════════════════════════════════════
+            is_multi_speaker = (
+                transcription.speaker_count is not None and
+                transcription.speaker_count > 1 and
+                source_segments and
+                len(source_segments) > 0
             )
 
-            # Utiliser le processeur multi-speaker qui réutilise la chaîne mono-locuteur
-            from .multi_speaker_processor import process_multi_speaker_audio
+            if is_multi_speaker:
+                logger.info(
+                    f"[PIPELINE] 🎤 Mode MULTI-SPEAKER activé: "
+                    f"{transcription.speaker_count} speakers, "
+                    f"{len(source_segments)} segments"
+                )
+                logger.info(
+                    f"[PIPELINE] Architecture: "
+                    f"Extraction audio par speaker → "
+                    f"Voice model par speaker → "
+                    f"Chaîne mono-locuteur par speaker → "
+                    f"Réassemblage"
+                )
 
-            translations = await process_multi_speaker_audio(
-                translation_stage=self.translation_stage,
-                voice_clone_service=self.translation_stage.voice_clone_service,
-                segments=source_segments,
-                source_audio_path=audio_path,
-                target_languages=target_languages,
-                source_language=source_language,
-                message_id=message_id,
-                attachment_id=attachment_id,
-                user_voice_model=voice_model,
-                sender_speaker_id=transcription.sender_speaker_id,
-                model_type=model_type,
-                on_translation_ready=on_translation_ready,
-                diarization_speakers=transcription.diarization_speakers
-            )
+                # Utiliser le processeur multi-speaker qui réutilise la chaîne mono-locuteur
+                from .multi_speaker_processor import process_multi_speaker_audio
 
-            if not translations:
-                logger.warning(
-                    "[PIPELINE] ⚠️ Échec traitement multi-speaker, "
-                    "fallback sur méthode simple"
+                translations = await process_multi_speaker_audio(
+                    translation_stage=self.translation_stage,
+                    voice_clone_service=self.translation_stage.voice_clone_service,
+                    segments=source_segments,
+                    source_audio_path=audio_path,
+                    target_languages=target_languages,
+                    source_language=source_language,
+                    message_id=message_id,
+                    attachment_id=attachment_id,
+                    user_voice_model=voice_model,
+                    sender_speaker_id=transcription.sender_speaker_id,
+                    model_type=model_type,
+                    on_translation_ready=on_translation_ready,
+                    diarization_speakers=transcription.diarization_speakers
                 )
-                # Fallback sur méthode simple
+
+                if not translations:
+                    logger.warning(
+                        "[PIPELINE] ⚠️ Échec traitement multi-speaker, "
+                        "fallback sur méthode simple"
+                    )
+                    # Fallback sur méthode simple
+                    translations = await self.translation_stage.process_languages(
+                        target_languages=target_languages,
+                        source_text=transcription.text,
+                        source_language=source_language,
+                        audio_hash=transcription.audio_hash,
+                        voice_model=voice_model,
+                        message_id=message_id,
+                        attachment_id=attachment_id,
+                        model_type=model_type,
+                        cloning_params=cloning_params,
+                        max_workers=max_workers,
+                        source_audio_path=audio_path,
+                        on_translation_ready=on_translation_ready
+                    )
+            else:
+                logger.info("[PIPELINE] 🎤 Mode MONO-SPEAKER: utilisation chaîne simple")
+
+                # Méthode simple (chaîne mono-locuteur qui fonctionne)
                 translations = await self.translation_stage.process_languages(
                     target_languages=target_languages,
                     source_text=transcription.text,
@@ -656,82 +681,64 @@ class AudioMessagePipeline:
                     source_audio_path=audio_path,
                     on_translation_ready=on_translation_ready
                 )
-        else:
-            logger.info("[PIPELINE] 🎤 Mode MONO-SPEAKER: utilisation chaîne simple")
-
-            # Méthode simple (chaîne mono-locuteur qui fonctionne)
-            translations = await self.translation_stage.process_languages(
-                target_languages=target_languages,
-                source_text=transcription.text,
-                source_language=source_language,
-                audio_hash=transcription.audio_hash,
-                voice_model=voice_model,
-                message_id=message_id,
-                attachment_id=attachment_id,
-                model_type=model_type,
-                cloning_params=cloning_params,
-                max_workers=max_workers,
-                source_audio_path=audio_path,
-                on_translation_ready=on_translation_ready
-            )
-
-        logger.info(f"[PIPELINE] Generated {len(translations)} translations")
 
-        # ═══════════════════════════════════════════════════════════════
-        # STAGE 5: BUILD RESULT
-        # ═══════════════════════════════════════════════════════════════
-        processing_time = int((time.time() - start_time) * 1000)
+            logger.info(f"[PIPELINE] Generated {len(translations)} translations")
 
-        # Serialize voice profile for Gateway (if new profile created)
-        new_voice_profile_data = None
-        if voice_model and not existing_voice_profile and voice_model.embedding is not None:
-            new_voice_profile_data = self._serialize_voice_model(
-                voice_model=voice_model,
-                user_id=voice_model_user_id
-            )
+            # ═══════════════════════════════════════════════════════════════
+            # STAGE 5: BUILD RESULT
+            # ═══════════════════════════════════════════════════════════════
+            processing_time = int((time.time() - start_time) * 1000)
 
-        result = AudioMessageResult(
-            message_id=message_id,
-            attachment_id=attachment_id,
-            original=OriginalAudio(
-                audio_path=audio_path,
-                audio_url=audio_url,
-                transcription=transcription.text,
-                language=transcription.language,
-                duration_ms=transcription.duration_ms,
-                confidence=transcription.confidence,
-                source=transcription.source,
-                segments=self._serialize_segments(transcription.segments),
-                speaker_count=transcription.speaker_count,
-                primary_speaker_id=transcription.primary_speaker_id,
-                sender_voice_identified=transcription.sender_voice_identified,
-                sender_speaker_id=transcription.sender_speaker_id,
-                speaker_analysis=transcription.speaker_analysis
-            ),
-            translations=translations,
-            voice_model_user_id=voice_model_user_id,
-            voice_model_quality=voice_model.quality_score if voice_model else 0.0,
-            processing_time_ms=processing_time,
-            new_voice_profile=new_voice_profile_data,
-            requested_languages=list(target_languages)
-        )
+            # Serialize voice profile for Gateway (if new profile created)
+            new_voice_profile_data = None
+            if voice_model and not existing_voice_profile and voice_model.embedding is not None:
+                new_voice_profile_data = self._serialize_voice_model(
+                    voice_model=voice_model,
+                    user_id=voice_model_user_id
+                )
 
-        logger.info(
-            f"[PIPELINE] ✅ Pipeline complete: "
-            f"{len(translations)} translations in {processing_time}ms"
-        )
+            result = AudioMessageResult(
+                message_id=message_id,
+                attachment_id=attachment_id,
+                original=OriginalAudio(
+                    audio_path=audio_path,
+                    audio_url=audio_url,
+                    transcription=transcription.text,
+                    language=transcription.language,
+                    duration_ms=transcription.duration_ms,
+                    confidence=transcription.confidence,
+                    source=transcription.source,
+                    segments=self._serialize_segments(transcription.segments),
+                    speaker_count=transcription.speaker_count,
+                    primary_speaker_id=transcription.primary_speaker_id,
+                    sender_voice_identified=transcription.sender_voice_identified,
+                    sender_speaker_id=transcription.sender_speaker_id,
+                    speaker_analysis=transcription.speaker_analysis
+                ),
+                translations=translations,
+                voice_model_user_id=voice_model_user_id,
+                voice_model_quality=voice_model.quality_score if voice_model else 0.0,
+                processing_time_ms=processing_time,
+                new_voice_profile=new_voice_profile_data,
+                requested_languages=list(target_languages)
+            )
 
-        # Log des métadonnées de diarisation dans le résultat
-        if transcription.speaker_count:
             logger.info(
-                f"[PIPELINE] 🎤 Diarisation dans résultat final: "
-                f"{transcription.speaker_count} speaker(s), "
-                f"primary={transcription.primary_speaker_id}, "
-                f"sender_identified={transcription.sender_voice_identified}, "
-                f"sender_speaker={transcription.sender_speaker_id}"
+                f"[PIPELINE] ✅ Pipeline complete: "
+                f"{len(translations)} translations in {processing_time}ms"
             )
 
-        return result
+            # Log des métadonnées de diarisation dans le résultat
+            if transcription.speaker_count:
+                logger.info(
+                    f"[PIPELINE] 🎤 Diarisation dans résultat final: "
+                    f"{transcription.speaker_count} speaker(s), "
+                    f"primary={transcription.primary_speaker_id}, "
+                    f"sender_identified={transcription.sender_voice_identified}, "
+                    f"sender_speaker={transcription.sender_speaker_id}"
+                )
+
+            return result
 
     def _build_transcription_only_result(
         self,
@@ -16,9 +16,10 @@ Architecture:
 Cette approche optimise le nombre d'appels TTS et préserve l'ordre de la conversation.
 
 Cache WAV:
-- Les conversions M4A → WAV sont mises en cache pendant 7 jours
-- Répertoire: models/wav_cache
-- Nettoyage automatique des fichiers expirés
+- Les conversions M4A → WAV (16 kHz mono) sont rangées dans le magasin
+  d'artefacts (utils.artifact_store), clé = hash du contenu audio
+- Budget disque borné (LRU) ; les conversions inutilisées depuis 7 jours
+  sont supprimées
 
 """
 
@@ -30,85 +31,58 @@ import asyncio
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
+from utils.artifact_store import get_artifact_store
+
 logger = logging.getLogger(__name__)
 
-# Répertoire de cache WAV
-WAV_CACHE_DIR = "/Users/smpceo/Documents/v2_meeshy/services/translator/models/wav_cache"
+# Transformation des conversions WAV dans le magasin d'artefacts
+WAV_CACHE_TRANSFORM = "wav16k-mono"
 WAV_CACHE_MAX_AGE_DAYS = 7
 
 
-def cleanup_wav_cache(cache_dir: str = WAV_CACHE_DIR, max_age_days: int = WAV_CACHE_MAX_AGE_DAYS) -> int:
+def cleanup_wav_cache(max_age_days: int = WAV_CACHE_MAX_AGE_DAYS) -> int:
     """
-    Nettoie le cache WAV en supprimant les fichiers plus vieux que max_age_days.
+    Supprime les conversions WAV inutilisées depuis plus de max_age_days.
+
+    Le budget disque global est déjà tenu par l'éviction LRU du magasin ;
+    ce nettoyage libère plus tôt les conversions qui ne servent plus.
 
     Args:
-        cache_dir: Répertoire du cache
-        max_age_days: Âge maximum des fichiers en jours
+        max_age_days: Âge maximum depuis le dernier accès, en jours
 
     Returns:
         Nombre de fichiers supprimés
     """
-    if not os.path.exists(cache_dir):
-        return 0
-
-    max_age_seconds = max_age_days * 86400
-    current_time = time.time()
-    removed_count = 0
-
     try:
-        for filename in os.listdir(cache_dir):
-            if not filename.endswith('.wav'):
-                continue
-
-            file_path = os.path.join(cache_dir, filename)
-            file_age = current_time - os.path.getmtime(file_path)
-
-            if file_age > max_age_seconds:
-                try:
-                    os.remove(file_path)
-                    removed_count += 1
-                    logger.info(
-                        f"[WAV_CACHE] 🗑️  Supprimé: {filename} "
-                        f"(âge: {file_age/86400:.1f}j > {max_age_days}j)"
-                    )
-                except Exception as e:
-                    logger.warning(f"[WAV_CACHE] ⚠️  Impossible de supprimer {filename}: {e}")
-
-        if removed_count > 0:
-            logger.info(f"[WAV_CACHE] ✅ Nettoyage terminé: {removed_count} fichier(s) supprimé(s)")
-
+        removed_count = get_artifact_store().evict_older_than(
+            max_age_days * 86400, transform_prefix=WAV_CACHE_TRANSFORM
+        )
     except Exception as e:
         logger.error(f"[WAV_CACHE] ❌ Erreur nettoyage cache: {e}")
+        return 0
 
+    if removed_count > 0:
+        logger.info(f"[WAV_CACHE] ✅ Nettoyage terminé: {removed_count} fichier(s) supprimé(s)")
     return removed_count
 
 
-def get_wav_cache_stats(cache_dir: str = WAV_CACHE_DIR) -> Dict[str, Any]:
+def get_wav_cache_stats() -> Dict[str, Any]:
     """
     Retourne les statistiques du cache WAV.
 
     Returns:
         Dict avec: total_files, total_size_mb, oldest_file_age_days
     """
-    if not os.path.exists(cache_dir):
-        return {"total_files": 0, "total_size_mb": 0, "oldest_file_age_days": 0}
-
     total_files = 0
     total_size = 0
     oldest_age = 0
     current_time = time.time()
 
     try:
-        for filename in os.listdir(cache_dir):
-            if not filename.endswith('.wav'):
-                continue
-
-            file_path = os.path.join(cache_dir, filename)
+        for entry in get_artifact_store().iter_entries(WAV_CACHE_TRANSFORM):
             total_files += 1
-            total_size += os.path.getsize(file_path)
-            file_age = (current_time - os.path.getmtime(file_path)) / 86400
-            oldest_age = max(oldest_age, file_age)
-
+            total_size += entry.size
+            oldest_age = max(oldest_age, (current_time - entry.last_access) / 86400)
     except Exception as e:
         logger.error(f"[WAV_CACHE] ❌ Erreur stats cache: {e}")
 
@@ -682,13 +656,10 @@ async def _extract_speaker_audio(
         import soundfile as sf
         import numpy as np
         import subprocess
-        import hashlib
-        import time
+        from contextlib import nullcontext
         from pathlib import Path
 
         audio_path_to_read = source_audio_path
-        temp_wav_path = None
-        cache_used = False
 
         def _is_real_wav(p):
             try:
@@ -704,39 +675,32 @@ async def _extract_speaker_audio(
             needs_convert = True
 
         if needs_convert:
-            with open(source_audio_path, 'rb') as f:
-                file_hash = hashlib.md5(f.read()).hexdigest()[:16]
+            from utils.audio_hash import get_audio_hasher
 
-            os.makedirs(WAV_CACHE_DIR, exist_ok=True)
+            file_hash = await get_audio_hasher().hash_file_async(source_audio_path)
 
-            cached_wav_filename = f"{file_hash}_{Path(source_audio_path).stem}.wav"
-            cached_wav_path = os.path.join(WAV_CACHE_DIR, cached_wav_filename)
-
-            if os.path.exists(cached_wav_path):
-                file_age = time.time() - os.path.getmtime(cached_wav_path)
-                if file_age < 604800:
-                    audio_path_to_read = cached_wav_path
-                    temp_wav_path = cached_wav_path
-                    cache_used = True
-                else:
-                    os.remove(cached_wav_path)
-
-            if not cache_used:
+            def convert(wav_path):
                 cmd = [
                     'ffmpeg', '-i', source_audio_path,
                     '-ar', '16000', '-ac', '1', '-y',
-                    cached_wav_path
+                    wav_path
                 ]
+                subprocess.run(cmd, capture_output=True, timeout=30, check=True)
 
-                result = subprocess.run(cmd, capture_output=True, timeout=30)
-
-                if result.returncode != 0:
-                    return None
+            store = get_artifact_store()
+            try:
+                cached_wav_path = await asyncio.to_thread(
+                    store.get_or_create, file_hash, WAV_CACHE_TRANSFORM, '.wav', convert
+                )
+            except subprocess.SubprocessError:
+                cached_wav_path = None
+            if cached_wav_path is None:
+                return None
 
-                audio_path_to_read = cached_wav_path
-                temp_wav_path = cached_wav_path
+            audio_path_to_read = cached_wav_path
 
-        audio_data, sample_rate = sf.read(audio_path_to_read)
+        with store.pinned(audio_path_to_read) if needs_convert else nullcontext():
+            audio_data, sample_rate = sf.read(audio_path_to_read)
 
         # ═══════════════════════════════════════════════════════════════
         # STRATÉGIE : Concaténer les segments TRANSCRITS les plus longs
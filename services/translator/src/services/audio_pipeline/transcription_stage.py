@@ -139,7 +139,8 @@ class TranscriptionStage:
         audio_duration_ms: int = 0,
         user_language: Optional[str] = None,
         metadata: Optional[AudioMessageMetadata] = None,
-        use_cache: bool = True
+        use_cache: bool = True,
+        audio_hash: Optional[str] = None
     ) -> TranscriptionStageResult:
         """
         Process audio transcription with caching.
@@ -160,6 +161,8 @@ class TranscriptionStage:
             user_language: Langue définie par l'utilisateur (fallback si audio court ou confiance basse)
             metadata: Optional mobile metadata
             use_cache: Enable cache lookup/storage
+            audio_hash: Content hash already computed from the in-memory
+                        ZMQ frame (skips re-reading the file)
 
         Returns:
             TranscriptionStageResult with text, language, confidence
@@ -177,7 +180,7 @@ class TranscriptionStage:
         # ═══════════════════════════════════════════════════════════════
         # STEP 1: COMPUTE AUDIO HASH (cache key)
         # ═══════════════════════════════════════════════════════════════
-        audio_hash = await self._compute_audio_hash(attachment_id, audio_path)
+        audio_hash = await self._compute_audio_hash(attachment_id, audio_path, audio_hash)
         logger.info(f"[TRANSCRIPTION_STAGE] 🔑 Audio hash: {audio_hash[:8]}...")
 
         # ═══════════════════════════════════════════════════════════════
@@ -295,9 +298,18 @@ class TranscriptionStage:
     async def _compute_audio_hash(
         self,
         attachment_id: str,
-        audio_path: str
+        audio_path: str,
+        audio_hash: Optional[str] = None
     ) -> str:
-        """Compute or retrieve audio hash for cache key"""
+        """Compute or retrieve audio hash for cache key (file hashed off the event loop)"""
+        if audio_hash:
+            # Hash computed from the ZMQ frame: only record the attachment mapping
+            try:
+                await self.audio_cache.remember_audio_hash(attachment_id, audio_hash)
+            except Exception as e:
+                logger.debug(f"[TRANSCRIPTION_STAGE] Hash mapping not stored: {e}")
+            return audio_hash
+
         try:
             audio_hash = await self.audio_cache.get_or_compute_audio_hash(
                 attachment_id,
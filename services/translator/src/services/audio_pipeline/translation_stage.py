@@ -316,6 +316,14 @@ class TranslationStage:
             f"{languages_to_process}"
         )
 
+        # Multi-target: source text encoded once for every language to process
+        pretranslated = await self._prefetch_translations(
+            text=source_text,
+            source_language=source_language,
+            target_languages=languages_to_process,
+            model_type=model_type
+        )
+
         # Parallel processing with ThreadPoolExecutor
         parallel_start = time.time()
         results = await self._process_languages_parallel(
@@ -331,7 +339,8 @@ class TranslationStage:
             max_workers=max_workers,
             source_audio_path=source_audio_path,
             on_translation_ready=on_translation_ready,
-            target_languages=target_languages
+            target_languages=target_languages,
+            pretranslated=pretranslated
         )
         parallel_time = int((time.time() - parallel_start) * 1000)
 
@@ -406,13 +415,16 @@ class TranslationStage:
         max_workers: int,
         source_audio_path: Optional[str] = None,
         on_translation_ready: Optional[any] = None,
-        target_languages: Optional[List[str]] = None
+        target_languages: Optional[List[str]] = None,
+        pretranslated: Optional[Dict[str, str]] = None
     ) -> Dict[str, Optional[TranslatedAudioVersion]]:
         """
         Process languages in parallel using ThreadPoolExecutor.
 
         True parallelization via separate event loops per thread.
+        Languages present in `pretranslated` skip the text translation step.
         """
+        pretranslated = pretranslated or {}
         tasks = [(lang, cloning_params) for lang in languages]
 
         def run_tasks():
@@ -434,7 +446,8 @@ class TranslationStage:
                         lang_cloning_params,
                         source_audio_path,
                         on_translation_ready,
-                        target_languages
+                        target_languages,
+                        pretranslated.get(lang)
                     ): lang
                     for lang, lang_cloning_params in tasks
                 }
@@ -475,7 +488,8 @@ class TranslationStage:
         cloning_params: Optional[Dict[str, Any]],
         source_audio_path: Optional[str] = None,
         on_translation_ready: Optional[any] = None,
-        target_languages: Optional[List[str]] = None
+        target_languages: Optional[List[str]] = None,
+        pretranslated_text: Optional[str] = None
     ) -> Tuple[str, Optional[TranslatedAudioVersion]]:
         """
         Process a single language synchronously (for ThreadPoolExecutor).
@@ -504,7 +518,8 @@ class TranslationStage:
                         lang_start=lang_start,
                         source_audio_path=source_audio_path,
                         on_translation_ready=on_translation_ready,
-                        target_languages=target_languages
+                        target_languages=target_languages,
+                        pretranslated_text=pretranslated_text
                     )
                 )
                 return result
@@ -531,24 +546,28 @@ class TranslationStage:
         lang_start: float,
         source_audio_path: Optional[str] = None,
         on_translation_ready: Optional[any] = None,
-        target_languages: Optional[List[str]] = None
+        target_languages: Optional[List[str]] = None,
+        pretranslated_text: Optional[str] = None
     ) -> Tuple[str, Optional[TranslatedAudioVersion]]:
         """
         Process single language: translate + TTS + cache.
 
         Pipeline:
-        1. Translate text (with cache)
+        1. Translate text (with cache), unless already translated upstream
         2. Generate TTS audio
         3. Store in cache
         """
         try:
             # 1. Translate text
-            translated_text = await self._translate_text_with_cache(
-                text=source_text,
-                source_language=source_language,
-                target_language=target_lang,
-                model_type=model_type
-            )
+            if pretranslated_text is not None:
+                translated_text = pretranslated_text
+            else:
+                translated_text = await self._translate_text_with_cache(
+                    text=source_text,
+                    source_language=source_language,
+                    target_language=target_lang,
+                    model_type=model_type
+                )
 
             # 2. Generate TTS audio
             if voice_model:
@@ -727,6 +746,127 @@ class TranslationStage:
             traceback.print_exc()
             return (target_lang, None)
 
+    async def _prefetch_translations(
+        self,
+        text: str,
+        source_language: str,
+        target_languages: List[str],
+        model_type: str
+    ) -> Dict[str, str]:
+        """
+        Translate text to all target languages in one multi-target call.
+
+        The ML service encodes the source once and only decodes per language.
+        Best effort: languages missing from the result are translated later
+        by each language thread (_translate_text_with_cache).
+        """
+        translated: Dict[str, str] = {}
+        if len(target_languages) < 2 or not asyncio.iscoroutinefunction(
+            getattr(self.translation_service, 'translate_multilingual', None)
+        ):
+            return translated
+
+        try:
+            missing: List[str] = []
+            cached_by_lang = await self._get_cached_translations(
+                text, source_language, target_languages, model_type
+            )
+            for lang in target_languages:
+                cached = cached_by_lang.get(lang)
+                if cached:
+                    translated[lang] = cached.get("translated_text", text)
+                else:
+                    missing.append(lang)
+
+            if not missing:
+                return translated
+
+            results = await self.translation_service.translate_multilingual(
+                text=text,
+                source_language=source_language,
+                target_languages=missing,
+                model_type=model_type,
+                source_channel="audio_pipeline"
+            )
+        except Exception as e:
+            logger.warning(f"[TRANSLATION_STAGE] Multilingual prefetch failed: {e}")
+            return translated
+
+        fresh: Dict[str, str] = {}
+        for lang in missing:
+            result = (results or {}).get(lang)
+            if not isinstance(result, dict) or 'translated_text' not in result:
+                continue
+            fresh[lang] = result['translated_text']
+        translated.update(fresh)
+        await self._cache_translations(text, source_language, fresh, model_type)
+
+        logger.info(
+            f"[TRANSLATION_STAGE] ⚡ Multilingual prefetch: "
+            f"{len(translated)}/{len(target_languages)} languages translated"
+        )
+        return translated
+
+    async def _get_cached_translations(
+        self,
+        text: str,
+        source_language: str,
+        target_languages: List[str],
+        model_type: str
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Cached translations of one text for several languages (one MGET)."""
+        if asyncio.iscoroutinefunction(
+            getattr(self.translation_cache, 'get_translations_for_targets', None)
+        ):
+            return await self.translation_cache.get_translations_for_targets(
+                text=text,
+                source_lang=source_language,
+                target_langs=target_languages,
+                model_type=model_type
+            )
+
+        return {
+            lang: await self.translation_cache.get_translation(
+                text=text,
+                source_lang=source_language,
+                target_lang=lang,
+                model_type=model_type
+            )
+            for lang in target_languages
+        }
+
+    async def _cache_translations(
+        self,
+        text: str,
+        source_language: str,
+        translations: Dict[str, str],
+        model_type: str
+    ) -> None:
+        """Cache translations of one text for several languages (pipelined SETEX)."""
+        if not translations:
+            return
+
+        if asyncio.iscoroutinefunction(
+            getattr(self.translation_cache, 'set_translations_batch', None)
+        ):
+            await self.translation_cache.set_translations_batch(
+                items=[
+                    (text, source_language, lang, translated)
+                    for lang, translated in translations.items()
+                ],
+                model_type=model_type
+            )
+            return
+
+        for lang, translated in translations.items():
+            await self.translation_cache.set_translation(
+                text=text,
+                source_lang=source_language,
+                target_lang=lang,
+                translated_text=translated,
+                model_type=model_type
+            )
+
     async def _translate_text_with_cache(
         self,
         text: str,
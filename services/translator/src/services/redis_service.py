@@ -19,10 +19,15 @@ import time
 import json
 import re
 from collections import OrderedDict
-from typing import Optional, Dict, Any, List
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Iterator, List, Tuple, Union, AsyncIterator
 from dataclasses import dataclass
 from datetime import datetime
 
+from utils.circuit_breaker import CircuitBreaker
+from utils.consistent_hash import HashRing
+from utils.performance import PerformanceConfig
+
 logger = logging.getLogger(__name__)
 
 MAX_MEMORY_CACHE_SIZE = 500
@@ -41,7 +46,7 @@ except ImportError:
 @dataclass
 class CacheEntry:
     """Entrée de cache avec expiration"""
-    value: str
+    value: Union[str, bytes]
     expires_at: float  # timestamp
 
 
@@ -50,10 +55,18 @@ class RedisService:
     Service Redis avec fallback automatique sur cache mémoire
 
     Fonctionnalités:
-    - Connexion Redis async avec retry
+    - Connexion Redis async, pool borné (`redis_max_connections`)
+    - Disjoncteur: après N erreurs consécutives, bascule en mémoire et
+      reconnexion en arrière-plan (sonde semi-ouverte, backoff exponentiel)
+    - Write-behind: les clés écrites en mémoire pendant la coupure sont
+      rejouées dans Redis à la reconnexion (TTL restant conservé)
+    - Latence et erreurs par opération (get_stats)
     - Fallback automatique sur cache mémoire
     - Nettoyage automatique des entrées expirées
-    - Méthodes: get, set, setex, delete, keys
+    - Méthodes: get, set, setex, delete, keys, scan_iter
+    - Sorted sets (index secondaires): zadd, zrem, zrangebyscore, zcard
+    - Valeurs binaires (codec de cache): écrites telles quelles, relues via
+      un client sans décodage UTF-8 (`binary=True`)
     """
 
     _instance = None
@@ -71,16 +84,53 @@ class RedisService:
 
         self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379")
         self.redis: Optional[aioredis.Redis] = None
+        self.redis_raw: Optional[aioredis.Redis] = None  # decode_responses=False
         self.memory_cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.memory_zsets: Dict[str, Dict[str, float]] = {}  # fallback des sorted sets
         self.is_redis_available = False
+        # Seulement si redis-py est absent: une coupure Redis ouvre le disjoncteur
         self.permanently_disabled = not REDIS_AVAILABLE
         self.connection_attempts = 0
-        self.max_connection_attempts = 3
+
+        config = PerformanceConfig()
+        self.max_connections = config.redis_max_connections
+        self.max_connection_attempts = config.redis_breaker_failure_threshold
+        self.breaker = CircuitBreaker(
+            "REDIS",
+            failure_threshold=config.redis_breaker_failure_threshold,
+            reset_timeout_s=config.redis_breaker_reset_s,
+            max_reset_timeout_s=config.redis_breaker_max_reset_s
+        )
+        self._reconnect_task: Optional[asyncio.Task] = None
+
+        # Write-behind: clé -> 'set' | 'delete' | 'zset' écrite en mémoire pendant la coupure
+        self.replay_max_keys = config.redis_replay_max_keys
+        self._pending_replay: OrderedDict[str, str] = OrderedDict()
+        self._pending_zrem: Dict[str, set] = {}
+
+        # Métriques par opération: op -> {count, errors, total_ms, max_ms}
+        self.op_metrics: Dict[str, Dict[str, float]] = {}
+        self.replay_stats = {'reconnects': 0, 'replayed': 0, 'dropped': 0}
+
         self._cleanup_task: Optional[asyncio.Task] = None
         self._initialized = True
 
         logger.info(f"[REDIS] Service initialisé: url={self.redis_url}")
 
+    @classmethod
+    def create_node(cls, redis_url: str) -> "RedisService":
+        """
+        Instance hors singleton pour un nœud d'un cache shardé
+
+        Chaque nœud a son pool, son disjoncteur, son fallback mémoire et son
+        write-behind: une coupure ne dégrade que son shard.
+        """
+        node = super().__new__(cls)
+        node._initialized = False
+        node.__init__(redis_url)
+        node.breaker.name = f"REDIS {redis_url}"
+        return node
+
     async def initialize(self) -> bool:
         """Initialise la connexion Redis"""
         if self.permanently_disabled:
@@ -89,20 +139,9 @@ class RedisService:
             return True
 
         try:
-            self.redis = aioredis.from_url(
-                self.redis_url,
-                encoding="utf-8",
-                decode_responses=True,
-                socket_connect_timeout=5,
-                socket_timeout=5,
-                retry_on_timeout=False
-            )
-
-            # Test de connexion
-            await self.redis.ping()
-            self.is_redis_available = True
-            self.connection_attempts = 0
-            logger.info("[REDIS] ✅ Redis connecté avec succès")
+            await self._connect()
+            self.breaker.record_success()
+            logger.info(f"[REDIS] ✅ Redis connecté avec succès (pool: {self.max_connections} connexions)")
 
             # Démarrer le nettoyage mémoire en backup
             self._start_memory_cleanup()
@@ -112,16 +151,77 @@ class RedisService:
             self.connection_attempts += 1
             # Log seulement le type et message pour éviter problème event loop
             error_msg = f"{type(e).__name__}: {str(e)}"
-            logger.warning(f"[REDIS] ⚠️ Connexion échouée ({self.connection_attempts}/{self.max_connection_attempts}): {error_msg}")
-
-            if self.connection_attempts >= self.max_connection_attempts:
-                self.permanently_disabled = True
-                logger.warning("[REDIS] ⚠️ Max tentatives atteintes - mode cache mémoire permanent")
+            logger.warning(f"[REDIS] ⚠️ Connexion échouée ({self.connection_attempts}): {error_msg} - reconnexion en arrière-plan")
 
+            # Redis peut démarrer après nous: cache mémoire en attendant la reconnexion
             self.is_redis_available = False
+            self.breaker.trip()
+            self._start_reconnect()
             self._start_memory_cleanup()
             return True  # On continue avec le cache mémoire
 
+    async def _connect(self) -> None:
+        """Crée les clients (pool borné) si besoin et vérifie la connexion (PING)"""
+        if self.redis is None:
+            self.redis = aioredis.from_url(
+                self.redis_url,
+                encoding="utf-8",
+                decode_responses=True,
+                socket_connect_timeout=5,
+                socket_timeout=5,
+                retry_on_timeout=False,
+                max_connections=self.max_connections
+            )
+
+        # Test de connexion
+        await self.redis.ping()
+
+        if self.redis_raw is None:
+            # Client sans décodage pour les valeurs binaires du codec de cache
+            self.redis_raw = aioredis.from_url(
+                self.redis_url,
+                decode_responses=False,
+                socket_connect_timeout=5,
+                socket_timeout=5,
+                retry_on_timeout=False,
+                max_connections=self.max_connections
+            )
+
+        self.is_redis_available = True
+        self.connection_attempts = 0
+
+    def _start_reconnect(self) -> None:
+        """Lance la reconnexion en arrière-plan (une seule à la fois)"""
+        if self.permanently_disabled:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = loop.create_task(self._reconnect_loop())
+
+    async def _reconnect_loop(self) -> None:
+        """Sonde Redis à l'échéance du disjoncteur jusqu'à reconnexion, puis rejoue le write-behind"""
+        while not self.is_redis_available and not self.permanently_disabled:
+            await asyncio.sleep(max(0.05, self.breaker.time_until_retry()))
+            if not self.breaker.allow_request():
+                continue
+            try:
+                await self._connect()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.connection_attempts += 1
+                self.breaker.record_failure()
+                logger.debug(f"[REDIS] Reconnexion échouée ({type(e).__name__}), tentative {self.connection_attempts}")
+                continue
+
+            self.breaker.record_success()
+            self.replay_stats['reconnects'] += 1
+            logger.info("[REDIS] ✅ Redis reconnecté - retour en mode Redis")
+            await self._replay_write_behind()
+
     def _start_memory_cleanup(self):
         """Démarre le nettoyage automatique du cache mémoire"""
         try:
@@ -154,13 +254,20 @@ class RedisService:
             except Exception as e:
                 logger.error(f"[REDIS] Erreur cleanup: {e}")
 
-    async def get(self, key: str) -> Optional[str]:
-        """Récupère une valeur (Redis ou mémoire)"""
+    async def get(self, key: str, binary: bool = False) -> Optional[Union[str, bytes]]:
+        """
+        Récupère une valeur (Redis ou mémoire)
+
+        Args:
+            key: Clé
+            binary: Lire sans décodage UTF-8 (valeurs du codec de cache)
+        """
         # Essayer Redis si disponible
-        if not self.permanently_disabled and self.is_redis_available and self.redis:
+        if self._redis_ready():
             try:
-                value = await self.redis.get(key)
-                return value
+                with self._track("get"):
+                    value = await self._client(binary).get(key)
+                    return value
             except Exception as e:
                 # Log seulement le type pour éviter problème event loop
                 # Ne pas essayer de convertir en string car l'exception peut contenir
@@ -170,6 +277,16 @@ class RedisService:
                 self._handle_redis_error()
 
         # Fallback cache mémoire (LRU: move to end on access)
+        return self._memory_get(key)
+
+    def _client(self, binary: bool) -> "aioredis.Redis":
+        """Client Redis: sans décodage pour les lectures binaires si disponible"""
+        if binary and self.redis_raw is not None:
+            return self.redis_raw
+        return self.redis
+
+    def _memory_get(self, key: str) -> Optional[Union[str, bytes]]:
+        """Lecture cache mémoire (LRU, entrées expirées supprimées)"""
         entry = self.memory_cache.get(key)
         if entry and entry.expires_at > time.time():
             self.memory_cache.move_to_end(key)
@@ -180,16 +297,17 @@ class RedisService:
 
         return None
 
-    async def set(self, key: str, value: str, ex: int = None) -> bool:
+    async def set(self, key: str, value: Union[str, bytes], ex: int = None) -> bool:
         """Définit une valeur (Redis ou mémoire)"""
         # Essayer Redis si disponible
-        if not self.permanently_disabled and self.is_redis_available and self.redis:
+        if self._redis_ready():
             try:
-                if ex:
-                    await self.redis.setex(key, ex, value)
-                else:
-                    await self.redis.set(key, value)
-                return True
+                with self._track("set"):
+                    if ex:
+                        await self.redis.setex(key, ex, value)
+                    else:
+                        await self.redis.set(key, value)
+                    return True
             except Exception as e:
                 # Log seulement le type pour éviter problème event loop
                 error_type = type(e).__name__
@@ -197,24 +315,30 @@ class RedisService:
                 self._handle_redis_error()
 
         # Fallback cache mémoire (LRU, bounded)
+        self._memory_set(key, value, ex)
+        self._note_pending(key, 'set')
+        return True
+
+    def _memory_set(self, key: str, value: Union[str, bytes], ex: int = None) -> None:
+        """Écriture cache mémoire (LRU borné à MAX_MEMORY_CACHE_SIZE)"""
         expires_at = time.time() + (ex if ex else 3600)  # 1 heure par défaut
         self.memory_cache[key] = CacheEntry(value=value, expires_at=expires_at)
         self.memory_cache.move_to_end(key)
         while len(self.memory_cache) > MAX_MEMORY_CACHE_SIZE:
             self.memory_cache.popitem(last=False)
-        return True
 
-    async def setex(self, key: str, seconds: int, value: str) -> bool:
+    async def setex(self, key: str, seconds: int, value: Union[str, bytes]) -> bool:
         """Définit une valeur avec expiration"""
         return await self.set(key, value, ex=seconds)
 
     async def delete(self, key: str) -> bool:
         """Supprime une clé"""
         # Essayer Redis si disponible
-        if not self.permanently_disabled and self.is_redis_available and self.redis:
+        if self._redis_ready():
             try:
-                await self.redis.delete(key)
-                return True
+                with self._track("delete"):
+                    await self.redis.delete(key)
+                    return True
             except Exception as e:
                 # Log seulement le type pour éviter problème event loop
                 error_type = type(e).__name__
@@ -224,15 +348,17 @@ class RedisService:
         # Fallback cache mémoire
         if key in self.memory_cache:
             del self.memory_cache[key]
+        self._note_pending(key, 'delete')
         return True
 
     async def keys(self, pattern: str) -> List[str]:
         """Récupère les clés correspondant à un pattern"""
         # Essayer Redis si disponible
-        if not self.permanently_disabled and self.is_redis_available and self.redis:
+        if self._redis_ready():
             try:
-                keys = await self.redis.keys(pattern)
-                return keys
+                with self._track("keys"):
+                    keys = await self.redis.keys(pattern)
+                    return keys
             except Exception as e:
                 # Log seulement le type pour éviter problème event loop
                 error_type = type(e).__name__
@@ -247,9 +373,10 @@ class RedisService:
     async def exists(self, key: str) -> bool:
         """Vérifie si une clé existe"""
         # Essayer Redis si disponible
-        if not self.permanently_disabled and self.is_redis_available and self.redis:
+        if self._redis_ready():
             try:
-                return await self.redis.exists(key) > 0
+                with self._track("exists"):
+                    return await self.redis.exists(key) > 0
             except Exception as e:
                 # Log seulement le type pour éviter problème event loop
                 error_type = type(e).__name__
@@ -262,12 +389,225 @@ class RedisService:
             return True
         return False
 
+    # ─────────────────────────────────────────────────────────────────────────
+    # OPÉRATIONS GROUPÉES - un aller-retour Redis pour N clés
+    # ─────────────────────────────────────────────────────────────────────────
+
+    async def mget(self, keys: List[str], binary: bool = False) -> List[Optional[Union[str, bytes]]]:
+        """Récupère plusieurs valeurs en un seul MGET (même ordre que `keys`)"""
+        if not keys:
+            return []
+
+        if self._redis_ready():
+            try:
+                with self._track("mget"):
+                    return list(await self._client(binary).mget(keys))
+            except Exception as e:
+                # Log seulement le type pour éviter problème event loop
+                error_type = type(e).__name__
+                logger.warning(f"[REDIS] Erreur mget ({error_type}) - fallback mémoire")
+                self._handle_redis_error()
+
+        # Fallback cache mémoire
+        return [self._memory_get(key) for key in keys]
+
+    async def setex_many(self, mapping: Dict[str, Union[str, bytes]], seconds: int) -> bool:
+        """Définit plusieurs valeurs avec expiration (SETEX pipelinés, un aller-retour)"""
+        if not mapping:
+            return True
+
+        if self._redis_ready():
+            try:
+                with self._track("setex_many"):
+                    async with self.redis.pipeline(transaction=False) as pipe:
+                        for key, value in mapping.items():
+                            pipe.setex(key, seconds, value)
+                        await pipe.execute()
+                    return True
+            except Exception as e:
+                # Log seulement le type pour éviter problème event loop
+                error_type = type(e).__name__
+                logger.warning(f"[REDIS] Erreur setex_many ({error_type}) - fallback mémoire")
+                self._handle_redis_error()
+
+        # Fallback cache mémoire
+        for key, value in mapping.items():
+            self._memory_set(key, value, seconds)
+            self._note_pending(key, 'set')
+        return True
+
+    async def exists_many(self, keys: List[str]) -> List[bool]:
+        """Vérifie l'existence de plusieurs clés (EXISTS pipelinés, un aller-retour)"""
+        if not keys:
+            return []
+
+        if self._redis_ready():
+            try:
+                with self._track("exists_many"):
+                    async with self.redis.pipeline(transaction=False) as pipe:
+                        for key in keys:
+                            pipe.exists(key)
+                        counts = await pipe.execute()
+                    return [count > 0 for count in counts]
+            except Exception as e:
+                # Log seulement le type pour éviter problème event loop
+                error_type = type(e).__name__
+                logger.warning(f"[REDIS] Erreur exists_many ({error_type}) - fallback mémoire")
+                self._handle_redis_error()
+
+        # Fallback cache mémoire
+        now = time.time()
+        return [
+            key in self.memory_cache and self.memory_cache[key].expires_at > now
+            for key in keys
+        ]
+
+    async def scan_iter(self, match: str, count: int = 500) -> AsyncIterator[str]:
+        """
+        Itère les clés correspondant à un pattern (SCAN par curseur).
+
+        Contrairement à KEYS, ne bloque pas Redis: chaque appel SCAN ne
+        parcourt qu'environ `count` entrées.
+        """
+        if self._redis_ready():
+            try:
+                with self._track("scan"):
+                    async for key in self.redis.scan_iter(match=match, count=count):
+                        yield key
+                    return
+            except Exception as e:
+                # Log seulement le type pour éviter problème event loop
+                error_type = type(e).__name__
+                logger.warning(f"[REDIS] Erreur scan ({error_type}) - fallback mémoire")
+                self._handle_redis_error()
+
+        # Fallback cache mémoire avec regex (instantané des clés)
+        regex = re.compile("^" + match.replace("*", ".*") + "$")
+        now = time.time()
+        for key, entry in list(self.memory_cache.items()):
+            if entry.expires_at > now and regex.match(key):
+                yield key
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # SORTED SETS - index secondaires (fallback: dict membre -> score)
+    # ─────────────────────────────────────────────────────────────────────────
+
+    async def zadd(self, key: str, mapping: Dict[str, float]) -> bool:
+        """Ajoute/met à jour des membres avec leur score"""
+        if not mapping:
+            return True
+
+        if self._redis_ready():
+            try:
+                with self._track("zadd"):
+                    await self.redis.zadd(key, mapping)
+                    return True
+            except Exception as e:
+                # Log seulement le type pour éviter problème event loop
+                error_type = type(e).__name__
+                logger.warning(f"[REDIS] Erreur zadd ({error_type}) - fallback mémoire")
+                self._handle_redis_error()
+
+        self.memory_zsets.setdefault(key, {}).update(
+            {member: float(score) for member, score in mapping.items()}
+        )
+        self._note_pending(key, 'zset')
+        return True
+
+    async def zrem(self, key: str, members: List[str]) -> bool:
+        """Retire des membres d'un sorted set"""
+        if not members:
+            return True
+
+        if self._redis_ready():
+            try:
+                with self._track("zrem"):
+                    await self.redis.zrem(key, *members)
+                    return True
+            except Exception as e:
+                # Log seulement le type pour éviter problème event loop
+                error_type = type(e).__name__
+                logger.warning(f"[REDIS] Erreur zrem ({error_type}) - fallback mémoire")
+                self._handle_redis_error()
+
+        zset = self.memory_zsets.get(key, {})
+        for member in members:
+            zset.pop(member, None)
+        self._note_pending(key, 'zset', removed=members)
+        return True
+
+    async def zrangebyscore(
+        self,
+        key: str,
+        min_score: float,
+        max_score: float,
+        start: int = 0,
+        num: int = 100
+    ) -> List[Tuple[str, float]]:
+        """Membres de score dans [min_score, max_score], triés (score, membre), paginés"""
+        if self._redis_ready():
+            try:
+                with self._track("zrangebyscore"):
+                    return [
+                        (member, float(score))
+                        for member, score in await self.redis.zrangebyscore(
+                            key, min_score, max_score, start=start, num=num, withscores=True
+                        )
+                    ]
+            except Exception as e:
+                # Log seulement le type pour éviter problème event loop
+                error_type = type(e).__name__
+                logger.warning(f"[REDIS] Erreur zrangebyscore ({error_type}) - fallback mémoire")
+                self._handle_redis_error()
+
+        items = sorted(
+            ((member, score) for member, score in self.memory_zsets.get(key, {}).items()
+             if min_score <= score <= max_score),
+            key=lambda item: (item[1], item[0])
+        )
+        return items[start:start + num]
+
+    async def zremrangebyscore(self, key: str, min_score: float, max_score: float) -> int:
+        """Retire les membres de score dans [min_score, max_score]"""
+        if self._redis_ready():
+            try:
+                with self._track("zremrangebyscore"):
+                    return int(await self.redis.zremrangebyscore(key, min_score, max_score))
+            except Exception as e:
+                # Log seulement le type pour éviter problème event loop
+                error_type = type(e).__name__
+                logger.warning(f"[REDIS] Erreur zremrangebyscore ({error_type}) - fallback mémoire")
+                self._handle_redis_error()
+
+        zset = self.memory_zsets.get(key, {})
+        removed = [member for member, score in zset.items() if min_score <= score <= max_score]
+        for member in removed:
+            del zset[member]
+        if removed:
+            self._note_pending(key, 'zset', removed=removed)
+        return len(removed)
+
+    async def zcard(self, key: str) -> int:
+        """Nombre de membres d'un sorted set"""
+        if self._redis_ready():
+            try:
+                with self._track("zcard"):
+                    return int(await self.redis.zcard(key))
+            except Exception as e:
+                # Log seulement le type pour éviter problème event loop
+                error_type = type(e).__name__
+                logger.warning(f"[REDIS] Erreur zcard ({error_type}) - fallback mémoire")
+                self._handle_redis_error()
+
+        return len(self.memory_zsets.get(key, {}))
+
     async def ttl(self, key: str) -> int:
         """Récupère le TTL d'une clé en secondes"""
         # Essayer Redis si disponible
-        if not self.permanently_disabled and self.is_redis_available and self.redis:
+        if self._redis_ready():
             try:
-                return await self.redis.ttl(key)
+                with self._track("ttl"):
+                    return await self.redis.ttl(key)
             except Exception as e:
                 # Log seulement le type pour éviter problème event loop
                 error_type = type(e).__name__
@@ -281,13 +621,104 @@ class RedisService:
             return max(0, remaining)
         return -2  # Clé n'existe pas
 
+    def _redis_ready(self) -> bool:
+        """Redis utilisable pour cette opération (sinon fallback mémoire)"""
+        return not self.permanently_disabled and self.is_redis_available and self.redis is not None
+
+    @contextmanager
+    def _track(self, op: str) -> Iterator[None]:
+        """Mesure la latence d'une opération Redis; un succès remet le disjoncteur à zéro"""
+        metrics = self.op_metrics.get(op)
+        if metrics is None:
+            metrics = self.op_metrics[op] = {'count': 0, 'errors': 0, 'total_ms': 0.0, 'max_ms': 0.0}
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            metrics['errors'] += 1
+            raise
+        else:
+            self.breaker.record_success()
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            metrics['count'] += 1
+            metrics['total_ms'] += elapsed_ms
+            metrics['max_ms'] = max(metrics['max_ms'], elapsed_ms)
+
     def _handle_redis_error(self):
-        """Gère une erreur Redis"""
+        """Gère une erreur Redis: au seuil du disjoncteur, bascule en mémoire et reconnecte en arrière-plan"""
         self.connection_attempts += 1
-        if self.connection_attempts >= self.max_connection_attempts:
-            self.permanently_disabled = True
+        self.breaker.record_failure()
+        if self.breaker.state != "closed" and self.is_redis_available:
             self.is_redis_available = False
-            logger.warning("[REDIS] ⚠️ Trop d'erreurs - passage permanent en cache mémoire")
+            logger.warning("[REDIS] ⚠️ Trop d'erreurs - cache mémoire jusqu'à la reconnexion")
+            self._start_reconnect()
+
+    # ─────────────────────────────────────────────────────────────────────────
+    # WRITE-BEHIND - écritures mémoire pendant la coupure, rejouées ensuite
+    # ─────────────────────────────────────────────────────────────────────────
+
+    def _note_pending(self, key: str, kind: str, removed: Optional[List[str]] = None) -> None:
+        """Mémorise une écriture faite en mémoire alors que Redis est attendu (`removed`: membres ZREM)"""
+        if self.permanently_disabled or self.replay_max_keys <= 0:
+            return
+        if removed:
+            self._pending_zrem.setdefault(key, set()).update(removed)
+        self._pending_replay[key] = kind
+        self._pending_replay.move_to_end(key)
+        while len(self._pending_replay) > self.replay_max_keys:
+            dropped, _ = self._pending_replay.popitem(last=False)
+            self._pending_zrem.pop(dropped, None)
+            self.replay_stats['dropped'] += 1
+
+    async def _replay_write_behind(self) -> int:
+        """
+        Rejoue dans Redis les écritures faites en mémoire pendant la coupure
+
+        Les valeurs gardent leur TTL restant; les clés évincées du cache
+        mémoire entre-temps sont perdues (elles seront recalculées).
+
+        Returns:
+            Nombre de clés rejouées
+        """
+        if not self._pending_replay:
+            return 0
+        pending, self._pending_replay = self._pending_replay, OrderedDict()
+        zrems, self._pending_zrem = self._pending_zrem, {}
+
+        now = time.time()
+        replayed = 0
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, kind in pending.items():
+                    if kind == 'set':
+                        entry = self.memory_cache.get(key)
+                        if entry is None or entry.expires_at <= now:
+                            continue
+                        pipe.setex(key, max(1, int(entry.expires_at - now)), entry.value)
+                    elif kind == 'delete':
+                        pipe.delete(key)
+                    elif kind == 'zset':
+                        if zrems.get(key):
+                            pipe.zrem(key, *zrems[key])
+                        if self.memory_zsets.get(key):
+                            pipe.zadd(key, self.memory_zsets[key])
+                    replayed += 1
+                await pipe.execute()
+        except Exception as e:
+            # Redis retombé pendant le rejeu: les clés restent en attente
+            for key, kind in pending.items():
+                self._pending_replay.setdefault(key, kind)
+            for key, members in zrems.items():
+                self._pending_zrem.setdefault(key, set()).update(members)
+            logger.warning(f"[REDIS] ⚠️ Rejeu write-behind interrompu ({type(e).__name__})")
+            self._handle_redis_error()
+            return 0
+
+        self.replay_stats['replayed'] += replayed
+        if replayed:
+            logger.info(f"[REDIS] 🔁 {replayed} écritures rejouées dans Redis après reconnexion")
+        return replayed
 
     def is_available(self) -> bool:
         """Vérifie si Redis est disponible"""
@@ -300,11 +731,32 @@ class RedisService:
             "redis_available": self.is_available(),
             "memory_entries": len(self.memory_cache),
             "permanently_disabled": self.permanently_disabled,
-            "connection_attempts": self.connection_attempts
+            "connection_attempts": self.connection_attempts,
+            "max_connections": self.max_connections,
+            "circuit": self.breaker.get_stats(),
+            "pending_replay": len(self._pending_replay),
+            **self.replay_stats,
+            "operations": {
+                op: {
+                    "count": int(m['count']),
+                    "errors": int(m['errors']),
+                    "avg_ms": round(m['total_ms'] / m['count'], 3) if m['count'] else 0.0,
+                    "max_ms": round(m['max_ms'], 3)
+                }
+                for op, m in self.op_metrics.items()
+            }
         }
 
     async def close(self):
         """Ferme la connexion Redis et nettoie"""
+        if self._reconnect_task:
+            self._reconnect_task.cancel()
+            try:
+                await self._reconnect_task
+            except asyncio.CancelledError:
+                pass
+            self._reconnect_task = None
+
         if self._cleanup_task:
             self._cleanup_task.cancel()
             try:
@@ -316,16 +768,230 @@ class RedisService:
             await self.redis.close()
             self.redis = None
 
+        if self.redis_raw:
+            await self.redis_raw.close()
+            self.redis_raw = None
+
         self.memory_cache.clear()
+        self.memory_zsets.clear()
+        self._pending_replay.clear()
+        self._pending_zrem.clear()
         logger.info("[REDIS] 🛑 Service Redis fermé")
 
 
+class ShardedRedisService:
+    """
+    Cache Redis réparti sur plusieurs nœuds par hachage cohérent
+
+    Même interface que RedisService (get/set/mget/setex_many/...), chaque
+    clé routée vers son nœud par un anneau à nœuds virtuels. Les opérations
+    multi-clés sont découpées par nœud et exécutées en parallèle.
+
+    Un nœud perdu n'est pas retiré de l'anneau: son shard passe sur son
+    fallback mémoire (disjoncteur propre) puis rejoue ses écritures à la
+    reconnexion, sans remapper les clés des autres nœuds.
+    """
+
+    def __init__(self, node_urls: List[str], vnodes: int = 160):
+        """
+        Initialise un RedisService par nœud
+
+        Args:
+            node_urls: URLs Redis des nœuds
+            vnodes: Points par nœud sur l'anneau
+        """
+        self.nodes: Dict[str, RedisService] = {url: RedisService.create_node(url) for url in node_urls}
+        self.ring = HashRing(self.nodes.keys(), vnodes=vnodes)
+        logger.info(f"[REDIS] Cache shardé: {len(self.nodes)} nœuds, {self.ring.vnodes} nœuds virtuels/nœud")
+
+    def node_for(self, key: str) -> RedisService:
+        """Nœud propriétaire d'une clé"""
+        return self.nodes[self.ring.get_node(key)]
+
+    async def initialize(self) -> bool:
+        """Connecte tous les nœuds en parallèle (un nœud absent reconnecte en arrière-plan)"""
+        await asyncio.gather(*(node.initialize() for node in self.nodes.values()))
+        available = sum(1 for node in self.nodes.values() if node.is_available())
+        logger.info(f"[REDIS] ✅ Cache shardé: {available}/{len(self.nodes)} nœuds connectés")
+        return True
+
+    # Opérations mono-clé: routées vers le nœud propriétaire
+
+    async def get(self, key: str, binary: bool = False) -> Optional[Union[str, bytes]]:
+        return await self.node_for(key).get(key, binary=binary)
+
+    async def set(self, key: str, value: Union[str, bytes], ex: int = None) -> bool:
+        return await self.node_for(key).set(key, value, ex=ex)
+
+    async def setex(self, key: str, seconds: int, value: Union[str, bytes]) -> bool:
+        return await self.node_for(key).setex(key, seconds, value)
+
+    async def delete(self, key: str) -> bool:
+        return await self.node_for(key).delete(key)
+
+    async def exists(self, key: str) -> bool:
+        return await self.node_for(key).exists(key)
+
+    async def ttl(self, key: str) -> int:
+        return await self.node_for(key).ttl(key)
+
+    async def zadd(self, key: str, mapping: Dict[str, float]) -> bool:
+        return await self.node_for(key).zadd(key, mapping)
+
+    async def zrem(self, key: str, members: List[str]) -> bool:
+        return await self.node_for(key).zrem(key, members)
+
+    async def zrangebyscore(
+        self,
+        key: str,
+        min_score: float,
+        max_score: float,
+        start: int = 0,
+        num: int = 100
+    ) -> List[Tuple[str, float]]:
+        return await self.node_for(key).zrangebyscore(key, min_score, max_score, start=start, num=num)
+
+    async def zremrangebyscore(self, key: str, min_score: float, max_score: float) -> int:
+        return await self.node_for(key).zremrangebyscore(key, min_score, max_score)
+
+    async def zcard(self, key: str) -> int:
+        return await self.node_for(key).zcard(key)
+
+    # Opérations multi-clés: un lot par nœud, lots en parallèle
+
+    async def mget(self, keys: List[str], binary: bool = False) -> List[Optional[Union[str, bytes]]]:
+        """MGET découpé par nœud, résultats remis dans l'ordre de `keys`"""
+        if not keys:
+            return []
+        groups = self.ring.group_by_node(keys)
+        results = await asyncio.gather(*(
+            self.nodes[url].mget([keys[i] for i in indices], binary=binary)
+            for url, indices in groups.items()
+        ))
+        values: List[Optional[Union[str, bytes]]] = [None] * len(keys)
+        for indices, node_values in zip(groups.values(), results):
+            for index, value in zip(indices, node_values):
+                values[index] = value
+        return values
+
+    async def setex_many(self, mapping: Dict[str, Union[str, bytes]], seconds: int) -> bool:
+        """SETEX pipelinés par nœud, nœuds en parallèle"""
+        if not mapping:
+            return True
+        keys = list(mapping)
+        groups = self.ring.group_by_node(keys)
+        results = await asyncio.gather(*(
+            self.nodes[url].setex_many({keys[i]: mapping[keys[i]] for i in indices}, seconds)
+            for url, indices in groups.items()
+        ))
+        return all(results)
+
+    async def exists_many(self, keys: List[str]) -> List[bool]:
+        """EXISTS pipelinés par nœud, résultats dans l'ordre de `keys`"""
+        if not keys:
+            return []
+        groups = self.ring.group_by_node(keys)
+        results = await asyncio.gather(*(
+            self.nodes[url].exists_many([keys[i] for i in indices])
+            for url, indices in groups.items()
+        ))
+        flags = [False] * len(keys)
+        for indices, node_flags in zip(groups.values(), results):
+            for index, flag in zip(indices, node_flags):
+                flags[index] = flag
+        return flags
+
+    async def keys(self, pattern: str) -> List[str]:
+        results = await asyncio.gather(*(node.keys(pattern) for node in self.nodes.values()))
+        return [key for node_keys in results for key in node_keys]
+
+    async def scan_iter(self, match: str, count: int = 500) -> AsyncIterator[str]:
+        """SCAN de chaque nœud à tour de rôle"""
+        for node in self.nodes.values():
+            async for key in node.scan_iter(match=match, count=count):
+                yield key
+
+    def is_available(self) -> bool:
+        """Au moins un shard servi par Redis"""
+        return any(node.is_available() for node in self.nodes.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Statistiques agrégées et par nœud"""
+        node_stats = {url: node.get_stats() for url, node in self.nodes.items()}
+        available = sum(1 for stats in node_stats.values() if stats["redis_available"])
+        if available == len(node_stats):
+            mode = "Redis"
+        elif available:
+            mode = "Degraded"
+        else:
+            mode = "Memory"
+        return {
+            "mode": mode,
+            "redis_available": available > 0,
+            "sharded": True,
+            "nodes_available": available,
+            "nodes_total": len(node_stats),
+            "memory_entries": sum(stats["memory_entries"] for stats in node_stats.values()),
+            "pending_replay": sum(stats["pending_replay"] for stats in node_stats.values()),
+            "nodes": node_stats
+        }
+
+    async def close(self):
+        """Ferme tous les nœuds"""
+        await asyncio.gather(*(node.close() for node in self.nodes.values()))
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # CACHE TRADUCTION TEXTE - BASÉ SUR HASH
 # ═══════════════════════════════════════════════════════════════════════════════
 
 import hashlib
 
+# Cache L1 en mémoire (W-TinyLFU) devant Redis pour les traductions chaudes
+L1_CACHE_AVAILABLE = False
+try:
+    from utils.l1_cache import TinyLFUCache, get_l1_translation_cache
+    L1_CACHE_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    pass
+
+
+# Codec binaire versionné des valeurs (msgpack/JSON compact + compression)
+CACHE_CODEC_AVAILABLE = False
+try:
+    from utils.cache_codec import get_cache_codec
+    CACHE_CODEC_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    pass
+
+
+# Hachage audio en flux / hors boucle (clés de cache audio)
+AUDIO_HASHER_AVAILABLE = False
+try:
+    from utils.audio_hash import get_audio_hasher
+    AUDIO_HASHER_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    pass
+
+
+def _encode_entry(value: Dict[str, Any]) -> Union[str, bytes]:
+    """Sérialise une entrée de cache (codec binaire ou JSON legacy)"""
+    if CACHE_CODEC_AVAILABLE:
+        return get_cache_codec().encode(value)
+    return json.dumps(value)
+
+
+def _decode_entry(data: Optional[Union[str, bytes]]) -> Optional[Dict[str, Any]]:
+    """Désérialise une entrée de cache binaire ou JSON legacy (None si absente ou corrompue)"""
+    if not data:
+        return None
+    if CACHE_CODEC_AVAILABLE:
+        return get_cache_codec().decode(data)
+    try:
+        return json.loads(data)
+    except (TypeError, ValueError):
+        return None
+
 
 class TranslationCacheService:
     """
@@ -338,11 +1004,24 @@ class TranslationCacheService:
     - Si le texte change → hash change → cache miss automatique
     - Réutilisation cross-message/conversation pour textes identiques
     - Fonctionne aussi au niveau segment (chaque segment est caché individuellement)
+    - L1 en mémoire (W-TinyLFU, borné en octets) devant Redis: alimenté par
+      les hits Redis et les écritures, les entrées chaudes ne quittent plus
+      le processus
+    - Redis shardé possible (ShardedRedisService, TRANSLATOR_REDIS_CACHE_NODES):
+      MGET/SETEX groupés découpés par nœud et exécutés en parallèle
     """
 
-    def __init__(self, redis_service: RedisService, settings=None):
+    def __init__(
+        self,
+        redis_service: Union[RedisService, ShardedRedisService],
+        settings=None,
+        l1_cache: Optional["TinyLFUCache"] = None
+    ):
         self.redis = redis_service
         self.settings = settings
+        self.l1 = l1_cache if l1_cache is not None else (
+            get_l1_translation_cache() if L1_CACHE_AVAILABLE else None
+        )
 
         # Pattern de clé - basé uniquement sur le hash du contenu
         self.key_pattern = "translation:text:{hash}"
@@ -385,22 +1064,46 @@ class TranslationCacheService:
         cache_hash = self._compute_hash(text, source_lang, target_lang, model_type)
         key = self.key_pattern.format(hash=cache_hash)
 
-        data = await self.redis.get(key)
+        premium_key = None
+        if model_type not in self.premium_models:
+            premium_key = self.key_pattern.format(
+                hash=self._compute_hash(text, source_lang, target_lang, "premium")
+            )
+
+        # L1: ni aller-retour réseau ni désérialisation
+        for l1_key in (key, premium_key):
+            if l1_key:
+                hit = self._l1_get(l1_key)
+                if hit is not None:
+                    return hit
+
+        data = _decode_entry(await self.redis.get(key, binary=True))
         if data:
             logger.debug(f"[CACHE] ✅ Hit: {source_lang}→{target_lang} (hash={cache_hash[:8]})")
-            return json.loads(data)
+            return self._l1_put(key, data)
 
         # Si on demande un modèle non-premium, vérifier si une version premium existe
-        if model_type not in self.premium_models:
-            premium_hash = self._compute_hash(text, source_lang, target_lang, "premium")
-            premium_key = self.key_pattern.format(hash=premium_hash)
-            premium_data = await self.redis.get(premium_key)
+        if premium_key:
+            premium_data = _decode_entry(await self.redis.get(premium_key, binary=True))
             if premium_data:
                 logger.debug(f"[CACHE] ✅ Hit premium: {source_lang}→{target_lang}")
-                return json.loads(premium_data)
+                return self._l1_put(premium_key, premium_data)
 
         return None
 
+    def _l1_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Lecture L1 (copie: l'entrée partagée ne doit pas être mutée)"""
+        if self.l1 is None:
+            return None
+        hit = self.l1.get(key)
+        return dict(hit) if hit is not None else None
+
+    def _l1_put(self, key: str, data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Alimente le L1 et retourne l'entrée"""
+        if self.l1 is not None and data is not None:
+            self.l1.put(key, dict(data))
+        return data
+
     async def set_translation(
         self,
         text: str,
@@ -421,26 +1124,88 @@ class TranslationCacheService:
             model_type: Type de modèle
             ttl: Durée de vie en secondes (défaut: 1 mois)
         """
-        cache_hash = self._compute_hash(text, source_lang, target_lang, model_type)
+        cache_data = self._build_cache_data(text, source_lang, target_lang, translated_text, model_type)
+        cache_hash = cache_data["text_hash"]
         key = self.key_pattern.format(hash=cache_hash)
         ttl = ttl or self.ttl_translation
 
-        cache_data = {
+        # Stocker par hash (réutilisation cross-message/segment)
+        success = await self.redis.setex(key, ttl, _encode_entry(cache_data))
+        self._l1_put(key, cache_data)
+
+        if success:
+            logger.debug(f"[CACHE] 💾 Traduction mise en cache: {source_lang}→{target_lang} (hash={cache_hash[:8]})")
+
+        return success
+
+    def _build_cache_data(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        translated_text: str,
+        model_type: str
+    ) -> Dict[str, Any]:
+        """Entrée de cache stockée (via le codec) pour une traduction"""
+        return {
             "translated_text": translated_text,
             "source_lang": source_lang,
             "target_lang": target_lang,
             "model_type": model_type,
             "cached_at": datetime.now().isoformat(),
-            "text_hash": cache_hash
+            "text_hash": self._compute_hash(text, source_lang, target_lang, model_type)
         }
 
-        # Stocker par hash (réutilisation cross-message/segment)
-        success = await self.redis.setex(key, ttl, json.dumps(cache_data))
+    async def get_translations_batch(
+        self,
+        requests: List[Tuple[str, str, str]],
+        model_type: str = "premium"
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Récupère plusieurs traductions en un aller-retour Redis (MGET).
 
-        if success:
-            logger.debug(f"[CACHE] 💾 Traduction mise en cache: {source_lang}→{target_lang} (hash={cache_hash[:8]})")
+        Les misses d'un modèle non-premium sont recherchés en version premium
+        dans un second MGET (au plus 2 allers-retours quel que soit N).
 
-        return success
+        Args:
+            requests: Liste de (texte, langue_source, langue_cible)
+            model_type: Type de modèle
+
+        Returns:
+            Liste alignée sur `requests`: résultat caché ou None
+        """
+        if not requests:
+            return []
+
+        keys = [
+            self.key_pattern.format(hash=self._compute_hash(text, src, tgt, model_type))
+            for text, src, tgt in requests
+        ]
+        results = await self._mget_entries(keys)
+
+        if model_type not in self.premium_models:
+            missing = [i for i, result in enumerate(results) if result is None]
+            if missing:
+                premium_keys = [
+                    self.key_pattern.format(hash=self._compute_hash(*requests[i], "premium"))
+                    for i in missing
+                ]
+                for i, entry in zip(missing, await self._mget_entries(premium_keys)):
+                    results[i] = entry
+
+        hits = sum(1 for result in results if result is not None)
+        logger.debug(f"[CACHE] Batch: {hits}/{len(requests)} hits")
+        return results
+
+    async def _mget_entries(self, keys: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """L1 d'abord, un seul MGET Redis pour les clés restantes"""
+        results = [self._l1_get(key) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            values = await self.redis.mget([keys[i] for i in missing], binary=True)
+            for i, data in zip(missing, values):
+                results[i] = self._l1_put(keys[i], _decode_entry(data))
+        return results
 
     async def get_batch_translations(
         self,
@@ -450,21 +1215,97 @@ class TranslationCacheService:
         model_type: str = "premium"
     ) -> Dict[str, Optional[Dict[str, Any]]]:
         """
-        Récupère plusieurs traductions en batch.
+        Récupère plusieurs traductions en batch (un MGET).
 
         Returns:
             Dict[text -> cached_result or None]
         """
-        results = {}
-        for text in texts:
-            cached = await self.get_translation(text, source_lang, target_lang, model_type)
-            results[text] = cached
-        return results
+        unique_texts = list(dict.fromkeys(texts))
+        cached = await self.get_translations_batch(
+            [(text, source_lang, target_lang) for text in unique_texts], model_type
+        )
+        return dict(zip(unique_texts, cached))
+
+    async def get_translations_for_targets(
+        self,
+        text: str,
+        source_lang: str,
+        target_langs: List[str],
+        model_type: str = "premium"
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Récupère les traductions d'un texte vers plusieurs langues (un MGET).
+
+        Returns:
+            Dict[target_lang -> cached_result or None]
+        """
+        cached = await self.get_translations_batch(
+            [(text, source_lang, lang) for lang in target_langs], model_type
+        )
+        return dict(zip(target_langs, cached))
+
+    async def set_translations_batch(
+        self,
+        items: List[Tuple[str, str, str, str]],
+        model_type: str = "premium",
+        ttl: int = None
+    ) -> bool:
+        """
+        Sauvegarde plusieurs traductions en un aller-retour (SETEX pipelinés).
+
+        Args:
+            items: Liste de (texte, langue_source, langue_cible, texte_traduit)
+            model_type: Type de modèle
+            ttl: Durée de vie en secondes (défaut: 1 mois)
+        """
+        if not items:
+            return True
+
+        mapping = {}
+        entries = {}
+        for text, src, tgt, translated_text in items:
+            cache_data = self._build_cache_data(text, src, tgt, translated_text, model_type)
+            key = self.key_pattern.format(hash=cache_data["text_hash"])
+            mapping[key] = _encode_entry(cache_data)
+            entries[key] = cache_data
+
+        success = await self.redis.setex_many(mapping, ttl or self.ttl_translation)
+        for key, cache_data in entries.items():
+            self._l1_put(key, cache_data)
+        if success:
+            logger.debug(f"[CACHE] 💾 {len(mapping)} traductions mises en cache (batch)")
+        return success
+
+    def hot_keys(self, n: int) -> List[str]:
+        """Clés L1 les plus fréquentes (instantané pour le préchauffage au redémarrage)"""
+        if self.l1 is None:
+            return []
+        return [key for key in self.l1.hot_keys(n) if isinstance(key, str)]
+
+    async def preload_l1(self, keys: List[str], batch_size: int = 500) -> int:
+        """
+        Recharge des entrées Redis dans le L1 (MGET par lots), les plus chaudes d'abord
+
+        Returns:
+            Nombre d'entrées chargées (les clés expirées entre-temps sont ignorées)
+        """
+        if self.l1 is None or not keys:
+            return 0
+        loaded = 0
+        for start in range(0, len(keys), batch_size):
+            batch = keys[start:start + batch_size]
+            values = await self.redis.mget(batch, binary=True)
+            for key, data in zip(batch, values):
+                if self._l1_put(key, _decode_entry(data)) is not None:
+                    loaded += 1
+        return loaded
 
     async def invalidate_translation(self, text: str, source_lang: str, target_lang: str, model_type: str = "premium") -> bool:
         """Invalide une traduction du cache"""
         cache_hash = self._compute_hash(text, source_lang, target_lang, model_type)
         key = self.key_pattern.format(hash=cache_hash)
+        if self.l1 is not None:
+            self.l1.invalidate(key)
         return await self.redis.delete(key)
 
     def get_stats(self) -> Dict[str, Any]:
@@ -472,7 +1313,8 @@ class TranslationCacheService:
         return {
             **self.redis.get_stats(),
             "ttl_translation": self.ttl_translation,
-            "premium_models": self.premium_models
+            "premium_models": self.premium_models,
+            "l1": self.l1.get_stats() if self.l1 is not None else None
         }
 
 
@@ -488,7 +1330,9 @@ class AudioCacheService:
     Stratégie:
     - Transcription: indexée par hash audio (pas attachmentId) pour réutilisation cross-conversation
     - Audio traduit: indexé par hash audio + langue cible
-    - Profil vocal: indexé par userId
+    - Profil vocal: indexé par userId, + index secondaires (sorted sets hors
+      du namespace voice:profile:*) par date de mise à jour et de prochaine
+      recalibration → listing paginé sans KEYS
     """
 
     def __init__(self, redis_service: RedisService, settings=None):
@@ -501,6 +1345,11 @@ class AudioCacheService:
         self.key_audio_hash_mapping = "audio:hash:mapping:{attachment_id}"  # attachment_id -> audio_hash
         self.key_voice_profile = "voice:profile:{user_id}"
 
+        # Index secondaires des profils vocaux (membre = userId)
+        self.key_voice_index_updated = "voice:index:updated"  # score = updatedAt
+        self.key_voice_index_recalibration = "voice:index:recalibration"  # score = nextRecalibrationAt
+        self._voice_index_checked = False
+
         # Patterns legacy (pour compatibilité)
         self.key_transcription = "audio:transcription:{attachment_id}"
         self.key_translated_audio = "audio:translation:{attachment_id}:{lang}"
@@ -520,23 +1369,45 @@ class AudioCacheService:
 
     def compute_audio_hash(self, audio_path: str) -> str:
         """
-        Calcule un hash SHA256 du contenu audio.
+        Calcule un hash du contenu audio (SHA256 par défaut, lu par blocs).
         Permet d'identifier un audio identique même dans différentes conversations.
+        Synchrone: depuis du code async, utiliser compute_audio_hash_async.
         """
         try:
+            if AUDIO_HASHER_AVAILABLE:
+                return get_audio_hasher().hash_file(audio_path)
             with open(audio_path, 'rb') as f:
                 content = f.read()
             return hashlib.sha256(content).hexdigest()[:32]
         except Exception as e:
-            # Log seulement le type et message pour éviter problème event loop
-            error_msg = f"{type(e).__name__}: {str(e)}"
-            logger.warning(f"[CACHE] Impossible de hasher l'audio ({error_msg})")
-            # Fallback sur le chemin
-            return hashlib.sha256(audio_path.encode()).hexdigest()[:32]
+            return self._path_hash(audio_path, e)
+
+    async def compute_audio_hash_async(self, audio_path: str) -> str:
+        """Comme compute_audio_hash, dans un thread de travail (ne bloque pas la boucle)"""
+        if not AUDIO_HASHER_AVAILABLE:
+            return await asyncio.to_thread(self.compute_audio_hash, audio_path)
+        try:
+            return await get_audio_hasher().hash_file_async(audio_path)
+        except Exception as e:
+            return self._path_hash(audio_path, e)
+
+    async def hash_audio_bytes(self, audio_bytes: bytes) -> str:
+        """Hash d'un audio encore en mémoire (frame ZMQ `_audioBinary`), avant écriture disque"""
+        if AUDIO_HASHER_AVAILABLE:
+            return await get_audio_hasher().hash_bytes_async(audio_bytes)
+        return hashlib.sha256(audio_bytes).hexdigest()[:32]
+
+    @staticmethod
+    def _path_hash(audio_path: str, error: Exception) -> str:
+        """Fallback: hash du chemin quand le fichier est illisible"""
+        # Log seulement le type et message pour éviter problème event loop
+        error_msg = f"{type(error).__name__}: {str(error)}"
+        logger.warning(f"[CACHE] Impossible de hasher l'audio ({error_msg})")
+        return hashlib.sha256(audio_path.encode()).hexdigest()[:32]
 
     async def get_or_compute_audio_hash(self, attachment_id: str, audio_path: str) -> str:
         """
-        Récupère le hash audio depuis le cache ou le calcule.
+        Récupère le hash audio depuis le cache ou le calcule (hors boucle).
         Stocke le mapping attachment_id -> audio_hash pour référence rapide.
         """
         # Vérifier si le mapping existe
@@ -545,14 +1416,19 @@ class AudioCacheService:
         if cached_hash:
             return cached_hash
 
-        # Calculer le hash
-        audio_hash = self.compute_audio_hash(audio_path)
+        # Calculer le hash (fichier lu par blocs dans un thread)
+        audio_hash = await self.compute_audio_hash_async(audio_path)
 
         # Stocker le mapping
         await self.redis.setex(mapping_key, self.ttl_hash_mapping, audio_hash)
 
         return audio_hash
 
+    async def remember_audio_hash(self, attachment_id: str, audio_hash: str) -> bool:
+        """Enregistre le mapping attachment_id -> audio_hash d'un hash déjà calculé (frame ZMQ)"""
+        mapping_key = self.key_audio_hash_mapping.format(attachment_id=attachment_id)
+        return await self.redis.setex(mapping_key, self.ttl_hash_mapping, audio_hash)
+
     # ─────────────────────────────────────────────────────────────────────────
     # TRANSCRIPTION STT - BASÉE SUR HASH AUDIO
     # ─────────────────────────────────────────────────────────────────────────
@@ -560,17 +1436,16 @@ class AudioCacheService:
     async def get_transcription_by_hash(self, audio_hash: str) -> Optional[Dict[str, Any]]:
         """Récupère une transcription par hash audio (cross-conversation)"""
         key = self.key_transcription_by_hash.format(audio_hash=audio_hash)
-        data = await self.redis.get(key)
+        data = _decode_entry(await self.redis.get(key, binary=True))
         if data:
             logger.debug(f"[CACHE] ✅ Hit transcription (hash={audio_hash[:8]})")
-            return json.loads(data)
-        return None
+        return data
 
     async def set_transcription_by_hash(self, audio_hash: str, transcription: Dict[str, Any], ttl: int = None) -> bool:
         """Sauvegarde une transcription par hash audio"""
         key = self.key_transcription_by_hash.format(audio_hash=audio_hash)
         ttl = ttl or self.ttl_transcription
-        success = await self.redis.setex(key, ttl, json.dumps(transcription))
+        success = await self.redis.setex(key, ttl, _encode_entry(transcription))
         if success:
             logger.debug(f"[CACHE] 💾 Transcription mise en cache (hash={audio_hash[:8]})")
         return success
@@ -589,10 +1464,7 @@ class AudioCacheService:
 
         # Fallback sur attachment_id (legacy)
         key = self.key_transcription.format(attachment_id=attachment_id)
-        data = await self.redis.get(key)
-        if data:
-            return json.loads(data)
-        return None
+        return _decode_entry(await self.redis.get(key, binary=True))
 
     async def set_transcription(self, attachment_id: str, transcription: Dict[str, Any], audio_path: str = None, ttl: int = None) -> bool:
         """Sauvegarde une transcription - utilise hash si audio_path fourni"""
@@ -605,7 +1477,7 @@ class AudioCacheService:
 
         # Stocker aussi par attachment_id (legacy compatibility)
         key = self.key_transcription.format(attachment_id=attachment_id)
-        return await self.redis.setex(key, ttl, json.dumps(transcription))
+        return await self.redis.setex(key, ttl, _encode_entry(transcription))
 
     # ─────────────────────────────────────────────────────────────────────────
     # AUDIO TRADUIT - BASÉ SUR HASH AUDIO
@@ -614,17 +1486,16 @@ class AudioCacheService:
     async def get_translated_audio_by_hash(self, audio_hash: str, lang: str) -> Optional[Dict[str, Any]]:
         """Récupère un audio traduit par hash (cross-conversation)"""
         key = self.key_translated_audio_by_hash.format(audio_hash=audio_hash, lang=lang)
-        data = await self.redis.get(key)
+        data = _decode_entry(await self.redis.get(key, binary=True))
         if data:
             logger.debug(f"[CACHE] ✅ Hit audio traduit {lang} (hash={audio_hash[:8]})")
-            return json.loads(data)
-        return None
+        return data
 
     async def set_translated_audio_by_hash(self, audio_hash: str, lang: str, audio_data: Dict[str, Any], ttl: int = None) -> bool:
         """Sauvegarde un audio traduit par hash"""
         key = self.key_translated_audio_by_hash.format(audio_hash=audio_hash, lang=lang)
         ttl = ttl or self.ttl_translated_audio
-        success = await self.redis.setex(key, ttl, json.dumps(audio_data))
+        success = await self.redis.setex(key, ttl, _encode_entry(audio_data))
         if success:
             logger.debug(f"[CACHE] 💾 Audio traduit {lang} mis en cache (hash={audio_hash[:8]})")
         return success
@@ -634,9 +1505,16 @@ class AudioCacheService:
         Récupère toutes les traductions audio existantes pour un hash.
         Retourne un dict {lang: audio_data or None}
         """
+        keys = [
+            self.key_translated_audio_by_hash.format(audio_hash=audio_hash, lang=lang)
+            for lang in target_languages
+        ]
         results = {}
-        for lang in target_languages:
-            results[lang] = await self.get_translated_audio_by_hash(audio_hash, lang)
+        for lang, data in zip(target_languages, await self.redis.mget(keys, binary=True)):
+            results[lang] = _decode_entry(data)
+        hits = [lang for lang, data in results.items() if data]
+        if hits:
+            logger.debug(f"[CACHE] ✅ Hit audio traduit {hits} (hash={audio_hash[:8]})")
         return results
 
     async def get_translated_audio(self, attachment_id: str, lang: str, audio_path: str = None) -> Optional[Dict[str, Any]]:
@@ -653,10 +1531,7 @@ class AudioCacheService:
 
         # Fallback sur attachment_id (legacy)
         key = self.key_translated_audio.format(attachment_id=attachment_id, lang=lang)
-        data = await self.redis.get(key)
-        if data:
-            return json.loads(data)
-        return None
+        return _decode_entry(await self.redis.get(key, binary=True))
 
     async def set_translated_audio(self, attachment_id: str, lang: str, audio_data: Dict[str, Any], audio_path: str = None, ttl: int = None) -> bool:
         """Sauvegarde un audio traduit - utilise hash si audio_path fourni"""
@@ -669,7 +1544,7 @@ class AudioCacheService:
 
         # Stocker aussi par attachment_id (legacy compatibility)
         key = self.key_translated_audio.format(attachment_id=attachment_id, lang=lang)
-        return await self.redis.setex(key, ttl, json.dumps(audio_data))
+        return await self.redis.setex(key, ttl, _encode_entry(audio_data))
 
     # ─────────────────────────────────────────────────────────────────────────
     # PROFIL VOCAL
@@ -678,22 +1553,168 @@ class AudioCacheService:
     async def get_voice_profile(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Récupère un profil vocal depuis le cache"""
         key = self.key_voice_profile.format(user_id=user_id)
-        data = await self.redis.get(key)
-        if data:
-            return json.loads(data)
-        return None
+        return _decode_entry(await self.redis.get(key, binary=True))
 
     async def set_voice_profile(self, user_id: str, profile: Dict[str, Any], ttl: int = None) -> bool:
-        """Sauvegarde un profil vocal dans le cache (TTL: 3 mois par défaut)"""
+        """Sauvegarde un profil vocal dans le cache (TTL: 3 mois par défaut) et l'indexe"""
         key = self.key_voice_profile.format(user_id=user_id)
         ttl = ttl or self.ttl_voice_profile
-        return await self.redis.setex(key, ttl, json.dumps(profile))
+        success = await self.redis.setex(key, ttl, _encode_entry(profile))
+        if success:
+            await self._index_voice_profile(user_id, profile)
+        return success
+
+    async def get_voice_profiles(self, user_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Récupère plusieurs profils vocaux en un MGET"""
+        keys = [self.key_voice_profile.format(user_id=user_id) for user_id in user_ids]
+        values = await self.redis.mget(keys, binary=True)
+        return {user_id: _decode_entry(data) for user_id, data in zip(user_ids, values)}
+
+    async def get_entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Récupère une entrée par clé complète (ex: issue de keys("voice:profile:*"))"""
+        return _decode_entry(await self.redis.get(key, binary=True))
 
     async def delete_voice_profile(self, user_id: str) -> bool:
-        """Supprime un profil vocal du cache"""
+        """Supprime un profil vocal du cache (et de ses index)"""
         key = self.key_voice_profile.format(user_id=user_id)
+        await self._unindex_voice_profiles([user_id])
         return await self.redis.delete(key)
 
+    # ─────────────────────────────────────────────────────────────────────────
+    # INDEX DES PROFILS VOCAUX - listing paginé sans KEYS
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _profile_timestamp(profile: Dict[str, Any], field: str) -> Optional[float]:
+        """Timestamp d'un champ ISO-8601 du profil (None si absent/invalide)"""
+        value = profile.get(field)
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except (TypeError, ValueError):
+            return None
+
+    async def _index_voice_profile(self, user_id: str, profile: Dict[str, Any]) -> None:
+        """Met à jour les index updatedAt / nextRecalibrationAt d'un profil"""
+        updated_at = self._profile_timestamp(profile, "updatedAt") or time.time()
+        await self.redis.zadd(self.key_voice_index_updated, {user_id: updated_at})
+
+        next_recalibration = self._profile_timestamp(profile, "nextRecalibrationAt")
+        if next_recalibration is not None:
+            await self.redis.zadd(self.key_voice_index_recalibration, {user_id: next_recalibration})
+        else:
+            await self.redis.zrem(self.key_voice_index_recalibration, [user_id])
+
+    async def _unindex_voice_profiles(self, user_ids: List[str]) -> None:
+        """Retire des profils (supprimés ou expirés) des index"""
+        await self.redis.zrem(self.key_voice_index_updated, user_ids)
+        await self.redis.zrem(self.key_voice_index_recalibration, user_ids)
+
+    async def count_voice_profiles(self) -> int:
+        """Nombre de profils vocaux indexés (ZCARD, O(1))"""
+        await self.ensure_voice_profile_index()
+        return await self.redis.zcard(self.key_voice_index_updated)
+
+    async def ensure_voice_profile_index(self) -> None:
+        """Reconstruit l'index au premier usage s'il est vide (profils antérieurs à l'index)"""
+        if self._voice_index_checked:
+            return
+        self._voice_index_checked = True
+        if await self.redis.zcard(self.key_voice_index_updated) == 0:
+            await self.rebuild_voice_profile_index()
+
+    async def rebuild_voice_profile_index(self, batch_size: int = 500) -> int:
+        """
+        Indexe les profils existants via SCAN (curseur, non bloquant) + MGET par lots.
+
+        Returns:
+            Nombre de profils indexés
+        """
+        pattern = self.key_voice_profile.format(user_id="*")
+        prefix = pattern[:-1]
+        indexed = 0
+        batch: List[str] = []
+
+        async def flush() -> int:
+            profiles = await self.get_voice_profiles([key[len(prefix):] for key in batch])
+            batch.clear()
+            for user_id, profile in profiles.items():
+                if profile:
+                    await self._index_voice_profile(user_id, profile)
+            return sum(1 for profile in profiles.values() if profile)
+
+        async for key in self.redis.scan_iter(match=pattern, count=batch_size):
+            batch.append(key.decode() if isinstance(key, bytes) else key)
+            if len(batch) >= batch_size:
+                indexed += await flush()
+        if batch:
+            indexed += await flush()
+
+        logger.info(f"[CACHE] 🗂️ Index des profils vocaux reconstruit: {indexed} profil(s)")
+        return indexed
+
+    async def iter_voice_profiles(
+        self,
+        page_size: int = 100,
+        due_before: Optional[float] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Parcourt les profils vocaux par pages (mémoire et temps bornés par page).
+
+        Curseur = dernier score lu (et non un offset): un profil recalibré
+        pendant l'itération, dont le score change, ne décale pas les pages.
+        Les membres d'index dont le profil a expiré sont retirés au passage.
+
+        Args:
+            page_size: Nombre de profils par page (un ZRANGEBYSCORE + un MGET)
+            due_before: Timestamp → seulement les profils dont nextRecalibrationAt <= due_before
+                        (index de recalibration), sinon tous par updatedAt croissant
+
+        Yields:
+            Listes de profils (dicts du cache)
+        """
+        await self.ensure_voice_profile_index()
+
+        if due_before is not None:
+            index_key, max_score = self.key_voice_index_recalibration, due_before
+        else:
+            index_key, max_score = self.key_voice_index_updated, float("inf")
+            # Profils dont le TTL est forcément écoulé
+            await self.redis.zremrangebyscore(
+                index_key, float("-inf"), time.time() - self.ttl_voice_profile
+            )
+
+        cursor = float("-inf")
+        seen_at_cursor: set = set()
+        while True:
+            requested = page_size + len(seen_at_cursor)
+            members = await self.redis.zrangebyscore(index_key, cursor, max_score, start=0, num=requested)
+            page = [
+                (member, score) for member, score in members
+                if not (score == cursor and member in seen_at_cursor)
+            ][:page_size]
+            if not page:
+                return
+
+            profiles = await self.get_voice_profiles([member for member, _ in page])
+            stale = [user_id for user_id, profile in profiles.items() if profile is None]
+            if stale:
+                await self._unindex_voice_profiles(stale)
+
+            found = [profile for profile in profiles.values() if profile is not None]
+            if found:
+                yield found
+
+            last_score = page[-1][1]
+            if last_score != cursor:
+                seen_at_cursor = set()
+            cursor = last_score
+            seen_at_cursor.update(member for member, score in page if score == last_score)
+
+            if len(members) < requested:
+                return
+
     def get_stats(self) -> Dict[str, Any]:
         """Retourne les statistiques du cache audio"""
         return {
@@ -709,6 +1730,7 @@ class AudioCacheService:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 _redis_service: Optional[RedisService] = None
+_translation_cache_redis: Optional[Union[RedisService, ShardedRedisService]] = None
 _audio_cache: Optional[AudioCacheService] = None
 _translation_cache: Optional[TranslationCacheService] = None
 
@@ -721,6 +1743,24 @@ def get_redis_service() -> RedisService:
     return _redis_service
 
 
+def get_translation_cache_redis() -> Union[RedisService, ShardedRedisService]:
+    """
+    Backend Redis du cache de traduction
+
+    Shardé sur TRANSLATOR_REDIS_CACHE_NODES si renseigné, sinon la connexion
+    principale (REDIS_URL).
+    """
+    global _translation_cache_redis
+    if _translation_cache_redis is None:
+        config = PerformanceConfig()
+        node_urls = [url.strip() for url in config.redis_cache_nodes.split(",") if url.strip()]
+        if node_urls:
+            _translation_cache_redis = ShardedRedisService(node_urls, vnodes=config.redis_hash_vnodes)
+        else:
+            _translation_cache_redis = get_redis_service()
+    return _translation_cache_redis
+
+
 def get_audio_cache_service(settings=None) -> AudioCacheService:
     """Retourne l'instance singleton du service de cache audio"""
     global _audio_cache
@@ -733,5 +1773,5 @@ def get_translation_cache_service(settings=None) -> TranslationCacheService:
     """Retourne l'instance singleton du service de cache traduction"""
     global _translation_cache
     if _translation_cache is None:
-        _translation_cache = TranslationCacheService(get_redis_service(), settings)
+        _translation_cache = TranslationCacheService(get_translation_cache_redis(), settings)
     return _translation_cache
@@ -0,0 +1,237 @@
+"""
+Module d'ordonnancement d'inférence (micro-batching continu)
+Responsabilités:
+- Collecter les chunks en attente de TOUS les appelants d'un même modèle
+  (pool ZMQ, REST /translate, TranslationStage audio)
+- Regrouper par paire de langues (src_lang + forced_bos_token_id cible)
+- Exécuter UN generate() paddé par groupe au lieu de N appels sérialisés
+- Résoudre le future de chaque appelant
+
+Le scheduler tourne dans un thread dédié et expose des
+`concurrent.futures.Future` : il est indépendant de l'event loop, ce qui est
+indispensable car le TranslationStage audio traduit depuis des threads qui
+possèdent chacun leur propre event loop.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, InvalidStateError
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# Signature: (source_lang_nllb, target_lang_nllb, texts) -> traductions (même ordre)
+BatchRunner = Callable[[str, str, List[str]], List[str]]
+
+
+@dataclass
+class PendingChunk:
+    """Chunk en attente d'inférence"""
+    text: str
+    source_lang: str
+    target_lang: str
+    future: Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class InferenceScheduler:
+    """
+    Scheduler de micro-batching pour UN modèle chargé
+
+    Stratégie:
+    1. Le premier chunk arrivé ouvre une fenêtre de `window_ms`
+    2. Les chunks arrivés pendant la fenêtre sont accumulés
+       (flush anticipé dès `max_batch_size` chunks)
+    3. Les chunks sont groupés par (src_lang, tgt_lang) — la langue source
+       fixe le token de langue du tokenizer, la cible le forced_bos_token_id
+    4. Un appel `run_batch` par groupe, dans l'ordre d'arrivée
+
+    Exemples:
+        >>> scheduler = InferenceScheduler("basic", run_batch, window_ms=5)
+        >>> future = scheduler.submit("Bonjour", "fra_Latn", "eng_Latn")
+        >>> future.result()
+        'Hello'
+    """
+
+    def __init__(
+        self,
+        name: str,
+        run_batch: BatchRunner,
+        window_ms: int = 5,
+        max_batch_size: int = 16
+    ):
+        """
+        Initialise le scheduler (le thread est démarré au premier submit)
+
+        Args:
+            name: Nom du modèle servi (logs)
+            run_batch: Fonction d'inférence batch pour un groupe homogène
+            window_ms: Fenêtre d'accumulation en millisecondes
+            max_batch_size: Nombre max de chunks par passe d'inférence
+        """
+        self.name = name
+        self._run_batch = run_batch
+        self.window_s = max(0, window_ms) / 1000.0
+        self.max_batch_size = max(1, max_batch_size)
+
+        self._pending: Deque[PendingChunk] = deque()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+        # Statistiques
+        self.stats = {
+            'chunks_submitted': 0,
+            'batches_run': 0,
+            'groups_run': 0,
+            'max_batch_size_seen': 0,
+            'errors': 0
+        }
+
+    def submit(self, text: str, source_lang: str, target_lang: str) -> Future:
+        """
+        Soumet un chunk à traduire
+
+        Args:
+            text: Texte du chunk
+            source_lang: Code langue source NLLB (ex: 'fra_Latn')
+            target_lang: Code langue cible NLLB (ex: 'eng_Latn')
+
+        Returns:
+            Future résolu avec le texte traduit
+        """
+        future: Future = Future()
+        with self._cond:
+            if not self._running:
+                self._start_locked()
+            self._pending.append(PendingChunk(text, source_lang, target_lang, future))
+            self.stats['chunks_submitted'] += 1
+            self._cond.notify()
+        return future
+
+    def _start_locked(self) -> None:
+        """Démarre le thread de traitement (appelé sous self._cond)"""
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._loop,
+            name=f"InferenceScheduler-{self.name}",
+            daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            f"🧮 [SCHEDULER] Scheduler d'inférence démarré pour '{self.name}' "
+            f"(fenêtre={self.window_s * 1000:.0f}ms, max_batch={self.max_batch_size})"
+        )
+
+    def _collect_batch(self) -> List[PendingChunk]:
+        """Attend le premier chunk puis accumule jusqu'à la fin de la fenêtre"""
+        with self._cond:
+            while self._running and not self._pending:
+                self._cond.wait()
+
+            if not self._pending:
+                return []
+
+            deadline = self._pending[0].enqueued_at + self.window_s
+            while self._running and len(self._pending) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(timeout=remaining)
+
+            batch = []
+            while self._pending and len(batch) < self.max_batch_size:
+                batch.append(self._pending.popleft())
+            return batch
+
+    def _loop(self) -> None:
+        """Boucle principale du thread scheduler"""
+        while True:
+            batch = self._collect_batch()
+            if not batch:
+                if not self._running:
+                    return
+                continue
+            try:
+                self._process_batch(batch)
+            except Exception as e:
+                # Le thread ne doit jamais mourir: les appelants attendraient indéfiniment
+                self.stats['errors'] += 1
+                logger.error(f"❌ [SCHEDULER] Erreur inattendue '{self.name}' ({len(batch)} chunks): {e}")
+                for chunk in batch:
+                    self._resolve(chunk.future, error=e)
+
+    @staticmethod
+    def _resolve(future: Future, result: Optional[str] = None, error: Optional[BaseException] = None) -> None:
+        """Résout un future sauf s'il l'est déjà (annulé par l'appelant entre-temps)"""
+        try:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+        except InvalidStateError:
+            pass
+
+    def _process_batch(self, batch: List[PendingChunk]) -> None:
+        """Exécute une passe d'inférence par paire de langues"""
+        groups: Dict[Tuple[str, str], List[PendingChunk]] = {}
+        for chunk in batch:
+            groups.setdefault((chunk.source_lang, chunk.target_lang), []).append(chunk)
+
+        self.stats['batches_run'] += 1
+        self.stats['max_batch_size_seen'] = max(self.stats['max_batch_size_seen'], len(batch))
+
+        for (source_lang, target_lang), chunks in groups.items():
+            self.stats['groups_run'] += 1
+            try:
+                translations = self._run_batch(
+                    source_lang, target_lang, [c.text for c in chunks]
+                )
+                if len(translations) != len(chunks):
+                    raise RuntimeError(
+                        f"{len(translations)} résultats pour {len(chunks)} chunks"
+                    )
+            except Exception as e:
+                self.stats['errors'] += 1
+                logger.error(
+                    f"❌ [SCHEDULER] Erreur inférence '{self.name}' "
+                    f"{source_lang}→{target_lang} ({len(chunks)} chunks): {e}"
+                )
+                for chunk in chunks:
+                    self._resolve(chunk.future, error=e)
+                continue
+
+            for chunk, translation in zip(chunks, translations):
+                self._resolve(chunk.future, result=translation)
+
+        if len(batch) > 1:
+            logger.debug(
+                f"⚡ [SCHEDULER] '{self.name}': {len(batch)} chunks en "
+                f"{len(groups)} passe(s) d'inférence"
+            )
+
+    @property
+    def pending_count(self) -> int:
+        """Nombre de chunks en attente"""
+        with self._cond:
+            return len(self._pending)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Retourne les statistiques du scheduler"""
+        return {**self.stats, 'pending': self.pending_count}
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Arrête le thread après avoir traité les chunks déjà soumis"""
+        with self._cond:
+            if not self._running:
+                return
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+        self._thread = None
+        logger.info(f"🛑 [SCHEDULER] Scheduler d'inférence '{self.name}' arrêté")
@@ -0,0 +1,458 @@
+"""
+Module de détection de langue
+Responsabilités:
+- Détection par écriture non ambiguë (hangul, kana, thaï, grec...) sans modèle
+- Backends enfichables essayés dans l'ordre (fastText lid.176, langdetect)
+- API batch: un seul appel backend pour tous les textes d'un batch
+- Prior par conversation/expéditeur: départage seulement, quand le backend
+  n'atteint pas le seuil de confiance ("ok", "merci") ; une détection fiable
+  l'emporte toujours (conversations de groupe multilingues)
+"""
+
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from utils.performance import PerformanceConfig
+
+logger = logging.getLogger(__name__)
+
+try:
+    from langdetect import detect_langs, DetectorFactory, LangDetectException
+    DetectorFactory.seed = 0  # déterministe
+    LANGDETECT_AVAILABLE = True
+except ImportError:
+    LANGDETECT_AVAILABLE = False
+
+try:
+    import fasttext
+    FASTTEXT_AVAILABLE = True
+except ImportError:
+    FASTTEXT_AVAILABLE = False
+
+DEFAULT_DETECT_LANGUAGE = os.getenv("TRANSLATOR_DEFAULT_DETECT_LANG", "fr")
+try:
+    DETECT_MIN_CONFIDENCE = float(os.getenv("TRANSLATOR_DETECT_MIN_CONFIDENCE", "0.80"))
+except ValueError:
+    DETECT_MIN_CONFIDENCE = 0.80
+
+# Nombre minimal de lettres pour tenter une détection statistique
+MIN_ALPHA_CHARS = 4
+
+_URL_PATTERN = re.compile(r'https?://\S+')
+
+# Écritures propres à une seule langue (parmi les langues supportées) :
+# détection immédiate, sans modèle. Cyrillique, arabe et devanagari sont
+# partagés par plusieurs langues et restent au backend statistique.
+_SCRIPT_RANGES: Tuple[Tuple[int, int, str], ...] = (
+    (0x3040, 0x30FF, 'ja'),   # Hiragana / Katakana
+    (0xAC00, 0xD7AF, 'ko'),   # Hangul (syllabes)
+    (0x1100, 0x11FF, 'ko'),   # Hangul (jamo)
+    (0x3130, 0x318F, 'ko'),   # Hangul (jamo de compatibilité)
+    (0x0E00, 0x0E7F, 'th'),   # Thaï
+    (0x0370, 0x03FF, 'el'),   # Grec
+    (0x0590, 0x05FF, 'he'),   # Hébreu
+    (0x0530, 0x058F, 'hy'),   # Arménien
+    (0x0980, 0x09FF, 'bn'),   # Bengali
+    (0x4E00, 0x9FFF, 'zh'),   # Idéogrammes CJC (zh, sauf si kana présents)
+)
+_SCRIPT_MIN_SHARE = 0.6
+_SCRIPT_SCAN_CHARS = 200
+
+
+@dataclass
+class DetectionResult:
+    """Résultat de détection (language=None si aucune détection fiable)"""
+    language: Optional[str]
+    confidence: float
+    method: str  # 'script', 'prior', 'cache', nom du backend, ou 'none'
+
+
+def _clean(text: Optional[str]) -> str:
+    return _URL_PATTERN.sub(" ", text or "").strip()
+
+
+def _alpha_count(text: str) -> int:
+    return sum(c.isalpha() for c in text)
+
+
+def detect_script_language(text: str) -> Optional[Tuple[str, float]]:
+    """
+    Langue déduite de l'écriture si elle est propre à une seule langue
+
+    Returns:
+        (langue, part des lettres dans cette écriture) ou None
+    """
+    counts: Dict[str, int] = {}
+    letters = 0
+    for char in text[:_SCRIPT_SCAN_CHARS]:
+        if not char.isalpha():
+            continue
+        letters += 1
+        code = ord(char)
+        if code < 0x0370:
+            continue
+        for start, end, lang in _SCRIPT_RANGES:
+            if start <= code <= end:
+                counts[lang] = counts.get(lang, 0) + 1
+                break
+
+    if not letters or not counts:
+        return None
+
+    # Japonais: kanji + kana → les idéogrammes comptent pour le japonais
+    if 'ja' in counts and 'zh' in counts:
+        counts['ja'] += counts.pop('zh')
+
+    lang, count = max(counts.items(), key=lambda item: item[1])
+    share = count / letters
+    if share < _SCRIPT_MIN_SHARE:
+        return None
+    return lang, share
+
+
+class LangdetectBackend:
+    """Backend langdetect (Python pur, profils n-grammes)"""
+
+    name = 'langdetect'
+
+    def is_available(self) -> bool:
+        return LANGDETECT_AVAILABLE
+
+    def detect_batch(self, texts: Sequence[str]) -> List[List[Tuple[str, float]]]:
+        """Classement (langue, probabilité) décroissant pour chaque texte"""
+        ranked_all = []
+        for text in texts:
+            try:
+                ranked = detect_langs(text)
+            except LangDetectException:
+                ranked_all.append([])
+                continue
+            # zh-cn/zh-tw -> zh
+            ranked_all.append([(item.lang.split("-")[0], item.prob) for item in ranked])
+        return ranked_all
+
+
+class FastTextBackend:
+    """
+    Backend fastText (modèle lid.176.bin / lid.176.ftz)
+
+    Classifieur n-grammes de caractères compilé : un `predict` sur la liste
+    complète des textes d'un batch, ordres de grandeur plus rapide que
+    langdetect sur des messages courts.
+    """
+
+    name = 'fasttext'
+
+    def __init__(self, model_path: str):
+        self.model_path = model_path
+        self._model = None
+        if FASTTEXT_AVAILABLE and model_path and os.path.exists(model_path):
+            try:
+                self._model = fasttext.load_model(model_path)
+                logger.info(f"✅ Modèle fastText de détection chargé: {model_path}")
+            except Exception as e:
+                logger.warning(f"⚠️ Chargement fastText impossible ({model_path}): {e}")
+
+    def is_available(self) -> bool:
+        return self._model is not None
+
+    def detect_batch(self, texts: Sequence[str]) -> List[List[Tuple[str, float]]]:
+        """Classement (langue, probabilité) décroissant pour chaque texte"""
+        # fastText refuse les retours à la ligne (un exemple par ligne)
+        labels, probs = self._model.predict([t.replace("\n", " ") for t in texts], k=3)
+        return [
+            [(label.replace("__label__", ""), float(prob)) for label, prob in zip(text_labels, text_probs)]
+            for text_labels, text_probs in zip(labels, probs)
+        ]
+
+
+class LanguagePriorCache:
+    """
+    Dernière langue détectée avec confiance, par contexte (LRU borné)
+
+    Le contexte est une clé opaque: identifiant de conversation, ou
+    "conversation:expéditeur" quand l'expéditeur est connu.
+    """
+
+    def __init__(self, max_size: int = 10000):
+        self.max_size = max(1, max_size)
+        self._priors: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, context_key: Optional[str]) -> Optional[str]:
+        if not context_key:
+            return None
+        with self._lock:
+            language = self._priors.get(context_key)
+            if language is not None:
+                self._priors.move_to_end(context_key)
+            return language
+
+    def observe(self, context_key: Optional[str], language: str) -> None:
+        if not context_key:
+            return
+        with self._lock:
+            self._priors[context_key] = language
+            self._priors.move_to_end(context_key)
+            while len(self._priors) > self.max_size:
+                self._priors.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._priors.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._priors)
+
+
+class LanguageDetector:
+    """
+    Détecteur de langue: écriture → backends → prior (départage)
+
+    Jamais de défaut 'en' arbitraire: sans détection fiable, repli sur le
+    prior du contexte, puis sur `fallback`, puis sur DEFAULT_DETECT_LANGUAGE.
+    Le prior ne court-circuite jamais le backend : dans une conversation de
+    groupe, le « ok » d'un participant anglophone n'hérite pas du français
+    du message précédent si le backend le reconnaît avec confiance.
+    Les résultats statistiques sont mémorisés par texte (LRU) : le même
+    message détecté par translate_text puis translate_with_structure ne
+    passe qu'une fois par le backend.
+    """
+
+    def __init__(
+        self,
+        backends: Optional[List[object]] = None,
+        min_confidence: float = DETECT_MIN_CONFIDENCE,
+        default_language: str = DEFAULT_DETECT_LANGUAGE,
+        prior_cache: Optional[LanguagePriorCache] = None,
+        result_cache_size: int = 4096
+    ):
+        """
+        Initialise le détecteur
+
+        Args:
+            backends: Backends statistiques essayés dans l'ordre
+            min_confidence: Probabilité minimale d'une détection fiable
+            default_language: Langue de repli sans fallback
+            prior_cache: Priors par contexte (None = désactivé)
+            result_cache_size: Taille du cache texte → résultat
+        """
+        self.backends = backends if backends is not None else [LangdetectBackend()]
+        self.min_confidence = min_confidence
+        self.default_language = default_language
+        self.prior_cache = prior_cache
+        self.result_cache_size = max(0, result_cache_size)
+
+        self._results: "OrderedDict[str, DetectionResult]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {
+            'script': 0, 'prior': 0, 'cache': 0, 'backend': 0, 'undetected': 0, 'backend_calls': 0
+        }
+
+    def detect(
+        self,
+        text: str,
+        fallback: Optional[str] = None,
+        context_key: Optional[str] = None
+    ) -> str:
+        """Code langue détecté (jamais None)"""
+        return self.detect_batch([text], fallback=fallback, context_keys=[context_key])[0]
+
+    def detect_with_confidence(self, text: str, context_key: Optional[str] = None) -> DetectionResult:
+        """Résultat détaillé (language=None si aucune détection fiable)"""
+        return self.detect_batch_with_confidence([text], context_keys=[context_key])[0]
+
+    def detect_batch(
+        self,
+        texts: Sequence[str],
+        fallback: Optional[str] = None,
+        context_keys: Optional[Sequence[Optional[str]]] = None
+    ) -> List[str]:
+        """Détecte la langue de plusieurs textes (un appel backend pour le lot)"""
+        default = fallback if fallback is not None else self.default_language
+        return [
+            result.language or default
+            for result in self.detect_batch_with_confidence(texts, context_keys)
+        ]
+
+    def detect_batch_with_confidence(
+        self,
+        texts: Sequence[str],
+        context_keys: Optional[Sequence[Optional[str]]] = None
+    ) -> List[DetectionResult]:
+        """
+        Détecte la langue de plusieurs textes
+
+        Args:
+            texts: Textes à analyser
+            context_keys: Contexte (conversation) de chaque texte, pour le prior
+
+        Returns:
+            Un DetectionResult par texte, dans l'ordre
+        """
+        keys = list(context_keys) if context_keys is not None else [None] * len(texts)
+        results: List[Optional[DetectionResult]] = [None] * len(texts)
+        cleaned = [_clean(text) for text in texts]
+        pending: List[int] = []
+
+        for i, text in enumerate(cleaned):
+            alpha = _alpha_count(text)
+            if not alpha:
+                results[i] = self._from_prior(keys[i])
+                continue
+
+            script = detect_script_language(text)
+            if script is not None:
+                results[i] = DetectionResult(script[0], script[1], 'script')
+                self.stats['script'] += 1
+                self._observe(keys[i], script[0])
+                continue
+
+            # Trop court pour un backend: seul le prior peut trancher
+            if alpha < MIN_ALPHA_CHARS:
+                results[i] = self._from_prior(keys[i])
+                if results[i].language is None:
+                    self.stats['undetected'] += 1
+                continue
+
+            cached = self._cached(text)
+            if cached is not None:
+                self.stats['cache'] += 1
+                if cached.language is not None:
+                    results[i] = cached
+                    self._observe(keys[i], cached.language)
+                else:
+                    results[i] = self._from_prior(keys[i])
+                continue
+
+            pending.append(i)
+
+        if pending:
+            self._run_backends(cleaned, pending, results)
+            for i in pending:
+                result = results[i]
+                if result.language is not None:
+                    self._observe(keys[i], result.language)
+                else:
+                    prior = self._from_prior(keys[i])
+                    if prior.language is not None:
+                        results[i] = prior
+
+        return results
+
+    def _run_backends(
+        self,
+        cleaned: List[str],
+        pending: List[int],
+        results: List[Optional[DetectionResult]]
+    ) -> None:
+        """Backends dans l'ordre, chacun sur les textes encore non résolus"""
+        remaining = list(pending)
+        for backend in self.backends:
+            if not remaining:
+                break
+            if not backend.is_available():
+                continue
+            try:
+                ranked_all = backend.detect_batch([cleaned[i] for i in remaining])
+                self.stats['backend_calls'] += 1
+            except Exception as e:
+                logger.warning(f"⚠️ Détection {backend.name} en échec: {e}")
+                continue
+
+            unresolved = []
+            for i, ranked in zip(remaining, ranked_all):
+                if ranked and ranked[0][1] >= self.min_confidence:
+                    lang, prob = ranked[0]
+                    results[i] = DetectionResult(lang, prob, backend.name)
+                    self.stats['backend'] += 1
+                    self._store(cleaned[i], results[i])
+                else:
+                    unresolved.append(i)
+            remaining = unresolved
+
+        for i in remaining:
+            results[i] = DetectionResult(None, 0.0, 'none')
+            self.stats['undetected'] += 1
+            self._store(cleaned[i], results[i])
+
+    def _from_prior(self, context_key: Optional[str]) -> DetectionResult:
+        language = self.prior_cache.get(context_key) if self.prior_cache is not None else None
+        if language is None:
+            return DetectionResult(None, 0.0, 'none')
+        self.stats['prior'] += 1
+        return DetectionResult(language, self.min_confidence, 'prior')
+
+    def _observe(self, context_key: Optional[str], language: str) -> None:
+        if self.prior_cache is not None:
+            self.prior_cache.observe(context_key, language)
+
+    def _cached(self, text: str) -> Optional[DetectionResult]:
+        if not self.result_cache_size:
+            return None
+        with self._lock:
+            result = self._results.get(text)
+            if result is not None:
+                self._results.move_to_end(text)
+            return result
+
+    def _store(self, text: str, result: DetectionResult) -> None:
+        if not self.result_cache_size:
+            return
+        with self._lock:
+            self._results[text] = result
+            self._results.move_to_end(text)
+            while len(self._results) > self.result_cache_size:
+                self._results.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, object]:
+        """Retourne les statistiques du détecteur"""
+        with self._lock:
+            cached = len(self._results)
+        return {
+            **self.stats,
+            'backends': [b.name for b in self.backends if b.is_available()],
+            'cached_results': cached,
+            'priors': len(self.prior_cache) if self.prior_cache is not None else 0
+        }
+
+
+def build_backends(names: str, fasttext_model_path: str = "") -> List[object]:
+    """Instancie les backends listés ("fasttext,langdetect"), dans l'ordre"""
+    backends: List[object] = []
+    for name in (n.strip().lower() for n in names.split(",")):
+        if name == 'fasttext':
+            backends.append(FastTextBackend(fasttext_model_path))
+        elif name == 'langdetect':
+            backends.append(LangdetectBackend())
+        elif name:
+            logger.warning(f"⚠️ Backend de détection inconnu ignoré: {name}")
+    return backends
+
+
+_language_detector: Optional[LanguageDetector] = None
+_language_detector_lock = threading.Lock()
+
+
+def get_language_detector() -> LanguageDetector:
+    """Retourne le détecteur partagé (priors communs au pool ZMQ, au REST et à l'audio)"""
+    global _language_detector
+    if _language_detector is None:
+        with _language_detector_lock:
+            if _language_detector is None:
+                config = PerformanceConfig()
+                _language_detector = LanguageDetector(
+                    backends=build_backends(config.language_detector_backends, config.fasttext_model_path),
+                    prior_cache=LanguagePriorCache(config.language_prior_size)
+                )
+                logger.info(
+                    f"🔎 LanguageDetector initialisé "
+                    f"(backends={_language_detector.get_stats()['backends']})"
+                )
+    return _language_detector
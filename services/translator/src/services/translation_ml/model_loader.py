@@ -8,6 +8,7 @@ Responsabilités:
 """
 
 import os
+import shutil
 import logging
 import asyncio
 import threading
@@ -29,6 +30,14 @@ try:
 except ImportError:
     logger.warning("⚠️ Dependencies ML non disponibles")
 
+# Backend ONNX Runtime optionnel (optimum[onnxruntime])
+ONNX_AVAILABLE = False
+try:
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    ONNX_AVAILABLE = True
+except ImportError:
+    pass
+
 try:
     from services.model_manager import get_model_manager, ModelType
     MODEL_MANAGER_AVAILABLE = True
@@ -65,6 +74,63 @@ def build_model_load_kwargs(device: str, dtype: Any, cache_dir: str) -> Dict[str
     return kwargs
 
 
+INFERENCE_BACKENDS = ('torch', 'int8', 'onnx')
+
+
+def resolve_inference_backend(requested: str, device: str, onnx_available: bool = None) -> str:
+    """Résout le backend d'inférence effectivement utilisable.
+
+    `int8` (quantification dynamique des couches Linear) et `onnx` (ONNX Runtime
+    encodeur/décodeur avec KV-cache) sont des optimisations CPU : sur GPU on
+    reste sur torch (float16 via quantization_level). Un backend inconnu ou
+    une dépendance absente retombe sur `torch` plutôt que d'empêcher le
+    démarrage du service.
+    """
+    if onnx_available is None:
+        onnx_available = ONNX_AVAILABLE
+
+    backend = (requested or 'torch').lower()
+    if backend not in INFERENCE_BACKENDS:
+        logger.warning(f"⚠️ Backend d'inférence inconnu '{requested}', fallback torch")
+        return 'torch'
+    if backend != 'torch' and device != 'cpu':
+        logger.info(f"ℹ️ Backend '{backend}' réservé au CPU, device={device} → torch")
+        return 'torch'
+    if backend == 'onnx' and not onnx_available:
+        logger.warning("⚠️ optimum[onnxruntime] non installé, fallback torch")
+        return 'torch'
+    return backend
+
+
+# Décodeurs possibles d'un export optimum avec KV-cache (fusionné ou séparé)
+ONNX_DECODER_FILES = ('decoder_model_merged.onnx', 'decoder_with_past_model.onnx', 'decoder_model.onnx')
+
+
+def is_complete_onnx_export(path: Path) -> bool:
+    """True si l'export ONNX contient encodeur, décodeur et configuration.
+
+    Un export interrompu (arrêt du pod, disque plein) laisse un répertoire
+    partiel : le réutiliser ferait échouer chaque démarrage.
+    """
+    return (
+        (path / 'encoder_model.onnx').is_file()
+        and (path / 'config.json').is_file()
+        and any((path / name).is_file() for name in ONNX_DECODER_FILES)
+    )
+
+
+def quantize_dynamic_int8(model: Any) -> Any:
+    """Quantification dynamique int8 des couches Linear (CPU).
+
+    Les poids des Linear passent en int8 (÷4 en mémoire), les activations sont
+    quantifiées à la volée. `inplace=True` évite de garder une copie float32
+    du modèle pendant la conversion (pic RSS).
+    """
+    return torch.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+    )
+
+
 class ModelLoader:
     """
     Gestionnaire de chargement et cache des modèles ML
@@ -87,6 +153,7 @@ class ModelLoader:
         # Cache des modèles et tokenizers chargés
         self.models: Dict[str, Any] = {}
         self.tokenizers: Dict[str, Any] = {}
+        self.model_backends: Dict[str, str] = {}
 
         # ✨ Locks par modèle pour thread-safety des inférences PyTorch
         # Les modèles PyTorch ne sont PAS thread-safe, donc on doit sérialiser les inférences
@@ -126,6 +193,17 @@ class ModelLoader:
         # Alias pour compatibilité
         self.model_configs['medium'] = self.model_configs['basic']
 
+        # Petit modèle distillé optionnel pour les messages courts (FAST_MODEL)
+        fast_model = getattr(settings, 'fast_model', '')
+        if isinstance(fast_model, str) and fast_model:
+            self.model_configs['fast'] = {
+                'model_name': fast_model,
+                'local_path': self.models_path / fast_model,
+                'description': 'Modèle distillé - messages courts (fast_pool)',
+                'device': self.device,
+                'priority': 3
+            }
+
         logger.info(f"🔧 ModelLoader initialisé: {self.models_path}")
         logger.info(f"🔧 Device configuré: {self.device}")
 
@@ -218,10 +296,12 @@ class ModelLoader:
             if existing_config and existing_config['model_name'] == model_name:
                 self.models[model_type] = existing_model
                 self.tokenizers[model_type] = self.tokenizers[existing_type]
+                self.model_backends[model_type] = self.model_backends.get(existing_type, 'torch')
                 logger.info(f"♻️ Modèle {model_type} réutilise {existing_type}: {model_name}")
                 return
 
-        logger.info(f"📥 Chargement {model_type}: {model_name}")
+        backend = resolve_inference_backend(self.perf_config.inference_backend, config['device'])
+        logger.info(f"📥 Chargement {model_type}: {model_name} (backend={backend})")
 
         def load_model_sync():
             """Chargement synchrone du modèle et tokenizer"""
@@ -234,6 +314,9 @@ class ModelLoader:
                     model_max_length=512
                 )
 
+                if backend == 'onnx':
+                    return tokenizer, self._load_onnx_model(model_name)
+
                 # Déterminer dtype (float32 pour CPU, float16 pour GPU)
                 device = config['device']
                 dtype = torch.float32 if device == "cpu" else (
@@ -254,6 +337,9 @@ class ModelLoader:
                 # Mode evaluation pour désactiver dropout
                 model.eval()
 
+                if backend == 'int8':
+                    model = quantize_dynamic_int8(model)
+
                 return tokenizer, model
 
             except Exception as e:
@@ -270,8 +356,10 @@ class ModelLoader:
         # Enregistrer le tokenizer
         self.tokenizers[model_type] = tokenizer
 
-        # Appliquer torch.compile si activé
-        if self.perf_config.enable_torch_compile:
+        self.model_backends[model_type] = backend
+
+        # Appliquer torch.compile si activé (graphes float32 uniquement)
+        if self.perf_config.enable_torch_compile and backend == 'torch':
             model = self.perf_optimizer.compile_model(model, f"nllb_{model_type}")
 
         # Enregistrer le modèle
@@ -291,10 +379,83 @@ class ModelLoader:
             except Exception as e:
                 logger.warning(f"⚠️ Impossible d'enregistrer dans ModelManager: {e}")
 
-        logger.info(f"✅ Modèle {model_type} chargé: {model_name}")
+        logger.info(f"✅ Modèle {model_type} chargé: {model_name} (backend={backend})")
         if config['local_path'].exists():
             logger.info(f"📁 Modèle disponible en local: {config['local_path']}")
 
+    def _load_onnx_model(self, model_name: str) -> Any:
+        """
+        Charge le modèle en ONNX Runtime (encodeur + décodeur avec KV-cache)
+
+        L'export ONNX coûte plusieurs minutes : le résultat est sauvegardé sous
+        models_path/<model_name>-onnx et réutilisé aux démarrages suivants.
+        L'export part des poids locaux (hors ligne possible) et n'est publié,
+        par renommage atomique, qu'une fois complet.
+
+        Args:
+            model_name: Nom HuggingFace du modèle
+
+        Returns:
+            ORTModelForSeq2SeqLM (API generate() compatible transformers)
+        """
+        onnx_path = self.models_path / f"{model_name}-onnx"
+
+        if is_complete_onnx_export(onnx_path):
+            logger.info(f"📁 Modèle ONNX local: {onnx_path}")
+            return ORTModelForSeq2SeqLM.from_pretrained(str(onnx_path), use_cache=True)
+        if onnx_path.exists():
+            logger.warning(f"⚠️ Export ONNX incomplet ignoré: {onnx_path}")
+
+        source = self._resolve_local_model(model_name)
+        logger.info(f"🔄 Export ONNX de {model_name} depuis {source} (premier démarrage)...")
+        model = ORTModelForSeq2SeqLM.from_pretrained(
+            source,
+            export=True,
+            use_cache=True,
+            cache_dir=str(self.huggingface_cache)
+        )
+
+        # Écrit à côté (même système de fichiers) puis renommé: jamais d'export partiel publié
+        tmp_path = onnx_path.with_name(f"{onnx_path.name}.tmp-{os.getpid()}")
+        try:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            model.save_pretrained(str(tmp_path))
+            if not is_complete_onnx_export(tmp_path):
+                raise RuntimeError("fichiers encodeur/décodeur/config manquants")
+            if onnx_path.exists():
+                shutil.rmtree(onnx_path)
+            os.replace(tmp_path, onnx_path)
+            logger.info(f"💾 Modèle ONNX sauvegardé: {onnx_path}")
+        except Exception as e:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            logger.warning(f"⚠️ Impossible de sauvegarder l'export ONNX: {e}")
+        return model
+
+    def _resolve_local_model(self, model_name: str) -> str:
+        """
+        Source locale des poids d'un modèle
+
+        Copie sous models_path, sinon instantané du cache HuggingFace (celui
+        que lit le chargement PyTorch) ; le nom HuggingFace (téléchargement)
+        en dernier recours.
+        """
+        local_path = self.models_path / model_name
+        if (local_path / 'config.json').is_file():
+            return str(local_path)
+        try:
+            from huggingface_hub import snapshot_download
+            return snapshot_download(
+                repo_id=model_name,
+                cache_dir=str(self.huggingface_cache),
+                local_files_only=True
+            )
+        except Exception:
+            return model_name
+
+    def get_model_backend(self, model_type: str) -> str:
+        """Retourne le backend d'inférence du modèle ('torch', 'int8', 'onnx')"""
+        return self.model_backends.get(model_type, 'torch')
+
     def get_thread_local_tokenizer(self, model_type: str) -> Optional[Any]:
         """
         Obtient ou crée un tokenizer pour le thread actuel (évite 'Already borrowed')
@@ -358,6 +519,20 @@ class ModelLoader:
 
         return self._model_inference_locks[model_type]
 
+    def reset_after_fork(self):
+        """
+        Réinitialise l'état lié aux threads dans un processus réplica forké
+
+        Seul le thread qui a forké survit dans l'enfant : un lock tenu par un
+        autre thread au moment du fork ne serait jamais relâché, et les
+        tokenizers thread-local sont indexés par des ids de threads qui
+        n'existent plus. Les modèles et tokenizers chargés sont conservés
+        (poids partagés avec le processus parent).
+        """
+        self._model_inference_locks = {}
+        self._thread_local_tokenizers = {}
+        self._tokenizer_lock = threading.Lock()
+
     def is_model_loaded(self, model_type: str) -> bool:
         """Vérifie si un modèle est chargé"""
         return model_type in self.models
@@ -377,6 +552,7 @@ class ModelLoader:
             except Exception:
                 pass
         self.models.clear()
+        self.model_backends.clear()
 
         # Libérer les tokenizers
         self.tokenizers.clear()
@@ -0,0 +1,749 @@
+"""
+Module pool de réplicas d'inférence multi-processus
+Responsabilités:
+- Partage des poids des modèles chargés (mémoire partagée) avec N processus réplicas
+- Un TranslatorEngine par réplica (executor, lock d'inférence et GIL propres)
+- Dispatch des traductions du processus front vers les réplicas (un pipe par réplica)
+- Supervision (réplica mort: échec de ses requêtes puis re-fork par un
+  processus zygote resté inactif) et arrêt propre
+"""
+
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from multiprocessing import reduction
+from multiprocessing.connection import Connection, wait as wait_connections
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+try:
+    import torch
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+
+# Méthodes du TranslatorEngine exécutables dans un réplica
+REPLICA_METHODS = ('translate_text', 'translate_batch', 'translate_multilingual')
+
+# Intervalle de surveillance des réplicas par le thread lecteur (secondes)
+SUPERVISION_INTERVAL_S = 1.0
+
+
+def resolve_replica_count(
+    requested: int,
+    device: str,
+    backends: Iterable[str],
+    fork_available: bool = None
+) -> int:
+    """Résout le nombre de réplicas effectivement utilisable (0 = mode in-process).
+
+    Les réplicas sont forkés APRÈS le chargement des modèles pour hériter des
+    poids sans les recharger : il faut donc le start method `fork` (Linux),
+    un device CPU (CUDA n'est pas fork-safe) et un backend torch/int8 (les
+    sessions ONNX Runtime et leurs threads internes ne survivent pas au fork).
+    """
+    if fork_available is None:
+        fork_available = 'fork' in multiprocessing.get_all_start_methods()
+
+    if requested < 2:
+        return 0
+    if not fork_available:
+        logger.warning("⚠️ [REPLICAS] fork indisponible sur cette plateforme, mode in-process")
+        return 0
+    if device != 'cpu':
+        logger.info(f"ℹ️ [REPLICAS] Pool de processus réservé au CPU, device={device} → in-process")
+        return 0
+    if 'onnx' in set(backends):
+        logger.warning("⚠️ [REPLICAS] Backend ONNX non fork-safe, mode in-process")
+        return 0
+    return requested
+
+
+def share_model_weights(model: Any) -> bool:
+    """Déplace les poids d'un modèle torch en mémoire partagée (/dev/shm).
+
+    Après le fork, les pages des poids sont communes au parent et aux
+    réplicas : la RAM n'est pas dupliquée par réplica, même si un accès
+    écrit dans une page voisine (ce qui déclencherait sinon une copie
+    copy-on-write). Les poids int8 packés ne sont pas déplacés mais restent
+    partagés en copy-on-write (jamais écrits à l'inférence).
+    """
+    share_memory = getattr(model, 'share_memory', None)
+    if share_memory is None:
+        return False
+    try:
+        share_memory()
+        return True
+    except Exception as e:
+        logger.warning(f"⚠️ [REPLICAS] share_memory() impossible, copy-on-write seul: {e}")
+        return False
+
+
+def _default_engine_factory(model_loader) -> Any:
+    """Crée le TranslatorEngine d'un réplica sur les modèles hérités du parent"""
+    from .translator_engine import TranslatorEngine
+
+    model_loader.reset_after_fork()
+    executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="replica-infer")
+    return TranslatorEngine(model_loader, executor)
+
+
+def _replica_main(
+    replica_id: int,
+    model_loader,
+    engine_factory: Callable[[Any], Any],
+    conn,
+    max_inflight: int,
+    torch_threads: int
+) -> None:
+    """
+    Boucle principale d'un processus réplica
+
+    Les tâches arrivent par le pipe du réplica (le front choisit le réplica
+    le moins chargé) et sont lues dans la limite de `max_inflight` : quelques
+    requêtes en vol suffisent au micro-batching du réplica. Un pipe par
+    réplica plutôt qu'une queue partagée : un réplica tué ne peut pas
+    emporter avec lui le verrou de lecture des autres, et sa mort se lit
+    comme un EOF côté front.
+    """
+    if TORCH_AVAILABLE and torch_threads > 0:
+        torch.set_num_threads(torch_threads)
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    engine = engine_factory(model_loader)
+    conn.send((None, 'ready', replica_id))
+
+    async def _run(request_id: int, method: str, args: tuple, slots: asyncio.Semaphore):
+        try:
+            fn = getattr(engine, method)
+            if asyncio.iscoroutinefunction(fn):
+                value = await fn(*args)
+            else:
+                # Méthode bloquante du moteur (warmup_pair): hors de la boucle du réplica
+                value = await loop.run_in_executor(None, fn, *args)
+            conn.send((request_id, True, value))
+        except Exception as e:
+            conn.send((request_id, False, f"{type(e).__name__}: {e}"))
+        finally:
+            slots.release()
+
+    async def _serve():
+        slots = asyncio.Semaphore(max(1, max_inflight))
+        tasks = set()
+        while True:
+            await slots.acquire()
+            try:
+                item = await loop.run_in_executor(None, conn.recv)
+            except (EOFError, OSError):
+                break  # Front disparu
+            if item is None:
+                break
+            request_id, method, args = item
+            task = loop.create_task(_run(request_id, method, args, slots))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    try:
+        loop.run_until_complete(_serve())
+    finally:
+        cleanup = getattr(engine, 'cleanup', None)
+        if cleanup is not None:
+            cleanup()
+        loop.close()
+
+
+def _zygote_main(
+    control,
+    model_loader,
+    engine_factory: Callable[[Any], Any],
+    max_inflight: int,
+    torch_threads: int
+) -> None:
+    """
+    Processus zygote: re-forke les réplicas morts
+
+    Forké au démarrage du pool, avant tout trafic, il ne fait ensuite
+    qu'attendre des ordres sur son pipe de contrôle : un seul thread, aucun
+    lock tenu, aucun pool OpenMP/torch initialisé par une inférence. Un
+    re-fork depuis ici est aussi sûr que le fork initial, là où un fork du
+    front en plein trafic héritait des locks tenus par ses autres threads.
+
+    Ordre `replica_id` → fork du réplica, puis renvoi au front de son
+    extrémité de pipe (descripteur passé par SCM_RIGHTS) et de son pid.
+    """
+    children: Set[int] = set()
+    while True:
+        for pid in list(children):
+            try:
+                done, _ = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                done = pid
+            if done:
+                children.discard(pid)
+        try:
+            if not control.poll(SUPERVISION_INTERVAL_S):
+                continue
+            replica_id = control.recv()
+        except (EOFError, OSError):
+            break  # Front disparu
+        if replica_id is None:
+            break
+
+        front_conn, replica_conn = multiprocessing.Pipe(duplex=True)
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                control.close()
+                front_conn.close()
+                _replica_main(
+                    replica_id, model_loader, engine_factory,
+                    replica_conn, max_inflight, torch_threads
+                )
+            except BaseException:
+                code = 1
+            finally:
+                os._exit(code)
+
+        replica_conn.close()
+        children.add(pid)
+        try:
+            reduction.send_handle(control, front_conn.fileno(), os.getppid())
+            control.send(pid)
+        except OSError:
+            break
+        finally:
+            front_conn.close()
+
+
+class _ForkedReplica:
+    """Réplica re-forké par le zygote (petit-enfant du front, suivi par pid)"""
+
+    exitcode = None  # Connu du seul zygote, qui le récolte
+
+    def __init__(self, pid: int, replica_id: int):
+        self.pid = pid
+        self.name = f"translation-replica-{replica_id}"
+
+    def is_alive(self) -> bool:
+        try:
+            os.kill(self.pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+        return True
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.is_alive() and (deadline is None or time.monotonic() < deadline):
+            time.sleep(0.05)
+
+    def terminate(self) -> None:
+        try:
+            os.kill(self.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+
+class ReplicaPool:
+    """
+    Pool de N processus réplicas d'inférence
+
+    Dans un seul processus, tous les workers du pool ZMQ passent par le même
+    ThreadPoolExecutor et le même lock par modèle : l'orchestration Python
+    plafonne à ~1 cœur. Ici chaque réplica possède son TranslatorEngine (et
+    donc son lock d'inférence) et son propre GIL ; les poids, chargés une
+    fois par le parent, sont partagés en mémoire.
+
+    Expose la même API async que TranslatorEngine (translate_text,
+    translate_batch, translate_multilingual) : TranslationService l'utilise
+    à la place du moteur local quand il est actif.
+
+    Chaque requête est envoyée au réplica qui en a le moins en vol, qui en
+    devient propriétaire : s'il meurt (EOF sur son pipe), ses requêtes
+    échouent aussitôt et il est re-forké (au plus `max_restarts` fois).
+    Une requête sans réponse après `dispatch_timeout` échoue (réplica bloqué).
+
+    Doit être démarré juste après le chargement des modèles, avant tout
+    trafic : aucun lock d'inférence n'est alors tenu au moment du fork. Les
+    re-forks ultérieurs passent par un zygote forké à ce même moment, jamais
+    par le front (dont les threads tiennent des locks en plein trafic).
+    """
+
+    def __init__(
+        self,
+        model_loader,
+        num_replicas: int,
+        engine_factory: Optional[Callable[[Any], Any]] = None,
+        max_inflight: int = 4,
+        start_timeout: float = 120.0,
+        dispatch_timeout: Optional[float] = 300.0,
+        max_restarts: int = 5
+    ):
+        """
+        Initialise le pool (les processus sont créés par start())
+
+        Args:
+            model_loader: ModelLoader avec modèles chargés (hérités par les réplicas)
+            num_replicas: Nombre de processus réplicas
+            engine_factory: Fabrique du moteur d'un réplica (défaut: TranslatorEngine)
+            max_inflight: Requêtes en vol max par réplica
+            start_timeout: Délai max d'attente du démarrage des réplicas (secondes)
+            dispatch_timeout: Délai max d'une requête dispatchée (None = sans borne)
+            max_restarts: Nombre max de re-forks de réplicas morts
+        """
+        self.model_loader = model_loader
+        self.num_replicas = num_replicas
+        self.engine_factory = engine_factory or _default_engine_factory
+        self.max_inflight = max_inflight
+        self.start_timeout = start_timeout
+        self.dispatch_timeout = dispatch_timeout
+        self.max_restarts = max(0, max_restarts)
+
+        self._ctx = None
+        self._torch_threads = 1
+        self._processes: List[Any] = []
+        self._conns: List[Any] = []
+        self._send_locks: List[threading.Lock] = []
+        self._dead: Set[int] = set()
+        self._zygote = None
+        self._zygote_conn = None
+        self._reader_thread: Optional[threading.Thread] = None
+
+        self._pending: Dict[int, Future] = {}
+        self._owners: Dict[int, int] = {}
+        self._pending_lock = threading.Lock()
+        self._request_ids = itertools.count()
+        self._running = False
+        self._reading = False
+
+        self.stats = {
+            'dispatched': 0,
+            'completed': 0,
+            'failed': 0,
+            'timeouts': 0,
+            'restarts': 0,
+            'shared_models': 0
+        }
+
+    @property
+    def is_running(self) -> bool:
+        """True si le pool accepte des requêtes"""
+        return self._running
+
+    def start(self) -> bool:
+        """
+        Partage les poids puis forke les réplicas
+
+        Returns:
+            True si tous les réplicas sont prêts, False sinon (pool arrêté)
+        """
+        if self._running:
+            return True
+
+        self._ctx = multiprocessing.get_context('fork')
+
+        # Un même modèle peut être enregistré sous plusieurs alias (basic/medium)
+        models = {id(model): model for model in self.model_loader.models.values()}
+        self.stats['shared_models'] = sum(share_model_weights(m) for m in models.values())
+
+        self._torch_threads = max(1, (os.cpu_count() or 1) // self.num_replicas)
+        # Zygote forké en premier: il n'hérite d'aucun pipe de réplica
+        if self.max_restarts > 0:
+            self._start_zygote()
+        for replica_id in range(self.num_replicas):
+            process, conn = self._spawn(replica_id)
+            self._processes.append(process)
+            self._conns.append(conn)
+            self._send_locks.append(threading.Lock())
+
+        ready = sum(self._wait_ready(conn) for conn in self._conns)
+        if ready < self.num_replicas:
+            logger.error(
+                f"❌ [REPLICAS] {ready}/{self.num_replicas} réplicas prêts après "
+                f"{self.start_timeout:.0f}s, arrêt du pool"
+            )
+            self._running = True
+            self.stop()
+            return False
+
+        self._running = True
+        self._reading = True
+        self._reader_thread = threading.Thread(
+            target=self._read_results, name="replica-results", daemon=True
+        )
+        self._reader_thread.start()
+
+        logger.info(
+            f"🧬 [REPLICAS] {self.num_replicas} réplicas démarrés "
+            f"({self.stats['shared_models']} modèle(s) en mémoire partagée, "
+            f"{self._torch_threads} thread(s) torch/réplica)"
+        )
+        return True
+
+    def _spawn(self, replica_id: int):
+        """Forke le processus d'un réplica et retourne (processus, pipe côté front)"""
+        front_conn, replica_conn = self._ctx.Pipe(duplex=True)
+        process = self._ctx.Process(
+            target=_replica_main,
+            args=(
+                replica_id, self.model_loader, self.engine_factory,
+                replica_conn, self.max_inflight, self._torch_threads
+            ),
+            name=f"translation-replica-{replica_id}",
+            daemon=True
+        )
+        process.start()
+        # Seul le réplica garde son extrémité: sa mort ferme le pipe (EOF côté front)
+        replica_conn.close()
+        return process, front_conn
+
+    def _start_zygote(self) -> None:
+        """Forke le zygote qui servira aux re-forks de réplicas morts"""
+        self._zygote_conn, zygote_conn = self._ctx.Pipe(duplex=True)
+        self._zygote = self._ctx.Process(
+            target=_zygote_main,
+            args=(
+                zygote_conn, self.model_loader, self.engine_factory,
+                self.max_inflight, self._torch_threads
+            ),
+            name="translation-replica-zygote",
+            daemon=True
+        )
+        self._zygote.start()
+        zygote_conn.close()
+
+    def _respawn(self, replica_id: int):
+        """Fait re-forker un réplica par le zygote (processus, pipe côté front)"""
+        if self._zygote_conn is None:
+            raise RuntimeError("zygote absent")
+        try:
+            self._zygote_conn.send(replica_id)
+            if not self._zygote_conn.poll(self.start_timeout):
+                raise RuntimeError("zygote muet")
+            fd = reduction.recv_handle(self._zygote_conn)
+            pid = self._zygote_conn.recv()
+        except (EOFError, OSError) as e:
+            raise RuntimeError(f"zygote injoignable: {e}")
+        return _ForkedReplica(pid, replica_id), Connection(fd)
+
+    def _stop_zygote(self) -> None:
+        if self._zygote_conn is not None:
+            try:
+                self._zygote_conn.send(None)
+            except (OSError, ValueError):
+                pass
+            self._zygote_conn.close()
+            self._zygote_conn = None
+        if self._zygote is not None:
+            self._zygote.join(2.0)
+            if self._zygote.is_alive():
+                self._zygote.terminate()
+                self._zygote.join(1.0)
+            self._zygote = None
+
+    def _wait_ready(self, conn) -> bool:
+        """Attend le message 'ready' d'un réplica"""
+        try:
+            if not conn.poll(self.start_timeout):
+                return False
+            request_id, status, _ = conn.recv()
+        except (EOFError, OSError):
+            return False
+        return request_id is None and status == 'ready'
+
+    def _read_results(self) -> None:
+        """Thread front: résout les futures et surveille les réplicas"""
+        while self._reading:
+            watched = {
+                conn: replica_id for replica_id, conn in enumerate(self._conns)
+                if replica_id not in self._dead
+            }
+            if not watched:
+                return
+
+            for conn in wait_connections(list(watched), timeout=SUPERVISION_INTERVAL_S):
+                replica_id = watched[conn]
+                try:
+                    item = conn.recv()
+                except (EOFError, OSError):
+                    self._on_replica_exit(replica_id)
+                    continue
+                self._on_result(replica_id, item)
+
+            # Réplica bloqué dans un appel natif puis tué sans EOF lisible
+            for replica_id, process in enumerate(self._processes):
+                if replica_id not in self._dead and not process.is_alive() and not self._conns[replica_id].poll():
+                    self._on_replica_exit(replica_id)
+
+    def _on_result(self, replica_id: int, item) -> None:
+        request_id, ok, value = item
+        if request_id is None:
+            logger.info(f"🧬 [REPLICAS] Réplica {replica_id} prêt")
+            return
+
+        with self._pending_lock:
+            future = self._pending.pop(request_id, None)
+            self._owners.pop(request_id, None)
+        if future is None:
+            return  # Abandonnée après timeout
+
+        if ok:
+            self.stats['completed'] += 1
+            self._resolve(future, result=value)
+        else:
+            self.stats['failed'] += 1
+            self._resolve(future, error=RuntimeError(f"[replica] {value}"))
+
+    def _on_replica_exit(self, replica_id: int) -> None:
+        """Échoue les requêtes du réplica mort et le re-forke"""
+        process = self._processes[replica_id]
+        process.join(1.0)
+        self._conns[replica_id].close()
+
+        with self._pending_lock:
+            self._dead.add(replica_id)
+            owned = [rid for rid, owner in self._owners.items() if owner == replica_id]
+            futures = [self._pending.pop(rid, None) for rid in owned]
+            for rid in owned:
+                del self._owners[rid]
+        if not self._running:
+            return  # Arrêt normal
+
+        reason = f"réplica {replica_id} arrêté (exitcode={process.exitcode})"
+        if self.stats['restarts'] < self.max_restarts:
+            self.stats['restarts'] += 1
+            logger.warning(
+                f"⚠️ [REPLICAS] {reason}, {len(owned)} requête(s) échouée(s), "
+                f"re-fork ({self.stats['restarts']}/{self.max_restarts})"
+            )
+            try:
+                # Forké par le zygote, pas par ce thread: le front tourne et
+                # ses autres threads peuvent tenir des locks en ce moment.
+                # Les requêtes envoyées avant son 'ready' attendent dans le pipe
+                process, conn = self._respawn(replica_id)
+            except RuntimeError as e:
+                logger.error(f"❌ [REPLICAS] Re-fork du réplica {replica_id} impossible: {e}")
+            else:
+                with self._send_locks[replica_id]:
+                    self._processes[replica_id] = process
+                    self._conns[replica_id] = conn
+                with self._pending_lock:
+                    self._dead.discard(replica_id)
+        else:
+            logger.error(f"❌ [REPLICAS] {reason}, plus de re-fork disponible")
+
+        # Après le re-fork: un appelant qui réessaie trouve le réplica remplacé
+        for future in futures:
+            if future is not None:
+                self.stats['failed'] += 1
+                self._resolve(future, error=RuntimeError(f"[replica] {reason}"))
+
+        if len(self._dead) == len(self._processes):
+            logger.error("❌ [REPLICAS] Tous les réplicas sont morts, retour au mode in-process")
+            self._running = False
+            self._reading = False
+            self._fail_pending("tous les réplicas sont arrêtés")
+
+    @staticmethod
+    def _resolve(future: Future, result: Any = None, error: Optional[BaseException] = None) -> None:
+        """Résout un future sauf s'il l'est déjà (abandonné par l'appelant)"""
+        try:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+        except InvalidStateError:
+            pass
+
+    def _fail_pending(self, reason: str) -> None:
+        """Échoue toutes les requêtes en vol"""
+        with self._pending_lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+            self._owners.clear()
+        for future in pending:
+            self._resolve(future, error=RuntimeError(f"[replica] {reason}"))
+
+    def _send(self, request_id: int, method: str, args: tuple, replica_id: Optional[int] = None) -> None:
+        """Confie la requête au réplica désigné, sinon au réplica vivant qui en a le moins en vol"""
+        with self._pending_lock:
+            load = {rid: 0 for rid in range(len(self._processes)) if rid not in self._dead}
+            if not load:
+                raise RuntimeError("[replica] aucun réplica disponible")
+            if replica_id is None:
+                for owner in self._owners.values():
+                    if owner in load:
+                        load[owner] += 1
+                replica_id = min(load, key=load.get)
+            elif replica_id not in load:
+                raise RuntimeError(f"[replica] réplica {replica_id} indisponible")
+            self._owners[request_id] = replica_id
+
+        try:
+            with self._send_locks[replica_id]:
+                self._conns[replica_id].send((request_id, method, args))
+        except (OSError, ValueError) as e:
+            # Pipe fermé: le réplica vient de mourir, le lecteur s'occupe du re-fork
+            raise RuntimeError(f"[replica] réplica {replica_id} injoignable: {e}")
+
+    async def _dispatch(self, method: str, *args, replica_id: Optional[int] = None) -> Any:
+        """
+        Envoie un appel du moteur à un réplica (le moins chargé si `replica_id`
+        n'est pas fourni) et attend son résultat
+
+        Raises:
+            RuntimeError: Pool arrêté, erreur du moteur ou réplica mort
+            asyncio.TimeoutError: Pas de réponse avant `dispatch_timeout`
+        """
+        if not self._running:
+            raise RuntimeError("ReplicaPool non démarré")
+
+        future: Future = Future()
+        request_id = next(self._request_ids)
+        with self._pending_lock:
+            self._pending[request_id] = future
+        try:
+            self._send(request_id, method, args, replica_id)
+        except RuntimeError:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+                self._owners.pop(request_id, None)
+            raise
+        self.stats['dispatched'] += 1
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.dispatch_timeout)
+        except asyncio.TimeoutError:
+            # Réplica bloqué: la réponse tardive éventuelle sera ignorée
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+                self._owners.pop(request_id, None)
+            self.stats['timeouts'] += 1
+            raise asyncio.TimeoutError(
+                f"[replica] {method}: pas de réponse après {self.dispatch_timeout:.0f}s"
+            )
+
+    async def translate_text(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        model_type: str
+    ) -> str:
+        """TranslatorEngine.translate_text exécuté dans un réplica"""
+        return await self._dispatch('translate_text', text, source_lang, target_lang, model_type)
+
+    async def translate_batch(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str,
+        model_type: str
+    ) -> List[str]:
+        """TranslatorEngine.translate_batch exécuté dans un réplica"""
+        return await self._dispatch('translate_batch', list(texts), source_lang, target_lang, model_type)
+
+    async def translate_multilingual(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_langs: List[str],
+        model_type: str
+    ) -> Dict[str, List[str]]:
+        """TranslatorEngine.translate_multilingual exécuté dans un réplica"""
+        return await self._dispatch(
+            'translate_multilingual', list(texts), source_lang, list(target_langs), model_type
+        )
+
+    async def warmup_pair(
+        self,
+        model_type: str,
+        nllb_source: str,
+        nllb_target: str,
+        token_lengths: List[int]
+    ) -> bool:
+        """
+        TranslatorEngine.warmup_pair exécuté dans chaque réplica vivant
+
+        Chaque réplica a son propre cache de pipelines : préchauffer un seul
+        réplica laisserait les autres payer la première requête.
+
+        Returns:
+            True si la paire est prête dans tous les réplicas
+        """
+        with self._pending_lock:
+            replica_ids = [rid for rid in range(len(self._processes)) if rid not in self._dead]
+        results = await asyncio.gather(*[
+            self._dispatch(
+                'warmup_pair', model_type, nllb_source, nllb_target, list(token_lengths), replica_id=rid
+            )
+            for rid in replica_ids
+        ], return_exceptions=True)
+        for rid, result in zip(replica_ids, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"⚠️ [REPLICAS] Warm-up {model_type} {nllb_source}→{nllb_target} (réplica {rid}): {result}")
+        return bool(results) and all(result is True for result in results)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Arrête les réplicas (les requêtes en vol sont terminées)"""
+        if not self._running and not self._processes:
+            return
+
+        logger.info("🛑 [REPLICAS] Arrêt des réplicas...")
+        self._running = False
+
+        for replica_id, conn in enumerate(self._conns):
+            if replica_id in self._dead:
+                continue
+            try:
+                with self._send_locks[replica_id]:
+                    conn.send(None)
+            except (OSError, ValueError):
+                pass
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                logger.warning(f"⚠️ [REPLICAS] {process.name} ne répond pas, terminate()")
+                process.terminate()
+                process.join(1.0)
+
+        if self._reader_thread is not None:
+            # Le lecteur consomme les derniers résultats jusqu'à l'EOF de chaque pipe
+            self._reader_thread.join(timeout)
+            self._reader_thread = None
+        self._reading = False
+
+        self._fail_pending("pool arrêté")
+        self._stop_zygote()
+        for conn in self._conns:
+            conn.close()
+        self._processes.clear()
+        self._conns.clear()
+        self._send_locks.clear()
+        self._dead.clear()
+        logger.info("✅ [REPLICAS] Réplicas arrêtés")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retourne les statistiques du pool"""
+        with self._pending_lock:
+            in_flight = len(self._pending)
+        return {
+            **self.stats,
+            'replicas': self.num_replicas,
+            'alive': sum(1 for p in self._processes if p.is_alive()),
+            'in_flight': in_flight,
+            'running': self._running
+        }
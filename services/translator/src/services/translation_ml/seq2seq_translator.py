@@ -4,11 +4,45 @@ Supporte: NLLB, T5, mT5, mBART, et autres modèles similaires
 """
 
 import logging
-from typing import List, Union, Dict, Optional
+import os
+import threading
+import weakref
+from typing import Any, List, Union, Dict, Optional
 from enum import Enum
 
+from utils.token_cache import get_token_cache
+
 logger = logging.getLogger(__name__)
 
+# Un tokenizer thread-local est partagé par tous les pipelines (paires de
+# langues) créés depuis le même thread : src_lang est un état mutable du
+# tokenizer et les tokenizers rapides lèvent "Already borrowed" en accès
+# concurrent. Chaque tokenisation se fait donc sous le lock de son tokenizer.
+# Indexé par l'instance elle-même (référence faible) : un id() réutilisé après
+# la libération d'un tokenizer ne retrouve pas un lock périmé.
+_tokenizer_locks: "weakref.WeakKeyDictionary[Any, threading.Lock]" = weakref.WeakKeyDictionary()
+_tokenizer_locks_guard = threading.Lock()
+
+
+def _get_tokenizer_lock(tokenizer) -> threading.Lock:
+    """Retourne le lock dédié à une instance de tokenizer"""
+    with _tokenizer_locks_guard:
+        lock = _tokenizer_locks.get(tokenizer)
+        if lock is None:
+            lock = _tokenizer_locks[tokenizer] = threading.Lock()
+    return lock
+
+
+def _reset_tokenizer_locks() -> None:
+    """Dans un enfant forké: les locks tenus par des threads du parent ne seraient jamais relâchés"""
+    global _tokenizer_locks, _tokenizer_locks_guard
+    _tokenizer_locks = weakref.WeakKeyDictionary()
+    _tokenizer_locks_guard = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_tokenizer_locks)
+
 
 class ModelType(Enum):
     """Types de modèles supportés"""
@@ -28,7 +62,9 @@ class Seq2SeqTranslator:
     - T5/mT5: utilise des préfixes comme "translate English to French: {text}"
     - mBART: similaire à NLLB avec des codes spécifiques
 
-    Auto-détecte le type de modèle depuis model.config
+    Auto-détecte le type de modèle depuis model.config, ainsi que le backend
+    d'inférence (torch float32, torch int8 quantifié, ONNX Runtime) : tous
+    exposent generate(), seul le placement sur device diffère.
     """
 
     def __init__(
@@ -65,6 +101,7 @@ class Seq2SeqTranslator:
 
         # Auto-détection du type de modèle
         self.model_type = model_type or self._detect_model_type()
+        self.backend = self._detect_backend()
 
         # Configurer le device du modèle
         self._setup_device()
@@ -99,9 +136,33 @@ class Seq2SeqTranslator:
             logger.warning(f"⚠️  Type de modèle inconnu: {model_name}, mode auto")
             return ModelType.UNKNOWN
 
+    def _detect_backend(self) -> str:
+        """
+        Détecte le backend d'inférence du modèle
+
+        Returns:
+            'onnx' (ONNX Runtime), 'int8' (quantification dynamique) ou 'torch'
+        """
+        if type(self.model).__module__.startswith('optimum.onnxruntime'):
+            return 'onnx'
+
+        modules = getattr(self.model, 'modules', None)
+        if callable(modules):
+            try:
+                for module in modules():
+                    if type(module).__module__.startswith(
+                        ('torch.ao.nn.quantized', 'torch.nn.quantized')
+                    ):
+                        return 'int8'
+            except Exception:
+                pass
+
+        return 'torch'
+
     def _setup_device(self):
         """Configure le device (CPU/GPU)"""
-        if self.device >= 0:
+        # Les backends int8 et ONNX Runtime sont des backends CPU
+        if self.device >= 0 and self.backend == 'torch':
             try:
                 import torch
                 if torch.cuda.is_available():
@@ -176,6 +237,88 @@ class Seq2SeqTranslator:
         """Prétraite une liste de textes"""
         return [self._preprocess_text(text) for text in texts]
 
+    def _token_namespace(self) -> str:
+        """
+        Namespace du cache de tokens: tout ce qui change les ids d'un texte
+
+        NLLB/mBART préfixent le token de la langue source ; T5 encode les
+        langues dans le préfixe (déjà inclus dans le texte prétraité).
+        """
+        name = getattr(self.tokenizer, 'name_or_path', None) or f"tokenizer-{id(self.tokenizer)}"
+        src = None if self.model_type in [ModelType.T5, ModelType.MT5] else self.src_lang
+        return f"{name}|{src}|{self.max_length}"
+
+    def encode(self, texts: List[str], src_lang: str = None) -> List[List[int]]:
+        """
+        Tokenise des textes (sans padding) via le cache LRU de token ids
+
+        Seuls les textes absents du cache passent par le tokenizer, en un
+        seul appel. Le planificateur de batches (longueurs), __call__ et
+        translate_multi_target partagent ainsi UNE tokenisation par texte.
+
+        Args:
+            texts: Textes bruts
+            src_lang: Langue source (override de l'init)
+
+        Returns:
+            input_ids de chaque texte (même ordre)
+        """
+        src_lang = src_lang or self.src_lang
+        if src_lang != self.src_lang:
+            self.src_lang = src_lang
+            self._setup_translation_strategy()
+
+        preprocessed = self._preprocess_texts(texts)
+        namespace = self._token_namespace()
+        cache = get_token_cache()
+
+        input_ids = cache.get_many(namespace, preprocessed)
+        missing = [i for i, ids in enumerate(input_ids) if ids is None]
+
+        if missing:
+            with _get_tokenizer_lock(self.tokenizer):
+                # Le tokenizer peut avoir été réglé par un autre pipeline
+                if self.model_type not in [ModelType.T5, ModelType.MT5]:
+                    self.tokenizer.src_lang = self.src_lang
+                encoded = self.tokenizer(
+                    [preprocessed[i] for i in missing],
+                    truncation=True,
+                    max_length=self.max_length
+                )
+            for i, ids in zip(missing, encoded['input_ids']):
+                input_ids[i] = list(ids)
+                cache.put(namespace, preprocessed[i], input_ids[i])
+
+        return input_ids
+
+    def _build_inputs(self, input_ids: List[List[int]]) -> Dict:
+        """
+        Padde des token ids pré-calculés en tenseurs prêts pour le modèle
+
+        Args:
+            input_ids: Sortie de encode()
+
+        Returns:
+            Dict input_ids/attention_mask (sur GPU si configuré)
+        """
+        with _get_tokenizer_lock(self.tokenizer):
+            inputs = self.tokenizer.pad(
+                {'input_ids': input_ids},
+                padding=True,
+                return_tensors="pt"
+            )
+        inputs = {k: inputs[k] for k in ('input_ids', 'attention_mask')}
+
+        if self.device >= 0 and self.backend == 'torch':
+            try:
+                import torch
+                if torch.cuda.is_available():
+                    inputs = {k: v.to(f'cuda:{self.device}') for k, v in inputs.items()}
+            except Exception:
+                pass
+
+        return inputs
+
     def __call__(
         self,
         texts: Union[str, List[str]],
@@ -184,6 +327,7 @@ class Seq2SeqTranslator:
         max_length: int = None,
         num_beams: int = 1,
         do_sample: bool = False,
+        input_ids: Optional[List[List[int]]] = None,
         **kwargs
     ) -> Union[Dict, List[Dict]]:
         """
@@ -196,6 +340,8 @@ class Seq2SeqTranslator:
             max_length: Longueur max (override de l'init)
             num_beams: Nombre de beams pour la génération
             do_sample: Activer le sampling
+            input_ids: Token ids déjà calculés par encode() (évite de
+                re-tokeniser ; doivent correspondre à `texts` et src_lang)
             **kwargs: Autres paramètres pour generate()
 
         Returns:
@@ -217,34 +363,20 @@ class Seq2SeqTranslator:
             self.tgt_lang = tgt_lang
             self._setup_translation_strategy()
 
-        # Prétraiter les textes selon le modèle
-        preprocessed_texts = self._preprocess_texts(texts)
+        # Tokeniser (cache LRU de token ids) puis padder au plus long du batch
+        if input_ids is None:
+            input_ids = self.encode(texts)
+        inputs = self._build_inputs(input_ids)
 
-        # Tokeniser les textes
-        inputs = self.tokenizer(
-            preprocessed_texts,
-            return_tensors="pt",
-            padding=True,
-            truncation=True,
-            max_length=self.max_length
-        )
-
-        # Déplacer vers device si GPU
-        if self.device >= 0:
-            try:
-                import torch
-                if torch.cuda.is_available():
-                    inputs = {k: v.to(f'cuda:{self.device}') for k, v in inputs.items()}
-            except Exception:
-                pass
-
-        # Préparer les arguments de génération
+        # Préparer les arguments de génération (max_new_tokens, s'il est
+        # fourni, remplace max_length: generate() refuse les deux à la fois)
         generate_kwargs = {
-            'max_length': max_length,
             'num_beams': num_beams,
             'do_sample': do_sample,
             **kwargs
         }
+        if 'max_new_tokens' not in kwargs:
+            generate_kwargs['max_length'] = max_length
 
         # Ajouter forced_bos_token_id pour NLLB/mBART
         if self.forced_bos_token_id is not None:
@@ -265,6 +397,81 @@ class Seq2SeqTranslator:
 
         return results
 
+    def translate_multi_target(
+        self,
+        texts: List[str],
+        tgt_langs: List[str],
+        src_lang: str = None,
+        max_length: int = None,
+        num_beams: int = 1,
+        do_sample: bool = False,
+        **kwargs
+    ) -> Dict[str, List[str]]:
+        """
+        Traduit des textes vers PLUSIEURS langues cibles avec un seul encodage
+
+        La source est tokenisée et passée dans l'encodeur UNE fois ; seuls le
+        décodeur et le forced_bos_token_id changent par langue cible.
+        T5/mT5 encodent la cible dans le préfixe d'entrée : pas de partage
+        possible, on retombe sur un appel __call__ par langue.
+
+        Args:
+            texts: Textes source
+            tgt_langs: Langues cibles (format dépend du modèle)
+            src_lang: Langue source (override de l'init)
+            max_length: Longueur max (override de l'init)
+            num_beams: Nombre de beams pour la génération
+            do_sample: Activer le sampling
+            **kwargs: Autres paramètres pour generate()
+
+        Returns:
+            Dict {langue_cible: [traductions dans l'ordre de texts]}
+        """
+        src_lang = src_lang or self.src_lang
+        max_length = max_length or self.max_length
+
+        if not texts or not tgt_langs:
+            return {tgt: [] for tgt in tgt_langs}
+
+        if self.model_type in [ModelType.T5, ModelType.MT5]:
+            return {
+                tgt: [
+                    r['translation_text'] for r in self(
+                        texts, src_lang=src_lang, tgt_lang=tgt, max_length=max_length,
+                        num_beams=num_beams, do_sample=do_sample, **kwargs
+                    )
+                ]
+                for tgt in tgt_langs
+            }
+
+        # La langue source fixe le token de langue ajouté par le tokenizer
+        inputs = self._build_inputs(self.encode(texts, src_lang=src_lang))
+
+        # Encodage UNIQUE de la source
+        encoder_outputs = self.model.get_encoder()(
+            input_ids=inputs['input_ids'],
+            attention_mask=inputs['attention_mask'],
+            return_dict=True
+        )
+
+        results: Dict[str, List[str]] = {}
+        for tgt in tgt_langs:
+            # Copie superficielle: generate() peut réaffecter les champs de
+            # encoder_outputs (expansion beams) — ne pas polluer les cibles suivantes
+            length_kwargs = {} if 'max_new_tokens' in kwargs else {'max_length': max_length}
+            outputs = self.model.generate(
+                encoder_outputs=type(encoder_outputs)(**encoder_outputs),
+                attention_mask=inputs['attention_mask'],
+                num_beams=num_beams,
+                do_sample=do_sample,
+                forced_bos_token_id=self.tokenizer.convert_tokens_to_ids(tgt),
+                **length_kwargs,
+                **kwargs
+            )
+            results[tgt] = self.tokenizer.batch_decode(outputs, skip_special_tokens=True)
+
+        return results
+
     def get_model_info(self) -> Dict:
         """
         Retourne les informations sur le modèle
@@ -277,7 +484,8 @@ class Seq2SeqTranslator:
             'model_name': self.model.config.model_type,
             'src_lang': self.src_lang,
             'tgt_lang': self.tgt_lang,
-            'device': 'cuda' if self.device >= 0 else 'cpu',
+            'backend': self.backend,
+            'device': 'cuda' if self.device >= 0 and self.backend == 'torch' else 'cpu',
             'max_length': self.max_length,
             'batch_size': self.batch_size
         }
@@ -3,7 +3,7 @@ Module de cache de traductions
 Responsabilités:
 - Cache des traductions avec TTL
 - Intégration Redis ou mémoire
-- Vérification et mise en cache parallèle
+- Vérification et mise en cache groupées (MGET / SETEX pipelinés)
 - Optimisation des requêtes répétées
 """
 
@@ -11,6 +11,8 @@ import logging
 import asyncio
 from typing import Optional, Dict, Any, List, Tuple
 
+from utils.translation_validation import is_failed_translation
+
 logger = logging.getLogger(__name__)
 
 # Import conditionnel du cache Redis
@@ -128,7 +130,7 @@ class TranslationCache:
         model_type: str
     ) -> Tuple[List[Optional[Dict]], List[Tuple[int, str]]]:
         """
-        Vérifie le cache pour plusieurs segments en parallèle
+        Vérifie le cache pour plusieurs segments en un seul aller-retour (MGET)
 
         Args:
             segments: Liste de segments à vérifier
@@ -141,61 +143,42 @@ class TranslationCache:
                 - résultats_cachés: Liste avec None ou dict pour chaque segment
                 - segments_à_traduire: Liste de (index, texte) à traduire
         """
-        if not self.is_available():
-            # Pas de cache, tout à traduire
-            segments_to_translate = []
-            for i, seg in enumerate(segments):
-                if seg.get('type') == 'line' and seg.get('text', '').strip():
-                    segments_to_translate.append((i, seg.get('text', '')))
-            return [None] * len(segments), segments_to_translate
-
-        cached_results = [None] * len(segments)
-        segments_to_translate = []
+        cached_results: List[Optional[Dict]] = [None] * len(segments)
+        lines: List[Tuple[int, str]] = []
 
-        async def check_segment(idx: int, segment: Dict) -> Tuple[int, Optional[Dict], str]:
-            """Vérifie le cache pour un segment"""
+        for idx, segment in enumerate(segments):
             segment_type = segment.get('type', 'line')
 
-            # Préserver les types spéciaux
-            if segment_type in ['paragraph_break', 'separator', 'empty_line', 'code']:
-                return (idx, segment, 'preserved')
-
-            if segment_type == 'line':
-                segment_text = segment.get('text', '')
-                if not segment_text.strip():
-                    return (idx, segment, 'empty')
-
-                # Vérifier le cache
-                cached = await self.get_translation(
-                    text=segment_text,
-                    source_lang=source_lang,
-                    target_lang=target_lang,
-                    model_type=model_type
-                )
-
-                if cached:
-                    return (idx, {'type': 'line', 'text': cached.get('translated_text', segment_text)}, 'cached')
-
-                # Pas en cache, à traduire
-                return (idx, segment_text, 'to_translate')
-
-            return (idx, segment, 'preserved')
+            # Préserver les types spéciaux (et les lignes vides)
+            if segment_type != 'line' or not segment.get('text', '').strip():
+                if self.is_available():
+                    cached_results[idx] = segment
+                continue
 
-        # Vérifier en parallèle
-        tasks = [check_segment(i, seg) for i, seg in enumerate(segments)]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+            lines.append((idx, segment.get('text', '')))
 
-        # Traiter les résultats
-        for result in results:
-            if isinstance(result, Exception):
-                continue
+        if not self.is_available() or not lines:
+            # Pas de cache, tout à traduire
+            return cached_results, lines
 
-            idx, data, status = result
+        try:
+            cached = await self._cache_service.get_batch_translations(
+                texts=[text for _, text in lines],
+                source_lang=source_lang,
+                target_lang=target_lang,
+                model_type=model_type
+            )
+        except Exception as e:
+            logger.debug(f"Erreur récupération cache batch: {e}")
+            return cached_results, lines
 
-            if status in ['cached', 'preserved', 'empty']:
-                cached_results[idx] = data
-            elif status == 'to_translate':
-                segments_to_translate.append((idx, data))
+        segments_to_translate = []
+        for idx, text in lines:
+            hit = cached.get(text)
+            if hit:
+                cached_results[idx] = {'type': 'line', 'text': hit.get('translated_text', text)}
+            else:
+                segments_to_translate.append((idx, text))
 
         return cached_results, segments_to_translate
 
@@ -207,7 +190,7 @@ class TranslationCache:
         model_type: str
     ):
         """
-        Met en cache plusieurs résultats en parallèle (fire-and-forget)
+        Met en cache plusieurs résultats en un aller-retour (fire-and-forget)
 
         Args:
             cache_items: Liste de (texte_original, texte_traduit)
@@ -215,28 +198,51 @@ class TranslationCache:
             target_lang: Langue cible
             model_type: Type de modèle
         """
+        # Jamais un échec du moteur: il serait resservi pendant un mois
+        cache_items = [
+            (orig_text, trans_text) for orig_text, trans_text in cache_items
+            if not is_failed_translation(trans_text)
+        ]
         if not self.is_available() or not cache_items:
             return
 
         async def cache_all():
-            """Cache tous les items en parallèle"""
-            tasks = []
-            for orig_text, trans_text in cache_items:
-                task = self.set_translation(
-                    text=orig_text,
-                    source_lang=source_lang,
-                    target_lang=target_lang,
-                    translated_text=trans_text,
+            """SETEX pipelinés pour tous les items"""
+            try:
+                await self._cache_service.set_translations_batch(
+                    items=[
+                        (orig_text, source_lang, target_lang, trans_text)
+                        for orig_text, trans_text in cache_items
+                    ],
                     model_type=model_type
                 )
-                tasks.append(task)
-
-            # Exécuter toutes les mises en cache sans bloquer
-            await asyncio.gather(*tasks, return_exceptions=True)
+            except Exception as e:
+                logger.debug(f"Erreur mise en cache batch: {e}")
 
         # Lancer en arrière-plan
         asyncio.create_task(cache_all())
 
+    def hot_keys(self, n: int) -> List[str]:
+        """Clés de cache les plus fréquentes (vide si le cache n'est pas disponible)"""
+        if not self.is_available():
+            return []
+        return self._cache_service.hot_keys(n)
+
+    async def preload_hot_keys(self, keys: List[str]) -> int:
+        """
+        Précharge en mémoire (L1) les traductions chaudes d'une session précédente
+
+        Returns:
+            Nombre d'entrées chargées
+        """
+        if not self.is_available() or not keys:
+            return 0
+        try:
+            return await self._cache_service.preload_l1(keys)
+        except Exception as e:
+            logger.warning(f"⚠️ Erreur préchargement cache: {e}")
+            return 0
+
     async def clear_cache(self):
         """Vide le cache (si supporté)"""
         if not self.is_available():
@@ -0,0 +1,431 @@
+"""
+Mémoire de traduction au niveau phrase/segment avec réutilisation approximative
+Le cache Redis ne sert que les correspondances exactes ; le trafic de chat
+regorge de quasi-doublons (un prénom, un nombre, un emoji, une ponctuation
+qui change) et de messages de bots construits sur un même gabarit.
+
+Deux niveaux :
+- Gabarit : nombres, URLs (mask_urls), emojis (placeholders du
+  TextSegmenter) et mentions @ sont masqués avant la mise en clé puis
+  réinjectés dans la traduction mémorisée
+- Approximatif : index MinHash/LSH sur les trigrammes de caractères, vérifié
+  par alignement de mots ; seuls la casse, la ponctuation et les hashtags
+  recopiés tels quels dans la traduction peuvent différer (un mot ordinaire
+  qui change change le sens : « Le film était nul » n'est pas « top »)
+"""
+
+import logging
+import re
+import threading
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from random import Random
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from utils.performance import PerformanceConfig
+from utils.text_segmentation import EMOJI_PATTERN
+from utils.translation_validation import is_failed_translation
+from .translator_engine import mask_urls
+
+logger = logging.getLogger(__name__)
+
+# Marqueurs internes (zone Unicode privée: n'apparaissent jamais dans un message)
+SLOT_MARK = "\ue000"
+_SLOT_END = "\ue001"
+_SLOT_KINDS = {'url': 'U', 'emoji': 'E', 'mention': 'M', 'number': 'N'}
+_TEMPLATE_SLOT = re.compile(SLOT_MARK + r"(\d+)" + _SLOT_END)
+
+_PLACEHOLDER_PATTERN = re.compile(
+    r"(?P<url>🔗(?P<url_index>\d+)🔗)"
+    r"|(?P<emoji>🔹EMOJI_\d+🔹|" + EMOJI_PATTERN.pattern + r")"
+    r"|(?P<mention>(?<![\w@])@\w+)"
+    r"|(?P<number>\d+(?:[.,:]\d+)*)"
+)
+_WHITESPACE = re.compile(r"\s+")
+_HASHTAG = re.compile(r"#\w+")
+
+# MinHash: 16 bandes × 2 lignes (candidats dès ~50% de trigrammes communs,
+# la similarité réelle est ensuite vérifiée par alignement de mots)
+MINHASH_BANDS = 16
+MINHASH_ROWS = 2
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = Random(0x7E57)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(MINHASH_BANDS * MINHASH_ROWS)
+]
+
+FUZZY_MIN_TOKENS = 4
+MAX_SUBSTITUTIONS = 2
+MAX_CANDIDATES = 64
+
+Namespace = Tuple[str, str, str]
+
+
+@dataclass
+class MemoryMatch:
+    """Traduction servie par la mémoire"""
+    translated_text: str
+    match_type: str  # 'exact', 'template' ou 'fuzzy'
+    similarity: float = 1.0
+
+
+@dataclass
+class _MemoryEntry:
+    tokens: List[str]       # mots du source masqué (casse et ponctuation d'origine)
+    canonical: List[str]    # mots normalisés (minuscules, sans ponctuation)
+    values: List[str]       # valeurs masquées du source mémorisé
+    template: str           # traduction avec marqueurs de slots
+    bands: Tuple[int, ...]  # signature LSH
+
+
+def mask_placeholders(text: str) -> Tuple[str, List[str]]:
+    """
+    Masque URLs, emojis/placeholders emoji, mentions et nombres
+
+    Returns:
+        (texte masqué normalisé, valeurs masquées dans l'ordre)
+
+    Exemples:
+        >>> mask_placeholders("Code 4521 🔹EMOJI_0🔹  https://x.io")
+        ('Code \\ue000N \\ue000E \\ue000U', ['4521', '🔹EMOJI_0🔹', 'https://x.io'])
+    """
+    url_masked, urls = mask_urls(text)
+    values: List[str] = []
+
+    def _replace(match: "re.Match[str]") -> str:
+        kind = match.lastgroup if match.lastgroup != 'url_index' else 'url'
+        if match.group('url'):
+            kind = 'url'
+            values.append(urls[int(match.group('url_index'))])
+        else:
+            values.append(match.group(0))
+        return f" {SLOT_MARK}{_SLOT_KINDS[kind]} "
+
+    masked = _PLACEHOLDER_PATTERN.sub(_replace, url_masked)
+    return _WHITESPACE.sub(" ", masked).strip(), values
+
+
+def _canonical_token(token: str) -> str:
+    return "".join(ch for ch in token.lower() if ch.isalnum() or ch == SLOT_MARK)
+
+
+def _tokenize(masked: str) -> Tuple[List[str], List[str]]:
+    """Mots du texte masqué et leurs formes canoniques (mots de pure ponctuation ignorés)"""
+    tokens, canonical = [], []
+    for token in masked.split(" "):
+        canon = _canonical_token(token)
+        if canon:
+            tokens.append(token)
+            canonical.append(canon)
+    return tokens, canonical
+
+
+def _minhash_bands(canonical: List[str]) -> Tuple[int, ...]:
+    """Signature LSH (une valeur par bande) sur les trigrammes de caractères"""
+    joined = " ".join(canonical)
+    shingles = {joined[i:i + 3] for i in range(max(1, len(joined) - 2))}
+    hashes = [zlib.crc32(shingle.encode("utf-8")) for shingle in shingles]
+    signature = [
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes)
+        for a, b in _PERMUTATIONS
+    ]
+    return tuple(
+        hash(tuple(signature[band * MINHASH_ROWS:(band + 1) * MINHASH_ROWS]))
+        for band in range(MINHASH_BANDS)
+    )
+
+
+def _occurrences(text: str, value: str) -> List[int]:
+    """Positions de `value` dans `text` (les nombres ne matchent pas dans un nombre plus long)"""
+    if value[:1].isdigit():
+        pattern = r"(?<![\d.,:])" + re.escape(value) + r"(?![\d]|[.,:]\d)"
+    else:
+        pattern = re.escape(value)
+    return [match.start() for match in re.finditer(pattern, text)]
+
+
+def build_template(translated_text: str, values: List[str]) -> Optional[str]:
+    """
+    Remplace dans la traduction chaque valeur masquée du source par son slot
+
+    Returns:
+        Gabarit, ou None si une valeur n'est pas recopiée telle quelle
+        (nombre localisé, emoji perdu...) : la traduction n'est pas réutilisable
+    """
+    slots_by_value: Dict[str, List[int]] = {}
+    for index, value in enumerate(values):
+        slots_by_value.setdefault(value, []).append(index)
+
+    replacements: List[Tuple[int, int, int]] = []
+    for value, slots in slots_by_value.items():
+        positions = _occurrences(translated_text, value)
+        if len(positions) != len(slots):
+            return None
+        replacements.extend((pos, pos + len(value), slot) for pos, slot in zip(positions, slots))
+
+    template = translated_text
+    for start, end, slot in sorted(replacements, reverse=True):
+        template = f"{template[:start]}{SLOT_MARK}{slot}{_SLOT_END}{template[end:]}"
+    return template
+
+
+def fill_template(template: str, values: List[str]) -> str:
+    """Réinjecte les valeurs du nouveau source dans le gabarit"""
+    return _TEMPLATE_SLOT.sub(lambda match: values[int(match.group(1))], template)
+
+
+class TranslationMemory:
+    """
+    Mémoire de traduction LRU thread-safe par (source, cible, modèle)
+
+    Exemples:
+        >>> memory = TranslationMemory(max_size=1000, threshold=0.8)
+        >>> memory.remember("Votre code est 4521", "Your code is 4521", "fr", "en", "basic")
+        True
+        >>> memory.lookup("Votre code est 9876", "fr", "en", "basic").translated_text
+        'Your code is 9876'
+    """
+
+    def __init__(self, max_size: int = 50000, threshold: float = 0.8, max_chars: int = 500):
+        """
+        Initialise la mémoire
+
+        Args:
+            max_size: Nombre maximum d'entrées (LRU)
+            threshold: Similarité minimale (ratio d'alignement des mots) d'un match approximatif
+            max_chars: Longueur max d'un segment mémorisé
+        """
+        self.max_size = max(1, max_size)
+        self.threshold = threshold
+        self.max_chars = max_chars
+
+        self._entries: "OrderedDict[Tuple[Namespace, str], _MemoryEntry]" = OrderedDict()
+        self._buckets: Dict[Tuple[Namespace, int, int], Set[str]] = {}
+        self._lock = threading.Lock()
+
+        self.stats = {
+            'lookups': 0, 'exact_hits': 0, 'template_hits': 0, 'fuzzy_hits': 0,
+            'misses': 0, 'stores': 0, 'untemplatable': 0, 'evictions': 0
+        }
+
+    # ─────────────────────────────────────────────────────────────────────
+    # API publique
+    # ─────────────────────────────────────────────────────────────────────
+
+    def lookup(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        model_type: str
+    ) -> Optional[MemoryMatch]:
+        """Cherche une traduction réutilisable (gabarit exact puis approximatif)"""
+        if not text.strip() or len(text) > self.max_chars:
+            return None
+
+        namespace = (source_lang, target_lang, model_type)
+        masked, values = mask_placeholders(text)
+        with self._lock:
+            self.stats['lookups'] += 1
+            entry = self._entries.get((namespace, masked))
+            if entry is not None:
+                self._entries.move_to_end((namespace, masked))
+                match_type = 'exact' if entry.values == values else 'template'
+                self.stats[f'{match_type}_hits'] += 1
+                return MemoryMatch(fill_template(entry.template, values), match_type)
+
+        # MinHash et alignement hors verrou: appelé depuis la boucle asyncio,
+        # le verrou ne protège que l'index (les entrées ne sont jamais modifiées)
+        match, match_key = self._fuzzy_lookup(namespace, masked, values)
+        with self._lock:
+            if match_key is not None and (namespace, match_key) in self._entries:
+                self._entries.move_to_end((namespace, match_key))
+            self.stats['fuzzy_hits' if match else 'misses'] += 1
+        return match
+
+    def remember(
+        self,
+        text: str,
+        translated_text: str,
+        source_lang: str,
+        target_lang: str,
+        model_type: str
+    ) -> bool:
+        """
+        Mémorise une traduction produite par le moteur
+
+        Returns:
+            False si la traduction est en échec ou non réutilisable
+        """
+        if not text.strip() or len(text) > self.max_chars or is_failed_translation(translated_text):
+            return False
+
+        masked, values = mask_placeholders(text)
+        template = build_template(translated_text, values)
+        if template is None:
+            with self._lock:
+                self.stats['untemplatable'] += 1
+            return False
+
+        tokens, canonical = _tokenize(masked)
+        bands = _minhash_bands(canonical) if len(canonical) >= FUZZY_MIN_TOKENS else ()
+        namespace = (source_lang, target_lang, model_type)
+        entry = _MemoryEntry(tokens, canonical, values, template, bands)
+
+        with self._lock:
+            key = (namespace, masked)
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._unindex(namespace, masked, previous)
+            self._entries[key] = entry
+            for band, value in enumerate(bands):
+                self._buckets.setdefault((namespace, band, value), set()).add(masked)
+            self.stats['stores'] += 1
+
+            while len(self._entries) > self.max_size:
+                (old_namespace, old_masked), old_entry = self._entries.popitem(last=False)
+                self._unindex(old_namespace, old_masked, old_entry)
+                self.stats['evictions'] += 1
+        return True
+
+    def clear(self) -> None:
+        """Vide la mémoire"""
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Statistiques (taux de réutilisation par niveau)"""
+        with self._lock:
+            hits = self.stats['exact_hits'] + self.stats['template_hits'] + self.stats['fuzzy_hits']
+            lookups = self.stats['lookups']
+            return {
+                **self.stats,
+                'hit_rate': round(hits / lookups, 4) if lookups else 0.0,
+                'size': len(self._entries),
+                'threshold': self.threshold
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Recherche approximative
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _unindex(self, namespace: Namespace, masked: str, entry: _MemoryEntry) -> None:
+        """Retire une entrée des buckets LSH (appelé sous verrou)"""
+        for band, value in enumerate(entry.bands):
+            bucket = self._buckets.get((namespace, band, value))
+            if bucket is not None:
+                bucket.discard(masked)
+                if not bucket:
+                    del self._buckets[(namespace, band, value)]
+
+    def _fuzzy_lookup(
+        self,
+        namespace: Namespace,
+        masked: str,
+        values: List[str]
+    ) -> Tuple[Optional[MemoryMatch], Optional[str]]:
+        """Meilleur quasi-doublon et sa clé (verrou pris seulement pour lire l'index)"""
+        tokens, canonical = _tokenize(masked)
+        if len(canonical) < FUZZY_MIN_TOKENS:
+            return None, None
+        bands = _minhash_bands(canonical)
+
+        # Candidats: entrées partageant au moins une bande, les plus proches d'abord
+        with self._lock:
+            shared: Dict[str, int] = {}
+            for band, value in enumerate(bands):
+                for candidate in self._buckets.get((namespace, band, value), ()):
+                    shared[candidate] = shared.get(candidate, 0) + 1
+            ranked = sorted(shared, key=shared.get, reverse=True)[:MAX_CANDIDATES]
+            entries = [(candidate, self._entries.get((namespace, candidate))) for candidate in ranked]
+
+        best: Optional[MemoryMatch] = None
+        best_key: Optional[str] = None
+        for candidate, entry in entries:
+            if entry is None:
+                continue
+            matcher = SequenceMatcher(None, entry.canonical, canonical, autojunk=False)
+            similarity = matcher.ratio()
+            if similarity < self.threshold or (best and similarity <= best.similarity):
+                continue
+            translated = self._adapt(entry, tokens, matcher.get_opcodes(), values)
+            if translated is not None:
+                best = MemoryMatch(translated, 'fuzzy', round(similarity, 4))
+                best_key = candidate
+
+        return best, best_key
+
+    @staticmethod
+    def _adapt(
+        entry: _MemoryEntry,
+        tokens: List[str],
+        opcodes: List[Tuple[str, int, int, int, int]],
+        values: List[str]
+    ) -> Optional[str]:
+        """
+        Adapte la traduction mémorisée au nouveau source
+
+        Seules les substitutions mot à mot de hashtags sont acceptées, et
+        seulement si le hashtag remplacé apparaît une fois, tel quel, dans la
+        traduction. Tout autre mot qui diffère rejette le candidat.
+        """
+        if len(values) != len(entry.values):
+            return None
+
+        template = entry.template
+        substitutions = 0
+        for tag, i1, i2, j1, j2 in opcodes:
+            if tag == 'equal':
+                continue
+            if tag != 'replace' or (i2 - i1) != (j2 - j1):
+                return None
+            for old_token, new_token in zip(entry.tokens[i1:i2], tokens[j1:j2]):
+                if SLOT_MARK in old_token or SLOT_MARK in new_token:
+                    return None
+                old_word = _HASHTAG.search(old_token)
+                new_word = _HASHTAG.search(new_token)
+                if old_word is None or new_word is None:
+                    return None
+                old_word, new_word = old_word.group(0), new_word.group(0)
+                pattern = r"(?<!\w)" + re.escape(old_word) + r"(?!\w)"
+                if len(re.findall(pattern, template)) != 1:
+                    return None
+                template = re.sub(pattern, lambda _m: new_word, template)
+                substitutions += 1
+                if substitutions > MAX_SUBSTITUTIONS:
+                    return None
+
+        return fill_template(template, values)
+
+
+_translation_memory: Optional[TranslationMemory] = None
+_translation_memory_lock = threading.Lock()
+
+
+def get_translation_memory() -> Optional[TranslationMemory]:
+    """Retourne la mémoire de traduction partagée (None si TRANSLATOR_TRANSLATION_MEMORY=false)"""
+    global _translation_memory
+    if _translation_memory is None:
+        config = PerformanceConfig()
+        if not config.enable_translation_memory:
+            return None
+        with _translation_memory_lock:
+            if _translation_memory is None:
+                _translation_memory = TranslationMemory(
+                    max_size=config.translation_memory_size,
+                    threshold=config.translation_memory_threshold,
+                    max_chars=config.translation_memory_max_chars
+                )
+                logger.info(
+                    f"🧠 Mémoire de traduction initialisée (max_size={_translation_memory.max_size}, "
+                    f"seuil={_translation_memory.threshold})"
+                )
+    return _translation_memory
@@ -11,11 +11,23 @@ import logging
 import time
 import asyncio
 import threading
-from typing import Dict, Any, Optional
+from collections import Counter
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor
 
 from utils.text_segmentation import TextSegmenter
+from utils.performance import PerformanceConfig
+
+from .replica_pool import ReplicaPool, resolve_replica_count
+
+# Mémoire de traduction (gabarits + quasi-doublons), complément du cache exact
+TRANSLATION_MEMORY_AVAILABLE = False
+try:
+    from .translation_memory import get_translation_memory
+    TRANSLATION_MEMORY_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    pass
 
 logger = logging.getLogger(__name__)
 
@@ -72,10 +84,23 @@ class TranslationService:
         self.model_loader = model_loader
         self.translator_engine = translator_engine
         self.translation_cache = translation_cache
+        self.perf_config = PerformanceConfig()
+
+        # Pool de réplicas multi-processus (TRANSLATOR_USE_PROCESS_POOL), démarré
+        # après le chargement des modèles ; None = inférence in-process
+        self.replica_pool: Optional[ReplicaPool] = None
+
+        # Paires demandées (préchauffage au redémarrage) : comptées ici et non
+        # dans le cache de pipelines du moteur local, que les réplicas contournent
+        self._pair_usage: Counter = Counter()
+        self._pair_usage_lock = threading.Lock()
 
         # Segmenteur de texte pour préservation de structure
         self.text_segmenter = TextSegmenter(max_segment_length=100)
 
+        # Mémoire de traduction (None si désactivée)
+        self.translation_memory = get_translation_memory() if TRANSLATION_MEMORY_AVAILABLE else None
+
         # Stats globales
         self.stats = {
             'translations_count': 0,
@@ -151,6 +176,9 @@ class TranslationService:
                 # Initialiser le cache
                 await self.translation_cache.initialize()
 
+                # Réplicas multi-processus: forkés maintenant, avant tout trafic
+                await self._start_replica_pool()
+
                 # Finaliser
                 startup_time = time.time() - startup_start
                 self.stats['startup_time'] = startup_time
@@ -221,10 +249,31 @@ class TranslationService:
                 else self.translator_engine.detect_language(text)
             )
 
+            # Mémoire de traduction: même gabarit ou quasi-doublon déjà traduit
+            memory_match = (
+                self.translation_memory.lookup(text, detected_lang, target_language, model_type)
+                if self.translation_memory is not None else None
+            )
+            if memory_match is not None:
+                processing_time = time.time() - start_time
+                self._update_stats(processing_time, source_channel)
+                return {
+                    'translated_text': memory_match.translated_text,
+                    'detected_language': detected_lang,
+                    'confidence': 0.95 * memory_match.similarity,
+                    'model_used': f"{model_type}_ml",
+                    'from_cache': True,
+                    'processing_time': processing_time,
+                    'source_channel': source_channel,
+                    'translation_memory': memory_match.match_type
+                }
+
             # Traduire
-            translated_text = await self.translator_engine.translate_text(
+            self._record_pair(model_type, detected_lang, target_language)
+            translated_text = await self._inference_engine.translate_text(
                 text, detected_lang, target_language, model_type
             )
+            self._remember_translations([(text, translated_text)], detected_lang, target_language, model_type)
 
             processing_time = time.time() - start_time
             self._update_stats(processing_time, source_channel)
@@ -273,20 +322,7 @@ class TranslationService:
                 raise ValueError("Text cannot be empty")
 
             # Sélection automatique du modèle selon longueur
-            text_length = len(text)
-            original_model_type = model_type
-
-            if text_length >= 200 and self.model_loader.is_model_loaded('premium'):
-                model_type = 'premium'
-            elif text_length >= 50 and self.model_loader.is_model_loaded('medium'):
-                model_type = 'medium'
-            elif not self.model_loader.is_model_loaded(model_type):
-                available = self.model_loader.get_loaded_models()
-                if available:
-                    model_type = available[0]
-
-            if model_type != original_model_type:
-                logger.info(f"[STRUCTURED] Model switched: {original_model_type} → {model_type}")
+            model_type = self._select_model_type(text, model_type)
 
             # Texte simple: utiliser traduction standard
             if len(text) <= 100 and '\n\n' not in text and not self.text_segmenter.extract_emojis(text)[1]:
@@ -316,6 +352,9 @@ class TranslationService:
                 segments, detected_lang, target_language, model_type
             )
 
+            segments_to_translate = self._apply_translation_memory(
+                translated_segments, segments_to_translate, detected_lang, target_language, model_type
+            )
             cache_hits = sum(1 for s in translated_segments if s is not None)
 
             # Traduire les segments non-cachés en BATCH
@@ -331,7 +370,8 @@ class TranslationService:
                 try:
                     # Appel BATCH ML
                     logger.info(f"[BATCH-STRUCT] 📤 Appel translator_engine.translate_batch()...")
-                    translated_texts = await self.translator_engine.translate_batch(
+                    self._record_pair(model_type, detected_lang, target_language)
+                    translated_texts = await self._inference_engine.translate_batch(
                         texts_to_translate, detected_lang, target_language, model_type
                     )
                     logger.info(f"[BATCH-STRUCT] 📥 translate_batch retourné: {len(translated_texts)} résultats")
@@ -345,6 +385,7 @@ class TranslationService:
 
                     # Cacher les résultats en arrière-plan
                     if cache_items:
+                        self._remember_translations(cache_items, detected_lang, target_language, model_type)
                         await self.translation_cache.cache_batch_results(
                             cache_items, detected_lang, target_language, model_type
                         )
@@ -354,7 +395,7 @@ class TranslationService:
                     # Fallback individuel
                     for idx, text_to_trans in segments_to_translate:
                         try:
-                            translated = await self.translator_engine.translate_text(
+                            translated = await self._inference_engine.translate_text(
                                 text_to_trans, detected_lang, target_language, model_type
                             )
                             translated_segments[idx] = {'type': 'line', 'text': translated}
@@ -394,6 +435,273 @@ class TranslationService:
             logger.error(f"❌ Erreur traduction structurée [{source_channel}]: {e}")
             return await self.translate(text, source_language, target_language, model_type, source_channel)
 
+    async def translate_multilingual(
+        self,
+        text: str,
+        source_language: str = "auto",
+        target_languages: Optional[List[str]] = None,
+        model_type: str = "basic",
+        source_channel: str = "unknown"
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Traduction d'un texte vers plusieurs langues avec encodage source unique
+
+        Même contrat que translate_with_structure (structure et emojis
+        préservés, cache par segment) mais la source n'est segmentée, détectée
+        et encodée qu'UNE fois pour toutes les langues cibles.
+
+        Returns:
+            Dict {langue_cible: résultat au format translate_with_structure}
+        """
+        start_time = time.time()
+        target_languages = list(dict.fromkeys(target_languages or []))
+
+        if not text.strip():
+            raise ValueError("Text cannot be empty")
+
+        if not target_languages:
+            return {}
+
+        if not self.is_initialized:
+            return {
+                target: await self._fallback_translate(
+                    text, source_language, target, model_type, source_channel
+                )
+                for target in target_languages
+            }
+
+        try:
+            model_type = self._select_model_type(text, model_type)
+
+            detected_lang = (
+                source_language if source_language != "auto"
+                else self.translator_engine.detect_language(text)
+            )
+
+            segments, emojis_map = self.text_segmenter.segment_text(text)
+
+            # Cache par langue: chaque cible ne traduit que ses segments manquants
+            translated_by_target: Dict[str, List[Optional[Dict]]] = {}
+            missing_by_target: Dict[str, List[Tuple[int, str]]] = {}
+            for target in target_languages:
+                cached, to_translate = await self.translation_cache.check_cache_batch(
+                    segments, detected_lang, target, model_type
+                )
+                to_translate = self._apply_translation_memory(
+                    cached, to_translate, detected_lang, target, model_type
+                )
+                translated_by_target[target] = cached
+                if to_translate:
+                    missing_by_target[target] = to_translate
+
+            cache_only = not missing_by_target
+            if missing_by_target:
+                # Union des segments manquants, encodés une seule fois pour toutes les cibles
+                indices = sorted({idx for items in missing_by_target.values() for idx, _ in items})
+                texts_to_translate = [segments[idx]['text'] for idx in indices]
+
+                for target in missing_by_target:
+                    self._record_pair(model_type, detected_lang, target)
+                translated = await self._inference_engine.translate_multilingual(
+                    texts_to_translate, detected_lang, list(missing_by_target), model_type
+                )
+
+                for target, items in missing_by_target.items():
+                    by_index = dict(zip(indices, translated.get(target, [])))
+                    cache_items = []
+                    for idx, original_text in items:
+                        translated_text = by_index.get(idx, original_text)
+                        translated_by_target[target][idx] = {'type': 'line', 'text': translated_text}
+                        cache_items.append((original_text, translated_text))
+
+                    self._remember_translations(cache_items, detected_lang, target, model_type)
+                    await self.translation_cache.cache_batch_results(
+                        cache_items, detected_lang, target, model_type
+                    )
+
+            processing_time = time.time() - start_time
+            results: Dict[str, Dict[str, Any]] = {}
+            for target in target_languages:
+                translated_segments = [
+                    seg if seg is not None else segments[i]
+                    for i, seg in enumerate(translated_by_target[target])
+                ]
+                results[target] = {
+                    'translated_text': self.text_segmenter.reassemble_text(translated_segments, emojis_map),
+                    'detected_language': detected_lang,
+                    'confidence': 0.95,
+                    'model_used': f"{model_type}_ml_multilingual",
+                    'from_cache': cache_only or target not in missing_by_target,
+                    'processing_time': processing_time,
+                    'source_channel': source_channel,
+                    'segments_count': len(segments),
+                    'emojis_count': len(emojis_map)
+                }
+                self._update_stats(processing_time / len(target_languages), source_channel)
+
+            logger.info(
+                f"✅ [ML-MULTILINGUAL-{source_channel.upper()}] {len(text)} chars → "
+                f"{len(target_languages)} langues ({len(missing_by_target)} à traduire) "
+                f"({processing_time:.3f}s)"
+            )
+            return results
+
+        except Exception as e:
+            logger.error(f"❌ Erreur traduction multilingue [{source_channel}]: {e}")
+            return {
+                target: await self.translate_with_structure(
+                    text, source_language, target, model_type, source_channel
+                )
+                for target in target_languages
+            }
+
+    @property
+    def _inference_engine(self):
+        """Moteur d'inférence courant: pool de réplicas si actif, sinon moteur local"""
+        if self.replica_pool is not None and self.replica_pool.is_running:
+            return self.replica_pool
+        return self.translator_engine
+
+    def _record_pair(self, model_type: str, source_lang: str, target_lang: str) -> None:
+        """Compte une demande de traduction pour la paire (codes NLLB, comme les pipelines)"""
+        lang_codes = self.translator_engine.lang_codes
+        key = (model_type, lang_codes.get(source_lang, 'eng_Latn'), lang_codes.get(target_lang, 'fra_Latn'))
+        with self._pair_usage_lock:
+            self._pair_usage[key] += 1
+
+    def get_hot_language_pairs(self, n: int = 10) -> List[Tuple[str, str, str, int]]:
+        """
+        Retourne les N paires les plus demandées depuis le démarrage
+
+        Comptées à l'entrée du service : valables que l'inférence passe par
+        le moteur local ou par les réplicas.
+
+        Returns:
+            Liste de (model_type, code NLLB source, code NLLB cible, demandes)
+        """
+        with self._pair_usage_lock:
+            return [(*pair, count) for pair, count in self._pair_usage.most_common(n)]
+
+    async def warmup_pair(
+        self,
+        model_type: str,
+        nllb_source: str,
+        nllb_target: str,
+        token_lengths: List[int]
+    ) -> bool:
+        """
+        Préchauffe une paire là où l'inférence sera servie
+
+        Avec le pool, chaque réplica construit et exerce son propre pipeline ;
+        sinon le moteur local, dans un thread.
+
+        Returns:
+            True si la paire est prête partout
+        """
+        if self.replica_pool is not None and self.replica_pool.is_running:
+            return await self.replica_pool.warmup_pair(model_type, nllb_source, nllb_target, token_lengths)
+        return await asyncio.to_thread(
+            self.translator_engine.warmup_pair, model_type, nllb_source, nllb_target, token_lengths
+        )
+
+    async def _start_replica_pool(self) -> None:
+        """Démarre le pool de réplicas si TRANSLATOR_USE_PROCESS_POOL est activé"""
+        perf_config = self.perf_config
+        if not perf_config.use_process_pool:
+            return
+
+        loaded_models = self.model_loader.get_loaded_models()
+        num_replicas = resolve_replica_count(
+            perf_config.num_inference_workers,
+            self.model_loader.device,
+            [self.model_loader.get_model_backend(mt) for mt in loaded_models]
+        )
+        if not num_replicas:
+            return
+
+        pool = ReplicaPool(
+            self.model_loader,
+            num_replicas,
+            dispatch_timeout=perf_config.replica_dispatch_timeout_s or None,
+            max_restarts=perf_config.replica_max_restarts
+        )
+        # Fork depuis un thread sans boucle asyncio en cours (l'enfant crée la sienne)
+        loop = asyncio.get_running_loop()
+        if await loop.run_in_executor(None, pool.start):
+            self.replica_pool = pool
+        else:
+            logger.warning("⚠️ [REPLICAS] Démarrage échoué, inférence in-process")
+
+    def _select_model_type(self, text: str, model_type: str) -> str:
+        """Sélection automatique du modèle selon la longueur du texte"""
+        text_length = len(text)
+
+        if text_length >= 200 and self.model_loader.is_model_loaded('premium'):
+            selected = 'premium'
+        elif (text_length < self.perf_config.short_text_threshold and model_type != 'premium'
+              and self.model_loader.is_model_loaded('fast')):
+            # Textes de la fast_pool: petit modèle distillé si chargé (FAST_MODEL)
+            selected = 'fast'
+        elif text_length >= 50 and self.model_loader.is_model_loaded('medium'):
+            selected = 'medium'
+        elif not self.model_loader.is_model_loaded(model_type):
+            available = self.model_loader.get_loaded_models()
+            selected = available[0] if available else model_type
+        else:
+            selected = model_type
+
+        if selected != model_type:
+            logger.info(f"[STRUCTURED] Model switched: {model_type} → {selected}")
+        return selected
+
+    def _apply_translation_memory(
+        self,
+        translated_segments: List[Optional[Dict]],
+        segments_to_translate: List[Tuple[int, str]],
+        source_lang: str,
+        target_lang: str,
+        model_type: str
+    ) -> List[Tuple[int, str]]:
+        """
+        Complète depuis la mémoire de traduction les segments absents du cache
+
+        Les traductions servies ainsi ne sont pas écrites dans Redis (le cache
+        exact ne contient que des sorties du modèle).
+
+        Returns:
+            Segments restant à traduire par le modèle
+        """
+        if self.translation_memory is None or not segments_to_translate:
+            return segments_to_translate
+
+        remaining = []
+        for idx, original_text in segments_to_translate:
+            match = self.translation_memory.lookup(original_text, source_lang, target_lang, model_type)
+            if match is None:
+                remaining.append((idx, original_text))
+            else:
+                translated_segments[idx] = {'type': 'line', 'text': match.translated_text}
+
+        if len(remaining) < len(segments_to_translate):
+            logger.debug(
+                f"[MEMORY] 🧠 {len(segments_to_translate) - len(remaining)}/{len(segments_to_translate)} "
+                f"segments servis par la mémoire de traduction"
+            )
+        return remaining
+
+    def _remember_translations(
+        self,
+        items: List[Tuple[str, str]],
+        source_lang: str,
+        target_lang: str,
+        model_type: str
+    ) -> None:
+        """Alimente la mémoire de traduction avec des paires (source, traduction) du modèle"""
+        if self.translation_memory is None:
+            return
+        for original_text, translated_text in items:
+            self.translation_memory.remember(original_text, translated_text, source_lang, target_lang, model_type)
+
     async def _fallback_translate(
         self,
         text: str,
@@ -466,12 +774,15 @@ class TranslationService:
                     'name': self.model_loader.model_configs[model_type]['model_name'],
                     'description': self.model_loader.model_configs[model_type]['description'],
                     'local_path': str(self.model_loader.model_configs[model_type]['local_path']),
-                    'is_local': self.model_loader.model_configs[model_type]['local_path'].exists()
+                    'is_local': self.model_loader.model_configs[model_type]['local_path'].exists(),
+                    'backend': self.model_loader.get_model_backend(model_type)
                 } for model_type in self.model_loader.get_loaded_models()
             },
             'is_initialized': self.is_initialized,
             'startup_time': self.stats['startup_time'],
-            'device': self.model_loader.device
+            'device': self.model_loader.device,
+            'replicas': self.replica_pool.get_stats() if self.replica_pool else None,
+            'translation_memory': self.translation_memory.get_stats() if self.translation_memory else None
         }
 
     async def get_health(self) -> Dict[str, Any]:
@@ -487,6 +798,11 @@ class TranslationService:
         logger.info("🛑 Arrêt du service ML unifié...")
 
         try:
+            # Arrêter les réplicas avant de libérer les modèles partagés
+            if self.replica_pool is not None:
+                self.replica_pool.stop()
+                self.replica_pool = None
+
             # Nettoyage des modules
             self.model_loader.cleanup()
             self.translator_engine.cleanup()
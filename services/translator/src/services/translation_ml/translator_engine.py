@@ -10,29 +10,16 @@ Responsabilités:
 
 import logging
 import asyncio
-import os
+import math
 import threading
 import re
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor
 
 from config.settings import LANGUAGE_MAPPINGS
 
 logger = logging.getLogger(__name__)
 
-try:
-    from langdetect import detect_langs, DetectorFactory, LangDetectException
-    DetectorFactory.seed = 0  # déterministe
-    _LANGDETECT_OK = True
-except ImportError:
-    _LANGDETECT_OK = False
-
-DEFAULT_DETECT_LANGUAGE = os.getenv("TRANSLATOR_DEFAULT_DETECT_LANG", "fr")
-try:
-    DETECT_MIN_CONFIDENCE = float(os.getenv("TRANSLATOR_DETECT_MIN_CONFIDENCE", "0.80"))
-except ValueError:
-    DETECT_MIN_CONFIDENCE = 0.80
-
 
 # ═══════════════════════════════════════════════════════════════════════════
 # PRÉSERVATION DES LIENS HTTP(S)
@@ -149,6 +136,78 @@ def smart_split_text(text: str, max_chars: int = 200) -> List[str]:
     # un appel de traduction NLLB.
     return [chunk for chunk in chunks if chunk]
 
+
+# ═══════════════════════════════════════════════════════════════════════════
+# BATCHING PAR LONGUEUR (BUCKETING)
+# Un batch est paddé à son texte le plus long : une ligne de 5 tokens dans le
+# même batch qu'un paragraphe de 200 tokens coûte 200 tokens. On trie par
+# nombre de tokens et on remplit chaque batch sous un budget de tokens paddés
+# (len(batch) × plus_long) ; l'ordre d'origine est restauré après inférence.
+# ═══════════════════════════════════════════════════════════════════════════
+def build_token_batches(
+    token_counts: List[int],
+    max_tokens: int,
+    max_items: Optional[int] = None
+) -> List[List[int]]:
+    """Regroupe des textes en batches homogènes en longueur.
+
+    Args:
+        token_counts: Nombre de tokens de chaque texte
+        max_tokens: Budget de tokens paddés par batch (len(batch) × plus long)
+        max_items: Nombre max de textes par batch (None = illimité)
+
+    Returns:
+        Liste de batches, chacun étant une liste d'index dans `token_counts`
+        (un texte dépassant seul le budget forme son propre batch)
+
+    Exemples:
+        >>> build_token_batches([200, 5, 6, 190], max_tokens=400)
+        [[1, 2], [3, 0]]
+    """
+    order = sorted(range(len(token_counts)), key=lambda i: token_counts[i])
+
+    batches: List[List[int]] = []
+    current: List[int] = []
+    for index in order:
+        # Tri croissant: le texte courant est le plus long du batch candidat
+        padded_cost = (len(current) + 1) * max(1, token_counts[index])
+        full = max_items is not None and len(current) >= max_items
+        if current and (padded_cost > max_tokens or full):
+            batches.append(current)
+            current = []
+        current.append(index)
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# BUDGET DE GÉNÉRATION PROPORTIONNEL À L'ENTRÉE
+# Avec max_length=256 fixe, un "ok" qui part en boucle de répétition (cas
+# connu de NLLB sur les entrées très courtes) décode 256 tokens au lieu de 3.
+# Le budget suit la longueur d'entrée du plus long texte du batch.
+# ═══════════════════════════════════════════════════════════════════════════
+GENERATION_MAX_TOKENS = 256
+
+
+def compute_max_new_tokens(
+    input_tokens: int,
+    ratio: float,
+    floor: int,
+    cap: int = GENERATION_MAX_TOKENS
+) -> int:
+    """Nombre max de tokens générés pour une entrée de `input_tokens` tokens.
+
+    Exemples:
+        >>> compute_max_new_tokens(4, ratio=2.0, floor=16)
+        24
+        >>> compute_max_new_tokens(200, ratio=2.0, floor=16)
+        256
+    """
+    return max(1, min(cap, floor + int(math.ceil(ratio * input_tokens))))
+
+
 # Import conditionnel des dépendances ML
 ML_AVAILABLE = False
 try:
@@ -164,6 +223,10 @@ from utils.performance import (
     create_inference_context
 )
 from utils.pipeline_cache import LRUPipelineCache
+from utils.single_flight import SingleFlight
+from utils.translation_validation import is_failed_translation
+from .inference_scheduler import InferenceScheduler
+from .language_detector import LanguageDetector, get_language_detector
 
 
 class TranslatorEngine:
@@ -190,6 +253,20 @@ class TranslatorEngine:
         self._pipeline_cache = LRUPipelineCache(max_size=cache_size)
         self._pipeline_lock = threading.Lock()
 
+        # Micro-batching continu: UN scheduler d'inférence par modèle chargé.
+        # Les chunks de tous les appelants (pool ZMQ, REST, audio) sont
+        # regroupés quelques ms puis traduits en un seul generate() paddé.
+        self._schedulers: Dict[str, InferenceScheduler] = {}
+        self._schedulers_lock = threading.Lock()
+
+        # Single-flight: les traductions identiques concurrentes (message
+        # diffusé dans une grande conversation) partagent une seule inférence ;
+        # les échecs sont resservis quelques secondes sans retenter le modèle
+        self._single_flight: Optional[SingleFlight] = (
+            SingleFlight("engine", negative_ttl=self.perf_config.negative_cache_ttl_s)
+            if self.perf_config.enable_single_flight else None
+        )
+
         # Mapping des codes de langues NLLB — source unique : LANGUAGE_MAPPINGS
         # (config/settings.py). L'ancien dict codé en dur ne couvrait que 8 des 40
         # langues déclarées dans SUPPORTED_LANGUAGES ; les 32 autres tombaient sur
@@ -197,23 +274,31 @@ class TranslatorEngine:
         # → une demande de russe renvoyait silencieusement du français.
         self.lang_codes = dict(LANGUAGE_MAPPINGS)
 
+        # Détection de langue partagée (écriture, fastText/langdetect, priors
+        # par conversation)
+        self.language_detector: LanguageDetector = get_language_detector()
+
         logger.info("⚙️ TranslatorEngine initialisé")
 
-    def detect_language(self, text: str, fallback: Optional[str] = None) -> str:
-        """Détecte la langue source. langdetect seuillé ; jamais de défaut 'en'
-        arbitraire — repli sur `fallback` puis `DEFAULT_DETECT_LANGUAGE`."""
-        default = fallback if fallback is not None else DEFAULT_DETECT_LANGUAGE
-        cleaned = _URL_PATTERN.sub(" ", text or "").strip()
-        if not _LANGDETECT_OK or sum(c.isalpha() for c in cleaned) < 4:
-            return default
-        try:
-            ranked = detect_langs(cleaned)
-        except LangDetectException:
-            return default
-        top = ranked[0]
-        if top.prob < DETECT_MIN_CONFIDENCE:
-            return default
-        return top.lang.split("-")[0]  # zh-cn/zh-tw -> zh
+    def detect_language(
+        self,
+        text: str,
+        fallback: Optional[str] = None,
+        context_key: Optional[str] = None
+    ) -> str:
+        """Détecte la langue source (voir LanguageDetector). Jamais de défaut
+        'en' arbitraire — repli sur le prior du contexte, puis `fallback`,
+        puis `DEFAULT_DETECT_LANGUAGE`."""
+        return self.language_detector.detect(text, fallback=fallback, context_key=context_key)
+
+    def detect_languages(
+        self,
+        texts: List[str],
+        fallback: Optional[str] = None,
+        context_keys: Optional[List[Optional[str]]] = None
+    ) -> List[str]:
+        """Détection batch: un seul appel backend pour tous les textes"""
+        return self.language_detector.detect_batch(texts, fallback=fallback, context_keys=context_keys)
 
     def _get_or_create_pipeline(
         self,
@@ -313,7 +398,8 @@ class TranslatorEngine:
         Traduction ML d'un texte individuel avec pipeline réutilisable.
 
         Pour les textes longs (>200 caractères), découpe intelligemment
-        aux ponctuations et traduit par morceaux pour éviter la troncature.
+        aux ponctuations et traduit les morceaux en batch (un seul generate()
+        paddé) pour éviter la troncature.
 
         Args:
             text: Texte à traduire
@@ -327,6 +413,23 @@ class TranslatorEngine:
         if not self.model_loader.is_model_loaded(model_type):
             raise Exception(f"Modèle {model_type} non chargé")
 
+        if self._single_flight is None:
+            return await self._translate_text(text, source_lang, target_lang, model_type)
+
+        return await self._single_flight.do(
+            (text, source_lang, target_lang, model_type),
+            lambda: self._translate_text(text, source_lang, target_lang, model_type),
+            is_failure=is_failed_translation
+        )
+
+    async def _translate_text(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        model_type: str
+    ) -> str:
+        """Corps de translate_text (exécuté une fois par groupe single-flight)"""
         # ═══════════════════════════════════════════════════════════════════
         # PRÉSERVATION DES LIENS: masquer les URLs HTTP(S) AVANT découpage et
         # traduction (NLLB les corromprait). Restaurées verbatim à la fin.
@@ -350,14 +453,10 @@ class TranslatorEngine:
                 f"(tailles: {[len(c) for c in chunks]})"
             )
 
-            # Traduire chaque morceau
-            translated_chunks = []
-            for i, chunk in enumerate(chunks):
-                logger.debug(f"[TRANSLATE] Chunk {i+1}/{len(chunks)}: '{chunk[:50]}...'")
-                translated_chunk = await self._translate_single_chunk(
-                    chunk, source_lang, target_lang, model_type
-                )
-                translated_chunks.append(translated_chunk)
+            # Traduire tous les morceaux ensemble (batch), ordre conservé
+            translated_chunks = await self._translate_chunks(
+                chunks, source_lang, target_lang, model_type
+            )
 
             # Recoller les morceaux traduits
             final_translation = ' '.join(translated_chunks)
@@ -374,6 +473,66 @@ class TranslatorEngine:
         )
         return restore_urls(translated, urls)
 
+    async def _translate_chunks(
+        self,
+        chunks: List[str],
+        source_lang: str,
+        target_lang: str,
+        model_type: str
+    ) -> List[str]:
+        """
+        Traduit tous les morceaux d'un texte long en batch
+
+        Avant, chaque morceau coûtait un aller-retour executor, une prise de
+        lock et un generate() séquentiels (8 appels pour un message de
+        1500 caractères). Désormais:
+        - micro-batching activé: tous les morceaux sont soumis au scheduler
+          en même temps et partent dans la même passe d'inférence paddée
+        - sinon: un seul aller-retour executor, batches planifiés par
+          longueur (lock libéré entre deux batches)
+
+        Args:
+            chunks: Morceaux (≤ 200 caractères) dans l'ordre du texte
+            source_lang: Langue source
+            target_lang: Langue cible
+            model_type: Type de modèle
+
+        Returns:
+            Morceaux traduits, dans l'ordre de `chunks`
+        """
+        if self.perf_config.enable_micro_batching:
+            return list(await asyncio.gather(*[
+                self._translate_single_chunk(chunk, source_lang, target_lang, model_type)
+                for chunk in chunks
+            ]))
+
+        nllb_source = self.lang_codes.get(source_lang, 'eng_Latn')
+        nllb_target = self.lang_codes.get(target_lang, 'fra_Latn')
+
+        def translate_chunks_sync() -> List[str]:
+            """Traduction batch synchrone des morceaux dans un thread"""
+            try:
+                pipeline, is_available = self._get_or_create_pipeline(
+                    model_type, nllb_source, nllb_target
+                )
+                if not is_available or pipeline is None:
+                    raise Exception(f"Pipeline non disponible pour {model_type}")
+
+                translated: List[Optional[str]] = [None] * len(chunks)
+                for indices in self._plan_token_batches(pipeline, chunks):
+                    outputs = self._run_inference_batch(
+                        model_type, nllb_source, nllb_target, [chunks[i] for i in indices]
+                    )
+                    for index, output in zip(indices, outputs):
+                        translated[index] = output
+                return [t if t is not None else f"[NLLB-No-Result] {c}" for t, c in zip(translated, chunks)]
+            except Exception as e:
+                logger.error(f"Erreur pipeline {model_type}: {e}")
+                return [f"[ML-Pipeline-Error] {chunk}" for chunk in chunks]
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self.executor, translate_chunks_sync)
+
     async def _translate_single_chunk(
         self,
         text: str,
@@ -384,6 +543,10 @@ class TranslatorEngine:
         """
         Traduit un seul morceau de texte (≤ 200 caractères).
 
+        Avec le micro-batching activé, le chunk est soumis au scheduler
+        d'inférence du modèle et regroupé avec les chunks concurrents des
+        autres appelants ; sinon il est traduit seul dans l'executor.
+
         Args:
             text: Texte à traduire
             source_lang: Langue source
@@ -393,56 +556,210 @@ class TranslatorEngine:
         Returns:
             Texte traduit
         """
+        # Codes NLLB
+        nllb_source = self.lang_codes.get(source_lang, 'eng_Latn')
+        nllb_target = self.lang_codes.get(target_lang, 'fra_Latn')
+
+        if self.perf_config.enable_micro_batching:
+            scheduler = self._get_scheduler(model_type)
+            try:
+                return await asyncio.wrap_future(
+                    scheduler.submit(text, nllb_source, nllb_target)
+                )
+            except Exception as e:
+                logger.error(f"Erreur pipeline {model_type}: {e}")
+                return f"[ML-Pipeline-Error] {text}"
 
         def translate_sync():
             """Traduction synchrone dans un thread"""
             try:
-                # Codes NLLB
-                nllb_source = self.lang_codes.get(source_lang, 'eng_Latn')
-                nllb_target = self.lang_codes.get(target_lang, 'fra_Latn')
+                return self._run_inference_batch(model_type, nllb_source, nllb_target, [text])[0]
+            except Exception as e:
+                logger.error(f"Erreur pipeline {model_type}: {e}")
+                return f"[ML-Pipeline-Error] {text}"
 
-                # Obtenir pipeline du cache LRU (ou créer si nécessaire)
-                reusable_pipeline, is_available = self._get_or_create_pipeline(
-                    model_type, nllb_source, nllb_target
+        # Exécuter de manière asynchrone
+        loop = asyncio.get_event_loop()
+        translated = await loop.run_in_executor(self.executor, translate_sync)
+        return translated
+
+    def _get_scheduler(self, model_type: str) -> InferenceScheduler:
+        """
+        Retourne (ou crée) le scheduler d'inférence d'un modèle
+
+        Args:
+            model_type: Type de modèle ('basic', 'premium')
+
+        Returns:
+            InferenceScheduler dédié à ce modèle
+        """
+        scheduler = self._schedulers.get(model_type)
+        if scheduler is not None:
+            return scheduler
+
+        with self._schedulers_lock:
+            scheduler = self._schedulers.get(model_type)
+            if scheduler is None:
+                scheduler = InferenceScheduler(
+                    name=model_type,
+                    run_batch=lambda src, tgt, texts: self._run_inference_batch(
+                        model_type, src, tgt, texts
+                    ),
+                    window_ms=self.perf_config.micro_batch_window_ms,
+                    max_batch_size=self.perf_config.micro_batch_max_size
                 )
+                self._schedulers[model_type] = scheduler
+            return scheduler
 
-                if not is_available or reusable_pipeline is None:
-                    raise Exception(f"Pipeline non disponible pour {model_type}")
+    def _run_inference_batch(
+        self,
+        model_type: str,
+        nllb_source: str,
+        nllb_target: str,
+        texts: List[str]
+    ) -> List[str]:
+        """
+        Exécute UN generate() paddé pour des textes d'une même paire de langues
 
-                # ✨ THREAD-SAFETY: Lock d'inférence pour protéger le modèle PyTorch
-                model_lock = self.model_loader.get_model_inference_lock(model_type)
+        Appelé depuis le thread du scheduler (ou de l'executor si le
+        micro-batching est désactivé).
 
-                with model_lock:
-                    # OPTIMISATION AVANCÉE: Greedy decoding (4x plus rapide)
-                    with create_inference_context():
-                        result = reusable_pipeline(
-                            text,
-                            src_lang=nllb_source,
-                            tgt_lang=nllb_target,
-                            max_length=256,       # Optimisé pour chunks courts (découpage intelligent avant)
-                            num_beams=1,          # GREEDY (4x plus rapide!)
-                            do_sample=False       # Déterministe
-                            # early_stopping retiré: incompatible avec num_beams=1 (greedy decoding)
-                        )
+        Args:
+            model_type: Type de modèle
+            nllb_source: Code langue source NLLB
+            nllb_target: Code langue cible NLLB
+            texts: Textes à traduire (chunks ≤ 200 caractères)
+
+        Returns:
+            Textes traduits (même ordre)
+        """
+        # Obtenir pipeline du cache LRU (ou créer si nécessaire)
+        reusable_pipeline, is_available = self._get_or_create_pipeline(
+            model_type, nllb_source, nllb_target
+        )
+
+        if not is_available or reusable_pipeline is None:
+            raise Exception(f"Pipeline non disponible pour {model_type}")
+
+        # ✨ THREAD-SAFETY: Lock d'inférence pour protéger le modèle PyTorch
+        model_lock = self.model_loader.get_model_inference_lock(model_type)
+
+        # Budget de génération calculé HORS lock (token ids en cache)
+        length_kwargs = self._generation_length_kwargs(reusable_pipeline, texts)
+
+        with model_lock:
+            # OPTIMISATION AVANCÉE: Greedy decoding (4x plus rapide)
+            with create_inference_context():
+                results = reusable_pipeline(
+                    texts,
+                    src_lang=nllb_source,
+                    tgt_lang=nllb_target,
+                    num_beams=1,          # GREEDY (4x plus rapide!)
+                    do_sample=False,      # Déterministe
+                    # early_stopping retiré: incompatible avec num_beams=1 (greedy decoding)
+                    **length_kwargs
+                )
+
+        return self._extract_translations(results, texts)
 
-                # Extraire le résultat
-                # Note: Seq2SeqTranslator retourne un dict pour un texte unique
-                if result and 'translation_text' in result:
-                    return result['translation_text']
-                elif result and isinstance(result, list) and len(result) > 0 and 'translation_text' in result[0]:
-                    return result[0]['translation_text']
-                else:
-                    logger.error(f"[NLLB] Résultat inattendu: {result}")
-                    return f"[NLLB-No-Result] {text}"
+    def _plan_token_batches(self, pipeline, texts: List[str]) -> List[List[int]]:
+        """
+        Planifie les batches d'inférence par longueur de tokens
+
+        Les longueurs viennent de `pipeline.encode()` (cache LRU de token
+        ids partagé avec l'inférence qui suit : un texte n'est tokenisé
+        qu'une fois) ; à défaut, la longueur est estimée au nombre de mots.
 
+        Le budget de tokens vient de PerformanceOptimizer.get_optimal_batch_tokens
+        (dimensionné selon le device), le nombre de textes par batch reste
+        borné par `batch_size` : le lock modèle est libéré entre deux batches
+        (anti-famine audio ↔ texte).
+
+        Args:
+            pipeline: Seq2SeqTranslator (ou compatible) servant l'inférence
+            texts: Textes à traduire
+
+        Returns:
+            Batches d'index dans `texts`, chacun homogène en longueur
+        """
+        token_counts = None
+        encode = getattr(pipeline, 'encode', None)
+        if callable(encode):
+            try:
+                token_counts = [len(ids) for ids in encode(list(texts))]
             except Exception as e:
-                logger.error(f"Erreur pipeline {model_type}: {e}")
-                return f"[ML-Pipeline-Error] {text}"
+                logger.debug(f"[BATCH] Comptage tokens indisponible, estimation par mots: {e}")
 
-        # Exécuter de manière asynchrone
-        loop = asyncio.get_event_loop()
-        translated = await loop.run_in_executor(self.executor, translate_sync)
-        return translated
+        if token_counts is None or len(token_counts) != len(texts):
+            # Estimation: ~1.3 token par mot + tokens spéciaux (langue, </s>)
+            token_counts = [int(len(text.split()) * 1.3) + 2 for text in texts]
+
+        from utils.performance import get_performance_optimizer
+        max_tokens = get_performance_optimizer().get_optimal_batch_tokens(
+            self.perf_config.max_batch_tokens
+        )
+        return build_token_batches(token_counts, max_tokens, max_items=self.perf_config.batch_size)
+
+    def _generation_length_kwargs(self, pipeline, texts: List[str]) -> Dict[str, int]:
+        """
+        Borne de génération d'un batch: max_new_tokens proportionnel à l'entrée
+
+        Les longueurs viennent de `pipeline.encode()` (token ids en cache) ;
+        sans comptage possible, on garde l'ancien max_length=256.
+
+        Args:
+            pipeline: Seq2SeqTranslator (ou compatible) servant l'inférence
+            texts: Textes du batch
+
+        Returns:
+            kwargs de longueur à passer au pipeline
+        """
+        encode = getattr(pipeline, 'encode', None)
+        if callable(encode):
+            try:
+                longest = max(len(ids) for ids in encode(list(texts)))
+                return {
+                    'max_new_tokens': compute_max_new_tokens(
+                        longest,
+                        ratio=self.perf_config.max_new_tokens_ratio,
+                        floor=self.perf_config.max_new_tokens_floor
+                    )
+                }
+            except Exception as e:
+                logger.debug(f"[GENERATE] Comptage tokens indisponible, max_length fixe: {e}")
+        return {'max_length': GENERATION_MAX_TOKENS}
+
+    @staticmethod
+    def _extract_translations(results, texts: List[str]) -> List[str]:
+        """
+        Extrait les textes traduits du format pipeline (liste de dicts)
+
+        Args:
+            results: Sortie de Seq2SeqTranslator pour une liste de textes
+            texts: Textes source (pour les marqueurs d'erreur)
+
+        Returns:
+            Liste des traductions (même ordre que `texts`)
+        """
+        if isinstance(results, dict):
+            results = [results]
+
+        translations = []
+        for text, result in zip(texts, results or []):
+            if isinstance(result, dict) and 'translation_text' in result:
+                translations.append(result['translation_text'])
+            elif isinstance(result, list) and len(result) > 0 and 'translation_text' in result[0]:
+                translations.append(result[0]['translation_text'])
+            else:
+                logger.error(f"[NLLB] Résultat inattendu: {result}")
+                translations.append(f"[NLLB-No-Result] {text}")
+
+        # Résultat tronqué: ne jamais désaligner les appelants
+        for text in texts[len(translations):]:
+            logger.error("[NLLB] Résultat manquant pour un chunk")
+            translations.append(f"[NLLB-No-Result] {text}")
+
+        return translations
 
     async def translate_batch(
         self,
@@ -483,8 +800,6 @@ class TranslatorEngine:
         if not self.model_loader.is_model_loaded(model_type):
             raise Exception(f"Modèle {model_type} non chargé")
 
-        batch_size = self.perf_config.batch_size
-
         def translate_batch_sync():
             """Traduction batch synchrone - OPTIMISÉ POUR VITESSE"""
             try:
@@ -502,8 +817,6 @@ class TranslatorEngine:
                 if not is_available or reusable_pipeline is None:
                     raise Exception(f"Pipeline non disponible pour {model_type}")
 
-                all_results = []
-
                 # ✨ THREAD-SAFETY: Lock d'inférence pour protéger le modèle PyTorch
                 # Les modèles PyTorch ne sont PAS thread-safe, donc on sérialise les inférences
                 model_lock = self.model_loader.get_model_inference_lock(model_type)
@@ -519,43 +832,48 @@ class TranslatorEngine:
                 # `reusable_pipeline(chunk)` reste atomique et sérialisé par le lock,
                 # donc la thread-safety PyTorch est préservée.
                 # ═══════════════════════════════════════════════════════════════
-                n_chunks = (len(texts) + batch_size - 1) // batch_size
+                # Batches homogènes en longueur (moins de padding), ordre restauré à la fin
+                token_batches = self._plan_token_batches(reusable_pipeline, texts)
+                all_results: List[Optional[str]] = [None] * len(texts)
                 logger.info(
-                    f"🔒 [MODEL_LOCK] Inférence batch '{model_type}' en {n_chunks} chunk(s) "
+                    f"🔒 [MODEL_LOCK] Inférence batch '{model_type}' en {len(token_batches)} chunk(s) "
                     f"(lock acquis/libéré par chunk)"
                 )
 
                 # OPTIMISATION: Traitement direct SANS timeout wrapper (overhead supprimé)
                 with create_inference_context():
-                    for i in range(0, len(texts), batch_size):
-                        chunk = texts[i:i + batch_size]
+                    for indices in token_batches:
+                        chunk = [texts[i] for i in indices]
+                        length_kwargs = self._generation_length_kwargs(reusable_pipeline, chunk)
 
                         # ═══════════════════════════════════════════════════════════════
                         # OPTIMISATIONS NLLB AVANCÉES:
                         # - num_beams=1: Greedy decoding (4x plus rapide que beam search)
                         # - do_sample=False: Désactive sampling (déterministe)
-                        # - max_length=256: Optimisé pour segments courts
+                        # - max_new_tokens proportionnel à l'entrée (≤ 256)
                         # ═══════════════════════════════════════════════════════════════
                         with model_lock:
                             results = reusable_pipeline(
                                 chunk,
                                 src_lang=nllb_source,
                                 tgt_lang=nllb_target,
-                                max_length=256,       # Optimisé pour segments courts (découpage avant si besoin)
                                 num_beams=1,          # GREEDY DECODING (4x plus rapide!)
-                                do_sample=False       # Déterministe
+                                do_sample=False,      # Déterministe
                                 # early_stopping retiré: incompatible avec num_beams=1
+                                **length_kwargs
                             )
 
                         # Agrégation des résultats HORS lock (le modèle est libre
                         # pour une autre traduction pendant qu'on formate la sortie).
-                        for result in results:
+                        for index, result in zip(indices, results):
                             if isinstance(result, dict) and 'translation_text' in result:
-                                all_results.append(result['translation_text'])
+                                all_results[index] = result['translation_text']
                             elif isinstance(result, list) and len(result) > 0:
-                                all_results.append(result[0].get('translation_text', '[No-Result]'))
+                                all_results[index] = result[0].get('translation_text', '[No-Result]')
                             else:
-                                all_results.append('[Batch-No-Result]')
+                                all_results[index] = '[Batch-No-Result]'
+
+                all_results = [r if r is not None else '[Batch-No-Result]' for r in all_results]
 
                 logger.info(f"🔓 [MODEL_LOCK] Batch '{model_type}' terminé (lock libéré entre chunks)")
 
@@ -586,10 +904,123 @@ class TranslatorEngine:
         logger.info(f"⚡ [BATCH] {len(texts)} textes traduits en batch ({source_lang}→{target_lang})")
         return results
 
+    async def translate_multilingual(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_langs: List[str],
+        model_type: str
+    ) -> Dict[str, List[str]]:
+        """
+        OPTIMISATION: Traduction d'un même lot de textes vers N langues cibles
+
+        La source est tokenisée et encodée UNE seule fois par chunk ; l'encodeur
+        NLLB n'est pas réexécuté pour chaque langue (seuls le décodeur et le
+        forced_bos_token_id changent). Les messages de groupe partent vers 5-8
+        langues : c'était le premier poste de calcul gaspillé.
+
+        Args:
+            texts: Textes à traduire
+            source_lang: Code langue source ('fr', 'en', ...)
+            target_langs: Codes langues cibles
+            model_type: Type de modèle
+
+        Returns:
+            Dict {langue_cible: [traductions dans l'ordre de texts]}
+
+        Raises:
+            Exception: Échec de l'inférence (aucun marqueur d'erreur renvoyé)
+        """
+        target_langs = list(dict.fromkeys(target_langs))
+        if not texts or not target_langs:
+            return {tgt: [] for tgt in target_langs}
+
+        if not self.model_loader.is_model_loaded(model_type):
+            raise Exception(f"Modèle {model_type} non chargé")
+
+        # Masquage des URLs puis découpage: un texte long → plusieurs chunks,
+        # tous encodés ensemble. `owners[i]` = index du texte du chunk i.
+        masked = [mask_urls(text) for text in texts]
+        chunks: List[str] = []
+        owners: List[int] = []
+        for index, (masked_text, _) in enumerate(masked):
+            for chunk in smart_split_text(masked_text, max_chars=200) or [masked_text]:
+                chunks.append(chunk)
+                owners.append(index)
+
+        nllb_source = self.lang_codes.get(source_lang, 'eng_Latn')
+        nllb_targets = {tgt: self.lang_codes.get(tgt, 'fra_Latn') for tgt in target_langs}
+
+        def translate_multilingual_sync() -> Dict[str, List[str]]:
+            """Encodage unique + décodage par langue, lock acquis par chunk"""
+            pipeline, is_available = self._get_or_create_pipeline(
+                model_type, nllb_source, next(iter(nllb_targets.values()))
+            )
+            if not is_available or pipeline is None:
+                raise Exception(f"Pipeline non disponible pour {model_type}")
+
+            model_lock = self.model_loader.get_model_inference_lock(model_type)
+            per_target: Dict[str, List[Optional[str]]] = {tgt: [None] * len(chunks) for tgt in target_langs}
+
+            with create_inference_context():
+                for indices in self._plan_token_batches(pipeline, chunks):
+                    chunk_batch = [chunks[i] for i in indices]
+                    length_kwargs = self._generation_length_kwargs(pipeline, chunk_batch)
+                    # Lock par chunk (anti-famine audio ↔ texte, cf. translate_batch)
+                    with model_lock:
+                        outputs = pipeline.translate_multi_target(
+                            chunk_batch,
+                            tgt_langs=list(nllb_targets.values()),
+                            src_lang=nllb_source,
+                            num_beams=1,
+                            do_sample=False,
+                            **length_kwargs
+                        )
+                    for tgt, nllb_target in nllb_targets.items():
+                        for index, translated in zip(indices, outputs.get(nllb_target, [])):
+                            per_target[tgt][index] = translated
+
+            return per_target
+
+        loop = asyncio.get_event_loop()
+        try:
+            per_target_chunks = await loop.run_in_executor(self.executor, translate_multilingual_sync)
+        except Exception as e:
+            # Lever plutôt que renvoyer des marqueurs: les appelants retombent sur
+            # le chemin par langue au lieu de mettre un échec en cache
+            logger.error(f"[MULTILINGUAL] ❌ Erreur {model_type} {source_lang}→{target_langs}: {e}")
+            raise
+
+        # Recoller les chunks de chaque texte puis restaurer les URLs
+        results: Dict[str, List[str]] = {}
+        for tgt in target_langs:
+            translated_chunks = per_target_chunks.get(tgt, [])
+            joined: List[List[str]] = [[] for _ in texts]
+            for owner, translated in zip(owners, translated_chunks):
+                if translated is not None:
+                    joined[owner].append(translated)
+            results[tgt] = [
+                restore_urls(' '.join(parts), masked[index][1]) if parts else f"[NLLB-No-Result] {texts[index]}"
+                for index, parts in enumerate(joined)
+            ]
+
+        logger.info(
+            f"⚡ [MULTILINGUAL] {len(texts)} texte(s) / {len(chunks)} chunk(s) encodés une fois "
+            f"→ {len(target_langs)} langues ({source_lang}→{target_langs})"
+        )
+        return results
+
     def cleanup(self):
         """Libère les ressources du moteur"""
         logger.info("🧹 Nettoyage TranslatorEngine...")
 
+        # Arrêter les schedulers d'inférence (les chunks déjà soumis sont traités)
+        with self._schedulers_lock:
+            schedulers = list(self._schedulers.values())
+            self._schedulers.clear()
+        for scheduler in schedulers:
+            scheduler.stop()
+
         # Log statistiques finales du cache avant nettoyage
         self._pipeline_cache.log_stats()
 
@@ -618,3 +1049,73 @@ class TranslatorEngine:
             Liste de tuples (clé, position) des paires les plus fréquentes
         """
         return self._pipeline_cache.get_top_pairs(n)
+
+    def get_hot_language_pairs(self, n: int = 10) -> List[Tuple[str, str, str, int]]:
+        """
+        Retourne les N paires les plus demandées (préchauffage au redémarrage)
+
+        Returns:
+            Liste de (model_type, code NLLB source, code NLLB cible, demandes)
+        """
+        return self._pipeline_cache.get_hot_pairs(n)
+
+    def warmup_pair(
+        self,
+        model_type: str,
+        nllb_source: str,
+        nllb_target: str,
+        token_lengths: List[int]
+    ) -> bool:
+        """
+        Construit le pipeline d'une paire et l'exerce avec des batches factices
+
+        Bloquant (à lancer dans un thread) : le premier generate() par forme
+        d'entrée paie les allocations et le warmup torch, pas la première
+        requête utilisateur.
+
+        Args:
+            model_type: Type de modèle
+            nllb_source: Code langue source NLLB
+            nllb_target: Code langue cible NLLB
+            token_lengths: Longueurs (≈ tokens) des textes factices, une inférence par longueur
+
+        Returns:
+            True si le pipeline est prêt
+        """
+        if not self.model_loader.is_model_loaded(model_type):
+            return False
+
+        pipeline, is_available = self._get_or_create_pipeline(model_type, nllb_source, nllb_target)
+        if not is_available or pipeline is None:
+            return False
+
+        for length in token_lengths:
+            # Deux textes par batch: exerce aussi le padding
+            dummy = " ".join(["hello"] * max(1, length))
+            try:
+                self._run_inference_batch(model_type, nllb_source, nllb_target, [dummy, dummy[: len(dummy) // 2]])
+            except Exception as e:
+                logger.warning(f"⚠️ Warm-up {model_type} {nllb_source}→{nllb_target} ({length} tokens): {e}")
+                return False
+        return True
+
+    def get_single_flight_stats(self) -> Dict[str, int]:
+        """
+        Retourne les statistiques single-flight / cache négatif
+
+        Returns:
+            Dict (calculs exécutés, appels coalescés, hits négatifs)
+        """
+        return self._single_flight.get_stats() if self._single_flight else {}
+
+    def get_scheduler_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Retourne les statistiques des schedulers de micro-batching
+
+        Returns:
+            Dict {model_type: stats} (chunks soumis, passes, groupes, erreurs)
+        """
+        return {
+            model_type: scheduler.get_stats()
+            for model_type, scheduler in list(self._schedulers.items())
+        }
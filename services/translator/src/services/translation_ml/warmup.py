@@ -0,0 +1,252 @@
+"""
+Préchauffage au démarrage à partir des statistiques de la session précédente
+Après un déploiement, le cache de pipelines et le L1 repartent vides : les
+premières requêtes de chaque paire de langues paient la construction du
+pipeline, le premier generate() torch et un aller-retour Redis.
+
+- Pendant le service : instantané périodique sur disque des paires les plus
+  demandées (LRUPipelineCache) et des clés L1 les plus fréquentes
+- Au démarrage (après le chargement des modèles) : reconstruction des
+  pipelines, batches factices de longueurs représentatives, rechargement du
+  L1 ; /ready ne passe à prêt qu'une fois le préchauffage terminé (ou expiré)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+from utils.performance import PerformanceConfig
+
+logger = logging.getLogger(__name__)
+
+STATE_VERSION = 1
+STATE_FILENAME = "warmup_state.json"
+
+
+def parse_token_lengths(value: str) -> List[int]:
+    """'16,64,192' → [16, 64, 192] (valeurs invalides ignorées)"""
+    lengths = []
+    for part in (value or "").split(","):
+        part = part.strip()
+        if part.isdigit() and int(part) > 0:
+            lengths.append(int(part))
+    return lengths
+
+
+class WarmupManager:
+    """
+    Instantanés des paires/clés chaudes et préchauffage au démarrage
+
+    Usage:
+        warmup = WarmupManager(translation_service, translation_cache, state_path)
+        await warmup.run()            # après translation_service.initialize()
+        warmup.start_snapshots()      # instantanés périodiques
+        warmup.is_ready               # consulté par /ready
+    """
+
+    def __init__(
+        self,
+        translation_service,
+        translation_cache,
+        state_path: str,
+        config: Optional[PerformanceConfig] = None
+    ):
+        """
+        Initialise le gestionnaire
+
+        Args:
+            translation_service: TranslationService (paires chaudes, warmup_pair
+                vers le moteur local ou chaque réplica)
+            translation_cache: TranslationCache (hot_keys, preload_hot_keys)
+            state_path: Fichier JSON de l'instantané
+            config: Configuration (défaut: PerformanceConfig())
+        """
+        config = config or PerformanceConfig()
+        self.translation_service = translation_service
+        self.translation_cache = translation_cache
+        self.state_path = state_path
+        self.enabled = config.enable_warmup
+        self.top_pairs = config.warmup_top_pairs
+        self.hot_keys = config.warmup_hot_keys
+        self.token_lengths = parse_token_lengths(config.warmup_token_lengths)
+        self.snapshot_interval_s = config.warmup_snapshot_interval_s
+        self.timeout_s = config.warmup_timeout_s
+
+        self.status = 'pending'  # pending → running → done | timeout | failed | disabled
+        self._snapshot_task: Optional[asyncio.Task] = None
+
+        self.stats = {
+            'pairs_warmed': 0,
+            'pairs_failed': 0,
+            'keys_preloaded': 0,
+            'duration_s': 0.0,
+            'snapshots_written': 0
+        }
+
+    @property
+    def is_ready(self) -> bool:
+        """Préchauffage terminé (quelle qu'en soit l'issue)"""
+        return self.status not in ('pending', 'running')
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Instantanés
+    # ─────────────────────────────────────────────────────────────────────
+
+    def snapshot(self) -> Dict[str, Any]:
+        """État courant: paires les plus demandées et clés L1 les plus fréquentes"""
+        pairs = self.translation_service.get_hot_language_pairs(self.top_pairs)
+        return {
+            'version': STATE_VERSION,
+            'saved_at': time.time(),
+            'pairs': [list(pair) for pair in pairs],
+            'cache_keys': self.translation_cache.hot_keys(self.hot_keys)
+        }
+
+    def save_snapshot(self) -> bool:
+        """
+        Écrit l'instantané (remplacement atomique)
+
+        Un processus qui n'a encore rien servi n'écrase pas l'instantané
+        précédent.
+        """
+        state = self.snapshot()
+        if not state['pairs'] and not state['cache_keys']:
+            return False
+        try:
+            os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+            tmp_path = f"{self.state_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.state_path)
+            self.stats['snapshots_written'] += 1
+            return True
+        except OSError as e:
+            logger.warning(f"⚠️ [WARMUP] Instantané non écrit ({self.state_path}): {e}")
+            return False
+
+    def load_snapshot(self) -> Optional[Dict[str, Any]]:
+        """Instantané de la session précédente (None si absent, illisible ou d'une autre version)"""
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"⚠️ [WARMUP] Instantané illisible ({self.state_path}): {e}")
+            return None
+        if not isinstance(state, dict) or state.get('version') != STATE_VERSION:
+            return None
+        return state
+
+    def start_snapshots(self) -> None:
+        """Lance les instantanés périodiques"""
+        if not self.enabled or self.snapshot_interval_s <= 0 or self._snapshot_task is not None:
+            return
+        self._snapshot_task = asyncio.create_task(self._snapshot_loop())
+
+    async def _snapshot_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.snapshot_interval_s)
+            await asyncio.to_thread(self.save_snapshot)
+
+    async def stop(self) -> None:
+        """Arrête les instantanés périodiques et écrit un dernier instantané"""
+        if self._snapshot_task is not None:
+            self._snapshot_task.cancel()
+            try:
+                await self._snapshot_task
+            except asyncio.CancelledError:
+                pass
+            self._snapshot_task = None
+        if self.enabled:
+            self.save_snapshot()
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Préchauffage
+    # ─────────────────────────────────────────────────────────────────────
+
+    async def run(self) -> str:
+        """
+        Préchauffe pipelines et L1 depuis l'instantané, borné par warmup_timeout_s
+
+        Passé le délai, aucune nouvelle étape n'est lancée, mais l'étape en
+        cours (thread ou réplica, non interruptibles) est attendue jusqu'à sa
+        fin réelle : /ready ne passe pas à prêt pendant qu'elle occupe encore
+        les modèles.
+
+        Returns:
+            Statut final ('done', 'timeout', 'failed' ou 'disabled')
+        """
+        if not self.enabled:
+            self.status = 'disabled'
+            return self.status
+
+        self.status = 'running'
+        start = time.time()
+        try:
+            state = await asyncio.to_thread(self.load_snapshot)
+            if state:
+                await self._warm(state, asyncio.get_running_loop().time() + self.timeout_s)
+            self.status = 'done'
+        except asyncio.TimeoutError:
+            logger.warning(f"⚠️ [WARMUP] Préchauffage interrompu après {self.timeout_s}s")
+            self.status = 'timeout'
+        except Exception as e:
+            logger.error(f"❌ [WARMUP] Erreur de préchauffage: {e}")
+            self.status = 'failed'
+        finally:
+            self.stats['duration_s'] = round(time.time() - start, 3)
+
+        logger.info(
+            f"🔥 [WARMUP] {self.status}: {self.stats['pairs_warmed']} paires, "
+            f"{self.stats['keys_preloaded']} traductions en L1 ({self.stats['duration_s']}s)"
+        )
+        return self.status
+
+    async def _warm(self, state: Dict[str, Any], deadline: float) -> None:
+        # L1 d'abord: quelques MGET, servent immédiatement les messages les plus fréquents
+        keys = [key for key in state.get('cache_keys', []) if isinstance(key, str)][:self.hot_keys]
+        if keys:
+            self.stats['keys_preloaded'] = await self._step(
+                self.translation_cache.preload_hot_keys(keys), deadline
+            )
+
+        # Puis les pipelines, une paire à la fois (les cœurs restent au trafic)
+        for pair in state.get('pairs', [])[:self.top_pairs]:
+            if len(pair) < 3:
+                continue
+            model_type, source, target = pair[0], pair[1], pair[2]
+            warmed = await self._step(
+                self.translation_service.warmup_pair(model_type, source, target, self.token_lengths),
+                deadline
+            )
+            self.stats['pairs_warmed' if warmed else 'pairs_failed'] += 1
+
+    @staticmethod
+    async def _step(coro, deadline: float) -> Any:
+        """
+        Exécute une étape du préchauffage jusqu'à `deadline`
+
+        Raises:
+            asyncio.TimeoutError: Délai dépassé, une fois l'étape réellement terminée
+        """
+        loop = asyncio.get_running_loop()
+        task = asyncio.ensure_future(coro)
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), max(0.0, deadline - loop.time()))
+        except asyncio.TimeoutError:
+            # Annuler la tâche n'arrêterait ni le thread ni le réplica qui l'exécutent
+            await asyncio.gather(task, return_exceptions=True)
+            raise
+
+    def get_status(self) -> Dict[str, Any]:
+        """Statut et statistiques (exposés par /ready et /health)"""
+        return {
+            'status': self.status,
+            'ready': self.is_ready,
+            'state_path': self.state_path,
+            **self.stats
+        }
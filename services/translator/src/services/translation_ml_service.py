@@ -14,7 +14,7 @@ Total: ~290 lignes (vs 1191 lignes God Object original)
 import logging
 import os
 import threading
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
@@ -204,6 +204,22 @@ class TranslationMLService:
             text, source_language, target_language, model_type, source_channel
         )
 
+    async def translate_multilingual(
+        self,
+        text: str,
+        source_language: str = "auto",
+        target_languages: Optional[List[str]] = None,
+        model_type: str = "basic",
+        source_channel: str = "unknown"
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Traduction vers plusieurs langues (source encodée une seule fois)
+        DÉLÉGATION vers TranslationService.translate_multilingual()
+        """
+        return await self.translation_service.translate_multilingual(
+            text, source_language, target_languages, model_type, source_channel
+        )
+
     async def get_stats(self) -> Dict[str, Any]:
         """
         Retourne les statistiques globales
@@ -273,8 +289,8 @@ class TranslationMLService:
         target_lang: str,
         model_type: str
     ) -> str:
-        """Traduction ML - DÉLÉGATION vers TranslatorEngine"""
-        return await self.translator_engine.translate_text(
+        """Traduction ML - DÉLÉGATION vers le moteur d'inférence (réplicas si actifs)"""
+        return await self.translation_service._inference_engine.translate_text(
             text, source_lang, target_lang, model_type
         )
 
@@ -285,12 +301,24 @@ class TranslationMLService:
         target_lang: str,
         model_type: str
     ) -> list:
-        """Traduction batch - DÉLÉGATION vers TranslatorEngine"""
-        return await self.translator_engine.translate_batch(
+        """Traduction batch - DÉLÉGATION vers le moteur d'inférence (réplicas si actifs)"""
+        return await self.translation_service._inference_engine.translate_batch(
             texts, source_lang, target_lang, model_type
         )
 
 
+    async def _ml_translate_batch_multilingual(
+        self,
+        texts: list,
+        source_lang: str,
+        target_langs: list,
+        model_type: str
+    ) -> Dict[str, list]:
+        """Traduction batch multi-cibles - DÉLÉGATION vers le moteur d'inférence (réplicas si actifs)"""
+        return await self.translation_service._inference_engine.translate_multilingual(
+            texts, source_lang, target_langs, model_type
+        )
+
 # Instance globale du service (Singleton)
 def get_unified_ml_service(max_workers: int = 4) -> TranslationMLService:
     """Retourne l'instance unique du service ML refactorisé"""
@@ -8,11 +8,14 @@ Responsabilités:
 - Calcul de durée audio
 - Gestion des paramètres de synthèse
 - Segmentation intelligente pour textes longs
+- Réutilisation des audios déjà synthétisés (magasin d'artefacts, optionnel)
 """
 
 import os
 import re
+import json
 import shutil
+import hashlib
 import logging
 import time
 import uuid
@@ -21,7 +24,9 @@ from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 from pathlib import Path
 
+from utils.artifact_store import ArtifactStore
 from utils.audio_format import export_options, mime_type_for
+from utils.audio_hash import get_audio_hasher
 
 logger = logging.getLogger(__name__)
 
@@ -67,18 +72,28 @@ class Synthesizer:
     - Conversion de formats audio
     - Génération des résultats unifiés
     - Segmentation intelligente pour textes longs (>150 chars)
+    - Avec un magasin d'artefacts: segments et audios WAV rangés sous
+      (hash du texte, 'tts:<langue>:<voix>:<modèle>:<paramètres>') et
+      réutilisés au lieu d'être resynthétisés
     """
 
-    def __init__(self, output_dir: Path, default_format: str = "mp3"):
+    def __init__(
+        self,
+        output_dir: Path,
+        default_format: str = "mp3",
+        artifact_store: Optional[ArtifactStore] = None
+    ):
         """
         Initialise le synthétiseur.
 
         Args:
             output_dir: Répertoire de sortie pour les fichiers audio
             default_format: Format de sortie par défaut
+            artifact_store: Magasin d'artefacts des WAV synthétisés (None = pas de réutilisation)
         """
         self.output_dir = output_dir
         self.default_format = default_format
+        self.artifact_store = artifact_store
 
         # Créer les répertoires de sortie
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -192,11 +207,75 @@ class Synthesizer:
 
         return segments if segments else [text]
 
+    async def _tts_transform(
+        self,
+        target_language: str,
+        model: 'TTSModel',
+        speaker_audio_path: Optional[str],
+        conditionals: Optional[Any],
+        params: Dict[str, Any]
+    ) -> Optional[str]:
+        """
+        Transformation identifiant une synthèse reproductible dans le magasin
+
+        Returns:
+            'tts:<langue>:<voix>:<modèle>:<paramètres>', None sans magasin ou
+            si la voix n'est pas identifiable (conditionals sans audio de référence)
+        """
+        if self.artifact_store is None:
+            return None
+        if speaker_audio_path and os.path.exists(speaker_audio_path):
+            voice = await get_audio_hasher().hash_file_async(speaker_audio_path)
+        elif conditionals is None:
+            voice = "default"
+        else:
+            return None
+        simple_params = {
+            key: value for key, value in params.items()
+            if isinstance(value, (str, int, float, bool)) or value is None
+        }
+        params_digest = hashlib.sha256(json.dumps(simple_params, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+        return f"tts:{target_language}:{voice}:{model.value}:{params_digest}"
+
+    @staticmethod
+    def _text_hash(text: str) -> str:
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()[:32]
+
+    async def _synthesize_stored(
+        self,
+        backend: 'BaseTTSBackend',
+        text: str,
+        transform: str,
+        **synth_kwargs
+    ) -> Optional[str]:
+        """
+        Synthèse WAV via le magasin d'artefacts (réutilisée si déjà produite)
+
+        Returns:
+            Chemin de l'artefact, None si le backend n'a rien produit
+        """
+        content_hash = self._text_hash(text)
+        stored_path = self.artifact_store.get(content_hash, transform)
+        if stored_path is not None:
+            logger.debug(f"[Synthesizer] ♻️ Audio réutilisé ({transform})")
+            return stored_path
+
+        tmp_path = self.artifact_store.temp_path(".wav")
+        try:
+            await backend.synthesize(text=text, output_path=tmp_path, **synth_kwargs)
+            if not os.path.exists(tmp_path):
+                return None
+            return self.artifact_store.put_file(content_hash, transform, tmp_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
     async def _concatenate_audios(
         self,
         audio_paths: List[str],
         output_path: str,
-        silence_ms: int = 150
+        silence_ms: int = 150,
+        keep_inputs: bool = False
     ) -> str:
         """
         Concatène plusieurs fichiers audio avec des silences entre eux.
@@ -205,15 +284,18 @@ class Synthesizer:
             audio_paths: Liste des chemins audio à concaténer
             output_path: Chemin de sortie
             silence_ms: Durée du silence entre segments (ms)
+            keep_inputs: Conserver les fichiers d'entrée (artefacts du magasin)
 
         Returns:
             Chemin du fichier concaténé
         """
         if len(audio_paths) == 1:
-            # Un seul fichier, le renommer simplement
+            # Un seul fichier, le renommer (ou le copier s'il doit être conservé)
             if audio_paths[0] != output_path:
-                import shutil
-                shutil.move(audio_paths[0], output_path)
+                if keep_inputs:
+                    shutil.copyfile(audio_paths[0], output_path)
+                else:
+                    shutil.move(audio_paths[0], output_path)
             return output_path
 
         try:
@@ -245,6 +327,8 @@ class Synthesizer:
 
                 # Nettoyer les fichiers temporaires
                 for path in audio_paths:
+                    if keep_inputs:
+                        break
                     if os.path.exists(path) and path != output_path:
                         try:
                             os.unlink(path)
@@ -398,6 +482,15 @@ class Synthesizer:
         )
 
         try:
+            # Même texte, même voix, mêmes paramètres: l'audio du magasin est réutilisé
+            transform = await self._tts_transform(
+                target_language, model, speaker_audio_path, conditionals, kwargs
+            )
+            stored_full = (
+                self.artifact_store.get(self._text_hash(text), transform)
+                if transform else None
+            )
+
             # ═══════════════════════════════════════════════════════════════
             # SEGMENTATION POUR TEXTES LONGS
             # Chatterbox limite à ~140s audio (max_new_tokens=2048)
@@ -405,7 +498,12 @@ class Synthesizer:
             # ═══════════════════════════════════════════════════════════════
             segments = self._segment_text(text)
 
-            if len(segments) > 1:
+            if stored_full is not None:
+                logger.info(f"[Synthesizer] ♻️ Audio déjà synthétisé réutilisé ({transform})")
+                # Copie si le fichier est modifié sur place (ajustement de vitesse)
+                ArtifactStore.materialize(stored_full, synth_path, link=AUDIO_SPEED_FACTOR == 1.0)
+                output_path = synth_path
+            elif len(segments) > 1:
                 logger.info(
                     f"[Synthesizer] 📝 Texte long détecté ({len(text)} chars) → "
                     f"{len(segments)} segments à synthétiser SÉQUENTIELLEMENT"
@@ -429,14 +527,25 @@ class Synthesizer:
                     )
 
                     try:
-                        await backend.synthesize(
-                            text=segment_text,
-                            language=target_language,
-                            speaker_audio_path=speaker_audio_path,
-                            output_path=segment_path,
-                            conditionals=conditionals,
-                            **kwargs
-                        )
+                        if transform:
+                            segment_path = await self._synthesize_stored(
+                                backend,
+                                segment_text,
+                                transform,
+                                language=target_language,
+                                speaker_audio_path=speaker_audio_path,
+                                conditionals=conditionals,
+                                **kwargs
+                            ) or segment_path
+                        else:
+                            await backend.synthesize(
+                                text=segment_text,
+                                language=target_language,
+                                speaker_audio_path=speaker_audio_path,
+                                output_path=segment_path,
+                                conditionals=conditionals,
+                                **kwargs
+                            )
 
                         if os.path.exists(segment_path):
                             logger.debug(f"[Synthesizer] ✅ Segment {i+1} synthétisé")
@@ -454,10 +563,16 @@ class Synthesizer:
                 # Concaténer tous les segments
                 if segment_paths:
                     temp_concat_path = str(self.output_dir / "segments" / f"{file_id}_{target_language}_full.wav")
-                    await self._concatenate_audios(segment_paths, temp_concat_path)
+                    if transform:
+                        # Les segments appartiennent au magasin: ne pas les supprimer
+                        await self._concatenate_audios(segment_paths, temp_concat_path, keep_inputs=True)
+                    else:
+                        await self._concatenate_audios(segment_paths, temp_concat_path)
                     # Déplacer vers la destination finale
                     shutil.move(temp_concat_path, synth_path)
                     output_path = synth_path
+                    if transform and len(segment_paths) == len(segments):
+                        self.artifact_store.put_file(self._text_hash(text), transform, synth_path, move=False)
                 else:
                     raise RuntimeError("Aucun segment audio généré")
             else:
@@ -471,6 +586,8 @@ class Synthesizer:
                     **kwargs
                 )
                 output_path = synth_path
+                if transform and os.path.exists(synth_path):
+                    self.artifact_store.put_file(self._text_hash(text), transform, synth_path, move=False)
 
             # Ajuster la vitesse de l'audio (ralentir de 10% par défaut)
             if AUDIO_SPEED_FACTOR != 1.0:
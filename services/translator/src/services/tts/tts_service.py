@@ -22,6 +22,7 @@ from .models import TTSModel, TTSModelInfo, TTS_MODEL_INFO
 from .model_manager import ModelManager, ModelStatus
 from .language_router import LanguageRouter
 from .synthesizer import Synthesizer, UnifiedTTSResult
+from utils.artifact_store import get_artifact_store
 
 TTS_AUDIO_CACHE_TTL = int(os.getenv("TTS_AUDIO_CACHE_TTL", str(7 * 24 * 3600)))  # 7 days
 
@@ -84,7 +85,8 @@ class UnifiedTTSService:
         self.language_router = LanguageRouter(model_manager=self.model_manager)
         self.synthesizer = Synthesizer(
             output_dir=self.output_dir,
-            default_format=self.default_format
+            default_format=self.default_format,
+            artifact_store=get_artifact_store()
         )
 
         # État du service
@@ -6,7 +6,7 @@ Gère le stockage et la récupération des modèles de voix depuis Redis.
 import os
 import logging
 import base64
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator
 from pathlib import Path
 from datetime import datetime, timedelta
 import numpy as np
@@ -26,7 +26,7 @@ class VoiceCloneCacheManager:
     - Chargement/sauvegarde des modèles depuis/vers Redis
     - Conversion profil cache/DB ↔ VoiceModel
     - Gestion des embeddings (encodage base64)
-    - Listing des modèles en cache
+    - Listing paginé des modèles en cache (index Redis, sans KEYS)
     - Statistiques de cache
     """
 
@@ -277,11 +277,9 @@ class VoiceCloneCacheManager:
         """
         logger.info("[VOICE_CLONE_CACHE] 🔄 Démarrage recalibration trimestrielle...")
 
-        # Lister tous les modèles en cache
-        all_models = await self.list_all_cached_models()
-
         recalibrated = 0
-        for model in all_models:
+        # Seulement les modèles échus (index nextRecalibrationAt), page par page
+        async for model in self._iter_due_models(datetime.now()):
             if model.next_recalibration_at and datetime.now() >= model.next_recalibration_at:
                 logger.info(f"[VOICE_CLONE_CACHE] 🔄 Recalibration pour {model.user_id}")
 
@@ -326,36 +324,60 @@ class VoiceCloneCacheManager:
 
         logger.info(f"[VOICE_CLONE_CACHE] ✅ Recalibration trimestrielle terminée: {recalibrated} modèles mis à jour")
 
+    async def iter_cached_models(
+        self,
+        page_size: int = 100,
+        due_before: Optional[datetime] = None
+    ) -> AsyncIterator[List[VoiceModel]]:
+        """
+        Parcourt les modèles vocaux en cache par pages (générateur async).
+
+        S'appuie sur les index Redis (sorted sets) : un ZRANGEBYSCORE + un MGET
+        par page, jamais de KEYS ; mémoire bornée par `page_size`.
+
+        Args:
+            page_size: Nombre de profils par page
+            due_before: Seulement les modèles dont la recalibration est échue à cette date
+
+        Yields:
+            Listes de VoiceModel
+        """
+        try:
+            async for profiles in self.audio_cache.iter_voice_profiles(
+                page_size=page_size,
+                due_before=due_before.timestamp() if due_before else None
+            ):
+                models = []
+                for cached_profile in profiles:
+                    try:
+                        models.append(self._cache_profile_to_voice_model(cached_profile))
+                    except Exception as e:
+                        logger.warning(
+                            f"[VOICE_CLONE_CACHE] Erreur lecture profil {cached_profile.get('userId')}: {e}"
+                        )
+                if models:
+                    yield models
+        except Exception as e:
+            logger.error(f"[VOICE_CLONE_CACHE] Erreur listing modèles Redis: {e}")
+
+    async def _iter_due_models(self, now: datetime) -> AsyncIterator[VoiceModel]:
+        """Modèles dont la recalibration est échue, un par un (pages en arrière-plan)"""
+        async for models in self.iter_cached_models(due_before=now):
+            for model in models:
+                yield model
+
     async def list_all_cached_models(self) -> List[VoiceModel]:
         """
         Liste tous les modèles vocaux depuis le cache Redis.
 
-        Note: Cette méthode ne charge pas les embeddings pour des raisons de performance.
-        Utiliser load_embedding() si l'embedding est nécessaire.
+        Pour de gros volumes, préférer iter_cached_models() (pages bornées).
 
         Returns:
             Liste de tous les modèles en cache
         """
         models = []
-
-        try:
-            # Lister toutes les clés de profils vocaux
-            profile_keys = await self.audio_cache.redis.keys("voice:profile:*")
-
-            for key in profile_keys:
-                try:
-                    data = await self.audio_cache.redis.get(key)
-                    if data:
-                        import json
-                        cached_profile = json.loads(data)
-                        model = self._cache_profile_to_voice_model(cached_profile)
-                        models.append(model)
-                except Exception as e:
-                    logger.warning(f"[VOICE_CLONE_CACHE] Erreur lecture profil {key}: {e}")
-
-        except Exception as e:
-            logger.error(f"[VOICE_CLONE_CACHE] Erreur listing modèles Redis: {e}")
-
+        async for page in self.iter_cached_models():
+            models.extend(page)
         return models
 
     async def get_stats(self) -> Dict[str, Any]:
@@ -375,9 +397,8 @@ class VoiceCloneCacheManager:
             cache_stats = self.audio_cache.get_stats()
             cache_available = cache_stats.get("redis_available", False) or cache_stats.get("memory_entries", 0) > 0
 
-            # Compter les modèles en cache
-            profile_keys = await self.audio_cache.redis.keys("voice:profile:*")
-            models_count = len(profile_keys)
+            # Compter les modèles en cache (ZCARD de l'index, O(1))
+            models_count = await self.audio_cache.count_voice_profiles()
         except Exception as e:
             logger.warning(f"[VOICE_CLONE_CACHE] Erreur comptage modèles: {e}")
 
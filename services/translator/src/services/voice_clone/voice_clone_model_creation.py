@@ -28,6 +28,7 @@ import numpy as np
 from .voice_metadata import VoiceModel, VoiceCharacteristics
 from .voice_analyzer import get_voice_analyzer
 from .voice_fingerprint import VoiceFingerprint
+from utils.artifact_store import get_artifact_store
 from utils.audio_format_converter import convert_to_wav_if_needed
 
 logger = logging.getLogger(__name__)
@@ -449,8 +450,9 @@ class VoiceCloneModelCreator:
             # Convertir en WAV si nécessaire (M4A, AAC non supportés par soundfile)
             wav_path = convert_to_wav_if_needed(audio_path)
 
-            # Charger l'audio
-            audio, sr = sf.read(wav_path)
+            # Charger l'audio (WAV du magasin épinglé pendant la lecture)
+            with get_artifact_store().pinned(wav_path):
+                audio, sr = sf.read(wav_path)
             if len(audio.shape) > 1:
                 audio = audio.mean(axis=1)  # Convertir en mono
 
@@ -472,33 +472,11 @@ class VoiceCloneService:
 
     async def _list_all_cached_models(self) -> List[VoiceModel]:
         """
-        Liste tous les modeles vocaux depuis le cache Redis.
+        Liste tous les modeles vocaux depuis le cache Redis (index pagine, sans KEYS).
 
-        Note: Cette methode ne charge pas les embeddings pour des raisons de performance.
-        Utiliser _load_embedding() si l'embedding est necessaire.
+        Voir VoiceCloneCacheManager.iter_cached_models pour un parcours par pages.
         """
-        models = []
-
-        try:
-            audio_cache = self._get_audio_cache()
-            # Lister toutes les clés de profils vocaux
-            profile_keys = await audio_cache.redis.keys("voice:profile:*")
-
-            for key in profile_keys:
-                try:
-                    data = await audio_cache.redis.get(key)
-                    if data:
-                        import json
-                        cached_profile = json.loads(data)
-                        model = self._cache_profile_to_voice_model(cached_profile)
-                        models.append(model)
-                except Exception as e:
-                    logger.warning(f"[VOICE_CLONE] Erreur lecture profil {key}: {e}")
-
-        except Exception as e:
-            logger.error(f"[VOICE_CLONE] Erreur listing modeles Redis: {e}")
-
-        return models
+        return await self._get_cache_manager().list_all_cached_models()
 
     async def get_stats(self) -> Dict[str, Any]:
         """Retourne les statistiques du service"""
@@ -0,0 +1,218 @@
+"""
+Contrôle d'admission des requêtes ZMQ (budgets de concurrence par type)
+
+Sans borne, une rafale d'`audio_process` lançait autant de tâches
+Whisper/TTS concurrentes que de messages reçus (OOM). Chaque classe de
+requête a ici un budget de tâches actives et une file d'attente bornée ;
+au-delà, la requête est rejetée explicitement. La boucle de réception
+n'attend (le socket PULL n'est plus lu, la HWM ZMQ repousse vers la gateway)
+que si toutes les classes sont saturées : cesser de lire pour un audio
+bloquerait aussi les traductions qui le suivent dans le socket.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Coroutine, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Politiques de saturation
+BACKPRESSURE = "backpressure"  # tout saturé: attendre une place (sans lire le socket) puis rejeter
+SHED = "shed"                  # rejeter immédiatement
+
+# Type de tâche (label du serveur) → classe budgétée
+REQUEST_CLASSES = {
+    'translation': 'translation',
+    'story_text_object_translation': 'translation',
+    'audio_process': 'audio_process',
+    'transcription': 'transcription',
+    'voice_api': 'voice_api',
+    'voice_profile': 'voice_api',
+}
+
+
+def parse_admission_budgets(value: str) -> Dict[str, Tuple[int, int]]:
+    """'audio_process=4:32,...' → {'audio_process': (4, 32)} (entrées invalides ignorées)"""
+    budgets = {}
+    for part in (value or "").split(","):
+        name, _, spec = part.strip().partition("=")
+        concurrency, _, queue_size = spec.partition(":")
+        if name and concurrency.strip().isdigit() and int(concurrency) > 0:
+            queue = int(queue_size) if queue_size.strip().isdigit() else 0
+            budgets[name.strip()] = (int(concurrency), queue)
+    return budgets
+
+
+@dataclass
+class _ClassState:
+    """Budget et état d'une classe de requêtes"""
+    limit: int
+    queue_size: int
+    running: int = 0
+    waiting: Deque[Tuple[Coroutine, str]] = field(default_factory=deque)
+    stats: Dict[str, float] = field(default_factory=lambda: {
+        'admitted': 0, 'enqueued': 0, 'rejected': 0, 'backpressure_waits': 0, 'backpressure_ms': 0.0
+    })
+
+
+class AdmissionController:
+    """
+    Budgets de concurrence et files bornées par classe de requête
+
+    - Place libre: la tâche démarre (via `spawn`)
+    - Budget plein, file non pleine: la coroutine attend son tour
+    - File pleine: politique `backpressure` → si toutes les classes sont
+      saturées, `submit` attend une place au plus `max_wait_s` (l'appelant ne
+      lit plus le socket), puis rejet ; sinon rejet immédiat, pour ne pas
+      bloquer derrière elle les classes qui ont encore de la place ;
+      politique `shed` → rejet immédiat
+    - Types sans budget: démarrés directement
+
+    Usage:
+        admission = AdmissionController(parse_admission_budgets(spec), spawn=server._create_tracked_task)
+        if not await admission.submit('audio_process', handler(request)):
+            await publish_overloaded(request)
+    """
+
+    def __init__(
+        self,
+        budgets: Dict[str, Tuple[int, int]],
+        spawn: Callable[[Coroutine, str], Any],
+        policy: str = BACKPRESSURE,
+        max_wait_s: float = 5.0
+    ):
+        """
+        Initialise le contrôleur
+
+        Args:
+            budgets: classe → (tâches actives max, file d'attente max)
+            spawn: Lance une coroutine (ex: ZMQTranslationServer._create_tracked_task)
+            policy: 'backpressure' ou 'shed'
+            max_wait_s: Attente maximale d'une place en backpressure
+        """
+        self.policy = policy if policy in (BACKPRESSURE, SHED) else BACKPRESSURE
+        self.max_wait_s = max(0.0, max_wait_s)
+        self._spawn = spawn
+        self._states: Dict[str, _ClassState] = {
+            name: _ClassState(limit=limit, queue_size=max(0, queue_size))
+            for name, (limit, queue_size) in budgets.items()
+        }
+        # Signalé à chaque place libérée, toutes classes confondues
+        self._released: Optional[asyncio.Event] = None
+
+    @staticmethod
+    def request_class(task_type: str) -> str:
+        """Classe budgétée d'un type de tâche"""
+        return REQUEST_CLASSES.get(task_type, task_type)
+
+    async def submit(self, task_type: str, coro: Coroutine) -> bool:
+        """
+        Démarre ou met en file une coroutine selon le budget de sa classe
+
+        Returns:
+            True si admise (démarrée ou en file), False si rejetée (coroutine fermée)
+        """
+        state = self._states.get(self.request_class(task_type))
+        if state is None:
+            self._spawn(coro, task_type)
+            return True
+
+        if self._try_admit(state, coro, task_type):
+            return True
+
+        if self.policy == BACKPRESSURE and self.max_wait_s > 0 and self._all_saturated():
+            if self._released is None:
+                self._released = asyncio.Event()
+            state.stats['backpressure_waits'] += 1
+            start = time.monotonic()
+            deadline = start + self.max_wait_s
+            try:
+                while (remaining := deadline - time.monotonic()) > 0:
+                    self._released.clear()
+                    try:
+                        await asyncio.wait_for(self._released.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                    if self._try_admit(state, coro, task_type):
+                        return True
+                    if not self._all_saturated():
+                        break  # Une autre classe a de la place: reprendre la lecture
+            finally:
+                state.stats['backpressure_ms'] += (time.monotonic() - start) * 1000
+
+        state.stats['rejected'] += 1
+        coro.close()
+        logger.warning(
+            f"[ADMISSION] ⛔ {task_type} rejeté: {state.running}/{state.limit} actives, "
+            f"{len(state.waiting)}/{state.queue_size} en attente"
+        )
+        return False
+
+    def _all_saturated(self) -> bool:
+        """True si aucune classe budgétée n'a de place (ni tâche libre, ni file)"""
+        return all(
+            state.running >= state.limit and len(state.waiting) >= state.queue_size
+            for state in self._states.values()
+        )
+
+    def _try_admit(self, state: _ClassState, coro: Coroutine, task_type: str) -> bool:
+        if state.running < state.limit:
+            self._start(state, coro, task_type)
+            return True
+        if len(state.waiting) < state.queue_size:
+            state.waiting.append((coro, task_type))
+            state.stats['enqueued'] += 1
+            return True
+        return False
+
+    def _start(self, state: _ClassState, coro: Coroutine, task_type: str) -> None:
+        state.running += 1
+        state.stats['admitted'] += 1
+        self._spawn(self._run(state, coro), task_type)
+
+    async def _run(self, state: _ClassState, coro: Coroutine) -> Any:
+        try:
+            return await coro
+        finally:
+            state.running -= 1
+            if state.waiting:
+                next_coro, next_type = state.waiting.popleft()
+                self._start(state, next_coro, next_type)
+            if self._released is not None:
+                self._released.set()
+
+    def close_pending(self) -> int:
+        """Abandonne les coroutines en file (arrêt du serveur)"""
+        dropped = 0
+        for state in self._states.values():
+            while state.waiting:
+                coro, _ = state.waiting.popleft()
+                coro.close()
+                dropped += 1
+        return dropped
+
+    def queue_depth(self, request_class: str) -> int:
+        """Nombre de requêtes en file pour une classe"""
+        state = self._states.get(request_class)
+        return len(state.waiting) if state else 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Profondeurs de file, tâches actives et compteurs par classe"""
+        return {
+            'policy': self.policy,
+            'max_wait_s': self.max_wait_s,
+            'classes': {
+                name: {
+                    'running': state.running,
+                    'limit': state.limit,
+                    'queued': len(state.waiting),
+                    'queue_size': state.queue_size,
+                    **{key: round(value, 1) if isinstance(value, float) else value
+                       for key, value in state.stats.items()}
+                }
+                for name, state in self._states.items()
+            }
+        }
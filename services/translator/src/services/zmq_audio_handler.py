@@ -17,6 +17,7 @@ from typing import Dict, Optional, List
 logger = logging.getLogger(__name__)
 
 from .segment_serialization import _get_voice_similarity_score, _segment_to_dict
+from .zmq_models import deadline_from_request
 from utils.audio_format import read_audio_bytes
 
 # Import du pipeline audio.
@@ -80,6 +81,14 @@ except ImportError as e:
     logger.warning(f"⚠️ [AUDIO-HANDLER] AudioFetcher non disponible: {e}")
     pass
 
+# Hash du contenu audio calculé en mémoire depuis les frames ZMQ
+AUDIO_HASHER_AVAILABLE = False
+try:
+    from utils.audio_hash import get_audio_hasher
+    AUDIO_HASHER_AVAILABLE = True
+except ImportError as e:
+    logger.warning(f"⚠️ [AUDIO-HANDLER] Hash audio en mémoire non disponible: {e}")
+
 
 class AudioHandler:
     """Handler pour les traitements audio via ZMQ"""
@@ -174,6 +183,20 @@ class AudioHandler:
         task_id = str(uuid.uuid4())
         start_time = time.time()
 
+        # Requête restée en file d'admission au-delà de son échéance: la
+        # gateway a déjà abandonné, Whisper/TTS tourneraient pour rien
+        late_s = start_time - deadline_from_request(request_data, now=start_time)
+        if late_s > 0:
+            logger.warning(f"⌛ [TRANSLATOR] Requête audio expirée abandonnée: {request_data.get('messageId')} (+{late_s * 1000:.0f}ms)")
+            await self._publish_audio_error(
+                task_id=task_id,
+                message_id=request_data.get('messageId', ''),
+                attachment_id=request_data.get('attachmentId', ''),
+                error="Audio request deadline expired",
+                error_code="deadline_expired"
+            )
+            return
+
         if not _retry_audio_pipeline_import():
             logger.error("[TRANSLATOR] ❌ Audio pipeline non disponible")
             await self._publish_audio_error(
@@ -199,6 +222,11 @@ class AudioHandler:
                 raise RuntimeError("AudioFetcher n'est pas disponible - service requis pour le traitement audio")
 
             audio_fetcher = get_audio_fetcher()
+
+            # Clé de cache calculée depuis la frame binaire, avant toute
+            # écriture disque (pas de relecture du fichier par le pipeline)
+            audio_hash = await self._hash_audio_frame(request_data.get('_audioBinary'))
+
             local_audio_path, audio_source = await audio_fetcher.acquire_audio(
                 attachment_id=request_data.get('attachmentId'),
                 audio_binary=request_data.get('_audioBinary'),  # ZMQ multipart (plus efficace)
@@ -321,7 +349,9 @@ class AudioHandler:
                 # Callback pour envoi progressif de la transcription
                 on_transcription_ready=on_transcription_ready,
                 # Callback pour envoi progressif des traductions
-                on_translation_ready=on_translation_ready
+                on_translation_ready=on_translation_ready,
+                # Hash calculé depuis la frame ZMQ (None → fichier haché par le pipeline)
+                audio_hash=audio_hash
             )
 
             processing_time = int((time.time() - start_time) * 1000)
@@ -399,6 +429,20 @@ class AudioHandler:
                 error_code="processing_failed"
             )
 
+    async def _hash_audio_frame(self, audio_binary: Optional[bytes]) -> Optional[str]:
+        """Hash du contenu de la frame `_audioBinary` (thread de travail au-delà de 256 Ko).
+
+        None si pas de frame ou hachage indisponible : le pipeline hache alors
+        le fichier acquis, par blocs, hors de la boucle.
+        """
+        if not audio_binary or not AUDIO_HASHER_AVAILABLE:
+            return None
+        try:
+            return await get_audio_hasher().hash_bytes_async(audio_binary)
+        except Exception as e:
+            logger.warning(f"⚠️ [TRANSLATOR] Hash de la frame audio impossible: {e}")
+            return None
+
     async def _report_total_translation_failure(self, task_id: str, request_data: dict, result) -> bool:
         """Signale au client l'échec de TOUTES les langues demandées.
 
@@ -4,18 +4,84 @@ Modèles de données pour le serveur ZMQ de traduction
 Contient les dataclasses et modèles utilisés par le serveur de traduction.
 """
 
+import math
 import time
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, List, Optional
 
 # Import des optimisations de performance
 PERFORMANCE_MODULE_AVAILABLE = False
 try:
-    from utils.performance import Priority
+    from utils.performance import Priority, PerformanceConfig
     PERFORMANCE_MODULE_AVAILABLE = True
 except ImportError:  # pragma: no cover
     pass
 
+# Échéance par défaut d'une traduction texte (délai de réponse attendu par la gateway)
+DEFAULT_TRANSLATION_DEADLINE_S = (
+    PerformanceConfig().translation_deadline_s if PERFORMANCE_MODULE_AVAILABLE else 30.0
+)
+
+# Échéance par défaut d'un pipeline audio (deadman voix de la gateway, 15 min)
+DEFAULT_AUDIO_DEADLINE_S = (
+    PerformanceConfig().audio_deadline_s if PERFORMANCE_MODULE_AVAILABLE else 900.0
+)
+
+# Type de requête gateway → échéance par défaut (texte si type inconnu)
+DEFAULT_DEADLINES_S = {
+    'translation': DEFAULT_TRANSLATION_DEADLINE_S,
+    'story_text_object_translation': DEFAULT_TRANSLATION_DEADLINE_S,
+    'audio_process': DEFAULT_AUDIO_DEADLINE_S,
+    'transcription_only': DEFAULT_AUDIO_DEADLINE_S,
+    'voice_translate': DEFAULT_AUDIO_DEADLINE_S,
+    'voice_translate_async': DEFAULT_AUDIO_DEADLINE_S,
+}
+
+# Horodatage gateway ignoré au-delà de cet écart d'horloge
+_MAX_CLOCK_SKEW_S = 3600.0
+
+
+def _epoch_s(value: Any) -> Optional[float]:
+    """Horodatage gateway (epoch ms) → epoch s, None si absent ou invalide"""
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+        return None
+    return value / 1000.0
+
+
+def deadline_from_request(request_data: dict, default_s: float = None, now: float = None) -> float:
+    """
+    Échéance absolue (epoch s) d'une requête gateway
+
+    Par ordre de préférence: `deadline` (epoch ms), `timeoutMs` compté depuis
+    `timestamp` (ou la réception), `timestamp` + délai par défaut, réception
+    + délai par défaut. Le délai par défaut dépend du `type` de la requête
+    (DEFAULT_DEADLINES_S). Un horodatage trop éloigné de l'horloge locale est ignoré.
+    """
+    now = time.time() if now is None else now
+    if default_s is None:
+        default_s = DEFAULT_DEADLINES_S.get(request_data.get('type'), DEFAULT_TRANSLATION_DEADLINE_S)
+
+    deadline = _epoch_s(request_data.get('deadline'))
+    if deadline is not None and abs(deadline - now) <= _MAX_CLOCK_SKEW_S:
+        return deadline
+
+    sent_at = _epoch_s(request_data.get('timestamp'))
+    if sent_at is None or abs(sent_at - now) > _MAX_CLOCK_SKEW_S:
+        sent_at = now
+
+    timeout_ms = request_data.get('timeoutMs')
+    if isinstance(timeout_ms, (int, float)) and not isinstance(timeout_ms, bool) and timeout_ms > 0:
+        return sent_at + timeout_ms / 1000.0
+    return sent_at + default_s
+
+
+def task_deadline(item: Any) -> float:
+    """Échéance d'un élément de file (inf si aucune)"""
+    deadline = getattr(item, 'deadline', None)
+    if isinstance(deadline, (int, float)) and not isinstance(deadline, bool):
+        return float(deadline)
+    return math.inf
+
 
 @dataclass
 class TranslationTask:
@@ -29,10 +95,13 @@ class TranslationTask:
     model_type: str = "basic"
     created_at: float = None
     priority: int = 2  # 1=HIGH (short), 2=MEDIUM, 3=LOW (long), 4=BULK
+    deadline: Optional[float] = None  # epoch s; passée, la tâche est abandonnée avant inférence
 
     def __post_init__(self):
         if self.created_at is None:
             self.created_at = time.time()
+        if self.deadline is None:
+            self.deadline = self.created_at + DEFAULT_TRANSLATION_DEADLINE_S
         # Auto-assign priority based on text length if not set
         if PERFORMANCE_MODULE_AVAILABLE and self.priority == 2:
             text_len = len(self.text)
@@ -42,3 +111,7 @@ class TranslationTask:
                 self.priority = Priority.MEDIUM.value
             else:
                 self.priority = Priority.LOW.value
+
+    def is_expired(self, now: float = None) -> bool:
+        """Échéance dépassée (la gateway a abandonné la requête)"""
+        return (time.time() if now is None else now) > self.deadline
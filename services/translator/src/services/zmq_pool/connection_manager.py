@@ -5,27 +5,186 @@ Responsabilités:
 - Gestion des queues de traduction (normal, any, fast)
 - Batch accumulation pour traitement optimisé
 - Enqueue logic et priorités
+- Ordonnancement par échéance (EDF) dans chaque queue
+- Partage équitable entre conversations (deficit round-robin pondéré)
 - Queue statistics et monitoring
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
+import math
 import os
-from typing import Dict, List, Optional
-from collections import defaultdict
+from typing import Any, Dict, List, Optional
+from collections import Counter, defaultdict, deque
 
 # Import local
-from ..zmq_models import TranslationTask
+from ..zmq_models import TranslationTask, task_deadline
+from utils.performance import PerformanceConfig
 
 logger = logging.getLogger(__name__)
 
 
+class DeadlineQueue(asyncio.Queue):
+    """
+    asyncio.Queue servie par échéance la plus proche (EDF)
+
+    Même API qu'asyncio.Queue (put/get/qsize/full/maxsize) ; à échéance
+    égale (ou sans échéance), l'ordre d'arrivée est conservé.
+    """
+
+    def _init(self, maxsize):
+        self._queue = []
+        self._seq = itertools.count()
+
+    def _put(self, item):
+        heapq.heappush(self._queue, (task_deadline(item), next(self._seq), item))
+
+    def _get(self):
+        return heapq.heappop(self._queue)[2]
+
+    def peek_deadline(self) -> float:
+        """Échéance de la prochaine tâche servie (inf si vide)"""
+        return self._queue[0][0] if self._queue else math.inf
+
+
+def parse_flow_weights(value: str) -> Dict[str, float]:
+    """'conv_a=4,conv_b=0.5' → {'conv_a': 4.0, 'conv_b': 0.5} (entrées invalides ignorées)"""
+    weights = {}
+    for part in (value or "").split(","):
+        name, _, weight = part.strip().partition("=")
+        try:
+            weight_value = float(weight)
+        except ValueError:
+            continue
+        if name.strip() and weight_value > 0:
+            weights[name.strip()] = weight_value
+    return weights
+
+
+def _item_tasks(item: Any) -> List[Any]:
+    """Tâches portées par un élément de file (batch développé)"""
+    return getattr(item, '_batch_tasks', None) or [item]
+
+
+class FairQueue(DeadlineQueue):
+    """
+    File à partage équitable entre conversations (deficit round-robin pondéré)
+
+    Une sous-file par conversation, servie par échéance (EDF) ; les
+    conversations actives sont servies à tour de rôle, chacune recevant
+    `weight` éléments par tour (poids fractionnaires acceptés). Un élément
+    coûte 1 : un batch est une seule inférence. Une conversation bruyante
+    n'allonge donc que sa propre sous-file.
+
+    Même API qu'asyncio.Queue ; `maxsize` borne le total d'éléments.
+    """
+
+    def __init__(self, maxsize: int = 0, weights: Optional[Dict[str, float]] = None):
+        self.weights: Dict[str, float] = dict(weights or {})
+        super().__init__(maxsize=maxsize)
+
+    def _init(self, maxsize):
+        # _queue: conversation → tas (échéance, seq, élément) ; vide = aucune sous-file
+        self._queue: Dict[str, list] = {}
+        self._seq = itertools.count()
+        self._active: deque = deque()
+        self._deficit: Dict[str, float] = {}
+        self._size = 0
+        self._pending: Counter = Counter()
+
+    def qsize(self) -> int:
+        return self._size
+
+    @staticmethod
+    def flow_key(item: Any) -> str:
+        """Sous-file d'un élément (conversation, ou celle choisie pour un batch)"""
+        return getattr(item, '_flow_key', None) or getattr(item, 'conversation_id', None) or "unknown"
+
+    def weight(self, flow: str) -> float:
+        return max(0.01, self.weights.get(flow, 1.0))
+
+    def _put(self, item):
+        flow = self.flow_key(item)
+        heap = self._queue.get(flow)
+        if heap is None:
+            heap = self._queue[flow] = []
+            self._active.append(flow)
+            self._deficit[flow] = 0.0
+        heapq.heappush(heap, (task_deadline(item), next(self._seq), item))
+        self._size += 1
+        for task in _item_tasks(item):
+            self._pending[getattr(task, 'conversation_id', flow)] += 1
+
+    def _next_flow(self, commit: bool) -> str:
+        """Sous-file servie ensuite ; `commit` applique les crédits du tour"""
+        deficits = self._deficit if commit else dict(self._deficit)
+        active = self._active if commit else deque(self._active)
+        while True:
+            flow = active[0]
+            if deficits[flow] >= 1.0:
+                return flow
+            # Nouveau passage: crédit selon le poids, sinon la main passe
+            deficits[flow] += self.weight(flow)
+            if deficits[flow] >= 1.0:
+                return flow
+            active.rotate(-1)
+
+    def _get(self):
+        flow = self._next_flow(commit=True)
+        heap = self._queue[flow]
+        item = heapq.heappop(heap)[2]
+        self._size -= 1
+        self._deficit[flow] -= 1.0
+        for task in _item_tasks(item):
+            conversation = getattr(task, 'conversation_id', flow)
+            self._pending[conversation] -= 1
+            if self._pending[conversation] <= 0:
+                del self._pending[conversation]
+
+        if not heap:
+            # Sous-file vidée: elle quitte le tour sans garder de crédit
+            del self._queue[flow]
+            del self._deficit[flow]
+            self._active.popleft()
+        elif self._deficit[flow] < 1.0:
+            self._active.rotate(-1)
+        return item
+
+    def peek_deadline(self) -> float:
+        """Échéance du prochain élément servi (inf si vide)"""
+        if not self._size:
+            return math.inf
+        return self._queue[self._next_flow(commit=False)][0][0]
+
+    def pending_tasks(self, conversation_id: str) -> int:
+        """Tâches en file pour une conversation (contenu des batchs compris)"""
+        return self._pending.get(conversation_id, 0)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Conversations actives et plus grosse sous-file"""
+        return {
+            'active_conversations': len(self._queue),
+            'max_conversation_backlog': max((len(heap) for heap in self._queue.values()), default=0),
+        }
+
+
+def head_deadline(queue: Any) -> float:
+    """Échéance en tête d'une queue (inf si inconnue ou vide)"""
+    if isinstance(queue, DeadlineQueue):
+        return queue.peek_deadline()
+    return math.inf
+
+
 class ConnectionManager:
     """
     Gestionnaire des connexions et queues de traduction
 
     Features:
-    - Pools FIFO séparées (normal, any, fast)
+    - Pools séparées (normal, any, fast), chacune servie par échéance (EDF)
+    - Partage équitable entre conversations dans chaque pool (FairQueue),
+      poids configurables et plafond de tâches en attente par conversation
     - Batch accumulation pour gains de performance 2-3x
     - Priority queue pour textes courts
     - Statistics et monitoring
@@ -45,10 +204,20 @@ class ConnectionManager:
             any_pool_size: Taille max de la pool "any"
             fast_pool_size: Taille max de la fast pool (textes courts)
         """
-        # Queues FIFO
-        self.normal_pool = asyncio.Queue(maxsize=normal_pool_size)
-        self.any_pool = asyncio.Queue(maxsize=any_pool_size)
-        self.fast_pool = asyncio.Queue(maxsize=fast_pool_size)
+        config = PerformanceConfig()
+        self.enable_fair_queue = config.enable_fair_queue
+        self.max_pending_per_conversation = max(0, config.fair_queue_max_per_conversation)
+        weights = parse_flow_weights(config.fair_queue_weights)
+
+        # Queues par échéance (FIFO à échéance égale), une sous-file par conversation
+        if self.enable_fair_queue:
+            self.normal_pool = FairQueue(maxsize=normal_pool_size, weights=weights)
+            self.any_pool = FairQueue(maxsize=any_pool_size, weights=weights)
+            self.fast_pool = FairQueue(maxsize=fast_pool_size, weights=weights)
+        else:
+            self.normal_pool = DeadlineQueue(maxsize=normal_pool_size)
+            self.any_pool = DeadlineQueue(maxsize=any_pool_size)
+            self.fast_pool = DeadlineQueue(maxsize=fast_pool_size)
 
         # Configuration batch accumulation
         self.enable_batching = os.getenv("TRANSLATOR_BATCH_ENABLED", "true").lower() == "true"
@@ -63,7 +232,7 @@ class ConnectionManager:
         # Priority queue configuration
         PERFORMANCE_MODULE_AVAILABLE = False
         try:
-            from utils.performance import Priority, PerformanceConfig
+            from utils.performance import Priority
             PERFORMANCE_MODULE_AVAILABLE = True
         except ImportError:  # pragma: no cover
             pass
@@ -81,13 +250,15 @@ class ConnectionManager:
             'fast_pool_size': 0,
             'pool_full_rejections': 0,
             'batches_created': 0,
-            'fast_track_count': 0
+            'fast_track_count': 0,
+            'conversation_cap_rejections': 0
         }
 
         logger.info(
             f"[CONNECTION] ConnectionManager initialized: "
             f"normal_pool({normal_pool_size}), any_pool({any_pool_size}), "
-            f"fast_pool({fast_pool_size})"
+            f"fast_pool({fast_pool_size}), fair_queue={self.enable_fair_queue} "
+            f"(max {self.max_pending_per_conversation}/conversation, {len(weights)} poids)"
         )
         logger.info(
             f"[CONNECTION] Batch processing: enabled={self.enable_batching}, "
@@ -127,6 +298,16 @@ class ConnectionManager:
             True si enfilée avec succès, False sinon
         """
         try:
+            # Une conversation au-delà de son plafond est refusée: elle ne peut
+            # pas remplir les pools au détriment des autres
+            if self._conversation_full(task.conversation_id):
+                self.stats['conversation_cap_rejections'] += 1
+                logger.warning(
+                    f"Conversation {task.conversation_id} au plafond "
+                    f"({self.max_pending_per_conversation} tâches), rejet de {task.task_id}"
+                )
+                return False
+
             # ════════════════════════════════════════════════════════════════
             # OPTIMISATION: Textes courts → fast_pool (traités en priorité)
             # ════════════════════════════════════════════════════════════════
@@ -214,21 +395,55 @@ class ConnectionManager:
             target_languages=tasks[0].target_languages,
             conversation_id=tasks[0].conversation_id,
             model_type=tasks[0].model_type,
-            created_at=tasks[0].created_at
+            created_at=tasks[0].created_at,
+            # Le batch passe au rang de sa tâche la plus urgente
+            deadline=min(task_deadline(task) for task in tasks)
         )
 
         # Stocker les tâches originales
         batch_task._batch_tasks = tasks  # type: ignore
 
         # Enqueue dans la pool appropriée
-        if tasks[0].conversation_id == "any":
-            if not self.any_pool.full():
-                await self.any_pool.put(batch_task)
-                self.stats['batches_created'] += 1
-        else:
-            if not self.normal_pool.full():
-                await self.normal_pool.put(batch_task)
-                self.stats['batches_created'] += 1
+        pool = self.any_pool if tasks[0].conversation_id == "any" else self.normal_pool
+        if isinstance(pool, FairQueue):
+            batch_task._flow_key = self._batch_flow(pool, tasks)  # type: ignore
+        if not pool.full():
+            await pool.put(batch_task)
+            self.stats['batches_created'] += 1
+
+    @staticmethod
+    def _batch_flow(pool: "FairQueue", tasks: List[TranslationTask]) -> str:
+        """
+        Sous-file d'un batch multi-conversations: la moins chargée de ses
+        conversations. Les tâches d'une conversation calme groupées avec
+        celles d'une conversation bruyante passent au tour de la calme
+        (au plus batch_max_size tâches bruyantes en profitent).
+        """
+        conversations = list(dict.fromkeys(task.conversation_id for task in tasks))
+        return min(conversations, key=pool.pending_tasks)
+
+    def _conversation_full(self, conversation_id: str) -> bool:
+        """Plafond de tâches en attente (pools + accumulateur) atteint"""
+        if not self.enable_fair_queue or not self.max_pending_per_conversation:
+            return False
+        pending = sum(
+            pool.pending_tasks(conversation_id)
+            for pool in (self.normal_pool, self.any_pool, self.fast_pool)
+        )
+        pending += sum(
+            1 for tasks in self._batch_accumulator.values()
+            for task in tasks if task.conversation_id == conversation_id
+        )
+        return pending >= self.max_pending_per_conversation
+
+    def set_conversation_weight(self, conversation_id: str, weight: Optional[float]):
+        """Poids d'une conversation (tenant premium) ; None rétablit le poids par défaut"""
+        for pool in (self.normal_pool, self.any_pool, self.fast_pool):
+            if isinstance(pool, FairQueue):
+                if weight is None:
+                    pool.weights.pop(conversation_id, None)
+                else:
+                    pool.weights[conversation_id] = weight
 
     def _get_batch_key(self, task: TranslationTask) -> str:
         """
@@ -282,5 +497,10 @@ class ConnectionManager:
             'normal_pool_size': self.normal_pool.qsize(),
             'any_pool_size': self.any_pool.qsize(),
             'fast_pool_size': self.fast_pool.qsize(),
-            'pending_batches': sum(len(tasks) for tasks in self._batch_accumulator.values())
+            'pending_batches': sum(len(tasks) for tasks in self._batch_accumulator.values()),
+            'fair_queue': {
+                name: pool.get_stats()
+                for name, pool in (('normal', self.normal_pool), ('any', self.any_pool), ('fast', self.fast_pool))
+                if isinstance(pool, FairQueue)
+            }
         }
@@ -9,15 +9,58 @@ Responsabilités:
 """
 
 import asyncio
+import copy
 import logging
 import time
-from typing import List, Callable, Optional, Any
+from typing import Dict, List, Callable, Optional, Any, Tuple
 
 # Import local
 from ..zmq_models import TranslationTask
 
+# Table de phrases courtes (promues depuis les hits du cache Redis)
+PHRASE_TABLE_AVAILABLE = False
+try:
+    from utils.phrase_table import get_phrase_table
+    PHRASE_TABLE_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    pass
+
+# Détection de langue batch + priors par conversation (source_language='auto')
+LANGUAGE_DETECTOR_AVAILABLE = False
+try:
+    from ..translation_ml.language_detector import get_language_detector
+    LANGUAGE_DETECTOR_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    pass
+
+from utils.concurrency_limiter import AdaptiveConcurrencyLimiter
+from utils.performance import PerformanceConfig
+from utils.single_flight import SingleFlight
+from utils.translation_validation import is_failed_translation
+
 logger = logging.getLogger(__name__)
 
+# Coalescence des traductions identiques en vol + cache négatif des échecs
+_perf_config = PerformanceConfig()
+_translation_flight: Optional[SingleFlight] = (
+    SingleFlight("zmq_translation", negative_ttl=_perf_config.negative_cache_ttl_s)
+    if _perf_config.enable_single_flight else None
+)
+
+# Concurrence des appels moteur pilotée par la latence mesurée (remplace le
+# scaling des workers sur la taille de file): au-delà de la saturation,
+# ajouter des appels concurrents n'ajoute que de l'attente sur le lock modèle
+_inference_limiter: Optional[AdaptiveConcurrencyLimiter] = (
+    AdaptiveConcurrencyLimiter(
+        "inference",
+        initial_limit=_perf_config.adaptive_concurrency_initial,
+        min_limit=_perf_config.adaptive_concurrency_min,
+        max_limit=_perf_config.adaptive_concurrency_max,
+        tolerance=_perf_config.adaptive_concurrency_tolerance
+    )
+    if _perf_config.enable_adaptive_concurrency else None
+)
+
 # Budget d'inférence — incident prod 2026-07-04 : un post de 1839 chars
 # (fr → 7 langues) n'a JAMAIS été traduit. Le texte est bien segmenté en
 # phrases par translate_with_structure, mais le timeout FIXE de 45 s
@@ -46,6 +89,36 @@ def inference_timeout_for(text_length: int) -> float:
     return min(INFERENCE_TIMEOUT_MAX_S, INFERENCE_TIMEOUT_BASE_S + extra)
 
 
+def get_inference_limiter() -> Optional[AdaptiveConcurrencyLimiter]:
+    """Limiteur adaptatif des appels moteur (None si désactivé)"""
+    return _inference_limiter
+
+
+async def _run_inference(call: Callable, budget: float, deadline: Optional[float] = None) -> Any:
+    """
+    Appel moteur sous jeton du limiteur adaptatif, puis borné par `budget`
+
+    L'attente du jeton ne consomme pas le budget d'inférence ; elle cesse à
+    l'échéance de la tâche (ConcurrencyLimitExceeded). La latence est
+    échantillonnée par unité de budget, proportionnel au coût attendu. Après
+    un timeout, le jeton reste pris tant que l'inférence tourne encore dans
+    l'executor.
+    """
+    if _inference_limiter is None:
+        return await asyncio.wait_for(call(), timeout=budget)
+
+    wait = None if deadline is None else max(0.0, deadline - time.time())
+    return await _inference_limiter.run(
+        call, cost=budget / INFERENCE_TIMEOUT_BASE_S, timeout=budget, wait_timeout=wait
+    )
+
+
+def _earliest_deadline(tasks: List[TranslationTask]) -> Optional[float]:
+    """Échéance la plus proche d'un groupe de tâches (None si aucune)"""
+    deadlines = [t.deadline for t in tasks if isinstance(getattr(t, 'deadline', None), (int, float))]
+    return min(deadlines) if deadlines else None
+
+
 async def process_single_translation(
     task: TranslationTask,
     worker_name: str,
@@ -69,6 +142,14 @@ async def process_single_translation(
     results = []
 
     try:
+        task = _resolve_auto_sources([task])[0]
+
+        # Multi-cibles: source encodée UNE fois pour toutes les langues
+        # (les langues en échec retombent sur le chemin par langue ci-dessous)
+        prefetched = await _prefetch_multilingual(
+            task, worker_name, translation_service, translation_cache
+        )
+
         # Une langue à la fois : l'inférence ML est sérialisée par le lock
         # modèle (model_loader.get_model_inference_lock), un fan-out
         # concurrent ne parallélise rien mais fait courir le budget de
@@ -76,13 +157,15 @@ async def process_single_translation(
         # multi-langues expirait alors toutes ses langues d'un coup.
         for target_language in task.target_languages:
             try:
-                result = await _translate_single_language(
-                    task=task,
-                    target_language=target_language,
-                    worker_name=worker_name,
-                    translation_service=translation_service,
-                    translation_cache=translation_cache
-                )
+                result = prefetched.get(target_language)
+                if result is None:
+                    result = await _translate_single_language(
+                        task=task,
+                        target_language=target_language,
+                        worker_name=worker_name,
+                        translation_service=translation_service,
+                        translation_cache=translation_cache
+                    )
 
                 # Ajouter métadonnées
                 result['poolType'] = 'any' if task.conversation_id == 'any' else 'normal'
@@ -110,18 +193,23 @@ async def process_batch_translation(
     tasks: List[TranslationTask],
     worker_name: str,
     translation_service: Any,
-    publish_func: Callable
+    publish_func: Callable,
+    translation_cache: Optional[Any] = None
 ) -> int:
     """
     Traite un batch de tâches de traduction
 
-    OPTIMISATION: 2-3x plus rapide que N appels individuels
+    OPTIMISATION: 2-3x plus rapide que N appels individuels. Les paires
+    (texte, langue) sont cherchées dans le cache en un MGET, les textes
+    identiques ne sont traduits qu'une fois, seuls les misses vont au moteur
+    et les nouvelles traductions sont réécrites en un aller-retour.
 
     Args:
         tasks: Liste de tâches de traduction
         worker_name: Nom du worker
         translation_service: Service de traduction ML
         publish_func: Fonction pour publier les résultats
+        translation_cache: Service de cache Redis (None = pas de cache)
 
     Returns:
         Nombre de traductions complétées
@@ -133,95 +221,107 @@ async def process_batch_translation(
     translations_completed = 0
 
     try:
+        # source 'auto': une détection batch, puis un sous-batch par langue
+        tasks = _resolve_auto_sources(tasks)
+        if len({t.source_language for t in tasks}) > 1:
+            by_language: Dict[str, List[TranslationTask]] = {}
+            for task in tasks:
+                by_language.setdefault(task.source_language, []).append(task)
+            completed = 0
+            for group in by_language.values():
+                completed += await process_batch_translation(
+                    group, worker_name, translation_service, publish_func, translation_cache
+                )
+            return completed
+
         # Extraire les informations communes
         source_lang = tasks[0].source_language
-        target_langs = tasks[0].target_languages
+        target_langs = list(dict.fromkeys(tasks[0].target_languages))
         model_type = tasks[0].model_type
         pool_type = 'any' if tasks[0].conversation_id == 'any' else 'normal'
 
-        # Extraire les textes
-        texts = [t.text for t in tasks]
+        # Textes uniques: un message diffusé plusieurs fois n'est traduit qu'une fois
+        texts = list(dict.fromkeys(t.text for t in tasks))
+        batch_deadline = _earliest_deadline(tasks)
 
         logger.info(
-            f"⚡ [BATCH] Worker {worker_name}: processing {len(texts)} texts "
-            f"({source_lang}→{target_langs})"
+            f"⚡ [BATCH] Worker {worker_name}: processing {len(tasks)} tasks, "
+            f"{len(texts)} unique texts ({source_lang}→{target_langs})"
         )
 
-        # Pour chaque langue cible
-        for target_lang in target_langs:
+        # ÉTAPE 1: cache (un MGET pour toutes les paires texte × langue)
+        cached = await _batch_cache_lookup(texts, source_lang, target_langs, model_type, translation_cache)
+        misses = {
+            lang: [text for text in texts if (text, lang) not in cached]
+            for lang in target_langs
+        }
+
+        # ÉTAPE 2: moteur, uniquement pour les misses
+        translated, errors = await _batch_translate_misses(
+            misses, source_lang, model_type, translation_service, batch_deadline
+        )
+
+        # ÉTAPE 3: réécriture groupée (jamais un échec: il serait resservi un mois)
+        if translation_cache and translated:
+            items = [
+                (text, source_lang, lang, translated_text)
+                for (text, lang), translated_text in translated.items()
+                if not is_failed_translation(translated_text)
+            ]
             try:
-                # Utiliser le batch translation du service ML — budget = somme
-                # des budgets individuels (proportionnels à la longueur).
-                batch_timeout = sum(inference_timeout_for(len(t)) for t in texts)
-                if translation_service and hasattr(translation_service, '_ml_translate_batch'):
-                    try:
-                        translated_texts = await asyncio.wait_for(
-                            translation_service._ml_translate_batch(
-                                texts=texts,
-                                source_lang=source_lang,
-                                target_lang=target_lang,
-                                model_type=model_type
-                            ),
-                            timeout=batch_timeout
-                        )
-                    except asyncio.TimeoutError:
-                        logger.error(f"⏱️ [BATCH] Timeout ({batch_timeout:.0f}s) for {source_lang}→{target_lang} batch={len(texts)}")
-                        raise
-                else:
-                    # Fallback: traduire un par un
-                    translated_texts = []
-                    for text in texts:
-                        single_budget = inference_timeout_for(len(text))
-                        try:
-                            result = await asyncio.wait_for(
-                                translation_service.translate_with_structure(
-                                    text=text,
-                                    source_language=source_lang,
-                                    target_language=target_lang,
-                                    model_type=model_type,
-                                    source_channel='zmq_batch'
-                                ),
-                                timeout=single_budget
-                            )
-                        except asyncio.TimeoutError:
-                            logger.error(f"⏱️ [BATCH] Single inference timeout ({single_budget:.0f}s, {len(text)} chars) {source_lang}→{target_lang}")
-                            raise
-                        translated_texts.append(result.get('translated_text', text))
-
-                # Distribuer les résultats
-                for i, (task, translated_text) in enumerate(zip(tasks, translated_texts)):
-                    processing_time = time.time() - batch_start
+                await translation_cache.set_translations_batch(items, model_type=model_type)
+            except Exception as e:
+                logger.warning(f"[BATCH] Cache write-back failed ({len(items)} items): {e}")
 
+        _batch_cache_stats['tasks'] += len(tasks)
+        _batch_cache_stats['pairs'] += len(tasks) * len(target_langs)
+        _batch_cache_stats['cache_hits'] += sum(
+            1 for task in tasks for lang in target_langs if (task.text, lang) in cached
+        )
+        _batch_cache_stats['inferred'] += len(translated)
+
+        # ÉTAPE 4: publication par tâche et par langue
+        for target_lang in target_langs:
+            for i, task in enumerate(tasks):
+                key = (task.text, target_lang)
+                processing_time = time.time() - batch_start
+
+                if key in cached:
+                    _record_phrase_hit(task, target_lang, cached[key])
+                    result = _create_cache_hit_result(
+                        task, target_lang, cached[key], worker_name, processing_time
+                    )
+                elif key in translated:
                     result = {
                         'messageId': task.message_id,
-                        'translatedText': translated_text,
+                        'translatedText': translated[key],
                         'sourceLanguage': source_lang,
                         'targetLanguage': target_lang,
                         'confidenceScore': 0.95,
                         'processingTime': processing_time,
                         'modelType': model_type,
                         'workerName': worker_name,
-                        'fromCache': False,
-                        'batchSize': len(tasks),
-                        'batchIndex': i,
-                        'poolType': pool_type,
-                        'created_at': task.created_at
+                        'fromCache': False
                     }
-
-                    await publish_func(task.task_id, result, target_lang)
-                    translations_completed += 1
-
-            except Exception as e:
-                logger.error(f"[BATCH] Translation error for {target_lang}: {e}")
-                # Publier des erreurs pour chaque tâche
-                for task in tasks:
-                    error_result = _create_error_result(task, target_lang, str(e))
-                    await publish_func(task.task_id, error_result, target_lang)
+                else:
+                    error = errors.get(target_lang, 'batch translation missing')
+                    await publish_func(task.task_id, _create_error_result(task, target_lang, error), target_lang)
+                    continue
+
+                result.update({
+                    'batchSize': len(tasks),
+                    'batchIndex': i,
+                    'poolType': pool_type,
+                    'created_at': task.created_at
+                })
+                await publish_func(task.task_id, result, target_lang)
+                translations_completed += 1
 
         batch_time = (time.time() - batch_start) * 1000
         logger.info(
             f"✅ [BATCH] {len(tasks)} translations completed in {batch_time:.0f}ms "
-            f"({batch_time/len(tasks):.0f}ms/text)"
+            f"({batch_time/len(tasks):.0f}ms/text, {len(cached)} cache hits, "
+            f"{len(translated)} inferred)"
         )
 
     except Exception as e:  # pragma: no cover
@@ -230,6 +330,146 @@ async def process_batch_translation(
     return translations_completed
 
 
+# Compteurs du chemin batch (paires servies par le cache vs inférées)
+_batch_cache_stats: Dict[str, int] = {'tasks': 0, 'pairs': 0, 'cache_hits': 0, 'inferred': 0}
+
+
+def get_batch_cache_stats() -> Dict[str, Any]:
+    """Statistiques cache du chemin batch (taux de hit par paire tâche × langue)"""
+    pairs = _batch_cache_stats['pairs']
+    return {
+        **_batch_cache_stats,
+        'hit_rate': round(_batch_cache_stats['cache_hits'] / pairs, 3) if pairs else 0.0
+    }
+
+
+async def _batch_cache_lookup(
+    texts: List[str],
+    source_lang: str,
+    target_langs: List[str],
+    model_type: str,
+    translation_cache: Optional[Any]
+) -> Dict[Tuple[str, str], dict]:
+    """
+    Entrées de cache des paires (texte, langue) en un appel groupé
+
+    Returns:
+        Dict {(texte, langue_cible): entrée du cache} (hits uniquement)
+    """
+    if not translation_cache or not texts:
+        return {}
+
+    pairs = [(text, lang) for lang in target_langs for text in texts]
+    try:
+        entries = await translation_cache.get_translations_batch(
+            [(text, source_lang, lang) for text, lang in pairs], model_type=model_type
+        )
+    except Exception as e:
+        logger.warning(f"[BATCH] Cache lookup failed, translating all {len(pairs)} pairs: {e}")
+        return {}
+    return {pair: entry for pair, entry in zip(pairs, entries or []) if entry}
+
+
+async def _batch_translate_misses(
+    misses: Dict[str, List[str]],
+    source_lang: str,
+    model_type: str,
+    translation_service: Any,
+    batch_deadline: Optional[float]
+) -> Tuple[Dict[Tuple[str, str], str], Dict[str, str]]:
+    """
+    Traduit les textes absents du cache, par langue cible
+
+    Returns:
+        ({(texte, langue_cible): traduction}, {langue_cible: erreur})
+    """
+    translated: Dict[Tuple[str, str], str] = {}
+    errors: Dict[str, str] = {}
+    langs = [lang for lang, texts in misses.items() if texts]
+    if not langs:
+        return translated, errors
+
+    # Batch multi-cibles: textes encodés une seule fois pour toutes les langues
+    if len(langs) > 1 and _supports_async(translation_service, '_ml_translate_batch_multilingual'):
+        texts = list(dict.fromkeys(text for lang in langs for text in misses[lang]))
+        multi_timeout = sum(inference_timeout_for(len(t)) for t in texts) * len(langs)
+        try:
+            prefetched = await _run_inference(
+                lambda: translation_service._ml_translate_batch_multilingual(
+                    texts=texts,
+                    source_lang=source_lang,
+                    target_langs=langs,
+                    model_type=model_type
+                ),
+                multi_timeout,
+                batch_deadline
+            )
+        except Exception as e:
+            logger.warning(f"[BATCH] Multilingual batch failed, per-language fallback: {e!r}")
+            prefetched = {}
+        for lang in langs:
+            outputs = (prefetched or {}).get(lang) or []
+            if len(outputs) == len(texts):
+                for text, output in zip(texts, outputs):
+                    if text in misses[lang]:
+                        translated[(text, lang)] = output
+
+    # Pour chaque langue cible
+    for target_lang in langs:
+        texts = [text for text in misses[target_lang] if (text, target_lang) not in translated]
+        if not texts:
+            continue
+        try:
+            # Utiliser le batch translation du service ML — budget = somme
+            # des budgets individuels (proportionnels à la longueur).
+            batch_timeout = sum(inference_timeout_for(len(t)) for t in texts)
+            if translation_service and hasattr(translation_service, '_ml_translate_batch'):
+                try:
+                    translated_texts = await _run_inference(
+                        lambda: translation_service._ml_translate_batch(
+                            texts=texts,
+                            source_lang=source_lang,
+                            target_lang=target_lang,
+                            model_type=model_type
+                        ),
+                        batch_timeout,
+                        batch_deadline
+                    )
+                except asyncio.TimeoutError:
+                    logger.error(f"⏱️ [BATCH] Timeout ({batch_timeout:.0f}s) for {source_lang}→{target_lang} batch={len(texts)}")
+                    raise
+            else:
+                # Fallback: traduire un par un
+                translated_texts = []
+                for text in texts:
+                    single_budget = inference_timeout_for(len(text))
+                    try:
+                        result = await _run_inference(
+                            lambda: translation_service.translate_with_structure(
+                                text=text,
+                                source_language=source_lang,
+                                target_language=target_lang,
+                                model_type=model_type,
+                                source_channel='zmq_batch'
+                            ),
+                            single_budget,
+                            batch_deadline
+                        )
+                    except asyncio.TimeoutError:
+                        logger.error(f"⏱️ [BATCH] Single inference timeout ({single_budget:.0f}s, {len(text)} chars) {source_lang}→{target_lang}")
+                        raise
+                    translated_texts.append(result.get('translated_text', text))
+
+            for text, translated_text in zip(texts, translated_texts):
+                translated[(text, target_lang)] = translated_text
+
+        except Exception as e:
+            logger.error(f"[BATCH] Translation error for {target_lang}: {e}")
+            errors[target_lang] = str(e)
+
+    return translated, errors
+
+
 async def _translate_single_language(
     task: TranslationTask,
     target_language: str,
@@ -240,6 +480,10 @@ async def _translate_single_language(
     """
     Traduit un texte vers une langue cible spécifique (avec cache Redis)
 
+    Les requêtes identiques concurrentes (même texte, langues et modèle —
+    message populaire diffusé dans une grande conversation) sont coalescées :
+    une seule lecture Redis, une seule inférence, une seule écriture.
+
     Args:
         task: Tâche de traduction
         target_language: Langue cible
@@ -251,116 +495,50 @@ async def _translate_single_language(
         Résultat de traduction
     """
     start_time = time.time()
+    inference_budget = inference_timeout_for(len(task.text))
 
     try:
-        # ═══════════════════════════════════════════════════════════════════
-        # ÉTAPE 1: Vérifier le cache
-        # ═══════════════════════════════════════════════════════════════════
-        if translation_cache:
-            cached = await translation_cache.get_translation(
-                text=task.text,
-                source_lang=task.source_language,
-                target_lang=target_language,
-                model_type=task.model_type
+        async def lookup_or_translate():
+            return await _lookup_or_translate(
+                task, target_language, translation_service, translation_cache,
+                inference_budget
             )
 
-            if cached:
-                processing_time = time.time() - start_time
-                logger.debug(
-                    f"⚡ [CACHE] Hit: {task.source_language}→{target_language} "
-                    f"(msg={task.message_id})"
-                )
+        if _translation_flight is not None and translation_service:
+            outcome = await _translation_flight.do(
+                (task.text, task.source_language, target_language, task.model_type),
+                lookup_or_translate,
+                is_failure=_is_failed_outcome
+            )
+        else:
+            outcome = await lookup_or_translate()
 
-                return {
-                    'messageId': task.message_id,
-                    'translatedText': cached.get('translated_text', ''),
-                    'sourceLanguage': cached.get('source_lang', task.source_language),
-                    'targetLanguage': target_language,
-                    'confidenceScore': 0.99,
-                    'processingTime': processing_time,
-                    'modelType': cached.get('model_type', task.model_type),
-                    'workerName': worker_name,
-                    'fromCache': True,
-                    'segmentsCount': 0,
-                    'emojisCount': 0
-                }
-
-        # ═══════════════════════════════════════════════════════════════════
-        # ÉTAPE 2: Traduire si pas en cache
-        # ═══════════════════════════════════════════════════════════════════
-        if translation_service:
-            inference_budget = inference_timeout_for(len(task.text))
-            try:
-                result = await asyncio.wait_for(
-                    translation_service.translate_with_structure(
-                        text=task.text,
-                        source_language=task.source_language,
-                        target_language=target_language,
-                        model_type=task.model_type,
-                        source_channel='zmq'
-                    ),
-                    timeout=inference_budget
-                )
-            except asyncio.TimeoutError:
-                logger.error(
-                    f"⏱️ [PROCESSOR] Inference timeout ({inference_budget:.0f}s, {len(task.text)} chars) "
-                    f"for {task.source_language}→{target_language} "
-                    f"msg={task.message_id} task={task.task_id}"
-                )
-                raise RuntimeError(f"inference_timeout: {task.source_language}→{target_language}")
-
-            processing_time = time.time() - start_time
-
-            # Validation du résultat
-            if result is None:
-                logger.error(f"Translation service returned None for {worker_name}")
-                raise Exception("Translation service returned None")
-
-            if not isinstance(result, dict) or 'translated_text' not in result:
-                logger.error(f"Invalid result for {worker_name}: {result}")
-                raise Exception(f"Invalid translation result: {result}")
-
-            # ═══════════════════════════════════════════════════════════════════
-            # ÉTAPE 3: Mettre en cache la nouvelle traduction
-            # ═══════════════════════════════════════════════════════════════════
-            if translation_cache:
-                await translation_cache.set_translation(
-                    text=task.text,
-                    source_lang=task.source_language,
-                    target_lang=target_language,
-                    translated_text=result['translated_text'],
-                    model_type=task.model_type
+        processing_time = time.time() - start_time
+
+        if outcome is not None:
+            origin, payload = outcome
+            if origin == 'cache':
+                return _create_cache_hit_result(
+                    task, target_language, payload, worker_name, processing_time
                 )
+            return _create_service_result(
+                task, target_language, payload, worker_name, processing_time
+            )
 
-            return {
-                'messageId': task.message_id,
-                'translatedText': result['translated_text'],
-                'sourceLanguage': result.get('detected_language', task.source_language),
-                'targetLanguage': target_language,
-                'confidenceScore': result.get('confidence', 0.95),
-                'processingTime': processing_time,
-                'modelType': task.model_type,
-                'workerName': worker_name,
-                'fromCache': False,
-                'segmentsCount': result.get('segments_count', 0),
-                'emojisCount': result.get('emojis_count', 0)
-            }
-        else:
-            # Fallback si pas de service de traduction
-            translated_text = f"[{target_language.upper()}] {task.text}"
-            processing_time = time.time() - start_time
-
-            return {
-                'messageId': task.message_id,
-                'translatedText': translated_text,
-                'sourceLanguage': task.source_language,
-                'targetLanguage': target_language,
-                'confidenceScore': 0.1,
-                'processingTime': processing_time,
-                'modelType': 'fallback',
-                'workerName': worker_name,
-                'error': 'No translation service available'
-            }
+        # Fallback si pas de service de traduction
+        translated_text = f"[{target_language.upper()}] {task.text}"
+
+        return {
+            'messageId': task.message_id,
+            'translatedText': translated_text,
+            'sourceLanguage': task.source_language,
+            'targetLanguage': target_language,
+            'confidenceScore': 0.1,
+            'processingTime': processing_time,
+            'modelType': 'fallback',
+            'workerName': worker_name,
+            'error': 'No translation service available'
+        }
 
     except Exception as e:
         logger.error(f"Translation error in {worker_name}: {e}")
@@ -381,6 +559,347 @@ async def _translate_single_language(
         }
 
 
+async def _lookup_or_translate(
+    task: TranslationTask,
+    target_language: str,
+    translation_service: Any,
+    translation_cache: Optional[Any],
+    inference_budget: float
+) -> Optional[Tuple[str, dict]]:
+    """
+    Cache Redis puis inférence pour une langue cible (calcul partagé)
+
+    Args:
+        inference_budget: Timeout d'inférence (voir inference_timeout_for)
+
+    Returns:
+        ('cache', entrée du cache) ou ('service', résultat du service),
+        None si aucun service de traduction n'est disponible
+    """
+    # ═══════════════════════════════════════════════════════════════════
+    # ÉTAPE 1: Vérifier le cache
+    # ═══════════════════════════════════════════════════════════════════
+    if translation_cache:
+        cached = await translation_cache.get_translation(
+            text=task.text,
+            source_lang=task.source_language,
+            target_lang=target_language,
+            model_type=task.model_type
+        )
+
+        if cached:
+            logger.debug(
+                f"⚡ [CACHE] Hit: {task.source_language}→{target_language} "
+                f"(msg={task.message_id})"
+            )
+            _record_phrase_hit(task, target_language, cached)
+            return 'cache', cached
+
+    # ═══════════════════════════════════════════════════════════════════
+    # ÉTAPE 2: Traduire si pas en cache
+    # ═══════════════════════════════════════════════════════════════════
+    if not translation_service:
+        return None
+
+    try:
+        result = await _run_inference(
+            lambda: translation_service.translate_with_structure(
+                text=task.text,
+                source_language=task.source_language,
+                target_language=target_language,
+                model_type=task.model_type,
+                source_channel='zmq'
+            ),
+            inference_budget,
+            getattr(task, 'deadline', None)
+        )
+    except asyncio.TimeoutError:
+        logger.error(
+            f"⏱️ [PROCESSOR] Inference timeout ({inference_budget:.0f}s, {len(task.text)} chars) "
+            f"for {task.source_language}→{target_language} "
+            f"msg={task.message_id} task={task.task_id}"
+        )
+        raise RuntimeError(f"inference_timeout: {task.source_language}→{target_language}")
+
+    # Validation du résultat
+    _validate_service_result(result, 'single_flight')
+
+    # ═══════════════════════════════════════════════════════════════════
+    # ÉTAPE 3: Mettre en cache la nouvelle traduction (jamais un échec:
+    # il serait resservi pendant un mois au lieu d'être retenté)
+    # ═══════════════════════════════════════════════════════════════════
+    if translation_cache and not is_failed_translation(result['translated_text']):
+        await translation_cache.set_translation(
+            text=task.text,
+            source_lang=task.source_language,
+            target_lang=target_language,
+            translated_text=result['translated_text'],
+            model_type=task.model_type
+        )
+
+    return 'service', result
+
+
+def _is_failed_outcome(outcome: Optional[Tuple[str, dict]]) -> bool:
+    """Prédicat du cache négatif: traduction que le handler refuserait de publier"""
+    if outcome is None:
+        return False
+    origin, payload = outcome
+    return origin == 'service' and is_failed_translation(payload.get('translated_text'))
+
+
+async def serve_from_phrase_table(
+    task: TranslationTask,
+    publish_func: Callable
+) -> bool:
+    """
+    Publie directement un message court dont TOUTES les langues cibles sont
+    dans la table de phrases (ni file, ni Redis, ni inférence)
+
+    Args:
+        task: Tâche de traduction
+        publish_func: Fonction pour publier les résultats
+
+    Returns:
+        True si la tâche a été entièrement servie (sinon rien n'est publié)
+    """
+    phrase_table = get_phrase_table() if PHRASE_TABLE_AVAILABLE else None
+    if phrase_table is None or not task.target_languages or not phrase_table.is_eligible(task.text):
+        return False
+
+    start_time = time.time()
+    entries: Dict[str, dict] = {}
+    for target_language in dict.fromkeys(task.target_languages):
+        entry = phrase_table.lookup(
+            task.text, task.source_language, target_language, task.model_type
+        )
+        if entry is None:
+            return False
+        entries[target_language] = entry
+
+    processing_time = time.time() - start_time
+    for target_language, entry in entries.items():
+        result = _create_cache_hit_result(
+            task, target_language, entry, 'phrase_table', processing_time
+        )
+        result['poolType'] = 'fast'
+        result['created_at'] = task.created_at
+        await publish_func(task.task_id, result, target_language)
+
+    logger.debug(
+        f"⚡ [PHRASE_TABLE] '{task.text.strip()}' servi sans inférence "
+        f"({len(entries)} langue(s), msg={task.message_id})"
+    )
+    return True
+
+
+def _record_phrase_hit(task: TranslationTask, target_language: str, cached: dict) -> None:
+    """Compte un hit cache d'un message court (promotion dans la table de phrases)"""
+    phrase_table = get_phrase_table() if PHRASE_TABLE_AVAILABLE else None
+    if phrase_table is not None:
+        phrase_table.record_hit(
+            task.text, task.source_language, target_language, task.model_type, cached
+        )
+
+
+def _supports_async(service: Any, method_name: str) -> bool:
+    """Vrai si le service expose `method_name` comme coroutine (API optionnelle)"""
+    return asyncio.iscoroutinefunction(getattr(service, method_name, None))
+
+
+async def _prefetch_multilingual(
+    task: TranslationTask,
+    worker_name: str,
+    translation_service: Any,
+    translation_cache: Optional[Any]
+) -> Dict[str, dict]:
+    """
+    Traduit en UN appel toutes les langues cibles absentes du cache
+
+    La source n'est encodée qu'une fois par le modèle (translate_multilingual) :
+    pour un message de groupe vers 5-8 langues, l'encodeur n'est plus réexécuté
+    par langue. Best effort : toute langue absente du dict retourné est traitée
+    par _translate_single_language.
+
+    Returns:
+        Dict {langue_cible: résultat prêt à publier}
+    """
+    target_languages = list(dict.fromkeys(task.target_languages))
+    if len(target_languages) < 2 or not _supports_async(translation_service, 'translate_multilingual'):
+        return {}
+
+    start_time = time.time()
+    prefetched: Dict[str, dict] = {}
+    missing: List[str] = []
+
+    if translation_cache:
+        for target_language in target_languages:
+            cached = await translation_cache.get_translation(
+                text=task.text,
+                source_lang=task.source_language,
+                target_lang=target_language,
+                model_type=task.model_type
+            )
+            if cached:
+                _record_phrase_hit(task, target_language, cached)
+                prefetched[target_language] = _create_cache_hit_result(
+                    task, target_language, cached, worker_name, time.time() - start_time
+                )
+            else:
+                missing.append(target_language)
+    else:
+        missing = target_languages
+
+    if not missing:
+        return prefetched
+
+    # Budget = somme des budgets par langue (le décodage reste par langue)
+    inference_budget = inference_timeout_for(len(task.text)) * len(missing)
+    try:
+        translated = await _run_inference(
+            lambda: translation_service.translate_multilingual(
+                text=task.text,
+                source_language=task.source_language,
+                target_languages=missing,
+                model_type=task.model_type,
+                source_channel='zmq'
+            ),
+            inference_budget,
+            getattr(task, 'deadline', None)
+        )
+    except Exception as e:
+        logger.warning(
+            f"[PROCESSOR] Multilingual prefetch failed ({len(missing)} langues, "
+            f"{len(task.text)} chars) task={task.task_id}: {e!r} — fallback par langue"
+        )
+        return prefetched
+
+    processing_time = time.time() - start_time
+    for target_language in missing:
+        result = (translated or {}).get(target_language)
+        try:
+            _validate_service_result(result, worker_name)
+        except Exception:
+            continue
+        # Marqueur d'échec du moteur: ni cache ni publication, fallback par langue
+        if is_failed_translation(result['translated_text']):
+            continue
+
+        if translation_cache:
+            await translation_cache.set_translation(
+                text=task.text,
+                source_lang=task.source_language,
+                target_lang=target_language,
+                translated_text=result['translated_text'],
+                model_type=task.model_type
+            )
+
+        prefetched[target_language] = _create_service_result(
+            task, target_language, result, worker_name, processing_time
+        )
+
+    return prefetched
+
+
+def _detection_context(task: TranslationTask) -> Optional[str]:
+    """Clé de prior de langue: la conversation (aucune pour le pool 'any')"""
+    conversation_id = getattr(task, 'conversation_id', None)
+    if not conversation_id or conversation_id == 'any':
+        return None
+    return str(conversation_id)
+
+
+def _resolve_auto_sources(tasks: List[TranslationTask]) -> List[TranslationTask]:
+    """
+    Remplace source_language='auto' par la langue détectée
+
+    Une seule détection batch pour toutes les tâches 'auto' ; la langue
+    récente de la conversation (prior) ne départage que les détections peu
+    fiables. Les tâches sont copiées, jamais modifiées en place.
+    """
+    auto_tasks = [task for task in tasks if task.source_language == 'auto']
+    if not auto_tasks or not LANGUAGE_DETECTOR_AVAILABLE:
+        return tasks
+
+    try:
+        languages = get_language_detector().detect_batch(
+            [task.text for task in auto_tasks],
+            context_keys=[_detection_context(task) for task in auto_tasks]
+        )
+    except Exception as e:
+        logger.warning(f"[PROCESSOR] Language detection failed, keeping 'auto': {e}")
+        return tasks
+
+    detected = {id(task): language for task, language in zip(auto_tasks, languages)}
+    resolved = []
+    for task in tasks:
+        language = detected.get(id(task))
+        if language is None:
+            resolved.append(task)
+            continue
+        task = copy.copy(task)
+        task.source_language = language
+        resolved.append(task)
+    return resolved
+
+
+def _validate_service_result(result: Any, worker_name: str) -> None:
+    """Vérifie qu'un résultat du service ML est exploitable"""
+    if result is None:
+        logger.error(f"Translation service returned None for {worker_name}")
+        raise Exception("Translation service returned None")
+
+    if not isinstance(result, dict) or 'translated_text' not in result:
+        logger.error(f"Invalid result for {worker_name}: {result}")
+        raise Exception(f"Invalid translation result: {result}")
+
+
+def _create_cache_hit_result(
+    task: TranslationTask,
+    target_language: str,
+    cached: dict,
+    worker_name: str,
+    processing_time: float
+) -> dict:
+    """Crée le résultat publié pour une traduction servie par le cache Redis"""
+    return {
+        'messageId': task.message_id,
+        'translatedText': cached.get('translated_text', ''),
+        'sourceLanguage': cached.get('source_lang', task.source_language),
+        'targetLanguage': target_language,
+        'confidenceScore': 0.99,
+        'processingTime': processing_time,
+        'modelType': cached.get('model_type', task.model_type),
+        'workerName': worker_name,
+        'fromCache': True,
+        'segmentsCount': 0,
+        'emojisCount': 0
+    }
+
+
+def _create_service_result(
+    task: TranslationTask,
+    target_language: str,
+    result: dict,
+    worker_name: str,
+    processing_time: float
+) -> dict:
+    """Crée le résultat publié pour une traduction produite par le service ML"""
+    return {
+        'messageId': task.message_id,
+        'translatedText': result['translated_text'],
+        'sourceLanguage': result.get('detected_language', task.source_language),
+        'targetLanguage': target_language,
+        'confidenceScore': result.get('confidence', 0.95),
+        'processingTime': processing_time,
+        'modelType': task.model_type,
+        'workerName': worker_name,
+        'fromCache': False,
+        'segmentsCount': result.get('segments_count', 0),
+        'emojisCount': result.get('emojis_count', 0)
+    }
+
+
 def _create_error_result(
     task: TranslationTask,
     target_language: str,
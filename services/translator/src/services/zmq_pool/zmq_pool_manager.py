@@ -23,10 +23,11 @@ except ImportError:  # pragma: no cover
 
 # Import des modules internes
 from .worker_pool import WorkerPool, configure_pytorch_threads, calculate_optimal_workers
-from .connection_manager import ConnectionManager
+from .connection_manager import ConnectionManager, head_deadline
 
 # Import local
 from ..zmq_models import TranslationTask
+from utils.performance import PerformanceConfig
 
 # Import du cache Redis
 CACHE_AVAILABLE = False
@@ -46,9 +47,17 @@ class TranslationPoolManager:
     OPTIMISATIONS MULTI-UTILISATEURS:
     ═══════════════════════════════════════════════════════════════════════════
     1. BATCH ACCUMULATION: Accumule requêtes pendant 50ms → gains 2-3x throughput
+       (lookup cache groupé, textes dédupliqués, seuls les misses inférés)
     2. PIPELINE RÉUTILISABLE: Pipelines ML créés une fois par thread → économie 100-500ms
     3. PRIORITY QUEUE: Textes courts (<100 chars) traités en priorité via fast_pool
-    4. DYNAMIC SCALING: Ajustement automatique du nombre de workers
+    4. ADAPTIVE CONCURRENCY: limite d'appels moteur simultanés pilotée par la
+       latence mesurée (remplace le scaling des workers sur la taille de file)
+    5. DEADLINES: queues servies par échéance (EDF, y compris entre fast_pool et
+       pool régulière) ; une tâche dont la gateway a dépassé l'échéance est
+       abandonnée avant inférence (événement `translation_expired`)
+    6. FAIR QUEUING: une sous-file par conversation (deficit round-robin
+       pondéré, plafond par conversation) ; une conversation bruyante ne
+       retarde plus les conversations calmes
     ═══════════════════════════════════════════════════════════════════════════
 
     Configuration via variables d'environnement:
@@ -156,11 +165,23 @@ class TranslationPoolManager:
             self.translation_cache = get_translation_cache_service()
             logger.info("[POOL_MANAGER] Redis cache initialized for translations")
 
+        # Abandon des tâches expirées avant inférence
+        self.enable_deadline_drop = PerformanceConfig().enable_deadline_drop
+
+        # Concurrence des appels moteur pilotée par la latence: remplace le
+        # scaling des workers sur la taille de file (les workers ne font plus
+        # que borner le nombre de tâches en cours)
+        from .translation_processor import get_inference_limiter
+        self.inference_limiter = get_inference_limiter()
+
         # Statistiques globales
         self.stats = {
             'tasks_processed': 0,
             'tasks_failed': 0,
             'translations_completed': 0,
+            'phrase_table_served': 0,
+            'tasks_expired': 0,
+            'translations_expired': 0,
             'avg_processing_time': 0.0
         }
 
@@ -169,7 +190,8 @@ class TranslationPoolManager:
             f"normal({normal_workers}), any({any_workers})"
         )
         logger.info(
-            f"[POOL_MANAGER] Dynamic scaling: {'enabled' if enable_dynamic_scaling else 'disabled'}"
+            f"[POOL_MANAGER] Dynamic scaling: "
+            f"{'adaptive concurrency limit' if self.inference_limiter else 'enabled' if enable_dynamic_scaling else 'disabled'}"
         )
 
     async def enqueue_task(self, task: TranslationTask) -> bool:
@@ -180,8 +202,20 @@ class TranslationPoolManager:
             task: Tâche de traduction
 
         Returns:
-            True si enfilée avec succès
+            True si enfilée (ou servie directement) avec succès
         """
+        # Fast path: message court connu de la table de phrases pour toutes
+        # ses langues → publié immédiatement, sans passer par la fast_pool
+        from .translation_processor import serve_from_phrase_table
+
+        try:
+            if await serve_from_phrase_table(task, self._publish_translation_result):
+                self.stats['phrase_table_served'] += 1
+                self.stats['translations_completed'] += len(set(task.target_languages))
+                return True
+        except Exception as e:
+            logger.warning(f"[POOL_MANAGER] Phrase table fast path failed for {task.task_id}: {e}")
+
         return await self.connection_manager.enqueue_task(task)
 
     async def start_workers(self) -> List[asyncio.Task]:
@@ -226,10 +260,11 @@ class TranslationPoolManager:
 
         while self.normal_pool.workers_running:
             try:
-                # Check dynamic scaling
-                queue_size = self.connection_manager.normal_pool.qsize()
-                utilization = self.normal_pool.get_utilization()
-                await self.normal_pool.check_scaling(queue_size, utilization)
+                # Check dynamic scaling (remplacé par le limiteur adaptatif s'il est actif)
+                if self.inference_limiter is None:
+                    queue_size = self.connection_manager.normal_pool.qsize()
+                    utilization = self.normal_pool.get_utilization()
+                    await self.normal_pool.check_scaling(queue_size, utilization)
 
                 # Récupérer une tâche (priorité fast_pool d'abord)
                 task = await self._get_next_task(
@@ -258,10 +293,11 @@ class TranslationPoolManager:
 
         while self.any_pool.workers_running:
             try:
-                # Check dynamic scaling
-                queue_size = self.connection_manager.any_pool.qsize()
-                utilization = self.any_pool.get_utilization()
-                await self.any_pool.check_scaling(queue_size, utilization)
+                # Check dynamic scaling (remplacé par le limiteur adaptatif s'il est actif)
+                if self.inference_limiter is None:
+                    queue_size = self.connection_manager.any_pool.qsize()
+                    utilization = self.any_pool.get_utilization()
+                    await self.any_pool.check_scaling(queue_size, utilization)
 
                 # Récupérer une tâche (priorité fast_pool d'abord)
                 task = await self._get_next_task(
@@ -299,8 +335,14 @@ class TranslationPoolManager:
         Returns:
             TranslationTask ou None si timeout
         """
-        # Vérifier fast_pool d'abord (textes courts prioritaires)
+        # Vérifier fast_pool d'abord (textes courts prioritaires), sauf si la
+        # tête de la pool régulière a une échéance plus proche (EDF)
         if not fast_pool.empty():
+            if head_deadline(regular_pool) < head_deadline(fast_pool):
+                try:
+                    return regular_pool.get_nowait()
+                except asyncio.QueueEmpty:
+                    pass
             try:
                 task = fast_pool.get_nowait()
                 logger.debug(f"⚡ Task from fast_pool")
@@ -327,15 +369,20 @@ class TranslationPoolManager:
 
         try:
             # Détecter si c'est un batch
-            batch_tasks = getattr(task, '_batch_tasks', None)
+            tasks = getattr(task, '_batch_tasks', None) or [task]
 
-            if batch_tasks and len(batch_tasks) > 1:
+            # Échéance dépassée: la gateway a abandonné, inutile de traduire
+            if self.enable_deadline_drop:
+                tasks = await self._drop_expired(tasks)
+                if not tasks:
+                    return
+
+            if len(tasks) > 1:
                 # Traitement batch
-                await self._process_batch_translation(batch_tasks, worker_name)
+                await self._process_batch_translation(tasks, worker_name)
             else:
                 # Traitement single
-                actual_task = batch_tasks[0] if batch_tasks else task
-                await self._process_single_translation(actual_task, worker_name)
+                await self._process_single_translation(tasks[0], worker_name)
 
             # Mettre à jour les statistiques
             processing_time = time.time() - start_time
@@ -349,6 +396,28 @@ class TranslationPoolManager:
             logger.error(f"Error processing task {task.task_id}: {e}")
             self.stats['tasks_failed'] += 1
 
+    async def _drop_expired(self, tasks: List[TranslationTask]) -> List[TranslationTask]:
+        """
+        Écarte les tâches dont l'échéance est passée (événement translation_expired)
+
+        Returns:
+            Tâches encore dans les temps
+        """
+        now = time.time()
+        live = []
+        for task in tasks:
+            deadline = getattr(task, 'deadline', None)
+            if not isinstance(deadline, (int, float)) or deadline >= now:
+                live.append(task)
+                continue
+            self.stats['tasks_expired'] += 1
+            self.stats['translations_expired'] += len(set(task.target_languages))
+            try:
+                await self._publish_translation_expired(task, int((now - deadline) * 1000))
+            except Exception as e:
+                logger.warning(f"[POOL_MANAGER] translation_expired non publié pour {task.task_id}: {e}")
+        return live
+
     async def _process_single_translation(self, task: TranslationTask, worker_name: str):
         """Traite une tâche de traduction unique (délégué à translation processor)"""
         # Import dynamique pour éviter les dépendances circulaires
@@ -378,7 +447,8 @@ class TranslationPoolManager:
             tasks=tasks,
             worker_name=worker_name,
             translation_service=self.translation_service,
-            publish_func=self._publish_translation_result
+            publish_func=self._publish_translation_result,
+            translation_cache=self.translation_cache
         )
 
         # Mettre à jour les stats
@@ -399,6 +469,16 @@ class TranslationPoolManager:
         # Elle sera overridée par le ZMQ server
         pass
 
+    async def _publish_translation_expired(self, task: TranslationTask, late_ms: int):
+        """
+        Publie l'abandon d'une tâche expirée (placeholder, overridé par le ZMQ server)
+
+        Args:
+            task: Tâche abandonnée
+            late_ms: Retard sur l'échéance au moment de l'abandon
+        """
+        pass
+
     def get_stats(self) -> dict:
         """Retourne les statistiques globales"""
         connection_stats = self.connection_manager.get_stats()
@@ -413,6 +493,20 @@ class TranslationPoolManager:
             'uptime_seconds': time.time() - self._start_time
         }
 
+        # Table de phrases du fast path (messages courts)
+        from .translation_processor import PHRASE_TABLE_AVAILABLE, get_phrase_table
+        phrase_table = get_phrase_table() if PHRASE_TABLE_AVAILABLE else None
+        if phrase_table is not None:
+            stats_dict['phrase_table'] = phrase_table.get_stats()
+
+        # Chemin batch: paires servies par le cache vs inférées
+        from .translation_processor import get_batch_cache_stats
+        stats_dict['batch_cache'] = get_batch_cache_stats()
+
+        # Limite de concurrence adaptative: limite, RTT estimés, refus
+        if self.inference_limiter is not None:
+            stats_dict['inference_limiter'] = self.inference_limiter.get_stats()
+
         # Ajouter memory usage si psutil disponible
         if PSUTIL_AVAILABLE:
             stats_dict['memory_usage_mb'] = psutil.Process().memory_info().rss / 1024 / 1024
@@ -25,10 +25,12 @@ from .zmq_translation_handler import TranslationHandler
 from .zmq_audio_handler import AudioHandler
 from .zmq_transcription_handler import TranscriptionHandler
 from .zmq_voice_handler import VoiceHandler
+from .zmq_admission import AdmissionController, parse_admission_budgets
 
 # Import du service de base de données
 from .database_service import DatabaseService
 from .audio_fetcher import get_audio_fetcher
+from utils.performance import PerformanceConfig
 
 
 class ZMQTranslationServer:
@@ -40,7 +42,15 @@ class ZMQTranslationServer:
     - AudioHandler : traitement audio (multipart)
     - TranscriptionHandler : transcriptions seules
     - VoiceHandler : Voice API et profils vocaux
+
+    Les requêtes passent par un contrôle d'admission (budget de tâches et
+    file bornée par type) : saturé, le serveur cesse de lire le socket PULL
+    puis répond par un événement `overloaded`.
     """
+
+    # Contrôle d'admission (None = tâches lancées sans borne)
+    admission: Optional[AdmissionController] = None
+
     def __init__(self,
                  host: str = "0.0.0.0",
                  gateway_push_port: int = 5555,  # Port où Translator PULL bind (Gateway PUSH connect ici)
@@ -72,6 +82,7 @@ class ZMQTranslationServer:
         
         # Remplacer la méthode de publication du pool manager
         self.pool_manager._publish_translation_result = self._publish_translation_result
+        self.pool_manager._publish_translation_expired = self._publish_translation_expired
 
         # Service de base de données (optionnel - désactivé si database_url est None)
         self.database_service = DatabaseService(database_url) if database_url else None
@@ -99,6 +110,15 @@ class ZMQTranslationServer:
             'voice_profile': 0
         }
 
+        perf_config = PerformanceConfig()
+        if perf_config.zmq_admission_enabled:
+            self.admission = AdmissionController(
+                parse_admission_budgets(perf_config.zmq_admission_budgets),
+                spawn=self._create_tracked_task,
+                policy=perf_config.zmq_admission_policy,
+                max_wait_s=perf_config.zmq_admission_max_wait_s
+            )
+
         # OPTIMISATION: Cache CPU pour éviter le sleep(0.1) dans _publish_translation_result
         self._cached_cpu_usage = 0.0
         self._cpu_update_task = None
@@ -288,6 +308,46 @@ class ZMQTranslationServer:
         task.add_done_callback(task_done_callback)
         return task
 
+    async def _submit_tracked(self, coro, task_type: str, request_data: dict) -> bool:
+        """
+        Lance une tâche trackée via le contrôle d'admission
+
+        Peut attendre une place quand toutes les classes sont saturées
+        (backpressure: la boucle de réception ne lit plus le socket) ; une
+        requête rejetée reçoit un événement `overloaded`.
+
+        Returns:
+            True si la tâche est lancée ou en file
+        """
+        if self.admission is None:
+            self._create_tracked_task(coro, task_type)
+            return True
+        if await self.admission.submit(task_type, coro):
+            return True
+        await self._publish_overloaded(task_type, request_data)
+        return False
+
+    async def _publish_overloaded(self, task_type: str, request_data: dict):
+        """Répond immédiatement à une requête rejetée faute de capacité"""
+        message = {
+            'type': 'overloaded',
+            'requestType': request_data.get('type', task_type),
+            # Voice profile: corrélé par request_id côté gateway
+            'taskId': request_data.get('taskId') or request_data.get('request_id'),
+            'messageId': request_data.get('messageId'),
+            'attachmentId': request_data.get('attachmentId'),
+            'conversationId': request_data.get('conversationId'),
+            'queueDepth': self.admission.queue_depth(self.admission.request_class(task_type)),
+            'retryAfterMs': int(max(1.0, self.admission.max_wait_s) * 1000),
+            'timestamp': time.time()
+        }
+        try:
+            if self.pub_socket:
+                await self.pub_socket.send(json.dumps(message).encode('utf-8'))
+                logger.warning(f"⛔ [TRANSLATOR] Surcharge {task_type}: requête {message['taskId'] or message['messageId']} rejetée")
+        except Exception as e:
+            logger.error(f"❌ [TRANSLATOR] Erreur publication overloaded: {e}")
+
     def _inject_binary_frames(self, request_data: dict, binary_frames: list):
         """
         Injecte les frames binaires dans request_data selon binaryFrames indices.
@@ -350,27 +410,30 @@ class ZMQTranslationServer:
             await self.translation_handler._handle_translation_request_multipart(frames)
         elif request_type == 'translation':
             # ✨ Lancer en tâche asynchrone trackée pour ne pas bloquer
-            self._create_tracked_task(
+            await self._submit_tracked(
                 self.translation_handler._handle_translation_request_multipart(frames),
-                'translation'
+                'translation',
+                request_data
             )
             logger.debug(f"🚀 [NON-BLOCKING] Translation task créée ({len(self.active_tasks)} actives)")
         elif request_type == 'audio_process':
             # Injecter les binaires dans request_data pour audio_process
             self._inject_binary_frames(request_data, binary_frames)
             # ✨ Lancer en tâche asynchrone trackée (peut prendre 5-10s)
-            self._create_tracked_task(
+            await self._submit_tracked(
                 self.audio_handler._handle_audio_process_request(request_data),
-                'audio_process'
+                'audio_process',
+                request_data
             )
             logger.debug(f"🚀 [NON-BLOCKING] Audio process task créée ({len(self.active_tasks)} actives)")
         elif request_type == 'transcription_only':
             # Injecter les binaires dans request_data pour transcription_only
             self._inject_binary_frames(request_data, binary_frames)
             # ✨ Lancer en tâche asynchrone trackée (peut prendre 2-3s)
-            self._create_tracked_task(
+            await self._submit_tracked(
                 self.transcription_handler._handle_transcription_only_request(request_data),
-                'transcription'
+                'transcription',
+                request_data
             )
             logger.debug(f"🚀 [NON-BLOCKING] Transcription task créée ({len(self.active_tasks)} actives)")
         elif request_type == 'story_text_object_translation':
@@ -385,31 +448,35 @@ class ZMQTranslationServer:
             # demande, trois « Type de requête inconnu » en face, et des
             # textObjects sans une seule traduction pendant que la légende en
             # accumulait six.
-            self._create_tracked_task(
+            await self._submit_tracked(
                 self.translation_handler._handle_story_text_object_translation(request_data),
-                'story_text_object_translation'
+                'story_text_object_translation',
+                request_data
             )
             logger.debug(f"🚀 [NON-BLOCKING] StoryTextObject task créée ({len(self.active_tasks)} actives)")
         elif request_type == 'voice_api':
             # ✨ Lancer en tâche asynchrone trackée
-            self._create_tracked_task(
+            await self._submit_tracked(
                 self.voice_handler._handle_voice_api_request(request_data),
-                'voice_api'
+                'voice_api',
+                request_data
             )
             logger.debug(f"🚀 [NON-BLOCKING] Voice API task créée ({len(self.active_tasks)} actives)")
         elif request_type == 'voice_profile':
             # ✨ Lancer en tâche asynchrone trackée
-            self._create_tracked_task(
+            await self._submit_tracked(
                 self.voice_handler._handle_voice_profile_request(request_data),
-                'voice_profile'
+                'voice_profile',
+                request_data
             )
             logger.debug(f"🚀 [NON-BLOCKING] Voice profile task créée ({len(self.active_tasks)} actives)")
         elif self.voice_handler and hasattr(self.voice_handler, 'is_voice_api_request') and self.voice_handler.is_voice_api_request(request_type):
             # Support direct voice API request types (voice_translate_async, etc.)
             # ✨ Lancer en tâche asynchrone trackée
-            self._create_tracked_task(
+            await self._submit_tracked(
                 self.voice_handler._handle_voice_api_request(request_data),
-                'voice_api'
+                'voice_api',
+                request_data
             )
             logger.debug(f"🚀 [NON-BLOCKING] Voice API direct task créée ({len(self.active_tasks)} actives)")
         else:
@@ -442,6 +509,11 @@ class ZMQTranslationServer:
         if self.translation_handler:
             await self.translation_handler._publish_translation_result(task_id, result, target_language)
 
+    async def _publish_translation_expired(self, task: TranslationTask, late_ms: int):
+        """Délègue la publication d'une tâche expirée au handler de traduction"""
+        if self.translation_handler:
+            await self.translation_handler._publish_translation_expired(task, late_ms)
+
     def get_active_tasks_stats(self) -> dict:
         """
         Retourne les statistiques des tâches actives
@@ -474,6 +546,12 @@ class ZMQTranslationServer:
             except asyncio.CancelledError:
                 pass
 
+        # Requêtes encore en file d'admission: abandonnées
+        if self.admission:
+            dropped = self.admission.close_pending()
+            if dropped:
+                logger.warning(f"⚠️ {dropped} requête(s) en file d'admission abandonnée(s)")
+
         # ✨ Attendre la fin des tâches actives (avec timeout)
         if self.active_tasks:
             active_count = len(self.active_tasks)
@@ -519,6 +597,7 @@ class ZMQTranslationServer:
             'normal_workers': self.pool_manager.normal_pool.current_workers,
             'any_workers': self.pool_manager.any_pool.current_workers,
             'active_tasks': tasks_stats,  # ✨ Nouveau: stats des tâches actives
+            'admission': self.admission.get_stats() if self.admission else None,
             **pool_stats
         }
     
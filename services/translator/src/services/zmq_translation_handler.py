@@ -15,7 +15,7 @@ import uuid
 from typing import Dict, Optional
 
 # Import des modèles ZMQ
-from .zmq_models import TranslationTask
+from .zmq_models import TranslationTask, deadline_from_request
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +29,7 @@ except ImportError:
 
 # Import de la configuration des limites
 from config.message_limits import can_translate_message
+from utils.translation_validation import is_failed_translation
 
 # Import des constantes de disponibilité des pipelines
 try:
@@ -133,6 +134,10 @@ class TranslationHandler:
         self._inflight_tasks[task_id] = now + ttl_s
         return True
 
+    def release_inflight(self, task_id: str) -> None:
+        """Libère task_id (tâche abandonnée): une relance gateway sera traitée."""
+        self._inflight_tasks.pop(task_id, None)
+
     async def _handle_translation_request_multipart(self, frames: list[bytes]):
         """
         Traite une requête multipart ZMQ.
@@ -193,32 +198,9 @@ class TranslationHandler:
         """
         Traite une requête de traduction reçue via SUB
 
-        XXX: PARALLÉLISATION OPPORTUNITÉ #3 - Traduction multi-langues simultanée
-        TODO: Actuellement, si targetLanguages = ['en', 'es', 'de', 'it', 'pt']
-              chaque langue est traduite SÉQUENTIELLEMENT par le worker
-        TODO: Optimisation possible:
-              - Créer UNE tâche par langue cible (5 tâches au lieu d'1)
-              - Les workers traitent en parallèle (si plusieurs workers disponibles)
-              - OU: Batch translation dans le worker (traduire toutes les langues en 1 passe)
-        TODO: Implémentation suggérée:
-              # Option A: Multiple tasks (simple, utilise workers existants)
-              for target_lang in target_languages:
-                  task = TranslationTask(
-                      target_languages=[target_lang],  # UNE langue par tâche
-                      ...
-                  )
-                  await self.pool_manager.enqueue_task(task)
-              
-              # Option B: Batch API dans ML service (plus efficace)
-              results = await ml_service.translate_batch_multilingual(
-                  text=text,
-                  source_lang=source_lang,
-                  target_langs=['en', 'es', 'de', 'it', 'pt'],  # Toutes ensemble
-                  model_type=model_type
-              )
-        TODO: Gains attendus:
-              - Option A: N workers × vitesse (si N workers disponibles)
-              - Option B: 2-3x plus rapide (overhead réduit, batch processing)
+        Multi-langues: le worker traduit toutes les langues cibles d'une tâche
+        via TranslationService.translate_multilingual (source segmentée et
+        encodée une seule fois, seul le décodage est fait par langue).
         """
         try:
             # Note: request_data est déjà parsé par _handle_translation_request_multipart
@@ -349,7 +331,8 @@ class TranslationHandler:
                 source_language=request_data.get('sourceLanguage', 'fr'),
                 target_languages=request_data.get('targetLanguages', []),
                 conversation_id=request_data.get('conversationId', 'unknown'),
-                model_type=request_data.get('modelType', 'basic')
+                model_type=request_data.get('modelType', 'basic'),
+                deadline=deadline_from_request(request_data)
             )
             
             logger.info(f"🔧 [TRANSLATOR] Tâche créée: {task.task_id} pour {task.conversation_id} ({len(task.target_languages)} langues)")
@@ -505,6 +488,30 @@ class TranslationHandler:
             import traceback
             traceback.print_exc()
     
+    async def _publish_translation_expired(self, task: TranslationTask, late_ms: int):
+        """Signale à la gateway une tâche abandonnée avant inférence (échéance dépassée)"""
+        self.release_inflight(task.task_id)
+        message = {
+            'type': 'translation_expired',
+            'taskId': task.task_id,
+            'messageId': task.message_id,
+            'conversationId': task.conversation_id,
+            'targetLanguages': task.target_languages,
+            # Échéance de la tentative (epoch ms): la gateway ignore l'événement
+            # si sa tentative en cours est un renvoi postérieur
+            'deadline': int(task.deadline * 1000),
+            'lateByMs': late_ms,
+            'timestamp': time.time()
+        }
+        try:
+            if self.pub_socket:
+                await self.pub_socket.send(json.dumps(message).encode('utf-8'))
+                logger.warning(f"⌛ [TRANSLATOR] Tâche expirée abandonnée: {task.task_id} (+{late_ms}ms)")
+            else:
+                logger.error("❌ Socket PUB non initialisé")
+        except Exception as e:
+            logger.error(f"❌ [TRANSLATOR] Erreur publication translation_expired: {e}")
+
     def _is_valid_translation(self, translated_text: str, result: dict) -> bool:
         """
         Vérifie si une traduction est valide et peut être envoyée à la Gateway
@@ -516,32 +523,11 @@ class TranslationHandler:
         Returns:
             bool: True si la traduction est valide, False sinon
         """
-        # Vérifier que le texte traduit existe et n'est pas vide
-        if not translated_text or translated_text.strip() == '':
+        # Vérifier que le texte traduit existe, n'est pas vide et n'est pas
+        # un message d'erreur (motifs partagés avec le cache négatif)
+        if is_failed_translation(translated_text):
             return False
         
-        # Vérifier que ce n'est pas un message d'erreur
-        error_patterns = [
-            r'^\[.*Error.*\]',
-            r'^\[.*Failed.*\]',
-            r'^\[.*No.*Result.*\]',
-            r'^\[.*Fallback.*\]',
-            r'^\[.*ML.*Error.*\]',
-            r'^\[.*ÉCHEC.*\]',
-            r'^\[.*MODÈLES.*NON.*\]',
-            r'^\[.*MODÈLES.*NON.*CHARGÉS.*\]',
-            r'^\[.*NLLB.*No.*Result.*\]',
-            r'^\[.*NLLB.*Fallback.*\]',
-            r'^\[.*ERREUR.*\]',
-            r'^\[.*FAILED.*\]',
-            r'^\[.*TIMEOUT.*\]',
-            r'^\[.*META.*TENSOR.*\]'
-        ]
-        
-        for pattern in error_patterns:
-            if re.search(pattern, translated_text, re.IGNORECASE):
-                return False
-        
         # Vérifier que le texte traduit n'est pas identique au texte source
         original_text = result.get('originalText', '')
         if original_text and translated_text.strip().lower() == original_text.strip().lower():
@@ -644,10 +630,37 @@ class TranslationHandler:
         translations: Dict[str, str] = {}
         start_time = time.time()
 
-        for target_lang in target_languages:
-            if target_lang == source_language:
-                # Pas besoin de traduire vers la langue source
-                continue
+        # Pas besoin de traduire vers la langue source
+        targets = [lang for lang in dict.fromkeys(target_languages) if lang != source_language]
+
+        # Multi-cibles: source encodée une seule fois pour toutes les langues
+        if len(targets) > 1 and asyncio.iscoroutinefunction(
+            getattr(translation_service, 'translate_multilingual', None)
+        ):
+            try:
+                results = await translation_service.translate_multilingual(
+                    text=text,
+                    source_language=source_language,
+                    target_languages=targets,
+                    model_type=request_data.get('modelType', 'basic'),
+                    source_channel='zmq_story_text_object'
+                )
+                for target_lang, result in (results or {}).items():
+                    translated = result.get('translated_text') if isinstance(result, dict) else None
+                    if (
+                        translated and translated.strip() and translated != text
+                        and not is_failed_translation(translated)
+                    ):
+                        translations[target_lang] = translated
+                # Langues absentes ou en échec: reprises par la boucle par langue
+                targets = [lang for lang in targets if lang not in translations]
+            except Exception as e:
+                logger.warning(
+                    f"⚠️ [TRANSLATOR] story textObject multilingual failed, fallback par langue: "
+                    f"postId={post_id}, index={text_object_index}, err={e}"
+                )
+
+        for target_lang in targets:
             try:
                 result = await translation_service.translate_with_structure(
                     text=text,
@@ -0,0 +1,506 @@
+"""
+Magasin d'artefacts sur disque adressé par contenu (intermédiaires audio)
+Un seul répertoire, borné en octets, pour les conversions WAV, les segments
+TTS et les audios synthétisés : clé = hash du contenu source + transformation
+(`wav16k-mono`, `tts:fr:<voix>:...`), écritures atomiques, éviction LRU qui
+épargne les fichiers épinglés (en cours d'utilisation), index persistant
+rechargé au redémarrage.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from .performance import PerformanceConfig
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+INDEX_FILENAME = "index.json"
+TMP_DIRNAME = "tmp"
+
+
+@dataclass
+class ArtifactEntry:
+    """Artefact indexé (chemin relatif à la racine du magasin)"""
+    file: str
+    size: int
+    content_hash: str
+    transform: str
+    created_at: float
+    last_access: float
+
+
+class ArtifactStore:
+    """
+    Magasin d'artefacts adressé par (hash du contenu, transformation), thread-safe
+
+    - Chemin: <racine>/<ab>/<clé><ext>, clé = sha256(hash + transformation)
+    - Écriture atomique: fichier produit dans <racine>/tmp puis os.replace
+    - Budget `max_bytes`: éviction LRU (dernier accès) des entrées non
+      épinglées et non accédées depuis `grace_s` secondes
+    - Index JSON réécrit atomiquement (au plus toutes les `index_flush_interval_s`) ;
+      au chargement, les entrées sans fichier sont oubliées et les fichiers
+      hors index (arrêt avant écriture de l'index) réadoptés
+
+    Usage:
+        store = get_artifact_store()
+        wav = store.get_or_create(audio_hash, "wav16k-mono", ".wav",
+                                  lambda tmp: ffmpeg(src, tmp))
+        with store.pinned(wav):
+            audio, sr = sf.read(wav)
+    """
+
+    def __init__(
+        self,
+        root_dir: str,
+        max_bytes: int,
+        grace_s: float = 300.0,
+        index_flush_interval_s: float = 5.0
+    ):
+        """
+        Initialise le magasin (crée la racine, recharge l'index)
+
+        Args:
+            root_dir: Répertoire racine
+            max_bytes: Budget disque total (octets)
+            grace_s: Les entrées accédées depuis moins longtemps ne sont pas évincées
+            index_flush_interval_s: Délai minimal entre deux réécritures de l'index
+        """
+        self.root_dir = os.path.abspath(root_dir)
+        self.max_bytes = max(0, int(max_bytes))
+        self.grace_s = max(0.0, grace_s)
+        self.index_flush_interval_s = index_flush_interval_s
+
+        self._entries: Dict[str, ArtifactEntry] = {}
+        self._pins: Dict[str, int] = {}
+        # Clé en cours de production → (verrou, appelants)
+        self._producers: Dict[str, Tuple[threading.Lock, int]] = {}
+        self._total_bytes = 0
+        self._dirty = False
+        self._last_flush = 0.0
+        self._lock = threading.RLock()
+
+        self.stats = {'hits': 0, 'misses': 0, 'stored': 0, 'evictions': 0, 'evicted_bytes': 0}
+
+        os.makedirs(os.path.join(self.root_dir, TMP_DIRNAME), exist_ok=True)
+        self._load_index()
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Clés et chemins
+    # ─────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def make_key(content_hash: str, transform: str) -> str:
+        """Clé d'un artefact: sha256(hash du contenu, transformation) tronqué"""
+        return hashlib.sha256(f"{content_hash}\x00{transform}".encode('utf-8')).hexdigest()[:40]
+
+    def _relative_path(self, key: str, ext: str) -> str:
+        return os.path.join(key[:2], f"{key}{ext}")
+
+    def _absolute(self, relative: str) -> str:
+        return os.path.join(self.root_dir, relative)
+
+    def _key_for_path(self, path: str) -> Optional[str]:
+        name = os.path.basename(path)
+        key = name.split('.', 1)[0]
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and self._absolute(entry.file) == os.path.abspath(path):
+                return key
+        return None
+
+    def temp_path(self, ext: str = "") -> str:
+        """Chemin temporaire dans le magasin (même système de fichiers → os.replace atomique)"""
+        return os.path.join(self.root_dir, TMP_DIRNAME, f"{uuid.uuid4().hex}{ext}")
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Lecture / écriture
+    # ─────────────────────────────────────────────────────────────────────
+
+    def get(self, content_hash: str, transform: str) -> Optional[str]:
+        """Chemin de l'artefact s'il existe (marque l'accès pour le LRU), None sinon"""
+        key = self.make_key(content_hash, transform)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                path = self._absolute(entry.file)
+                if os.path.exists(path):
+                    entry.last_access = time.time()
+                    self._dirty = True
+                    self.stats['hits'] += 1
+                    return path
+                self._forget(key)
+            self.stats['misses'] += 1
+        return None
+
+    def put_file(self, content_hash: str, transform: str, src_path: str, move: bool = True) -> str:
+        """
+        Range un fichier produit ailleurs sous (hash, transformation)
+
+        Args:
+            content_hash: Hash du contenu source
+            transform: Transformation appliquée (ex: 'wav16k-mono')
+            src_path: Fichier produit (idéalement issu de temp_path())
+            move: Déplacer (True) ou copier le fichier source
+
+        Returns:
+            Chemin de l'artefact dans le magasin
+        """
+        key = self.make_key(content_hash, transform)
+        ext = os.path.splitext(src_path)[1]
+        relative = self._relative_path(key, ext)
+        final_path = self._absolute(relative)
+        os.makedirs(os.path.dirname(final_path), exist_ok=True)
+
+        staged = src_path
+        if not move or os.path.dirname(os.path.abspath(src_path)) != os.path.join(self.root_dir, TMP_DIRNAME):
+            # Autre système de fichiers possible: copie vers tmp, puis remplacement atomique
+            staged = self.temp_path(ext)
+            shutil.copyfile(src_path, staged)
+            if move:
+                os.unlink(src_path)
+        os.replace(staged, final_path)
+
+        now = time.time()
+        size = os.path.getsize(final_path)
+        with self._lock:
+            previous = self._entries.get(key)
+            if previous is not None:
+                self._total_bytes -= previous.size
+                if previous.file != relative:
+                    self._unlink(previous.file)
+            self._entries[key] = ArtifactEntry(relative, size, content_hash, transform, now, now)
+            self._total_bytes += size
+            self._dirty = True
+            self.stats['stored'] += 1
+            self._evict_over_budget()
+            self._maybe_flush()
+        return final_path
+
+    def put_bytes(self, content_hash: str, transform: str, data: bytes, ext: str) -> str:
+        """Range un contenu en mémoire (écriture atomique)"""
+        tmp_path = self.temp_path(ext)
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        return self.put_file(content_hash, transform, tmp_path)
+
+    def get_or_create(
+        self,
+        content_hash: str,
+        transform: str,
+        ext: str,
+        producer: Callable[[str], Any]
+    ) -> Optional[str]:
+        """
+        Retourne l'artefact, ou le produit via `producer(tmp_path)` (bloquant)
+
+        Le producteur écrit dans un chemin temporaire du magasin ; un
+        producteur qui lève ou ne crée pas le fichier ne laisse rien derrière.
+        Une seule production par artefact à la fois : les appelants
+        concurrents de la même clé attendent puis reprennent son résultat.
+
+        Returns:
+            Chemin de l'artefact, None si la production a échoué
+        """
+        path = self.get(content_hash, transform)
+        if path is not None:
+            return path
+
+        with self._producing(self.make_key(content_hash, transform)):
+            # Produit pendant l'attente par un appelant concurrent
+            path = self.get(content_hash, transform)
+            if path is not None:
+                return path
+
+            tmp_path = self.temp_path(ext)
+            try:
+                producer(tmp_path)
+                if not os.path.exists(tmp_path) or os.path.getsize(tmp_path) == 0:
+                    return None
+                return self.put_file(content_hash, transform, tmp_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+
+    @contextmanager
+    def _producing(self, key: str) -> Iterator[None]:
+        """Verrou de production d'une clé (oublié quand plus personne ne l'attend)"""
+        with self._lock:
+            lock, waiters = self._producers.get(key, (None, 0))
+            if lock is None:
+                lock = threading.Lock()
+            self._producers[key] = (lock, waiters + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self._lock:
+                lock, waiters = self._producers[key]
+                if waiters > 1:
+                    self._producers[key] = (lock, waiters - 1)
+                else:
+                    del self._producers[key]
+
+    @staticmethod
+    def materialize(path: str, dest_path: str, link: bool = True) -> str:
+        """
+        Expose un artefact à un chemin de livraison
+
+        Lien physique par défaut (aucune copie) ; `link=False` si le
+        destinataire modifie le fichier sur place.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(dest_path)), exist_ok=True)
+        if os.path.exists(dest_path):
+            os.unlink(dest_path)
+        if link:
+            try:
+                os.link(path, dest_path)
+                return dest_path
+            except OSError:
+                pass
+        shutil.copyfile(path, dest_path)
+        return dest_path
+
+    def remove(self, content_hash: str, transform: str) -> bool:
+        """Supprime un artefact (même épinglé)"""
+        key = self.make_key(content_hash, transform)
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._unlink(self._entries[key].file)
+            self._forget(key)
+            self._maybe_flush()
+            return True
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Épinglage
+    # ─────────────────────────────────────────────────────────────────────
+
+    def pin(self, path: str) -> bool:
+        """Protège un artefact de l'éviction (compteur de références)"""
+        key = self._key_for_path(path)
+        if key is None:
+            return False
+        with self._lock:
+            self._pins[key] = self._pins.get(key, 0) + 1
+        return True
+
+    def unpin(self, path: str) -> None:
+        """Relâche un épinglage"""
+        key = self._key_for_path(path)
+        if key is None:
+            return
+        with self._lock:
+            remaining = self._pins.get(key, 0) - 1
+            if remaining > 0:
+                self._pins[key] = remaining
+            else:
+                self._pins.pop(key, None)
+            self._evict_over_budget()
+
+    @contextmanager
+    def pinned(self, path: str) -> Iterator[str]:
+        """Épingle `path` le temps du bloc (sans effet pour un fichier hors magasin)"""
+        pinned = self.pin(path)
+        try:
+            yield path
+        finally:
+            if pinned:
+                self.unpin(path)
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Éviction
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _evict_over_budget(self) -> None:
+        if self._total_bytes <= self.max_bytes:
+            return
+        cutoff = time.time() - self.grace_s
+        candidates = sorted(
+            (entry.last_access, key) for key, entry in self._entries.items()
+            if key not in self._pins and entry.last_access < cutoff
+        )
+        for _, key in candidates:
+            if self._total_bytes <= self.max_bytes:
+                break
+            entry = self._entries[key]
+            self._unlink(entry.file)
+            self._forget(key)
+            self.stats['evictions'] += 1
+            self.stats['evicted_bytes'] += entry.size
+
+    def evict_older_than(self, max_age_s: float, transform_prefix: Optional[str] = None) -> int:
+        """
+        Supprime les artefacts non accédés depuis `max_age_s` (non épinglés)
+
+        Args:
+            max_age_s: Âge maximum depuis le dernier accès
+            transform_prefix: Ne viser que les transformations de ce préfixe
+
+        Returns:
+            Nombre d'artefacts supprimés
+        """
+        cutoff = time.time() - max_age_s
+        removed = 0
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if key in self._pins or entry.last_access >= cutoff:
+                    continue
+                if transform_prefix and not entry.transform.startswith(transform_prefix):
+                    continue
+                self._unlink(entry.file)
+                self._forget(key)
+                removed += 1
+            if removed:
+                self._maybe_flush()
+        return removed
+
+    def _forget(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size
+            self._pins.pop(key, None)
+            self._dirty = True
+
+    def _unlink(self, relative: str) -> None:
+        try:
+            os.unlink(self._absolute(relative))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"[ARTIFACTS] ⚠️ Suppression impossible {relative}: {e}")
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Index persistant
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _index_path(self) -> str:
+        return os.path.join(self.root_dir, INDEX_FILENAME)
+
+    def _load_index(self) -> None:
+        entries: Dict[str, Any] = {}
+        try:
+            with open(self._index_path(), 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if isinstance(state, dict) and state.get('version') == INDEX_VERSION:
+                entries = state.get('entries', {})
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"[ARTIFACTS] ⚠️ Index illisible, reconstruction depuis le disque: {e}")
+
+        for key, raw in entries.items():
+            try:
+                entry = ArtifactEntry(**raw)
+            except TypeError:
+                continue
+            if os.path.exists(self._absolute(entry.file)):
+                self._entries[key] = entry
+                self._total_bytes += entry.size
+
+        # Fichiers écrits après le dernier index (arrêt brutal): réadoptés
+        # avec leur mtime ; hash/transformation inconnus, seule l'éviction les voit
+        for shard in os.listdir(self.root_dir):
+            shard_dir = os.path.join(self.root_dir, shard)
+            if shard == TMP_DIRNAME or len(shard) != 2 or not os.path.isdir(shard_dir):
+                continue
+            for name in os.listdir(shard_dir):
+                key = name.split('.', 1)[0]
+                if key in self._entries:
+                    continue
+                path = os.path.join(shard_dir, name)
+                mtime = os.path.getmtime(path)
+                self._entries[key] = ArtifactEntry(os.path.join(shard, name), os.path.getsize(path), "", "", mtime, mtime)
+                self._total_bytes += self._entries[key].size
+                self._dirty = True
+
+        # Écritures interrompues
+        tmp_dir = os.path.join(self.root_dir, TMP_DIRNAME)
+        for name in os.listdir(tmp_dir):
+            try:
+                os.unlink(os.path.join(tmp_dir, name))
+            except OSError:
+                pass
+
+        self._evict_over_budget()
+        if self._entries:
+            logger.info(
+                f"[ARTIFACTS] 📦 {len(self._entries)} artefacts rechargés "
+                f"({self._total_bytes / (1024 * 1024):.1f} Mo / {self.max_bytes / (1024 * 1024):.0f} Mo)"
+            )
+
+    def _maybe_flush(self) -> None:
+        if self._dirty and time.time() - self._last_flush >= self.index_flush_interval_s:
+            self.flush_index()
+
+    def flush_index(self) -> bool:
+        """Réécrit l'index (remplacement atomique)"""
+        with self._lock:
+            state = {
+                'version': INDEX_VERSION,
+                'entries': {key: asdict(entry) for key, entry in self._entries.items()}
+            }
+            tmp_path = self.temp_path(".json")
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(state, f)
+                os.replace(tmp_path, self._index_path())
+            except OSError as e:
+                logger.warning(f"[ARTIFACTS] ⚠️ Index non écrit: {e}")
+                return False
+            self._dirty = False
+            self._last_flush = time.time()
+            return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Statistiques (occupation, épinglages, hits/misses, évictions)"""
+        with self._lock:
+            return {
+                'root_dir': self.root_dir,
+                'entries': len(self._entries),
+                'total_bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'pinned': len(self._pins),
+                **self.stats
+            }
+
+    def iter_entries(self, transform_prefix: Optional[str] = None) -> Iterator[ArtifactEntry]:
+        """Instantané des entrées (filtrées par préfixe de transformation)"""
+        with self._lock:
+            entries = list(self._entries.values())
+        for entry in entries:
+            if transform_prefix is None or entry.transform.startswith(transform_prefix):
+                yield entry
+
+
+_artifact_store: Optional[ArtifactStore] = None
+_artifact_store_lock = threading.Lock()
+
+
+def get_artifact_store() -> ArtifactStore:
+    """Retourne le magasin d'artefacts partagé (configuré par PerformanceConfig)"""
+    global _artifact_store
+    if _artifact_store is None:
+        with _artifact_store_lock:
+            if _artifact_store is None:
+                config = PerformanceConfig()
+                root_dir = config.artifact_store_dir or os.path.join(os.getenv("MODELS_PATH", "models"), "artifacts")
+                _artifact_store = ArtifactStore(
+                    root_dir,
+                    max_bytes=config.artifact_store_max_bytes,
+                    grace_s=config.artifact_store_grace_s
+                )
+                logger.info(
+                    f"📦 Magasin d'artefacts: {_artifact_store.root_dir} "
+                    f"(budget {_artifact_store.max_bytes / (1024 * 1024):.0f} Mo)"
+                )
+    return _artifact_store
@@ -12,17 +12,36 @@ soundfile (via libsndfile) ne supporte pas nativement :
 Ce module utilise pydub (via ffmpeg) pour la conversion.
 """
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import Optional
 
+from .artifact_store import get_artifact_store
+from .audio_hash import get_audio_hasher
+
 logger = logging.getLogger(__name__)
 
 # Formats audio supportés nativement par soundfile (libsndfile)
 SOUNDFILE_SUPPORTED_FORMATS = {'.wav', '.flac', '.ogg', '.aiff', '.aif', '.raw'}
 
-# Cache des conversions pour éviter les reconversions
-_conversion_cache: dict = {}
+# Transformation enregistrée dans le magasin d'artefacts (WAV 16-bit mono, fréquence d'origine)
+WAV_S16_MONO = "wav-s16-mono"
+
+
+def _export_wav(audio_path: str, wav_path: str) -> None:
+    """Décode `audio_path` avec pydub (ffmpeg) et l'écrit en WAV 16-bit mono"""
+    from pydub import AudioSegment as PydubAudioSegment
+
+    # Charger avec pydub (utilise ffmpeg en backend)
+    audio = PydubAudioSegment.from_file(audio_path)
+
+    # Exporter en WAV 16-bit, mono si stéréo
+    audio = audio.set_sample_width(2)  # 16-bit
+    if audio.channels > 1:
+        audio = audio.set_channels(1)  # Mono
+
+    audio.export(wav_path, format='wav')
 
 
 def convert_to_wav_if_needed(audio_path: str, cache: bool = True) -> str:
@@ -32,49 +51,67 @@ def convert_to_wav_if_needed(audio_path: str, cache: bool = True) -> str:
     soundfile/libsndfile ne supporte pas M4A, AAC, MP3 nativement.
     On utilise pydub (via ffmpeg) pour la conversion.
 
+    Avec `cache`, le WAV est rangé dans le magasin d'artefacts sous le hash
+    du contenu : un même audio (quel que soit son chemin) n'est converti
+    qu'une fois, et l'espace disque reste borné. Le chemin retourné doit
+    être épinglé (`get_artifact_store().pinned(wav_path)`) tant qu'il est lu.
+
+    Bloquant (hash + ffmpeg) : depuis une boucle asyncio, utiliser
+    convert_to_wav_if_needed_async.
+
     Args:
         audio_path: Chemin du fichier audio source
-        cache: Si True, utilise le cache pour éviter les reconversions
+        cache: Si True, utilise le magasin d'artefacts pour éviter les reconversions
 
     Returns:
         Chemin du fichier WAV (original si déjà supporté, sinon fichier converti)
     """
-    # Vérifier le cache
-    if cache and audio_path in _conversion_cache:
-        cached_path = _conversion_cache[audio_path]
-        if Path(cached_path).exists():
-            return cached_path
-
     ext = Path(audio_path).suffix.lower()
 
     # Si format déjà supporté, retourner tel quel
     if ext in SOUNDFILE_SUPPORTED_FORMATS:
         return audio_path
 
-    try:
-        from pydub import AudioSegment as PydubAudioSegment
+    audio_hash = get_audio_hasher().hash_file(audio_path) if cache else None
+    return _convert(audio_path, ext, audio_hash)
 
-        logger.info(f"[AUDIO_CONVERT] 🔄 Conversion {ext} → WAV: {Path(audio_path).name}")
 
-        # Charger avec pydub (utilise ffmpeg en backend)
-        audio = PydubAudioSegment.from_file(audio_path)
+async def convert_to_wav_if_needed_async(audio_path: str, cache: bool = True) -> str:
+    """
+    convert_to_wav_if_needed sans bloquer la boucle asyncio
+
+    Le hash et la conversion ffmpeg s'exécutent dans des threads de travail.
+    """
+    ext = Path(audio_path).suffix.lower()
+    if ext in SOUNDFILE_SUPPORTED_FORMATS:
+        return audio_path
 
-        # Créer un fichier WAV (même répertoire, suffixe _converted.wav)
-        wav_path = str(Path(audio_path).with_suffix('.converted.wav'))
+    audio_hash = await get_audio_hasher().hash_file_async(audio_path) if cache else None
+    return await asyncio.to_thread(_convert, audio_path, ext, audio_hash)
 
-        # Exporter en WAV 16-bit, mono si stéréo
-        audio = audio.set_sample_width(2)  # 16-bit
-        if audio.channels > 1:
-            audio = audio.set_channels(1)  # Mono
 
-        audio.export(wav_path, format='wav')
+def _convert(audio_path: str, ext: str, audio_hash: Optional[str]) -> str:
+    """Conversion WAV (bloquante) ; rangée dans le magasin sous `audio_hash` si fourni"""
+    try:
+        import pydub  # noqa: F401
 
-        logger.info(f"[AUDIO_CONVERT] ✅ Converti: {wav_path}")
+        if audio_hash is None:
+            # Créer un fichier WAV (même répertoire, suffixe _converted.wav)
+            wav_path = str(Path(audio_path).with_suffix('.converted.wav'))
+            logger.info(f"[AUDIO_CONVERT] 🔄 Conversion {ext} → WAV: {Path(audio_path).name}")
+            _export_wav(audio_path, wav_path)
+            logger.info(f"[AUDIO_CONVERT] ✅ Converti: {wav_path}")
+            return wav_path
 
-        # Mettre en cache
-        if cache:
-            _conversion_cache[audio_path] = wav_path
+        def produce(wav_path: str) -> None:
+            logger.info(f"[AUDIO_CONVERT] 🔄 Conversion {ext} → WAV: {Path(audio_path).name}")
+            _export_wav(audio_path, wav_path)
 
+        wav_path = get_artifact_store().get_or_create(audio_hash, WAV_S16_MONO, '.wav', produce)
+        if wav_path is None:
+            raise RuntimeError(f"Conversion {ext} → WAV vide: {audio_path}")
+
+        logger.info(f"[AUDIO_CONVERT] ✅ Converti: {wav_path}")
         return wav_path
 
     except ImportError:
@@ -85,11 +122,11 @@ def convert_to_wav_if_needed(audio_path: str, cache: bool = True) -> str:
         raise
 
 
-def clear_conversion_cache():
-    """Vide le cache des conversions."""
-    global _conversion_cache
-    _conversion_cache.clear()
-    logger.debug("[AUDIO_CONVERT] Cache vidé")
+def clear_conversion_cache() -> int:
+    """Supprime les conversions WAV du magasin d'artefacts (hors fichiers épinglés)."""
+    removed = get_artifact_store().evict_older_than(0, transform_prefix=WAV_S16_MONO)
+    logger.debug(f"[AUDIO_CONVERT] Cache vidé ({removed} conversions)")
+    return removed
 
 
 def get_supported_formats() -> set:
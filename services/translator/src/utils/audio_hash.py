@@ -0,0 +1,154 @@
+"""
+Hachage du contenu audio (clé de cache des transcriptions / audios traduits)
+Lecture du fichier par blocs dans un thread de travail, hachage direct en
+mémoire des frames ZMQ `_audioBinary` : la boucle asyncio (qui sert aussi
+les traductions texte ZMQ) n'est plus bloquée par un read() + SHA-256 de
+plusieurs Mo
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+from typing import Callable, Optional, Union
+
+from .performance import PerformanceConfig
+
+logger = logging.getLogger(__name__)
+
+# Hachages rapides non cryptographiques (optionnels)
+XXHASH_AVAILABLE = False
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    pass
+
+BLAKE3_AVAILABLE = False
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    pass
+
+# Longueur (hex) des clés de cache audio existantes (sha256 tronqué)
+AUDIO_HASH_CHARS = 32
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# En dessous, hacher sur la boucle coûte moins qu'un aller-retour vers un thread
+INLINE_HASH_MAX_BYTES = 256 * 1024
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+def _hasher_factory(algorithm: str) -> Callable[[], "hashlib._Hash"]:
+    """Constructeur d'objet de hachage incrémental (update/hexdigest)"""
+    if algorithm == 'sha256':
+        return hashlib.sha256
+    if algorithm == 'blake2b':
+        return lambda: hashlib.blake2b(digest_size=AUDIO_HASH_CHARS // 2)
+    if algorithm == 'xxh3':
+        return xxhash.xxh3_128
+    if algorithm == 'blake3':
+        return blake3.blake3
+    raise ValueError(f"Algorithme de hachage audio inconnu: {algorithm}")
+
+
+def resolve_algorithm(name: str) -> str:
+    """
+    Algorithme effectif : 'fast' → xxh3 > blake3 > blake2b selon les
+    bibliothèques installées ; xxh3/blake3 absents → blake2b (stdlib)
+    """
+    name = (name or 'sha256').lower()
+    if name == 'fast':
+        if XXHASH_AVAILABLE:
+            return 'xxh3'
+        if BLAKE3_AVAILABLE:
+            return 'blake3'
+        return 'blake2b'
+    if name == 'xxh3' and not XXHASH_AVAILABLE:
+        logger.warning("⚠️ xxhash non installé, blake2b utilisé pour le hash audio")
+        return 'blake2b'
+    if name == 'blake3' and not BLAKE3_AVAILABLE:
+        logger.warning("⚠️ blake3 non installé, blake2b utilisé pour le hash audio")
+        return 'blake2b'
+    if name not in ('sha256', 'blake2b', 'xxh3', 'blake3'):
+        logger.warning(f"⚠️ Algorithme de hash audio inconnu '{name}', sha256 utilisé")
+        return 'sha256'
+    return name
+
+
+class AudioHasher:
+    """
+    Hachage du contenu audio, synchrone ou délégué à un thread
+
+    - sha256 (défaut) : mêmes clés que les entrées de cache existantes
+    - blake2b / xxh3 / blake3 : plus rapides pour de simples clés de cache
+      (changer d'algorithme revient à repartir d'un cache audio froid)
+
+    Usage:
+        hasher = AudioHasher()
+        audio_hash = await hasher.hash_bytes_async(request_data['_audioBinary'])
+        audio_hash = await hasher.hash_file_async(audio_path)
+    """
+
+    def __init__(self, algorithm: str = 'sha256', chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialise le hacheur
+
+        Args:
+            algorithm: 'sha256', 'blake2b', 'xxh3', 'blake3' ou 'fast'
+            chunk_size: Taille des blocs lus sur disque (octets)
+        """
+        self.algorithm = resolve_algorithm(algorithm)
+        self.chunk_size = max(4096, chunk_size)
+        self._new = _hasher_factory(self.algorithm)
+
+    def hash_bytes(self, data: BytesLike) -> str:
+        """Hash d'un contenu en mémoire (frame ZMQ)"""
+        hasher = self._new()
+        hasher.update(data)
+        return hasher.hexdigest()[:AUDIO_HASH_CHARS]
+
+    def hash_file(self, path: str) -> str:
+        """Hash d'un fichier lu par blocs (mémoire constante)"""
+        hasher = self._new()
+        buffer = bytearray(self.chunk_size)
+        view = memoryview(buffer)
+        with open(path, 'rb', buffering=0) as f:
+            while True:
+                read = f.readinto(buffer)
+                if not read:
+                    break
+                hasher.update(view[:read])
+        return hasher.hexdigest()[:AUDIO_HASH_CHARS]
+
+    async def hash_bytes_async(self, data: BytesLike) -> str:
+        """Hash en mémoire ; délégué à un thread au-delà de INLINE_HASH_MAX_BYTES"""
+        if len(data) <= INLINE_HASH_MAX_BYTES:
+            return self.hash_bytes(data)
+        return await asyncio.to_thread(self.hash_bytes, data)
+
+    async def hash_file_async(self, path: str) -> str:
+        """Hash d'un fichier dans un thread de travail (ne bloque pas la boucle)"""
+        return await asyncio.to_thread(self.hash_file, path)
+
+
+_audio_hasher: Optional[AudioHasher] = None
+_audio_hasher_lock = threading.Lock()
+
+
+def get_audio_hasher() -> AudioHasher:
+    """Retourne le hacheur audio partagé (configuré par PerformanceConfig)"""
+    global _audio_hasher
+    if _audio_hasher is None:
+        with _audio_hasher_lock:
+            if _audio_hasher is None:
+                config = PerformanceConfig()
+                _audio_hasher = AudioHasher(
+                    algorithm=config.audio_hash_algorithm,
+                    chunk_size=config.audio_hash_chunk_size
+                )
+                logger.info(f"🔑 Hash audio: {_audio_hasher.algorithm} (blocs de {_audio_hasher.chunk_size}o)")
+    return _audio_hasher
@@ -0,0 +1,339 @@
+"""
+Codec versionné des valeurs de cache Redis (traductions, transcriptions, audio)
+Format binaire compact (msgpack ou JSON compact) compressé au-delà d'un seuil,
+marqué par un octet magique : les anciennes entrées JSON restent lisibles
+pendant la migration
+"""
+
+import json
+import logging
+import threading
+import zlib
+from typing import Any, Dict, Optional, Union
+
+from .performance import PerformanceConfig
+
+logger = logging.getLogger(__name__)
+
+# Dépendances optionnelles (fallback: JSON compact + zlib de la stdlib)
+MSGPACK_AVAILABLE = False
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    pass
+
+ZSTD_AVAILABLE = False
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    pass
+
+LZ4_AVAILABLE = False
+try:
+    import lz4.frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    pass
+
+# 0xC1 : octet jamais émis par msgpack et invalide en tête d'UTF-8 —
+# ne peut pas commencer une entrée JSON legacy
+MAGIC = 0xC1
+FORMAT_VERSION = 1
+HEADER_SIZE = 3  # MAGIC, version, flags
+
+SERIALIZER_JSON = 0
+SERIALIZER_MSGPACK = 1
+
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_ZSTD = 2
+COMPRESSION_LZ4 = 3
+
+_COMPRESSION_NAMES = {
+    'none': COMPRESSION_NONE,
+    'zlib': COMPRESSION_ZLIB,
+    'zstd': COMPRESSION_ZSTD,
+    'lz4': COMPRESSION_LZ4,
+}
+
+# Listes de dicts homogènes (segments, mots horodatés) stockées en colonnes:
+# les noms de champs ne sont écrits qu'une fois
+_COLUMNS_KEY = "\u0000c"
+_ROWS_KEY = "\u0000r"
+_MIN_COLUMNAR_ROWS = 2
+
+
+class CacheCodecError(ValueError):
+    """Entrée de cache illisible (format inconnu ou bibliothèque absente)"""
+
+
+def pack_columns(value: Any) -> Any:
+    """Convertit récursivement les listes de dicts de mêmes clés en colonnes"""
+    if isinstance(value, dict):
+        return {key: pack_columns(item) for key, item in value.items()}
+    if isinstance(value, list):
+        if (
+            len(value) >= _MIN_COLUMNAR_ROWS
+            and all(isinstance(row, dict) for row in value)
+            and all(isinstance(key, str) for key in value[0])
+        ):
+            columns = list(value[0])
+            if all(list(row) == columns for row in value[1:]):
+                return {
+                    _COLUMNS_KEY: columns,
+                    _ROWS_KEY: [[pack_columns(row[key]) for key in columns] for row in value]
+                }
+        return [pack_columns(item) for item in value]
+    return value
+
+
+def unpack_columns(value: Any) -> Any:
+    """Inverse de pack_columns"""
+    if isinstance(value, dict):
+        if _COLUMNS_KEY in value and _ROWS_KEY in value and len(value) == 2:
+            columns = value[_COLUMNS_KEY]
+            return [
+                {key: unpack_columns(item) for key, item in zip(columns, row)}
+                for row in value[_ROWS_KEY]
+            ]
+        return {key: unpack_columns(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [unpack_columns(item) for item in value]
+    return value
+
+
+def _resolve_compression(name: str) -> int:
+    """'auto' → meilleur algorithme installé (zstd > lz4 > zlib)"""
+    name = (name or 'auto').lower()
+    if name == 'auto':
+        if ZSTD_AVAILABLE:
+            return COMPRESSION_ZSTD
+        if LZ4_AVAILABLE:
+            return COMPRESSION_LZ4
+        return COMPRESSION_ZLIB
+
+    compression = _COMPRESSION_NAMES.get(name)
+    if compression is None:
+        logger.warning(f"⚠️ Compression de cache inconnue '{name}', zlib utilisé")
+        return COMPRESSION_ZLIB
+    if compression == COMPRESSION_ZSTD and not ZSTD_AVAILABLE:
+        logger.warning("⚠️ zstandard non installé, zlib utilisé pour le cache")
+        return COMPRESSION_ZLIB
+    if compression == COMPRESSION_LZ4 and not LZ4_AVAILABLE:
+        logger.warning("⚠️ lz4 non installé, zlib utilisé pour le cache")
+        return COMPRESSION_ZLIB
+    return compression
+
+
+class CacheCodec:
+    """
+    Sérialise les valeurs de cache en format binaire versionné
+
+    En-tête de 3 octets : MAGIC (0xC1), version, flags
+    (bits 0-1 : sérialiseur, bits 2-4 : compression). Une valeur sans
+    en-tête est une entrée JSON legacy et reste décodée telle quelle.
+
+    Exemples:
+        >>> codec = CacheCodec(compress_threshold=1024)
+        >>> codec.decode(codec.encode({"text": "Bonjour"}))
+        {'text': 'Bonjour'}
+        >>> codec.decode('{"text": "legacy"}')
+        {'text': 'legacy'}
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        compress_threshold: int = 1024,
+        compression: str = 'auto',
+        use_msgpack: Optional[bool] = None,
+        zstd_level: int = 3,
+        zlib_level: int = 6
+    ):
+        """
+        Initialise le codec
+
+        Args:
+            enabled: False = écrit du JSON legacy (lecture des deux formats)
+            compress_threshold: Taille sérialisée (octets) à partir de laquelle compresser
+            compression: 'auto', 'zstd', 'lz4', 'zlib' ou 'none'
+            use_msgpack: Force/interdit msgpack (None = si installé)
+            zstd_level: Niveau de compression zstd
+            zlib_level: Niveau de compression zlib
+        """
+        self.enabled = enabled
+        self.compress_threshold = max(0, compress_threshold)
+        self.compression = _resolve_compression(compression)
+        self.serializer = (
+            SERIALIZER_MSGPACK
+            if (MSGPACK_AVAILABLE if use_msgpack is None else use_msgpack and MSGPACK_AVAILABLE)
+            else SERIALIZER_JSON
+        )
+        self.zstd_level = zstd_level
+        self.zlib_level = zlib_level
+        self._local = threading.local()  # compresseurs zstd non thread-safe
+        self._stats_lock = threading.Lock()
+
+        self.stats = {
+            'encoded': 0, 'decoded': 0, 'legacy_decoded': 0, 'compressed': 0,
+            'errors': 0, 'raw_bytes': 0, 'stored_bytes': 0
+        }
+
+    # ─────────────────────────────────────────────────────────────────────
+    # API publique
+    # ─────────────────────────────────────────────────────────────────────
+
+    def encode(self, value: Any) -> Union[bytes, str]:
+        """
+        Encode une valeur pour Redis
+
+        Returns:
+            bytes (format binaire) ou str JSON si le codec est désactivé
+        """
+        if not self.enabled:
+            return json.dumps(value)
+
+        payload = self._serialize(pack_columns(value))
+        raw_size = len(payload)
+        compression = COMPRESSION_NONE
+        if self.compression != COMPRESSION_NONE and raw_size >= self.compress_threshold:
+            compressed = self._compress(payload, self.compression)
+            if len(compressed) < raw_size:
+                payload = compressed
+                compression = self.compression
+
+        flags = self.serializer | (compression << 2)
+        encoded = bytes((MAGIC, FORMAT_VERSION, flags)) + payload
+
+        with self._stats_lock:
+            self.stats['encoded'] += 1
+            self.stats['raw_bytes'] += raw_size
+            self.stats['stored_bytes'] += len(encoded)
+            if compression != COMPRESSION_NONE:
+                self.stats['compressed'] += 1
+        return encoded
+
+    def decode(self, data: Optional[Union[bytes, str]]) -> Optional[Any]:
+        """Décode une valeur Redis (binaire ou JSON legacy) ; None si absente ou illisible"""
+        if not data:
+            return None
+        try:
+            value = self.loads(data)
+        except Exception as e:  # zlib.error, ZstdError, msgpack, JSON...
+            with self._stats_lock:
+                self.stats['errors'] += 1
+            logger.debug(f"Entrée de cache illisible: {e}")
+            return None
+        return value
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Comme decode() mais lève une exception sur une entrée illisible"""
+        if isinstance(data, str):
+            self._count('legacy_decoded')
+            return json.loads(data)
+
+        data = bytes(data)
+        if data[0] != MAGIC:
+            self._count('legacy_decoded')
+            return json.loads(data)
+
+        if len(data) < HEADER_SIZE or data[1] != FORMAT_VERSION:
+            raise CacheCodecError(f"version de format inconnue: {data[1] if len(data) > 1 else None}")
+
+        flags = data[2]
+        serializer = flags & 0b11
+        compression = (flags >> 2) & 0b111
+        payload = self._decompress(data[HEADER_SIZE:], compression)
+        value = unpack_columns(self._deserialize(payload, serializer))
+        self._count('decoded')
+        return value
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Statistiques (volumes, taux de compression)"""
+        with self._stats_lock:
+            stats = dict(self.stats)
+        stats['compression_ratio'] = (
+            round(stats['stored_bytes'] / stats['raw_bytes'], 4) if stats['raw_bytes'] else 1.0
+        )
+        stats['serializer'] = 'msgpack' if self.serializer == SERIALIZER_MSGPACK else 'json'
+        stats['compression'] = {v: k for k, v in _COMPRESSION_NAMES.items()}[self.compression]
+        stats['compress_threshold'] = self.compress_threshold
+        stats['enabled'] = self.enabled
+        return stats
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Sérialisation / compression
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    def _serialize(self, value: Any) -> bytes:
+        if self.serializer == SERIALIZER_MSGPACK:
+            return msgpack.packb(value, use_bin_type=True)
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    @staticmethod
+    def _deserialize(payload: bytes, serializer: int) -> Any:
+        if serializer == SERIALIZER_JSON:
+            return json.loads(payload)
+        if serializer == SERIALIZER_MSGPACK:
+            if not MSGPACK_AVAILABLE:
+                raise CacheCodecError("entrée msgpack mais msgpack non installé")
+            return msgpack.unpackb(payload, raw=False)
+        raise CacheCodecError(f"sérialiseur inconnu: {serializer}")
+
+    def _compress(self, payload: bytes, compression: int) -> bytes:
+        if compression == COMPRESSION_ZSTD:
+            compressor = getattr(self._local, 'zstd', None)
+            if compressor is None:
+                compressor = self._local.zstd = zstandard.ZstdCompressor(level=self.zstd_level)
+            return compressor.compress(payload)
+        if compression == COMPRESSION_LZ4:
+            return lz4.frame.compress(payload)
+        return zlib.compress(payload, self.zlib_level)
+
+    def _decompress(self, payload: bytes, compression: int) -> bytes:
+        if compression == COMPRESSION_NONE:
+            return payload
+        if compression == COMPRESSION_ZLIB:
+            return zlib.decompress(payload)
+        if compression == COMPRESSION_ZSTD:
+            if not ZSTD_AVAILABLE:
+                raise CacheCodecError("entrée zstd mais zstandard non installé")
+            decompressor = getattr(self._local, 'zstd_d', None)
+            if decompressor is None:
+                decompressor = self._local.zstd_d = zstandard.ZstdDecompressor()
+            return decompressor.decompress(payload)
+        if compression == COMPRESSION_LZ4:
+            if not LZ4_AVAILABLE:
+                raise CacheCodecError("entrée lz4 mais lz4 non installé")
+            return lz4.frame.decompress(payload)
+        raise CacheCodecError(f"compression inconnue: {compression}")
+
+
+_cache_codec: Optional[CacheCodec] = None
+_cache_codec_lock = threading.Lock()
+
+
+def get_cache_codec() -> CacheCodec:
+    """Retourne le codec partagé des caches Redis (configuré par PerformanceConfig)"""
+    global _cache_codec
+    if _cache_codec is None:
+        with _cache_codec_lock:
+            if _cache_codec is None:
+                config = PerformanceConfig()
+                _cache_codec = CacheCodec(
+                    enabled=config.cache_codec_enabled,
+                    compress_threshold=config.cache_compress_threshold,
+                    compression=config.cache_compression
+                )
+                stats = _cache_codec.get_stats()
+                logger.info(
+                    f"📦 Codec de cache: {stats['serializer']}, compression={stats['compression']} "
+                    f"(seuil={stats['compress_threshold']}o, actif={stats['enabled']})"
+                )
+    return _cache_codec
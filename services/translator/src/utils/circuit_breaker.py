@@ -0,0 +1,137 @@
+"""
+Disjoncteur (circuit breaker) à état semi-ouvert pour les dépendances réseau
+Après N échecs consécutifs, les appels sont court-circuités pendant un délai
+(doublé à chaque sonde ratée, plafonné) au lieu d'attendre un timeout chacun ;
+une seule sonde passe ensuite pour décider de refermer ou de rouvrir.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Disjoncteur fermé → ouvert → semi-ouvert, thread-safe
+
+    - closed: tout passe ; `failure_threshold` échecs consécutifs l'ouvrent
+    - open: tout est refusé jusqu'à l'échéance du délai de réarmement
+    - half_open: une seule sonde autorisée ; succès → closed (délai remis à
+      `reset_timeout_s`), échec → open avec un délai doublé (≤ `max_reset_timeout_s`)
+
+    Usage:
+        breaker = CircuitBreaker("redis", failure_threshold=3)
+        if breaker.allow_request():
+            try:
+                await call()
+                breaker.record_success()
+            except ConnectionError:
+                breaker.record_failure()
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        reset_timeout_s: float = 1.0,
+        max_reset_timeout_s: float = 30.0
+    ):
+        """
+        Initialise le disjoncteur
+
+        Args:
+            name: Nom (logs et statistiques)
+            failure_threshold: Échecs consécutifs avant ouverture
+            reset_timeout_s: Délai initial avant la première sonde
+            max_reset_timeout_s: Plafond du délai (backoff exponentiel)
+        """
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout_s = max(0.0, reset_timeout_s)
+        self.max_reset_timeout_s = max(self.reset_timeout_s, max_reset_timeout_s)
+
+        self._state = CLOSED
+        self._failures = 0
+        self._current_timeout = self.reset_timeout_s
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+        self.stats = {'opened': 0, 'closed': 0, 'rejected': 0, 'probes': 0}
+
+    @property
+    def state(self) -> str:
+        """État courant ('closed', 'open' ou 'half_open')"""
+        return self._state
+
+    def allow_request(self) -> bool:
+        """
+        Autorise ou non un appel
+
+        En état ouvert, le premier appel après l'échéance devient la sonde
+        semi-ouverte ; les autres restent refusés jusqu'à son résultat.
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self._current_timeout:
+                self._state = HALF_OPEN
+                self.stats['probes'] += 1
+                return True
+            self.stats['rejected'] += 1
+            return False
+
+    def time_until_retry(self) -> float:
+        """Secondes avant qu'une sonde soit autorisée (0 si fermé ou échu)"""
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self._current_timeout - time.monotonic())
+
+    def record_success(self) -> None:
+        """Appel réussi: remet le compteur à zéro et referme le circuit"""
+        with self._lock:
+            self._failures = 0
+            if self._state != CLOSED:
+                self._state = CLOSED
+                self._current_timeout = self.reset_timeout_s
+                self.stats['closed'] += 1
+                logger.info(f"[{self.name}] ✅ Circuit refermé")
+
+    def record_failure(self) -> None:
+        """Appel échoué: ouvre le circuit au seuil, ou rouvre après une sonde ratée"""
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN:
+                self._current_timeout = min(self._current_timeout * 2, self.max_reset_timeout_s)
+                self._open()
+            elif self._state == CLOSED and self._failures >= self.failure_threshold:
+                self._open()
+
+    def trip(self) -> None:
+        """Ouvre le circuit immédiatement (dépendance injoignable au démarrage)"""
+        with self._lock:
+            if self._state != OPEN:
+                self._open()
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = time.monotonic()
+        self.stats['opened'] += 1
+        logger.warning(f"[{self.name}] ⚠️ Circuit ouvert ({self._failures} échecs, sonde dans {self._current_timeout:.1f}s)")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Statistiques (état, échecs consécutifs, délai courant, compteurs)"""
+        with self._lock:
+            return {
+                'state': self._state,
+                'consecutive_failures': self._failures,
+                'reset_timeout_s': self._current_timeout,
+                **self.stats
+            }
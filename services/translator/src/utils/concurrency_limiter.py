@@ -0,0 +1,262 @@
+"""
+Limiteur de concurrence adaptatif (gradient, à la TCP Vegas)
+La limite d'appels simultanés suit la latence mesurée : tant que la latence
+courte reste proche de la latence de référence, la limite croît (marge
+√limite) ; quand la file s'installe devant le moteur, la latence monte et la
+limite redescend. Un timeout la réduit multiplicativement. Les appelants
+au-delà de la limite attendent un jeton, au plus jusqu'à leur échéance.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ConcurrencyLimitExceeded(RuntimeError):
+    """Aucun jeton obtenu avant l'échéance de l'appelant"""
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limite de concurrence pilotée par la latence (asyncio, une boucle)
+
+    - Échantillon: durée de l'appel divisée par son coût (ex: budget
+      d'inférence proportionnel à la longueur du texte), pour comparer des
+      appels de tailles différentes
+    - rtt_long: moyenne exponentielle lente (référence sans file)
+    - gradient = clamp(tolerance × rtt_long / rtt, 0.5, 1) ; nouvelle limite
+      = limite × gradient + √limite, lissée par `smoothing`
+    - Limite non augmentée si moins de la moitié des jetons sont utilisés
+    - Timeout: limite × `backoff`
+
+    Usage:
+        limiter = AdaptiveConcurrencyLimiter("inference", initial_limit=4, max_limit=32)
+        async with limiter.slot(cost=2.0, timeout=remaining_s):
+            await engine_call()
+        # Appel exécuté dans un executor: jeton tenu jusqu'à sa fin réelle
+        await limiter.run(engine_call, cost=2.0, timeout=45.0, wait_timeout=remaining_s)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        smoothing: float = 0.2,
+        tolerance: float = 1.5,
+        backoff: float = 0.9,
+        long_window: int = 100
+    ):
+        """
+        Initialise le limiteur
+
+        Args:
+            name: Nom (logs et statistiques)
+            initial_limit: Limite de départ
+            min_limit: Plancher de la limite
+            max_limit: Plafond de la limite
+            smoothing: Poids d'une nouvelle estimation (0-1)
+            tolerance: Hausse de latence tolérée avant de réduire (1.5 = +50 %)
+            backoff: Facteur appliqué à la limite sur timeout
+            long_window: Échantillons de la moyenne lente (rtt_long)
+        """
+        self.name = name
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.smoothing = min(1.0, max(0.01, smoothing))
+        self.tolerance = max(1.0, tolerance)
+        self.backoff = min(1.0, max(0.1, backoff))
+        self._long_alpha = 2.0 / (max(1, long_window) + 1)
+
+        self._limit = float(min(self.max_limit, max(self.min_limit, initial_limit)))
+        self._inflight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._rtt_long: Optional[float] = None
+        self._rtt_last: Optional[float] = None
+
+        self.stats = {'acquired': 0, 'waited': 0, 'rejected': 0, 'dropped': 0, 'samples': 0}
+
+    @property
+    def limit(self) -> int:
+        """Nombre de jetons courant"""
+        return max(self.min_limit, int(self._limit))
+
+    @property
+    def inflight(self) -> int:
+        """Appels en cours"""
+        return self._inflight
+
+    async def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Obtient un jeton, en attendant au plus `timeout` secondes (None = sans borne)
+
+        Returns:
+            True si le jeton est obtenu, False si refusé (échéance atteinte)
+        """
+        if not self._waiters and self._inflight < self.limit:
+            self._inflight += 1
+            self.stats['acquired'] += 1
+            return True
+
+        if timeout is not None and timeout <= 0:
+            self.stats['rejected'] += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.stats['waited'] += 1
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            # Jeton transmis juste avant l'échéance: il est acquis
+            if waiter.done() and not waiter.cancelled():
+                return True
+            self.stats['rejected'] += 1
+            return False
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+        return True
+
+    def release(self, rtt: Optional[float] = None, inflight: Optional[int] = None, dropped: bool = False):
+        """
+        Rend un jeton et ajuste la limite
+
+        Args:
+            rtt: Latence normalisée de l'appel (None = pas d'échantillon)
+            inflight: Appels en cours au démarrage de l'appel
+            dropped: L'appel a expiré (réduction multiplicative)
+        """
+        self._inflight = max(0, self._inflight - 1)
+        if dropped:
+            self.stats['dropped'] += 1
+            self._limit = max(float(self.min_limit), self._limit * self.backoff)
+        elif rtt is not None and rtt > 0:
+            self._on_sample(rtt, self._inflight + 1 if inflight is None else inflight)
+        self._wake()
+
+    def _on_sample(self, rtt: float, inflight: int):
+        self.stats['samples'] += 1
+        self._rtt_last = rtt
+        if self._rtt_long is None:
+            self._rtt_long = rtt
+            return
+        self._rtt_long += self._long_alpha * (rtt - self._rtt_long)
+        # Après une longue surcharge, la référence dérive: la ramener vers le présent
+        if self._rtt_long / rtt > 2.0:
+            self._rtt_long *= 0.95
+
+        # Sous-utilisé: la latence ne dit rien de la capacité, pas de hausse
+        if inflight < self._limit / 2:
+            return
+
+        gradient = max(0.5, min(1.0, self.tolerance * self._rtt_long / rtt))
+        target = self._limit * gradient + math.sqrt(self._limit)
+        limit = self._limit * (1 - self.smoothing) + target * self.smoothing
+        self._limit = float(min(self.max_limit, max(self.min_limit, limit)))
+
+    def _wake(self):
+        while self._waiters and self._inflight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self._inflight += 1
+            self.stats['acquired'] += 1
+            waiter.set_result(True)
+
+    @asynccontextmanager
+    async def slot(self, cost: float = 1.0, timeout: Optional[float] = None) -> AsyncIterator[None]:
+        """
+        Exécute un appel sous jeton ; échantillonne sa latence / `cost`
+
+        Raises:
+            ConcurrencyLimitExceeded: Aucun jeton avant `timeout`
+        """
+        if not await self.acquire(timeout):
+            raise ConcurrencyLimitExceeded(
+                f"{self.name}: limite {self.limit} atteinte ({len(self._waiters)} en attente)"
+            )
+        inflight = self._inflight
+        start = time.monotonic()
+        try:
+            yield
+        except asyncio.TimeoutError:
+            self.release(dropped=True)
+            raise
+        except BaseException:
+            # Échec hors latence (erreur moteur, annulation): pas d'échantillon
+            self.release()
+            raise
+        else:
+            self.release(rtt=(time.monotonic() - start) / max(cost, 1e-6), inflight=inflight)
+
+    async def run(
+        self,
+        call: Callable[[], Awaitable[Any]],
+        cost: float = 1.0,
+        timeout: Optional[float] = None,
+        wait_timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Exécute `call()` sous jeton, borné par `timeout`
+
+        Contrairement à slot() + wait_for, un timeout (ou l'annulation de
+        l'appelant) n'abandonne que l'attente du résultat : l'appel continue
+        (un thread d'executor ne s'interrompt pas) et le jeton n'est rendu
+        qu'à sa fin réelle. La limite compte ainsi le travail effectivement
+        en cours sur le moteur.
+
+        Raises:
+            ConcurrencyLimitExceeded: Aucun jeton avant `wait_timeout`
+            asyncio.TimeoutError: Résultat non disponible avant `timeout`
+        """
+        if not await self.acquire(wait_timeout):
+            raise ConcurrencyLimitExceeded(
+                f"{self.name}: limite {self.limit} atteinte ({len(self._waiters)} en attente)"
+            )
+        inflight = self._inflight
+        start = time.monotonic()
+        abandoned = False
+        try:
+            work = asyncio.ensure_future(call())
+        except BaseException:
+            self.release()
+            raise
+
+        def _release(done: asyncio.Future) -> None:
+            failed = done.cancelled() or done.exception() is not None
+            if abandoned:
+                self.release(dropped=True)
+            elif failed:
+                self.release()
+            else:
+                self.release(rtt=(time.monotonic() - start) / max(cost, 1e-6), inflight=inflight)
+
+        work.add_done_callback(_release)
+        try:
+            return await asyncio.wait_for(asyncio.shield(work), timeout)
+        except asyncio.TimeoutError:
+            abandoned = True
+            raise
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Limite, jetons utilisés, estimations de latence et compteurs"""
+        return {
+            'name': self.name,
+            'limit': self.limit,
+            'inflight': self._inflight,
+            'waiting': sum(1 for waiter in self._waiters if not waiter.done()),
+            'min_limit': self.min_limit,
+            'max_limit': self.max_limit,
+            'rtt_long_ms': round(self._rtt_long * 1000, 1) if self._rtt_long is not None else None,
+            'rtt_last_ms': round(self._rtt_last * 1000, 1) if self._rtt_last is not None else None,
+            **self.stats
+        }
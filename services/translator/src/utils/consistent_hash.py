@@ -0,0 +1,91 @@
+"""
+Anneau de hachage cohérent à nœuds virtuels (répartition de clés entre nœuds)
+Chaque nœud occupe `vnodes` points de l'anneau ; une clé appartient au premier
+point qui suit son hash. Ajouter ou retirer un nœud ne déplace qu'environ 1/N
+des clés, et les nœuds virtuels lissent la charge entre nœuds.
+"""
+
+import bisect
+import hashlib
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def _hash(value: str) -> int:
+    """Hash 64 bits stable entre processus (contrairement à hash())"""
+    return int.from_bytes(hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+class HashRing:
+    """
+    Anneau de hachage cohérent, thread-safe
+
+    Usage:
+        ring = HashRing(["redis://a:6379", "redis://b:6379"], vnodes=160)
+        node = ring.get_node("translation:text:abc")
+        for node, indices in ring.group_by_node(keys).items():
+            ...
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), vnodes: int = 160):
+        """
+        Initialise l'anneau
+
+        Args:
+            nodes: Identifiants des nœuds (ex: URLs Redis)
+            vnodes: Points par nœud sur l'anneau
+        """
+        self.vnodes = max(1, vnodes)
+        self._points: List[int] = []
+        self._owners: List[str] = []
+        self._nodes: List[str] = []
+        self._lock = threading.Lock()
+        for node in nodes:
+            self.add_node(node)
+
+    @property
+    def nodes(self) -> List[str]:
+        """Nœuds de l'anneau (ordre d'ajout)"""
+        return list(self._nodes)
+
+    def add_node(self, node: str) -> None:
+        """Ajoute un nœud (sans effet s'il est déjà présent)"""
+        with self._lock:
+            if node in self._nodes:
+                return
+            self._nodes.append(node)
+            self._rebuild()
+
+    def remove_node(self, node: str) -> None:
+        """Retire un nœud ; ses clés passent aux nœuds suivants de l'anneau"""
+        with self._lock:
+            if node not in self._nodes:
+                return
+            self._nodes.remove(node)
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        points: List[Tuple[int, str]] = sorted(
+            (_hash(f"{node}#{i}"), node)
+            for node in self._nodes
+            for i in range(self.vnodes)
+        )
+        self._points = [point for point, _ in points]
+        self._owners = [owner for _, owner in points]
+
+    def get_node(self, key: str) -> Optional[str]:
+        """Nœud propriétaire de `key` (None si l'anneau est vide)"""
+        points, owners = self._points, self._owners
+        if not points:
+            return None
+        index = bisect.bisect(points, _hash(key))
+        return owners[index % len(owners)]
+
+    def group_by_node(self, keys: List[str]) -> Dict[str, List[int]]:
+        """Indices de `keys` regroupés par nœud propriétaire (ordre conservé)"""
+        groups: Dict[str, List[int]] = {}
+        for index, key in enumerate(keys):
+            node = self.get_node(key)
+            if node is not None:
+                groups.setdefault(node, []).append(index)
+        return groups
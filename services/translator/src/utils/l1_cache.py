@@ -0,0 +1,339 @@
+"""
+Cache L1 en mémoire (W-TinyLFU borné en octets) devant Redis
+Les entrées chaudes (salutations, messages système, grands salons) sont
+servies sans aller-retour réseau ni json.loads
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from .performance import PerformanceConfig
+
+logger = logging.getLogger(__name__)
+
+# Coût fixe estimé d'une entrée (dict, clé, nœud OrderedDict)
+ENTRY_OVERHEAD_BYTES = 200
+
+_SKETCH_SEEDS = (0x9E3779B1, 0x85EBCA77, 0xC2B2AE3D, 0x27D4EB2F)
+_SKETCH_MAX = 15  # compteurs 4 bits
+
+
+class FrequencySketch:
+    """
+    Count-Min Sketch à compteurs saturés (4 bits) avec vieillissement
+
+    Estime la fréquence d'accès récente d'une clé en mémoire constante :
+    tous les `sample_size` incréments, les compteurs sont divisés par deux
+    pour que les anciennes popularités s'effacent.
+    """
+
+    def __init__(self, width: int, sample_size: int):
+        width = max(64, width)
+        self.width = 1 << (width - 1).bit_length()  # puissance de 2
+        self._mask = self.width - 1
+        self._rows = [bytearray(self.width) for _ in _SKETCH_SEEDS]
+        self.sample_size = max(1, sample_size)
+        self._additions = 0
+
+    def _indexes(self, key: Hashable):
+        h = hash(key)
+        for seed in _SKETCH_SEEDS:
+            yield (((h ^ seed) * 0x9E3779B97F4A7C15) >> 17) & self._mask
+
+    def increment(self, key: Hashable) -> None:
+        for row, index in zip(self._rows, self._indexes(key)):
+            if row[index] < _SKETCH_MAX:
+                row[index] += 1
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            self._reset()
+
+    def frequency(self, key: Hashable) -> int:
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+
+    def _reset(self) -> None:
+        self._rows = [bytearray(count >> 1 for count in row) for row in self._rows]
+        self._additions //= 2
+
+
+def estimate_size(key: Any, value: Any) -> int:
+    """Taille approximative (octets) d'une entrée clé → dict de chaînes"""
+    size = ENTRY_OVERHEAD_BYTES + len(str(key).encode('utf-8'))
+    if isinstance(value, dict):
+        for item in value.values():
+            if isinstance(item, str):
+                size += len(item.encode('utf-8'))
+            else:
+                size += 16
+    elif isinstance(value, (str, bytes)):
+        size += len(value)
+    return size
+
+
+# (valeur, taille en octets, expiration monotonic)
+_Entry = Tuple[Any, int, float]
+
+
+class TinyLFUCache:
+    """
+    Cache W-TinyLFU thread-safe borné en octets
+
+    - Fenêtre LRU (≈1% du budget) : absorbe les rafales de nouvelles clés
+    - Segment principal SLRU (probation 20% / protégé 80%)
+    - Admission TinyLFU : une clé sortant de la fenêtre n'entre dans le
+      segment principal que si elle est plus fréquente (sketch) que la
+      victime qu'elle évincerait — un balayage de clés uniques ne chasse
+      pas les entrées chaudes.
+
+    Exemples:
+        >>> cache = TinyLFUCache(max_bytes=1 << 20)
+        >>> cache.put("k", {"translated_text": "Hello"})
+        True
+        >>> cache.get("k")["translated_text"]
+        'Hello'
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttl_s: float = 0.0,
+        window_ratio: float = 0.01,
+        protected_ratio: float = 0.8,
+        weigher: Callable[[Any, Any], int] = estimate_size
+    ):
+        """
+        Initialise le cache
+
+        Args:
+            max_bytes: Budget mémoire total (octets)
+            ttl_s: Durée de vie d'une entrée (0 = illimitée)
+            window_ratio: Part du budget pour la fenêtre d'admission
+            protected_ratio: Part du segment principal réservée aux entrées protégées
+            weigher: Calcul de la taille d'une entrée
+        """
+        self.max_bytes = max(1024, int(max_bytes))
+        self.ttl_s = ttl_s
+        self.weigher = weigher
+
+        self.window_max = max(1, int(self.max_bytes * window_ratio))
+        self.main_max = self.max_bytes - self.window_max
+        self.protected_max = int(self.main_max * protected_ratio)
+
+        self._window: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._probation: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._protected: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._window_bytes = 0
+        self._probation_bytes = 0
+        self._protected_bytes = 0
+
+        # ~1 compteur par entrée attendue (entrée moyenne ≈ 512 octets)
+        expected_entries = max(1024, self.max_bytes // 512)
+        self._sketch = FrequencySketch(expected_entries, sample_size=10 * expected_entries)
+        self._lock = threading.Lock()
+
+        self.stats = {
+            'hits': 0, 'misses': 0, 'evictions': 0, 'rejections': 0, 'expired': 0, 'puts': 0
+        }
+
+    # ─────────────────────────────────────────────────────────────────────
+    # API publique
+    # ─────────────────────────────────────────────────────────────────────
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Valeur en cache ou None (compte l'accès dans le sketch)"""
+        with self._lock:
+            self._sketch.increment(key)
+            segment = self._segment_of(key)
+            if segment is None:
+                self.stats['misses'] += 1
+                return None
+
+            value, size, expires_at = segment[key]
+            if expires_at and expires_at <= time.monotonic():
+                self._remove(key, segment)
+                self.stats['expired'] += 1
+                self.stats['misses'] += 1
+                return None
+
+            if segment is self._window or segment is self._protected:
+                segment.move_to_end(key)
+            else:
+                # Deuxième accès en probation → protégé
+                del self._probation[key]
+                self._probation_bytes -= size
+                self._protected[key] = (value, size, expires_at)
+                self._protected_bytes += size
+                self._demote_protected()
+
+            self.stats['hits'] += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> bool:
+        """
+        Insère ou remplace une entrée
+
+        Returns:
+            False si l'entrée dépasse à elle seule le budget du segment principal
+        """
+        size = self.weigher(key, value)
+        if size > self.main_max:
+            return False
+
+        expires_at = time.monotonic() + self.ttl_s if self.ttl_s > 0 else 0.0
+        with self._lock:
+            self.stats['puts'] += 1
+            segment = self._segment_of(key)
+            if segment is not None:
+                # Mise à jour en place (même segment)
+                self._remove(key, segment)
+                segment[key] = (value, size, expires_at)
+                self._add_bytes(segment, size)
+                self._demote_protected()
+                self._evict_main()
+                return True
+
+            self._window[key] = (value, size, expires_at)
+            self._window_bytes += size
+            self._drain_window()
+            return True
+
+    def invalidate(self, key: Hashable) -> None:
+        """Supprime une entrée"""
+        with self._lock:
+            segment = self._segment_of(key)
+            if segment is not None:
+                self._remove(key, segment)
+
+    def clear(self) -> None:
+        """Vide le cache (le sketch de fréquences est conservé)"""
+        with self._lock:
+            self._window.clear()
+            self._probation.clear()
+            self._protected.clear()
+            self._window_bytes = self._probation_bytes = self._protected_bytes = 0
+
+    def hot_keys(self, n: int) -> List[Hashable]:
+        """Les N clés en cache les plus fréquentes (sketch), pour le préchauffage"""
+        with self._lock:
+            keys = [*self._protected, *self._probation, *self._window]
+            keys.sort(key=self._sketch.frequency, reverse=True)
+            return keys[:n]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Statistiques (hit/miss/évictions, occupation mémoire)"""
+        with self._lock:
+            lookups = self.stats['hits'] + self.stats['misses']
+            return {
+                **self.stats,
+                'hit_rate': round(self.stats['hits'] / lookups, 4) if lookups else 0.0,
+                'entries': len(self._window) + len(self._probation) + len(self._protected),
+                'bytes': self._window_bytes + self._probation_bytes + self._protected_bytes,
+                'max_bytes': self.max_bytes,
+                'window_entries': len(self._window),
+                'probation_entries': len(self._probation),
+                'protected_entries': len(self._protected),
+                'ttl_s': self.ttl_s
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._window) + len(self._probation) + len(self._protected)
+
+    # ─────────────────────────────────────────────────────────────────────
+    # Mécanique W-TinyLFU (appelée sous verrou)
+    # ─────────────────────────────────────────────────────────────────────
+
+    def _segment_of(self, key: Hashable) -> Optional["OrderedDict[Hashable, _Entry]"]:
+        for segment in (self._window, self._probation, self._protected):
+            if key in segment:
+                return segment
+        return None
+
+    def _add_bytes(self, segment, size: int) -> None:
+        if segment is self._window:
+            self._window_bytes += size
+        elif segment is self._probation:
+            self._probation_bytes += size
+        else:
+            self._protected_bytes += size
+
+    def _remove(self, key: Hashable, segment) -> None:
+        _, size, _ = segment.pop(key)
+        self._add_bytes(segment, -size)
+
+    def _demote_protected(self) -> None:
+        """Protégé plein → ses plus anciennes entrées repassent en probation"""
+        while self._protected_bytes > self.protected_max and self._protected:
+            key, entry = self._protected.popitem(last=False)
+            self._protected_bytes -= entry[1]
+            self._probation[key] = entry
+            self._probation_bytes += entry[1]
+
+    def _evict_main(self) -> None:
+        """Segment principal au-delà du budget → éviction LRU de la probation"""
+        while self._probation_bytes + self._protected_bytes > self.main_max:
+            segment = self._probation if self._probation else self._protected
+            key, entry = segment.popitem(last=False)
+            self._add_bytes(segment, -entry[1])
+            self.stats['evictions'] += 1
+
+    def _drain_window(self) -> None:
+        """Fenêtre pleine → chaque candidat sortant passe le filtre d'admission"""
+        while self._window_bytes > self.window_max and self._window:
+            key, entry = self._window.popitem(last=False)
+            self._window_bytes -= entry[1]
+            self._admit(key, entry)
+
+    def _admit(self, key: Hashable, entry: _Entry) -> None:
+        size = entry[1]
+        candidate_freq = self._sketch.frequency(key)
+        victims = []
+        freed = 0
+        free = self.main_max - self._probation_bytes - self._protected_bytes
+
+        # Victimes potentielles dans l'ordre LRU: probation puis protégé
+        if free < size:
+            for segment in (self._probation, self._protected):
+                for victim_key, victim_entry in segment.items():
+                    if candidate_freq <= self._sketch.frequency(victim_key):
+                        self.stats['rejections'] += 1
+                        return
+                    victims.append((segment, victim_key))
+                    freed += victim_entry[1]
+                    if free + freed >= size:
+                        break
+                if free + freed >= size:
+                    break
+
+        for segment, victim_key in victims:
+            self._remove(victim_key, segment)
+            self.stats['evictions'] += 1
+
+        self._probation[key] = entry
+        self._probation_bytes += size
+
+
+_l1_cache: Optional[TinyLFUCache] = None
+_l1_cache_lock = threading.Lock()
+
+
+def get_l1_translation_cache() -> Optional[TinyLFUCache]:
+    """Retourne le cache L1 des traductions (None si TRANSLATOR_L1_CACHE=false)"""
+    global _l1_cache
+    if _l1_cache is None:
+        config = PerformanceConfig()
+        if not config.enable_l1_cache:
+            return None
+        with _l1_cache_lock:
+            if _l1_cache is None:
+                _l1_cache = TinyLFUCache(
+                    max_bytes=config.l1_cache_max_bytes,
+                    ttl_s=config.l1_cache_ttl_s
+                )
+                logger.info(
+                    f"🧊 Cache L1 initialisé (max_bytes={_l1_cache.max_bytes}, ttl={_l1_cache.ttl_s}s)"
+                )
+    return _l1_cache
@@ -39,22 +39,151 @@ class PerformanceConfig:
     batch_size: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_BATCH_SIZE", "8")))
     batch_timeout_ms: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_BATCH_TIMEOUT_MS", "50")))
     max_batch_tokens: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_MAX_BATCH_TOKENS", "4096")))
+    # Tokenizer output (token ids) LRU shared by batch planning, Seq2SeqTranslator and fallbacks
+    token_cache_size: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_TOKEN_CACHE_SIZE", "4096")))
+
+    # Continuous micro-batching (one inference scheduler per loaded model)
+    enable_micro_batching: bool = field(default_factory=lambda: os.getenv("TRANSLATOR_MICRO_BATCHING", "true").lower() == "true")
+    micro_batch_window_ms: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_MICRO_BATCH_WINDOW_MS", "5")))
+    micro_batch_max_size: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_MICRO_BATCH_MAX_SIZE", "16")))
 
     # Priority queue settings
     enable_priority_queue: bool = field(default_factory=lambda: os.getenv("TRANSLATOR_PRIORITY_QUEUE", "true").lower() == "true")
     short_text_threshold: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_SHORT_TEXT_THRESHOLD", "100")))
     medium_text_threshold: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_MEDIUM_TEXT_THRESHOLD", "500")))
 
+    # Short chat message fast path ("ok", "merci", "à demain")
+    # Phrase table: exact-match translations promoted from repeated cache hits
+    enable_phrase_table: bool = field(default_factory=lambda: os.getenv("TRANSLATOR_PHRASE_TABLE", "true").lower() == "true")
+    phrase_table_size: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_PHRASE_TABLE_SIZE", "10000")))
+    phrase_table_min_hits: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_PHRASE_TABLE_MIN_HITS", "3")))
+    short_message_max_chars: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_SHORT_MESSAGE_MAX_CHARS", "30")))
+    # Generation budget proportional to input length: max_new_tokens = floor + ratio * input_tokens
+    max_new_tokens_ratio: float = field(default_factory=lambda: float(os.getenv("TRANSLATOR_MAX_NEW_TOKENS_RATIO", "2.0")))
+    max_new_tokens_floor: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_MAX_NEW_TOKENS_FLOOR", "16")))
+
     # PyTorch optimization settings
     # Note: torch.compile on CPU can be slow - disabled by default for CPU-only
     enable_torch_compile: bool = field(default_factory=lambda: os.getenv("TRANSLATOR_TORCH_COMPILE", "false").lower() == "true")
     torch_compile_mode: str = field(default_factory=lambda: os.getenv("TRANSLATOR_COMPILE_MODE", "default"))
     enable_cudnn_benchmark: bool = field(default_factory=lambda: os.getenv("TRANSLATOR_CUDNN_BENCHMARK", "true").lower() == "true")
 
+    # CPU inference backend for NLLB models: "torch" (float32), "int8" (dynamic
+    # quantization of Linear layers) or "onnx" (ONNX Runtime with KV-cache)
+    inference_backend: str = field(default_factory=lambda: os.getenv("TRANSLATOR_INFERENCE_BACKEND", "torch").lower())
+
+    # Single-flight: identical concurrent translations share one computation;
+    # failing results are remembered briefly (negative cache, 0 = disabled)
+    enable_single_flight: bool = field(default_factory=lambda: os.getenv("TRANSLATOR_SINGLE_FLIGHT", "true").lower() == "true")
+    negative_cache_ttl_s: float = field(default_factory=lambda: float(os.getenv("TRANSLATOR_NEGATIVE_CACHE_TTL", "30")))
+
+    # In-process L1 translation cache in front of Redis (W-TinyLFU, bounded in bytes)
+    enable_l1_cache: bool = field(default_factory=lambda: os.getenv("TRANSLATOR_L1_CACHE", "true").lower() == "true")
+    l1_cache_max_bytes: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_L1_CACHE_MAX_BYTES", str(64 * 1024 * 1024))))
+    l1_cache_ttl_s: float = field(default_factory=lambda: float(os.getenv("TRANSLATOR_L1_CACHE_TTL", "3600")))
+
+    # Redis cache payload codec: versioned binary format (msgpack when installed, compact JSON
+    # otherwise), compressed above a size threshold; "false" keeps writing legacy JSON strings
+    cache_codec_enabled: bool = field(default_factory=lambda: os.getenv("TRANSLATOR_CACHE_CODEC", "true").lower() == "true")
+    cache_compress_threshold: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_CACHE_COMPRESS_THRESHOLD", "1024")))
+    cache_compression: str = field(default_factory=lambda: os.getenv("TRANSLATOR_CACHE_COMPRESSION", "auto").lower())  # auto|zstd|lz4|zlib|none
+
+    # Redis connection: bounded pool per client; consecutive errors open a circuit breaker
+    # (half-open probe with exponential backoff, background reconnection) instead of disabling
+    # Redis for the process lifetime; keys written to memory meanwhile are replayed on reconnect
+    redis_max_connections: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_REDIS_MAX_CONNECTIONS", "50")))
+    redis_breaker_failure_threshold: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_REDIS_BREAKER_FAILURES", "3")))
+    redis_breaker_reset_s: float = field(default_factory=lambda: float(os.getenv("TRANSLATOR_REDIS_BREAKER_RESET", "1.0")))
+    redis_breaker_max_reset_s: float = field(default_factory=lambda: float(os.getenv("TRANSLATOR_REDIS_BREAKER_MAX_RESET", "30.0")))
+    redis_replay_max_keys: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_REDIS_REPLAY_MAX_KEYS", "10000")))
+
+    # Translation cache sharding: comma-separated Redis URLs; keys are routed by consistent
+    # hashing (virtual nodes), batches split per node, a lost node degrades only its shard.
+    # Empty = the translation cache shares the main REDIS_URL connection
+    redis_cache_nodes: str = field(default_factory=lambda: os.getenv("TRANSLATOR_REDIS_CACHE_NODES", ""))
+    redis_hash_vnodes: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_REDIS_HASH_VNODES", "160")))
+
+    # ZMQ admission control: per request class "name=concurrency:queue" budgets; a saturated
+    # class gets an `overloaded` reply at once while other classes still have room; only when
+    # every class is saturated does the receive loop stop reading the PULL socket (ZMQ HWM
+    # pushes back) for at most max_wait seconds before replying ("shed" never waits)
+    zmq_admission_enabled: bool = field(default_factory=lambda: os.getenv("TRANSLATOR_ZMQ_ADMISSION", "true").lower() == "true")
+    zmq_admission_budgets: str = field(default_factory=lambda: os.getenv(
+        "TRANSLATOR_ZMQ_ADMISSION_BUDGETS",
+        "translation=256:2048,audio_process=4:32,transcription=8:64,voice_api=4:32"
+    ))
+    zmq_admission_policy: str = field(default_factory=lambda: os.getenv("TRANSLATOR_ZMQ_ADMISSION_POLICY", "backpressure").lower())
+    zmq_admission_max_wait_s: float = field(default_factory=lambda: float(os.getenv("TRANSLATOR_ZMQ_ADMISSION_MAX_WAIT", "5.0")))
+
+    # Translation deadlines: gateway `deadline`/`timeoutMs`/`timestamp` propagated to each task
+    # (default budget per request type below: text matches the gateway request timeout, audio
+    # its voice pipeline deadman); queues are served earliest deadline first and work past its
+    # deadline is dropped before inference
+    translation_deadline_s: float = field(default_factory=lambda: float(os.getenv("TRANSLATOR_TRANSLATION_DEADLINE", "30.0")))
+    audio_deadline_s: float = field(default_factory=lambda: float(os.getenv("TRANSLATOR_AUDIO_DEADLINE", "900.0")))
+    enable_deadline_drop: bool = field(default_factory=lambda: os.getenv("TRANSLATOR_DEADLINE_DROP", "true").lower() == "true")
+
+    # Fair queuing in the translation pools: one sub-queue per conversation served by deficit
+    # round-robin (weights "conversationId=weight,..." for premium tenants, default 1), capped
+    # at max_per_conversation pending tasks (0 = no cap) so a noisy room cannot starve the others
+    enable_fair_queue: bool = field(default_factory=lambda: os.getenv("TRANSLATOR_FAIR_QUEUE", "true").lower() == "true")
+    fair_queue_weights: str = field(default_factory=lambda: os.getenv("TRANSLATOR_FAIR_QUEUE_WEIGHTS", ""))
+    fair_queue_max_per_conversation: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_FAIR_QUEUE_MAX_PER_CONVERSATION", "500")))
+
+    # Adaptive concurrency limit on inference calls (gradient, Vegas-style): the limit follows
+    # measured latency per inference-budget unit instead of scaling workers on queue size;
+    # callers wait for a slot at most until their task deadline
+    enable_adaptive_concurrency: bool = field(default_factory=lambda: os.getenv("TRANSLATOR_ADAPTIVE_CONCURRENCY", "true").lower() == "true")
+    adaptive_concurrency_initial: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_ADAPTIVE_CONCURRENCY_INITIAL", "4")))
+    adaptive_concurrency_min: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_ADAPTIVE_CONCURRENCY_MIN", "1")))
+    adaptive_concurrency_max: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_ADAPTIVE_CONCURRENCY_MAX", "32")))
+    adaptive_concurrency_tolerance: float = field(default_factory=lambda: float(os.getenv("TRANSLATOR_ADAPTIVE_CONCURRENCY_TOLERANCE", "1.5")))
+
+    # Segment-level translation memory: numbers/URLs/emojis are masked and re-filled,
+    # near-duplicates (MinHash candidates) are reused above a word-alignment similarity
+    enable_translation_memory: bool = field(default_factory=lambda: os.getenv("TRANSLATOR_TRANSLATION_MEMORY", "true").lower() == "true")
+    translation_memory_size: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_TRANSLATION_MEMORY_SIZE", "50000")))
+    translation_memory_threshold: float = field(default_factory=lambda: float(os.getenv("TRANSLATOR_TRANSLATION_MEMORY_THRESHOLD", "0.8")))
+    translation_memory_max_chars: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_TRANSLATION_MEMORY_MAX_CHARS", "500")))
+
+    # Audio content hashing (cache keys): "sha256" keeps existing keys, "fast" picks
+    # xxh3 > blake3 > blake2b; files are streamed in chunks on a worker thread
+    audio_hash_algorithm: str = field(default_factory=lambda: os.getenv("TRANSLATOR_AUDIO_HASH_ALGORITHM", "sha256").lower())
+    audio_hash_chunk_size: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_AUDIO_HASH_CHUNK_SIZE", str(1024 * 1024))))
+
+    # Content-addressed artifact store for audio intermediates (WAV conversions, TTS audio):
+    # byte budget with LRU eviction, entries used within the grace period are never evicted
+    # (empty dir = $MODELS_PATH/artifacts)
+    artifact_store_dir: str = field(default_factory=lambda: os.getenv("TRANSLATOR_ARTIFACT_DIR", ""))
+    artifact_store_max_bytes: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_ARTIFACT_MAX_BYTES", str(2 * 1024 * 1024 * 1024))))
+    artifact_store_grace_s: float = field(default_factory=lambda: float(os.getenv("TRANSLATOR_ARTIFACT_GRACE", "300")))
+
+    # Language detection: backends tried in order (fasttext needs a lid.176 model file),
+    # per-conversation prior only breaks ties when no backend reaches the confidence threshold
+    language_detector_backends: str = field(default_factory=lambda: os.getenv("TRANSLATOR_LANGDETECT_BACKENDS", "fasttext,langdetect"))
+    fasttext_model_path: str = field(default_factory=lambda: os.getenv("TRANSLATOR_FASTTEXT_MODEL", ""))
+    language_prior_size: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_LANGUAGE_PRIOR_SIZE", "10000")))
+
+    # Startup warm-up: hot language pairs and hot L1 keys are snapshotted to disk periodically;
+    # after a restart their pipelines are rebuilt, exercised with dummy batches of the given
+    # token lengths and the L1 is preloaded before /ready reports ready (empty path = models dir)
+    enable_warmup: bool = field(default_factory=lambda: os.getenv("TRANSLATOR_WARMUP", "true").lower() == "true")
+    warmup_state_path: str = field(default_factory=lambda: os.getenv("TRANSLATOR_WARMUP_STATE_PATH", ""))
+    warmup_top_pairs: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_WARMUP_TOP_PAIRS", "8")))
+    warmup_hot_keys: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_WARMUP_HOT_KEYS", "5000")))
+    warmup_token_lengths: str = field(default_factory=lambda: os.getenv("TRANSLATOR_WARMUP_TOKEN_LENGTHS", "16,64,192"))
+    warmup_snapshot_interval_s: float = field(default_factory=lambda: float(os.getenv("TRANSLATOR_WARMUP_SNAPSHOT_INTERVAL", "300")))
+    warmup_timeout_s: float = field(default_factory=lambda: float(os.getenv("TRANSLATOR_WARMUP_TIMEOUT", "180")))
+
     # Thread/Process pool settings
     num_inference_workers: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_INFERENCE_WORKERS", "4")))
     use_process_pool: bool = field(default_factory=lambda: os.getenv("TRANSLATOR_USE_PROCESS_POOL", "false").lower() == "true")
 
+    # Replica supervision: a request with no answer from its replica within the dispatch timeout
+    # fails; a dead replica fails the requests it owned and is re-forked up to max_restarts times
+    replica_dispatch_timeout_s: float = field(default_factory=lambda: float(os.getenv("TRANSLATOR_REPLICA_DISPATCH_TIMEOUT", "300")))
+    replica_max_restarts: int = field(default_factory=lambda: int(os.getenv("TRANSLATOR_REPLICA_MAX_RESTARTS", "5")))
+
     # Memory settings
     max_memory_fraction: float = field(default_factory=lambda: float(os.getenv("TRANSLATOR_MAX_MEMORY_FRACTION", "0.85")))
     enable_memory_cleanup: bool = field(default_factory=lambda: os.getenv("TRANSLATOR_MEMORY_CLEANUP", "true").lower() == "true")
@@ -429,6 +558,37 @@ class PerformanceOptimizer:
             logger.debug(f"Error calculating optimal batch size: {e}")
             return min(default, 2)  # Safe fallback
 
+    def get_optimal_batch_tokens(self, default: int = 4096) -> int:
+        """
+        Get the padded-token budget per inference batch.
+
+        Same memory heuristics as get_optimal_batch_size, expressed in tokens
+        (items × longest item) so that batches of short lines can hold many
+        items while long paragraphs stay small.
+
+        Returns:
+            Token budget per batch (TRANSLATOR_MAX_BATCH_TOKENS on CPU)
+        """
+        try:
+            import torch
+
+            if self._cuda_available:
+                total_mem = torch.cuda.get_device_properties(0).total_memory
+                if total_mem > 16 * 1024**3:  # 16GB+ VRAM
+                    return default * 4
+                elif total_mem > 8 * 1024**3:  # 8GB+ VRAM
+                    return default * 2
+                return default
+
+            elif self._mps_available:
+                return default * 2
+
+            return default
+
+        except Exception as e:
+            logger.debug(f"Error calculating optimal batch tokens: {e}")
+            return default
+
     def warmup_model(self, model: Any, warmup_input: Any) -> bool:
         """
         Perform warmup pass on a model (from iOS script optimization).
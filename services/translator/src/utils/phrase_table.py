@@ -0,0 +1,193 @@
+"""
+Table de phrases courtes (correspondance exacte)
+Sert sans inférence ni aller-retour Redis les messages de chat très courts
+("ok", "merci", "à demain") dont la traduction est déjà connue du cache
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from .performance import PerformanceConfig
+
+logger = logging.getLogger(__name__)
+
+PhraseKey = Tuple[str, str, str, str]
+
+
+class PhraseTable:
+    """
+    Table LRU thread-safe (texte, source, cible, modèle) → entrée de cache
+
+    Construite à partir des statistiques de hits du cache de traduction :
+    une phrase courte n'est promue qu'après `min_hits` hits cache (elle
+    revient assez souvent pour mériter la mémoire, et sa traduction a déjà
+    été servie telle quelle). Les candidats non encore promus sont suivis
+    dans un compteur LRU borné. Les entrées gardent le format du cache de
+    traduction (`translated_text`, `source_lang`) pour être publiées comme
+    un hit cache.
+
+    Exemples:
+        >>> table = PhraseTable(max_size=100, min_hits=2, max_chars=30)
+        >>> table.record_hit("merci", "fr", "en", "basic", {"translated_text": "thank you"})
+        False
+        >>> table.record_hit("merci", "fr", "en", "basic", {"translated_text": "thank you"})
+        True
+        >>> table.lookup("merci", "fr", "en", "basic")["translated_text"]
+        'thank you'
+    """
+
+    def __init__(self, max_size: int = 10000, min_hits: int = 3, max_chars: int = 30):
+        """
+        Initialise la table
+
+        Args:
+            max_size: Nombre maximum de phrases promues
+            min_hits: Hits cache nécessaires avant promotion
+            max_chars: Longueur max (caractères) d'un message éligible
+        """
+        self.max_size = max(1, max_size)
+        self.min_hits = max(1, min_hits)
+        self.max_chars = max_chars
+
+        self._phrases: "OrderedDict[PhraseKey, Dict[str, Any]]" = OrderedDict()
+        self._candidates: "OrderedDict[PhraseKey, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.stats = {'hits': 0, 'misses': 0, 'promotions': 0, 'evictions': 0}
+
+    def is_eligible(self, text: str) -> bool:
+        """True si le texte est assez court pour la table"""
+        stripped = (text or '').strip()
+        return 0 < len(stripped) <= self.max_chars
+
+    @staticmethod
+    def _make_key(text: str, source_lang: str, target_lang: str, model_type: str) -> PhraseKey:
+        return text.strip(), source_lang, target_lang, model_type
+
+    def lookup(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        model_type: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Cherche la traduction exacte d'une phrase courte
+
+        Returns:
+            Entrée {'translated_text', 'source_lang'} ou None si la phrase
+            n'est pas (encore) dans la table
+        """
+        if not self.is_eligible(text):
+            return None
+
+        key = self._make_key(text, source_lang, target_lang, model_type)
+        with self._lock:
+            entry = self._phrases.get(key)
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+            self._phrases.move_to_end(key)
+            self.stats['hits'] += 1
+            return dict(entry)
+
+    def record_hit(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        model_type: str,
+        cached: Dict[str, Any]
+    ) -> bool:
+        """
+        Enregistre un hit du cache de traduction pour une phrase courte
+
+        Args:
+            text: Texte source
+            source_lang: Langue source demandée
+            target_lang: Langue cible
+            model_type: Type de modèle demandé
+            cached: Entrée servie par le cache de traduction
+
+        Returns:
+            True si la phrase est (ou vient d'être) promue dans la table
+        """
+        translated_text = (cached or {}).get('translated_text')
+        if not translated_text or not self.is_eligible(text):
+            return False
+
+        entry = {'translated_text': translated_text, 'source_lang': cached.get('source_lang', source_lang)}
+        key = self._make_key(text, source_lang, target_lang, model_type)
+        with self._lock:
+            if key in self._phrases:
+                # Le cache fait foi: une traduction mise à jour remplace l'ancienne
+                self._phrases[key] = entry
+                self._phrases.move_to_end(key)
+                return True
+
+            count = self._candidates.pop(key, 0) + 1
+            if count < self.min_hits:
+                self._candidates[key] = count
+                # Candidats bornés à 4× la table (phrases vues une seule fois)
+                while len(self._candidates) > self.max_size * 4:
+                    self._candidates.popitem(last=False)
+                return False
+
+            self._phrases[key] = entry
+            self.stats['promotions'] += 1
+            while len(self._phrases) > self.max_size:
+                self._phrases.popitem(last=False)
+                self.stats['evictions'] += 1
+            return True
+
+    def clear(self) -> None:
+        """Vide la table et les candidats"""
+        with self._lock:
+            self._phrases.clear()
+            self._candidates.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Retourne les statistiques de la table"""
+        with self._lock:
+            return {
+                **self.stats,
+                'size': len(self._phrases),
+                'candidates': len(self._candidates)
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._phrases)
+
+
+_phrase_table: Optional[PhraseTable] = None
+_phrase_table_resolved = False  # Configuration lue (table créée ou désactivée)
+_phrase_table_lock = threading.Lock()
+
+
+def get_phrase_table() -> Optional[PhraseTable]:
+    """
+    Retourne la table de phrases partagée (None si TRANSLATOR_PHRASE_TABLE=false)
+
+    Appelée à chaque message court : la configuration n'est lue qu'une fois,
+    y compris quand la table est désactivée.
+    """
+    global _phrase_table, _phrase_table_resolved
+    if not _phrase_table_resolved:
+        with _phrase_table_lock:
+            if not _phrase_table_resolved:
+                config = PerformanceConfig()
+                if config.enable_phrase_table:
+                    _phrase_table = PhraseTable(
+                        max_size=config.phrase_table_size,
+                        min_hits=config.phrase_table_min_hits,
+                        max_chars=config.short_message_max_chars
+                    )
+                    logger.info(
+                        f"📖 PhraseTable initialisée (max_size={_phrase_table.max_size}, "
+                        f"min_hits={_phrase_table.min_hits}, max_chars={_phrase_table.max_chars})"
+                    )
+                _phrase_table_resolved = True
+    return _phrase_table
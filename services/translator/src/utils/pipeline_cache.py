@@ -6,7 +6,7 @@ Gère efficacement les paires de langues fréquentes avec éviction automatique
 import logging
 import threading
 from collections import OrderedDict
-from typing import Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 import time
 
@@ -59,6 +59,10 @@ class LRUPipelineCache:
         self._lock = threading.Lock()
         self._stats = CacheStats()
 
+        # Demandes par paire (modèle, source, cible), évictions comprises:
+        # base des paires à préchauffer au redémarrage
+        self._usage: Dict[Tuple[str, str, str], int] = {}
+
         # Timestamp pour métriques
         self._last_stats_log = time.time()
         self._stats_log_interval = 300  # Log stats toutes les 5 minutes
@@ -95,6 +99,8 @@ class LRUPipelineCache:
 
         with self._lock:
             self._stats.total_requests += 1
+            pair = (model_type, source_lang, target_lang)
+            self._usage[pair] = self._usage.get(pair, 0) + 1
 
             if key in self._cache:
                 # HIT: déplacer en fin (marquer comme récemment utilisé)
@@ -214,6 +220,23 @@ class LRUPipelineCache:
             items = list(self._cache.items())[-n:]
             return [(key, idx) for idx, (key, _) in enumerate(items, 1)]
 
+    def get_hot_pairs(self, n: int = 10) -> List[Tuple[str, str, str, int]]:
+        """
+        Retourne les N paires les plus demandées depuis le démarrage
+
+        Contrairement à get_top_pairs (récence des pipelines en cache), le
+        compte survit aux évictions.
+
+        Args:
+            n: Nombre de paires à retourner
+
+        Returns:
+            Liste de tuples (model_type, source_lang, target_lang, demandes)
+        """
+        with self._lock:
+            ranked = sorted(self._usage.items(), key=lambda item: item[1], reverse=True)[:n]
+            return [(model, src, tgt, count) for (model, src, tgt), count in ranked]
+
     def clear(self) -> None:
         """Vide le cache complètement"""
         with self._lock:
@@ -0,0 +1,197 @@
+"""
+Coalescence des appels identiques en vol (single-flight) + cache négatif
+Un seul calcul par clé à la fois : les appelants concurrents attendent le
+même résultat au lieu de relancer Redis + inférence chacun de leur côté
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, InvalidStateError
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Groupe single-flight thread-safe, utilisable depuis plusieurs boucles asyncio
+
+    Le premier appelant d'une clé lance le calcul dans une tâche détachée ;
+    les suivants de la même boucle attendent la même
+    `concurrent.futures.Future`. L'annulation d'un appelant (timeout)
+    n'annule ni le calcul ni les autres appelants.
+
+    Les calculs en vol sont propres à leur boucle : une boucle de thread
+    (audio) arrêtée ou fermée emporterait avec elle une tâche leader dont
+    les appelants d'autres boucles attendraient le résultat sans fin. Les
+    entrées laissées par une boucle fermée sont purgées et leurs appelants
+    échoués.
+
+    Cache négatif optionnel : un résultat jugé en échec par `is_failure`
+    est conservé `negative_ttl` secondes et resservi tel quel, pour qu'une
+    entrée connue pour échouer ne soit pas retentée en boucle serrée.
+
+    Usage:
+        flight = SingleFlight("translation", negative_ttl=30.0)
+        result = await flight.do(
+            (text, src, tgt, model_type),
+            lambda: translate(text, src, tgt, model_type),
+            is_failure=is_failed_translation
+        )
+    """
+
+    def __init__(self, name: str, negative_ttl: float = 0.0, max_negative: int = 4096):
+        """
+        Initialise le groupe
+
+        Args:
+            name: Nom (logs et statistiques)
+            negative_ttl: Durée de vie des échecs mémorisés (0 = désactivé)
+            max_negative: Nombre max d'échecs mémorisés (LRU)
+        """
+        self.name = name
+        self.negative_ttl = negative_ttl
+        self.max_negative = max(1, max_negative)
+
+        # (boucle du leader, clé) → résultat partagé
+        self._inflight: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], Future] = {}
+        self._negative: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._tasks: Set[asyncio.Task] = set()
+        self._lock = threading.Lock()
+
+        self.stats = {'executed': 0, 'coalesced': 0, 'negative_hits': 0, 'negative_stored': 0}
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]],
+        is_failure: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """
+        Exécute `fn` une seule fois pour tous les appelants concurrents de `key`
+
+        Args:
+            key: Clé de coalescence (ex: (texte, source, cible, modèle))
+            fn: Fabrique de la coroutine à exécuter
+            is_failure: Prédicat d'échec pour le cache négatif
+
+        Returns:
+            Résultat partagé (ne pas le muter)
+        """
+        now = time.monotonic()
+        flight_key = (asyncio.get_running_loop(), key)
+        with self._lock:
+            negative = self._negative.get(key)
+            if negative is not None:
+                expires_at, value = negative
+                if expires_at > now:
+                    self.stats['negative_hits'] += 1
+                    return value
+                del self._negative[key]
+
+            future = self._inflight.get(flight_key)
+            leader = future is None
+            if leader:
+                self._purge_closed_loops()
+                future = Future()
+                self._inflight[flight_key] = future
+                self.stats['executed'] += 1
+            else:
+                self.stats['coalesced'] += 1
+
+        if leader:
+            task = asyncio.ensure_future(self._run(flight_key, future, fn, is_failure))
+            with self._lock:
+                self._tasks.add(task)
+            task.add_done_callback(self._forget_task)
+        else:
+            logger.debug(f"[SINGLE_FLIGHT:{self.name}] Appel coalescé sur un calcul en vol")
+
+        # shield: un appelant qui expire ne doit pas annuler le calcul partagé
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    async def _run(
+        self,
+        flight_key: Tuple[asyncio.AbstractEventLoop, Hashable],
+        future: Future,
+        fn: Callable[[], Awaitable[Any]],
+        is_failure: Optional[Callable[[Any], bool]]
+    ) -> None:
+        """Exécute le calcul partagé et publie son résultat"""
+        key = flight_key[1]
+        try:
+            value = await fn()
+        except (asyncio.CancelledError, GeneratorExit):
+            # Annulée, ou détruite avec sa boucle
+            with self._lock:
+                self._inflight.pop(flight_key, None)
+            self._fail(future, RuntimeError(f"single-flight '{self.name}' annulé"))
+            raise
+        except Exception as e:
+            with self._lock:
+                self._inflight.pop(flight_key, None)
+            self._fail(future, e)
+            return
+
+        failed = False
+        if is_failure is not None and self.negative_ttl > 0:
+            try:
+                failed = bool(is_failure(value))
+            except Exception as e:
+                logger.debug(f"[SINGLE_FLIGHT:{self.name}] Prédicat d'échec en erreur: {e}")
+
+        with self._lock:
+            self._inflight.pop(flight_key, None)
+            if failed:
+                self._negative[key] = (time.monotonic() + self.negative_ttl, value)
+                self._negative.move_to_end(key)
+                self.stats['negative_stored'] += 1
+                while len(self._negative) > self.max_negative:
+                    self._negative.popitem(last=False)
+
+        try:
+            future.set_result(value)
+        except InvalidStateError:
+            pass  # Déjà échoué par la purge
+
+    @staticmethod
+    def _fail(future: Future, error: BaseException) -> None:
+        """Échoue un résultat partagé sauf s'il l'est déjà"""
+        try:
+            future.set_exception(error)
+        except InvalidStateError:
+            pass
+
+    def _purge_closed_loops(self) -> None:
+        """Oublie les calculs en vol dont la boucle est fermée (sous `_lock`)"""
+        dead = [flight_key for flight_key in self._inflight if flight_key[0].is_closed()]
+        for flight_key in dead:
+            self._fail(
+                self._inflight.pop(flight_key),
+                RuntimeError(f"single-flight '{self.name}': boucle du calcul fermée")
+            )
+        if dead:
+            self._tasks = {task for task in self._tasks if not task.get_loop().is_closed()}
+            logger.warning(f"[SINGLE_FLIGHT:{self.name}] {len(dead)} calcul(s) abandonné(s) par une boucle fermée")
+
+    def _forget_task(self, task: asyncio.Task) -> None:
+        with self._lock:
+            self._tasks.discard(task)
+
+    def clear(self) -> None:
+        """Oublie les échecs mémorisés (les calculs en vol continuent)"""
+        with self._lock:
+            self._negative.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Retourne les statistiques du groupe"""
+        with self._lock:
+            self._purge_closed_loops()
+            return {
+                **self.stats,
+                'in_flight': len(self._inflight),
+                'negative_size': len(self._negative)
+            }
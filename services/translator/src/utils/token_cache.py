@@ -0,0 +1,133 @@
+"""
+Cache LRU des sorties du tokenizer (token ids)
+Évite de re-tokeniser le même texte entre le planificateur de batches,
+le wrapper Seq2Seq et les chemins de fallback
+"""
+
+import hashlib
+import logging
+import threading
+from array import array
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
+
+from .performance import PerformanceConfig
+from .pipeline_cache import CacheStats
+
+logger = logging.getLogger(__name__)
+
+
+class TokenCache:
+    """
+    Cache LRU thread-safe de token ids
+
+    Clé = (namespace du tokenizer, sha1 du texte). Le namespace doit inclure
+    tout ce qui change la sortie du tokenizer pour un même texte (modèle,
+    langue source NLLB — le token de langue est préfixé —, longueur max).
+    Les ids sont stockés en `array('l')` (8 octets/token au lieu d'un objet
+    int Python par token).
+
+    Exemples:
+        >>> cache = TokenCache(max_size=1024)
+        >>> cache.get_many("nllb-600M|fra_Latn|512", ["Bonjour"])
+        [None]
+        >>> cache.put("nllb-600M|fra_Latn|512", "Bonjour", [256057, 17994, 2])
+    """
+
+    def __init__(self, max_size: int = 4096):
+        """
+        Initialise le cache
+
+        Args:
+            max_size: Nombre maximum de textes tokenisés en cache
+        """
+        self.max_size = max(1, max_size)
+        self._cache: "OrderedDict[Tuple[str, str], array]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    @staticmethod
+    def _make_key(namespace: str, text: str) -> Tuple[str, str]:
+        """Clé compacte: le texte complet n'est pas conservé en mémoire"""
+        return namespace, hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+    def get_many(self, namespace: str, texts: Sequence[str]) -> List[Optional[List[int]]]:
+        """
+        Récupère les token ids de plusieurs textes
+
+        Args:
+            namespace: Namespace du tokenizer
+            texts: Textes (déjà prétraités)
+
+        Returns:
+            Liste alignée sur `texts`: token ids ou None si absent
+        """
+        keys = [self._make_key(namespace, text) for text in texts]
+        results: List[Optional[List[int]]] = []
+
+        with self._lock:
+            for key in keys:
+                self._stats.total_requests += 1
+                ids = self._cache.get(key)
+                if ids is None:
+                    self._stats.misses += 1
+                    results.append(None)
+                else:
+                    self._cache.move_to_end(key)
+                    self._stats.hits += 1
+                    results.append(ids.tolist())
+
+        return results
+
+    def put(self, namespace: str, text: str, token_ids: Sequence[int]) -> None:
+        """
+        Ajoute les token ids d'un texte
+
+        Args:
+            namespace: Namespace du tokenizer
+            text: Texte (déjà prétraité)
+            token_ids: Sortie input_ids du tokenizer pour ce texte
+        """
+        key = self._make_key(namespace, text)
+        ids = array('l', token_ids)
+
+        with self._lock:
+            self._cache[key] = ids
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+                self._stats.evictions += 1
+
+    def clear(self) -> None:
+        """Vide le cache"""
+        with self._lock:
+            self._cache.clear()
+
+    def get_stats(self) -> CacheStats:
+        """Retourne les statistiques du cache"""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                evictions=self._stats.evictions,
+                total_requests=self._stats.total_requests
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+
+_token_cache: Optional[TokenCache] = None
+_token_cache_lock = threading.Lock()
+
+
+def get_token_cache() -> TokenCache:
+    """Retourne le cache de tokens partagé (configuré par PerformanceConfig)"""
+    global _token_cache
+    if _token_cache is None:
+        with _token_cache_lock:
+            if _token_cache is None:
+                _token_cache = TokenCache(PerformanceConfig().token_cache_size)
+                logger.info(f"🗂️  TokenCache initialisé (max_size={_token_cache.max_size})")
+    return _token_cache
@@ -0,0 +1,43 @@
+"""
+Détection des traductions en échec
+Le moteur ne lève pas d'exception quand l'inférence échoue : il renvoie le
+texte source préfixé d'un marqueur ([ML-Pipeline-Error], [NLLB-No-Result]...).
+Source unique des motifs utilisés pour ne pas publier (handler ZMQ), ne pas
+mettre en cache, et mémoriser brièvement ces échecs (cache négatif)
+"""
+
+import re
+from typing import Optional
+
+TRANSLATION_ERROR_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'^\[.*Error.*\]',
+        r'^\[.*Failed.*\]',
+        r'^\[.*No.*Result.*\]',
+        r'^\[.*Fallback.*\]',
+        r'^\[.*ML.*Error.*\]',
+        r'^\[.*ÉCHEC.*\]',
+        r'^\[.*MODÈLES.*NON.*\]',
+        r'^\[.*MODÈLES.*NON.*CHARGÉS.*\]',
+        r'^\[.*NLLB.*No.*Result.*\]',
+        r'^\[.*NLLB.*Fallback.*\]',
+        r'^\[.*ERREUR.*\]',
+        r'^\[.*FAILED.*\]',
+        r'^\[.*TIMEOUT.*\]',
+        r'^\[.*META.*TENSOR.*\]'
+    )
+]
+
+
+def is_failed_translation(translated_text: Optional[str]) -> bool:
+    """True si le texte est vide ou porte un marqueur d'échec du moteur.
+
+    Exemples:
+        >>> is_failed_translation("[ML-Pipeline-Error] Bonjour")
+        True
+        >>> is_failed_translation("Hello")
+        False
+    """
+    if not translated_text or not translated_text.strip():
+        return True
+    return any(pattern.search(translated_text) for pattern in TRANSLATION_ERROR_PATTERNS)
@@ -26,7 +26,7 @@ from dataclasses import dataclass
 # Ajouter le repertoire src au path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from services.translation_ml.translator_engine import DEFAULT_DETECT_LANGUAGE
+from services.translation_ml.language_detector import DEFAULT_DETECT_LANGUAGE
 
 # Configuration du logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -144,8 +144,8 @@ class TestInitializeMethod:
         RedisService._instance = None
 
     @pytest.mark.asyncio
-    async def test_initialize_max_connection_attempts(self):
-        """Test initialize reaching max connection attempts"""
+    async def test_initialize_failure_opens_circuit_and_reconnects(self):
+        """Test initialize failure keeps retrying in background instead of disabling Redis"""
         RedisService._instance = None
         service = RedisService()
         service.permanently_disabled = False
@@ -155,10 +155,13 @@ class TestInitializeMethod:
             result = await service.initialize()
 
         assert result is True
-        assert service.permanently_disabled is True  # Should be permanently disabled now
+        assert service.permanently_disabled is False
         assert service.connection_attempts == 3
+        assert service.breaker.state == "open"
+        assert service._reconnect_task is not None
 
         # Cleanup
+        await service.close()
         if service._cleanup_task:
             service._cleanup_task.cancel()
             try:
@@ -377,20 +380,22 @@ class TestErrorHandling:
         assert service.permanently_disabled is False
 
     @pytest.mark.asyncio
-    async def test_handle_redis_error_permanent_disable(self, redis_service_with_mock):
-        """Test that _handle_redis_error permanently disables after max attempts"""
+    async def test_handle_redis_error_opens_circuit(self, redis_service_with_mock):
+        """Test that _handle_redis_error opens the circuit after consecutive errors"""
         service = redis_service_with_mock
-        service.connection_attempts = 2
 
-        service._handle_redis_error()
+        for _ in range(3):
+            service._handle_redis_error()
 
         assert service.connection_attempts == 3
-        assert service.permanently_disabled is True
+        assert service.breaker.state == "open"
+        assert service.permanently_disabled is False
         assert service.is_redis_available is False
+        await service.close()
 
     @pytest.mark.asyncio
-    async def test_multiple_errors_lead_to_permanent_disable(self, redis_service_with_mock):
-        """Test that multiple errors lead to permanent disable"""
+    async def test_multiple_errors_open_circuit(self, redis_service_with_mock):
+        """Test that multiple errors switch to memory mode until reconnection"""
         service = redis_service_with_mock
         service.connection_attempts = 0
         service.redis.get = AsyncMock(side_effect=Exception("Redis error"))
@@ -399,7 +404,10 @@ class TestErrorHandling:
         for _ in range(3):
             await service.get("test_key")
 
-        assert service.permanently_disabled is True
+        assert service.is_available() is False
+        assert service.permanently_disabled is False
+        assert service.get_stats()["operations"]["get"]["errors"] == 3
+        await service.close()
 
 
 # ===================================================================
@@ -817,11 +825,13 @@ class TestIntegrationScenarios:
         await service.set("key2", "value2")
         assert "key2" in service.memory_cache
 
-        # After 3 failures, should be permanently disabled
+        # After 3 failures, memory mode until the background reconnection succeeds
         await service.set("key3", "value3")
         await service.set("key4", "value4")
 
-        assert service.permanently_disabled is True
+        assert service.is_available() is False
+        assert service.breaker.state == "open"
+        await service.close()
 
     @pytest.mark.asyncio
     async def test_audio_cache_full_lifecycle(self):
@@ -0,0 +1,165 @@
+"""
+TDD — Limite de concurrence adaptative devant le moteur de traduction.
+
+Avant : WorkerPool.check_scaling ajustait le nombre de workers asyncio sur la
+taille de file et l'utilisation. Tous partagent l'executor et le lock modèle :
+au-delà de la saturation, plus de workers = plus d'attente, et le budget
+inference_timeout_for courait pendant cette attente.
+
+Après : utils.concurrency_limiter.AdaptiveConcurrencyLimiter (gradient, à la
+Vegas) devant chaque appel moteur du translation_processor. La limite suit la
+latence par unité de budget, un timeout la réduit, l'attente d'un jeton
+s'arrête à l'échéance de la tâche. Limite, RTT et refus sont exposés dans les
+stats du TranslationPoolManager.
+"""
+import asyncio
+import time
+
+import pytest
+
+from utils.concurrency_limiter import AdaptiveConcurrencyLimiter, ConcurrencyLimitExceeded
+
+
+def _feed(limiter, rtt, samples):
+    """Échantillons à pleine charge (tous les jetons utilisés)"""
+    for _ in range(samples):
+        limiter._inflight = limiter.limit
+        limiter.release(rtt=rtt, inflight=limiter.limit)
+
+
+def test_limit_grows_at_stable_latency_and_shrinks_when_queueing():
+    limiter = AdaptiveConcurrencyLimiter("t", initial_limit=4, max_limit=64)
+    _feed(limiter, rtt=0.1, samples=40)
+    grown = limiter.limit
+    assert grown > 4
+
+    # La file s'installe devant le moteur: latence ×4
+    _feed(limiter, rtt=0.4, samples=40)
+    assert limiter.limit < grown
+    stats = limiter.get_stats()
+    assert stats["rtt_last_ms"] == 400.0 and stats["rtt_long_ms"] < 400.0
+
+
+def test_underused_limit_does_not_grow():
+    limiter = AdaptiveConcurrencyLimiter("t", initial_limit=8)
+    for _ in range(50):
+        limiter._inflight = 1
+        limiter.release(rtt=0.1, inflight=1)
+    assert limiter.limit == 8
+
+
+def test_timeout_backs_off():
+    limiter = AdaptiveConcurrencyLimiter("t", initial_limit=10, backoff=0.5)
+    limiter._inflight = 1
+    limiter.release(dropped=True)
+    assert limiter.limit == 5 and limiter.get_stats()["dropped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_waiters_served_in_order_and_rejected_at_deadline():
+    limiter = AdaptiveConcurrencyLimiter("t", initial_limit=1, max_limit=1)
+    assert await limiter.acquire()
+
+    order = []
+
+    async def waiter(name, timeout):
+        if await limiter.acquire(timeout):
+            order.append(name)
+            limiter.release()
+
+    first = asyncio.create_task(waiter("a", None))
+    second = asyncio.create_task(waiter("b", None))
+    late = asyncio.create_task(waiter("late", 0.01))
+    await asyncio.sleep(0.05)
+    limiter.release()
+    await asyncio.gather(first, second, late)
+
+    assert order == ["a", "b"]
+    stats = limiter.get_stats()
+    assert stats["rejected"] == 1 and stats["inflight"] == 0 and stats["waiting"] == 0
+
+
+@pytest.mark.asyncio
+async def test_slot_samples_latency_per_cost_and_raises_when_refused():
+    limiter = AdaptiveConcurrencyLimiter("t", initial_limit=1, max_limit=1)
+
+    async with limiter.slot(cost=2.0):
+        await asyncio.sleep(0.02)
+    assert 5 <= limiter.get_stats()["rtt_last_ms"] < 50
+
+    await limiter.acquire()
+    with pytest.raises(ConcurrencyLimitExceeded):
+        async with limiter.slot(timeout=0):
+            pass
+
+    limiter.release()
+    with pytest.raises(asyncio.TimeoutError):
+        async with limiter.slot():
+            raise asyncio.TimeoutError()
+    assert limiter.get_stats()["dropped"] == 1 and limiter.inflight == 0
+
+
+@pytest.mark.asyncio
+async def test_engine_calls_gated_until_task_deadline(monkeypatch):
+    from services.zmq_pool import translation_processor
+
+    limiter = AdaptiveConcurrencyLimiter("inference", initial_limit=1, max_limit=1)
+    monkeypatch.setattr(translation_processor, "_inference_limiter", limiter)
+    gate = asyncio.Event()
+
+    async def engine():
+        await gate.wait()
+        return "ok"
+
+    running = asyncio.create_task(translation_processor._run_inference(engine, budget=45.0))
+    await asyncio.sleep(0)
+    with pytest.raises(ConcurrencyLimitExceeded):
+        await translation_processor._run_inference(engine, budget=45.0, deadline=time.time() + 0.02)
+
+    gate.set()
+    assert await running == "ok"
+    assert limiter.get_stats()["rejected"] == 1 and limiter.get_stats()["samples"] == 1
+
+
+def test_pool_manager_exposes_limiter_stats(monkeypatch):
+    from services.zmq_pool import translation_processor
+    from services.zmq_pool.zmq_pool_manager import TranslationPoolManager
+
+    limiter = AdaptiveConcurrencyLimiter("inference", initial_limit=3)
+    monkeypatch.setattr(translation_processor, "_inference_limiter", limiter)
+    manager = TranslationPoolManager(normal_workers=2, any_workers=2)
+
+    stats = manager.get_stats()["inference_limiter"]
+    assert stats["limit"] == 3 and stats["rejected"] == 0 and "rtt_long_ms" in stats
+
+
+@pytest.mark.asyncio
+async def test_token_held_until_executor_inference_really_ends(monkeypatch):
+    import threading
+
+    from services.zmq_pool import translation_processor
+
+    limiter = AdaptiveConcurrencyLimiter("inference", initial_limit=1, max_limit=1)
+    monkeypatch.setattr(translation_processor, "_inference_limiter", limiter)
+    release_engine = threading.Event()
+
+    async def engine():
+        # generate() dans l'executor: wait_for n'interrompt pas le thread
+        return await asyncio.get_running_loop().run_in_executor(None, release_engine.wait)
+
+    try:
+        with pytest.raises(asyncio.TimeoutError):
+            await translation_processor._run_inference(engine, budget=0.05)
+
+        # Le thread tourne encore: pas de jeton pour un nouvel appel
+        assert limiter.inflight == 1
+        with pytest.raises(ConcurrencyLimitExceeded):
+            await translation_processor._run_inference(engine, budget=1.0, deadline=time.time() + 0.02)
+    finally:
+        release_engine.set()
+
+    for _ in range(100):
+        if limiter.inflight == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert limiter.inflight == 0 and limiter.get_stats()["dropped"] == 1
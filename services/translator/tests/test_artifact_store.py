@@ -0,0 +1,146 @@
+"""
+TDD — Magasin d'artefacts adressé par contenu pour les intermédiaires audio.
+
+Avant : trois caches disque ad hoc — `.converted.wav` à côté des sources
+(dict mémoire perdu au redémarrage), un WAV_CACHE_DIR codé en dur
+(/Users/...) dans multi_speaker_processor, et des segments TTS resynthétisés
+à chaque demande identique. Aucun budget disque, aucune éviction sûre.
+
+Après : utils.artifact_store.ArtifactStore — clé (hash du contenu,
+transformation), écritures atomiques, budget en octets avec éviction LRU qui
+épargne les fichiers épinglés et récents, index rechargé au redémarrage ;
+le Synthesizer réutilise les audios déjà synthétisés.
+"""
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from utils.artifact_store import ArtifactStore
+
+
+def _store(tmp_path, max_bytes=10_000, grace_s=0.0):
+    return ArtifactStore(str(tmp_path / "artifacts"), max_bytes=max_bytes, grace_s=grace_s, index_flush_interval_s=0)
+
+
+def test_get_or_create_produces_once_and_atomically(tmp_path):
+    store = _store(tmp_path)
+    calls = []
+
+    def producer(tmp):
+        calls.append(tmp)
+        with open(tmp, "wb") as f:
+            f.write(b"x" * 100)
+
+    path = store.get_or_create("h1", "wav16k-mono", ".wav", producer)
+    assert path and os.path.exists(path) and path.endswith(".wav")
+    assert store.get_or_create("h1", "wav16k-mono", ".wav", producer) == path
+    assert len(calls) == 1
+    assert os.listdir(os.path.join(store.root_dir, "tmp")) == []
+
+    # Même contenu, autre transformation: autre artefact
+    assert store.get_or_create("h1", "tts:fr", ".wav", producer) != path
+
+
+def test_failed_producer_leaves_nothing(tmp_path):
+    store = _store(tmp_path)
+
+    def producer(tmp):
+        with open(tmp, "wb") as f:
+            f.write(b"partial")
+        raise RuntimeError("ffmpeg")
+
+    with pytest.raises(RuntimeError):
+        store.get_or_create("h1", "wav16k-mono", ".wav", producer)
+    assert store.get("h1", "wav16k-mono") is None
+    assert os.listdir(os.path.join(store.root_dir, "tmp")) == []
+
+
+def test_lru_eviction_spares_pinned_and_recent(tmp_path):
+    store = _store(tmp_path, max_bytes=250)
+    a = store.put_bytes("a", "t", b"a" * 100, ".bin")
+    b = store.put_bytes("b", "t", b"b" * 100, ".bin")
+
+    with store.pinned(a):
+        store.put_bytes("c", "t", b"c" * 100, ".bin")
+        # a épinglé: b (le moins récent restant) part
+        assert os.path.exists(a) and not os.path.exists(b)
+
+    store.grace_s = 3600
+    store.put_bytes("d", "t", b"d" * 100, ".bin")
+    # Tout est récent: dépassement toléré plutôt que supprimer un fichier en usage
+    assert store.get_stats()["entries"] == 3
+    assert store.get_stats()["evictions"] == 1
+
+
+def test_index_survives_restart_and_adopts_orphans(tmp_path):
+    store = _store(tmp_path)
+    path = store.put_bytes("h1", "wav16k-mono", b"w" * 10, ".wav")
+    store.flush_index()
+
+    # Artefact écrit après le dernier index (arrêt brutal) + écriture interrompue
+    orphan_dir = os.path.join(store.root_dir, "ff")
+    os.makedirs(orphan_dir, exist_ok=True)
+    with open(os.path.join(orphan_dir, "ff00.wav"), "wb") as f:
+        f.write(b"o" * 20)
+    with open(store.temp_path(".wav"), "wb") as f:
+        f.write(b"tmp")
+
+    reloaded = _store(tmp_path)
+    assert reloaded.get("h1", "wav16k-mono") == path
+    assert reloaded.get_stats()["entries"] == 2
+    assert reloaded.get_stats()["total_bytes"] == 30
+    assert os.listdir(os.path.join(reloaded.root_dir, "tmp")) == []
+
+
+def test_evict_older_than_by_prefix(tmp_path):
+    store = _store(tmp_path)
+    old = store.put_bytes("a", "wav16k-mono", b"a", ".wav")
+    tts = store.put_bytes("b", "tts:fr:default", b"b", ".wav")
+    for entry in store.iter_entries():
+        entry.last_access = time.time() - 10 * 86400
+
+    assert store.evict_older_than(86400, transform_prefix="wav16k-mono") == 1
+    assert not os.path.exists(old) and os.path.exists(tts)
+
+
+@pytest.mark.asyncio
+async def test_synthesizer_reuses_stored_audio(tmp_path):
+    synthesizer_module = pytest.importorskip("services.tts.synthesizer")
+    store = _store(tmp_path, max_bytes=10**6)
+    synth = synthesizer_module.Synthesizer(output_dir=tmp_path / "out", default_format="wav", artifact_store=store)
+
+    async def fake_duration(audio_path):
+        return 1000
+
+    synth._get_duration_ms = fake_duration
+
+    class Backend:
+        calls = 0
+
+        async def synthesize(self, text, language, output_path, **kwargs):
+            Backend.calls += 1
+            with open(output_path, "wb") as f:
+                f.write(b"RIFF----WAVEfmt ")
+            return output_path
+
+    model = SimpleNamespace(value="chatterbox")
+    model_info = SimpleNamespace(quality_score=90.0)
+    results = []
+    for message_id in ("m1", "m2"):
+        results.append(await synth.synthesize_with_voice(
+            text="Bonjour tout le monde.",
+            target_language="en",
+            backend=Backend(),
+            model=model,
+            model_info=model_info,
+            output_format="wav",
+            message_id=message_id,
+            exaggeration=0.5,
+        ))
+
+    assert Backend.calls == 1
+    assert results[0].audio_path != results[1].audio_path
+    assert all(os.path.exists(result.audio_path) for result in results)
+    assert store.get_stats()["hits"] >= 1
@@ -0,0 +1,138 @@
+"""
+TDD — Hachage audio en flux, hors boucle, et depuis la frame ZMQ.
+
+Avant : AudioCacheService.compute_audio_hash faisait open().read() du
+fichier entier + SHA-256 de façon synchrone dans la chaîne async
+(TranscriptionStage._compute_audio_hash) : un message vocal de plusieurs Mo
+bloquait la boucle qui sert aussi les traductions texte ZMQ.
+
+Après : utils.audio_hash lit le fichier par blocs dans un thread de
+travail ; la frame `_audioBinary` est hachée en mémoire avant l'écriture
+disque et le hash est transmis au pipeline ; mode rapide non
+cryptographique (xxh3 > blake3 > blake2b) configurable.
+"""
+import asyncio
+import hashlib
+import threading
+
+import pytest
+
+import utils.audio_hash as audio_hash_module
+from services.audio_pipeline.transcription_stage import TranscriptionStage
+from services.redis_service import AudioCacheService, RedisService
+from utils.audio_hash import AUDIO_HASH_CHARS, AudioHasher, resolve_algorithm
+
+
+@pytest.fixture
+def audio_file(tmp_path):
+    content = bytes(range(256)) * 20_000  # ~5 Mo
+    path = tmp_path / "voice.m4a"
+    path.write_bytes(content)
+    return str(path), content
+
+
+def test_streamed_file_hash_matches_legacy_sha256(audio_file):
+    path, content = audio_file
+    hasher = AudioHasher(chunk_size=64 * 1024)
+
+    legacy = hashlib.sha256(content).hexdigest()[:32]
+    assert hasher.hash_file(path) == legacy
+    # Frame en mémoire et fichier écrit donnent la même clé
+    assert hasher.hash_bytes(content) == legacy
+    assert hasher.hash_bytes(memoryview(content)) == legacy
+
+
+def test_fast_mode_falls_back_to_stdlib(monkeypatch, audio_file):
+    monkeypatch.setattr(audio_hash_module, "XXHASH_AVAILABLE", False)
+    monkeypatch.setattr(audio_hash_module, "BLAKE3_AVAILABLE", False)
+    assert resolve_algorithm("fast") == "blake2b"
+    assert resolve_algorithm("xxh3") == "blake2b"
+    assert resolve_algorithm("md5") == "sha256"
+
+    path, content = audio_file
+    hasher = AudioHasher(algorithm="fast")
+    digest = hasher.hash_file(path)
+    assert len(digest) == AUDIO_HASH_CHARS
+    assert digest == hasher.hash_bytes(content)
+    assert digest != AudioHasher().hash_file(path)
+
+
+@pytest.mark.asyncio
+async def test_async_hashing_runs_off_the_event_loop(audio_file):
+    path, content = audio_file
+    hasher = AudioHasher()
+    loop_thread = threading.get_ident()
+    seen = []
+
+    original = hasher.hash_file
+
+    def recording_hash_file(p):
+        seen.append(threading.get_ident())
+        return original(p)
+
+    hasher.hash_file = recording_hash_file
+    assert await hasher.hash_file_async(path) == hasher.hash_bytes(content)
+    assert seen and seen[0] != loop_thread
+
+    # Petite frame: hachée directement, grosse frame: thread
+    assert await hasher.hash_bytes_async(b"tiny") == hasher.hash_bytes(b"tiny")
+    assert await hasher.hash_bytes_async(content) == hasher.hash_bytes(content)
+
+
+@pytest.fixture
+def audio_cache():
+    RedisService._instance = None
+    service = RedisService()
+    service.permanently_disabled = True
+    yield AudioCacheService(service)
+    RedisService._instance = None
+
+
+@pytest.mark.asyncio
+async def test_audio_cache_hashes_without_blocking(audio_cache, audio_file):
+    path, content = audio_file
+    expected = hashlib.sha256(content).hexdigest()[:32]
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    task = asyncio.create_task(ticker())
+    try:
+        assert await audio_cache.get_or_compute_audio_hash("att-1", path) == expected
+    finally:
+        task.cancel()
+    assert ticks > 0  # la boucle a continué à tourner pendant le hachage
+
+    # Mapping mémorisé: pas de second hachage
+    assert await audio_cache.get_or_compute_audio_hash("att-1", "/missing") == expected
+    assert await audio_cache.hash_audio_bytes(content) == expected
+
+    # Fichier illisible: fallback sur le chemin
+    fallback = await audio_cache.compute_audio_hash_async("/missing/file.wav")
+    assert fallback == hashlib.sha256(b"/missing/file.wav").hexdigest()[:32]
+
+
+@pytest.mark.asyncio
+async def test_transcription_stage_uses_frame_hash(audio_cache):
+    stage = TranscriptionStage.__new__(TranscriptionStage)
+    stage.audio_cache = audio_cache
+
+    frame_hash = "f" * 32
+    assert await stage._compute_audio_hash("att-2", "/not/read.wav", frame_hash) == frame_hash
+    # Le mapping attachment -> hash est enregistré pour les lectures legacy
+    assert await audio_cache.get_or_compute_audio_hash("att-2", "/not/read.wav") == frame_hash
+
+
+@pytest.mark.asyncio
+async def test_zmq_handler_hashes_frame_before_disk():
+    from services.zmq_audio_handler import AudioHandler
+
+    handler = AudioHandler.__new__(AudioHandler)
+    frame = b"\x00\x01" * 1000
+    assert await handler._hash_audio_frame(frame) == hashlib.sha256(frame).hexdigest()[:32]
+    assert await handler._hash_audio_frame(None) is None
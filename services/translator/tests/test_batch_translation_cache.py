@@ -0,0 +1,143 @@
+"""
+TDD — Chemin batch du pool ZMQ branché sur le cache de traduction.
+
+Avant : process_batch_translation ne lisait ni n'écrivait le cache Redis
+(seul _translate_single_language le faisait). Dès que le batching
+s'enclenchait sous charge, le taux de hit tombait à zéro pour le trafic qui
+en avait le plus besoin, et un même texte présent deux fois était traduit
+deux fois.
+
+Après : un lookup groupé (get_translations_batch) pour toutes les paires
+(texte, langue), textes dédupliqués, seuls les misses envoyés au moteur,
+réécriture groupée (set_translations_batch) et `fromCache` exact par élément.
+"""
+import pytest
+
+from services.zmq_models import TranslationTask
+from services.zmq_pool import translation_processor as tp
+
+
+def _task(task_id, text, targets=("fr", "de")):
+    return TranslationTask(
+        task_id=task_id,
+        message_id=f"m-{task_id}",
+        text=text,
+        source_language="en",
+        target_languages=list(targets),
+        conversation_id="c1",
+        model_type="basic",
+    )
+
+
+class FakeCache:
+    """TranslationCacheService réduit aux appels groupés"""
+
+    def __init__(self, entries=None):
+        self.store = dict(entries or {})
+        self.lookups = []
+        self.writes = []
+
+    async def get_translations_batch(self, requests, model_type="premium"):
+        self.lookups.append(list(requests))
+        return [
+            {"translated_text": self.store[(text, tgt)], "model_type": model_type}
+            if (text, tgt) in self.store else None
+            for text, _src, tgt in requests
+        ]
+
+    async def set_translations_batch(self, items, model_type="premium", ttl=None):
+        self.writes.append(list(items))
+        for text, _src, tgt, translated in items:
+            self.store[(text, tgt)] = translated
+        return True
+
+
+class Engine:
+    def __init__(self, fail=()):
+        self.calls = []
+        self.fail = set(fail)
+
+    async def _ml_translate_batch(self, texts, source_lang, target_lang, model_type):
+        self.calls.append((target_lang, list(texts)))
+        if target_lang in self.fail:
+            raise RuntimeError("engine down")
+        return [f"<{target_lang}> {text}" for text in texts]
+
+
+@pytest.fixture
+def published():
+    results = []
+
+    async def publish(task_id, result, target_language):
+        results.append((task_id, target_language, result))
+
+    publish.results = results
+    return publish
+
+
+@pytest.mark.asyncio
+async def test_only_deduplicated_misses_reach_the_engine(published):
+    cache = FakeCache({("hello there", "fr"): "salut", ("see you", "de"): "tschüss"})
+    engine = Engine()
+    tasks = [_task("t1", "hello there"), _task("t2", "see you"), _task("t3", "hello there")]
+
+    completed = await tp.process_batch_translation(tasks, "w", engine, published, translation_cache=cache)
+
+    assert completed == 6
+    assert len(cache.lookups) == 1 and len(cache.lookups[0]) == 4  # 2 textes uniques × 2 langues
+    assert sorted(engine.calls) == [("de", ["hello there"]), ("fr", ["see you"])]
+
+    by_key = {(task_id, lang): result for task_id, lang, result in published.results}
+    assert by_key[("t1", "fr")]["fromCache"] and by_key[("t1", "fr")]["translatedText"] == "salut"
+    assert not by_key[("t1", "de")]["fromCache"]
+    assert by_key[("t3", "de")]["translatedText"] == "<de> hello there"
+    assert by_key[("t2", "de")]["fromCache"] and by_key[("t2", "de")]["batchSize"] == 3
+
+    # Réécriture en un appel, uniquement des nouvelles traductions
+    assert cache.writes == [[("see you", "en", "fr", "<fr> see you"), ("hello there", "en", "de", "<de> hello there")]]
+
+
+@pytest.mark.asyncio
+async def test_second_batch_is_served_from_cache(published):
+    cache = FakeCache()
+    engine = Engine()
+    tasks = [_task("t1", "good morning"), _task("t2", "good night")]
+    await tp.process_batch_translation(tasks, "w", engine, published, translation_cache=cache)
+    engine.calls.clear()
+
+    before = tp.get_batch_cache_stats()
+    completed = await tp.process_batch_translation(tasks, "w", engine, published, translation_cache=cache)
+
+    assert completed == 4 and engine.calls == []
+    after = tp.get_batch_cache_stats()
+    assert after["cache_hits"] - before["cache_hits"] == 4
+    assert after["inferred"] == before["inferred"]
+
+
+@pytest.mark.asyncio
+async def test_engine_failure_keeps_cache_hits_and_skips_write_back(published):
+    cache = FakeCache({("hello there", "fr"): "salut"})
+    engine = Engine(fail={"fr"})
+    tasks = [_task("t1", "hello there", targets=("fr",)), _task("t2", "other text", targets=("fr",))]
+
+    completed = await tp.process_batch_translation(tasks, "w", engine, published, translation_cache=cache)
+
+    assert completed == 1
+    by_task = {task_id: result for task_id, _lang, result in published.results}
+    assert by_task["t1"]["fromCache"]
+    assert by_task["t2"]["error"] == "engine down"
+    assert cache.writes == []
+
+
+@pytest.mark.asyncio
+async def test_cache_errors_fall_back_to_engine(published):
+    class BrokenCache(FakeCache):
+        async def get_translations_batch(self, requests, model_type="premium"):
+            raise ConnectionError("redis down")
+
+    engine = Engine()
+    tasks = [_task("t1", "hello there", targets=("fr",))]
+
+    completed = await tp.process_batch_translation(tasks, "w", engine, published, translation_cache=BrokenCache())
+
+    assert completed == 1 and engine.calls == [("fr", ["hello there"])]
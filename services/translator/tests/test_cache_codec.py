@@ -0,0 +1,166 @@
+"""
+TDD — Codec binaire versionné des valeurs de cache Redis.
+
+Avant : TranslationCacheService et AudioCacheService stockaient des chaînes
+json.dumps(...) (client decode_responses=True) ; les transcriptions avec
+segments mot à mot et les audios traduits avec listes de segments, gardés
+30 jours, dominaient la mémoire Redis et json.loads pesait sur les hits.
+
+Après : en-tête MAGIC/version/flags, msgpack (ou JSON compact) avec listes
+de segments stockées en colonnes, compression (zstd > lz4 > zlib) au-delà
+d'un seuil, lecture binaire via un client sans décodage ; les entrées JSON
+legacy restent lisibles pendant la migration.
+"""
+import json
+
+import pytest
+
+from services.redis_service import AudioCacheService, RedisService, TranslationCacheService
+from utils.cache_codec import (
+    COMPRESSION_NONE,
+    COMPRESSION_ZLIB,
+    MAGIC,
+    CacheCodec,
+    pack_columns,
+    unpack_columns,
+)
+from utils.l1_cache import TinyLFUCache
+
+
+def _transcription(n_segments=60):
+    return {
+        "text": " ".join(f"mot{i}" for i in range(n_segments)),
+        "language": "fr",
+        "confidence": 0.93,
+        "segments": [
+            {"text": f"mot{i}", "start": i * 0.4, "end": i * 0.4 + 0.35, "confidence": 0.9, "speaker_id": "s1"}
+            for i in range(n_segments)
+        ],
+    }
+
+
+def test_columnar_packing_round_trip():
+    value = _transcription(5)
+    packed = pack_columns(value)
+    assert isinstance(packed["segments"], dict)  # colonnes
+    assert unpack_columns(packed) == value
+
+    # Listes hétérogènes laissées telles quelles
+    mixed = {"items": [{"a": 1}, {"b": 2}], "tags": ["x", "y"], "one": [{"a": 1}]}
+    assert pack_columns(mixed) == mixed
+
+
+def test_binary_round_trip_and_header():
+    codec = CacheCodec(compress_threshold=1 << 20)
+    value = {"translated_text": "Bonjour 👋", "model_type": "premium", "score": 0.5, "tags": None}
+    encoded = codec.encode(value)
+
+    assert isinstance(encoded, bytes) and encoded[0] == MAGIC
+    assert (encoded[2] >> 2) & 0b111 == COMPRESSION_NONE  # sous le seuil
+    assert codec.decode(encoded) == value
+
+
+def test_large_payload_is_compressed_and_smaller_than_json():
+    codec = CacheCodec(compress_threshold=256, compression="zlib")
+    value = _transcription(200)
+    encoded = codec.encode(value)
+
+    assert (encoded[2] >> 2) & 0b111 == COMPRESSION_ZLIB
+    assert len(encoded) < len(json.dumps(value)) / 3
+    assert codec.decode(encoded) == value
+
+    stats = codec.get_stats()
+    assert stats["compressed"] == 1 and stats["compression_ratio"] < 1.0
+
+
+def test_legacy_json_entries_stay_readable():
+    codec = CacheCodec()
+    legacy = {"translated_text": "Hello", "segments": [{"text": "a"}, {"text": "b"}]}
+    assert codec.decode(json.dumps(legacy)) == legacy
+    assert codec.decode(json.dumps(legacy).encode("utf-8")) == legacy
+    assert codec.get_stats()["legacy_decoded"] == 2
+
+    # Codec désactivé: écrit du JSON legacy (rollout progressif)
+    assert CacheCodec(enabled=False).encode(legacy) == json.dumps(legacy)
+
+
+def test_unreadable_entries_decode_to_none():
+    codec = CacheCodec()
+    assert codec.decode(None) is None
+    assert codec.decode(bytes((MAGIC, 99, 0)) + b"{}") is None  # version inconnue
+    assert codec.decode(bytes((MAGIC, 1, 0b11))) is None  # sérialiseur inconnu
+    assert codec.decode(b"\xc1\x01\x04not-zlib") is None
+    assert codec.get_stats()["errors"] == 3
+
+
+@pytest.fixture
+def memory_service():
+    RedisService._instance = None
+    service = RedisService()
+    service.permanently_disabled = True
+    service.is_redis_available = False
+    yield service
+    RedisService._instance = None
+
+
+@pytest.mark.asyncio
+async def test_audio_cache_stores_binary_and_reads_legacy(memory_service):
+    audio_cache = AudioCacheService(memory_service)
+    transcription = _transcription(120)
+
+    await audio_cache.set_transcription_by_hash("abc123", transcription)
+    stored = memory_service.memory_cache["audio:transcription:hash:abc123"].value
+    assert isinstance(stored, bytes) and stored[0] == MAGIC
+    assert len(stored) < len(json.dumps(transcription))
+    assert await audio_cache.get_transcription_by_hash("abc123") == transcription
+
+    # Entrée écrite par une version précédente (JSON)
+    legacy = {"url": "en.mp3", "segments": [{"text": "hi", "start": 0.0}]}
+    await memory_service.setex("audio:translation:hash:abc123:en", 60, json.dumps(legacy))
+    assert await audio_cache.get_translated_audio_by_hash("abc123", "en") == legacy
+    all_audio = await audio_cache.get_all_translated_audio_by_hash("abc123", ["en", "de"])
+    assert all_audio == {"en": legacy, "de": None}
+
+
+@pytest.mark.asyncio
+async def test_translation_cache_round_trip_through_codec(memory_service):
+    cache = TranslationCacheService(memory_service, l1_cache=TinyLFUCache(max_bytes=1 << 20))
+    await cache.set_translation("Bonjour", "fr", "en", "Hello", model_type="premium")
+    await cache.set_translations_batch([("Merci", "fr", "en", "Thanks")], model_type="premium")
+    cache.l1.clear()  # forcer la lecture Redis
+
+    assert (await cache.get_translation("Bonjour", "fr", "en", "basic"))["translated_text"] == "Hello"
+    batch = await cache.get_batch_translations(["Merci", "Inconnu"], "fr", "en", "premium")
+    assert batch["Merci"]["translated_text"] == "Thanks" and batch["Inconnu"] is None
+
+
+class RecordingClient:
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+
+    async def get(self, key):
+        self.calls += 1
+        return self.value
+
+    async def mget(self, keys):
+        self.calls += 1
+        return [self.value for _ in keys]
+
+
+@pytest.mark.asyncio
+async def test_binary_reads_use_raw_client():
+    RedisService._instance = None
+    try:
+        service = RedisService()
+        service.permanently_disabled = False
+        service.is_redis_available = True
+        service.redis = RecordingClient("text")
+        service.redis_raw = RecordingClient(b"\xc1raw")
+
+        assert await service.get("k") == "text"
+        assert await service.get("k", binary=True) == b"\xc1raw"
+        assert await service.mget(["a", "b"], binary=True) == [b"\xc1raw", b"\xc1raw"]
+        assert service.redis.calls == 1 and service.redis_raw.calls == 2
+    finally:
+        RedisService._instance = None
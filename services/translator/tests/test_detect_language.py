@@ -34,6 +34,6 @@ def test_no_fallback_uses_configured_default_not_en():
 
 
 def test_langdetect_unavailable_returns_default(monkeypatch):
-    import services.translation_ml.translator_engine as eng
-    monkeypatch.setattr(eng, "_LANGDETECT_OK", False)
+    import services.translation_ml.language_detector as detector
+    monkeypatch.setattr(detector, "LANGDETECT_AVAILABLE", False)
     assert _engine().detect_language("Bonjour tout le monde", fallback="fr") == "fr"
@@ -0,0 +1,114 @@
+"""
+TDD — Partage équitable des pools de traduction entre conversations.
+
+Avant : enqueue_task ajoutait chaque tâche à une file partagée, distinguée
+seulement par "any" / le reste. Une grosse conversation de groupe ou un bot
+remplissait normal_pool et affamait toutes les autres conversations.
+
+Après : connection_manager.FairQueue — une sous-file par conversation (EDF
+à l'intérieur), servies en deficit round-robin pondéré (poids configurables
+pour les tenants premium), plafond de tâches en attente par conversation.
+L'accumulateur continue de grouper les conversations dans un même batch ; un
+batch mixte est servi au tour de sa conversation la moins chargée.
+"""
+import time
+
+import pytest
+
+from services.zmq_models import TranslationTask
+from services.zmq_pool.connection_manager import ConnectionManager, FairQueue, parse_flow_weights
+
+
+def _task(task_id, conv_id, deadline=None, text="a long enough message to skip the fast pool " * 3):
+    return TranslationTask(
+        task_id=task_id,
+        message_id=f"m-{task_id}",
+        text=text,
+        source_language="en",
+        target_languages=["fr"],
+        conversation_id=conv_id,
+        deadline=deadline,
+    )
+
+
+def test_parse_weights_ignores_invalid_entries():
+    assert parse_flow_weights("premium=4, small=0.5,bad=x,zero=0,=3") == {"premium": 4.0, "small": 0.5}
+
+
+@pytest.mark.asyncio
+async def test_quiet_conversation_not_starved_by_noisy_one():
+    queue = FairQueue(maxsize=1000)
+    for i in range(200):
+        await queue.put(_task(f"noisy{i}", "room"))
+    await queue.put(_task("quiet0", "dm"))
+
+    served = [(await queue.get()).task_id for _ in range(3)]
+    assert "quiet0" in served[:2]
+    assert queue.qsize() == 198
+
+
+@pytest.mark.asyncio
+async def test_weights_share_throughput():
+    queue = FairQueue(maxsize=1000, weights={"premium": 3, "slow": 0.5})
+    for i in range(60):
+        for conv in ("premium", "basic", "slow"):
+            await queue.put(_task(f"{conv}{i}", conv))
+
+    served = [(await queue.get()).conversation_id for _ in range(45)]
+    assert served.count("premium") == 3 * served.count("basic")
+    assert served.count("basic") == 2 * served.count("slow")
+
+
+@pytest.mark.asyncio
+async def test_each_conversation_served_by_deadline():
+    queue = FairQueue(maxsize=10)
+    now = time.time()
+    await queue.put(_task("late", "c1", deadline=now + 20))
+    await queue.put(_task("urgent", "c1", deadline=now + 2))
+
+    assert queue.peek_deadline() == now + 2
+    assert [(await queue.get()).task_id for _ in range(2)] == ["urgent", "late"]
+    assert queue.empty() and queue.pending_tasks("c1") == 0
+
+
+@pytest.mark.asyncio
+async def test_conversation_cap_rejects_only_that_conversation(monkeypatch):
+    monkeypatch.setenv("TRANSLATOR_FAIR_QUEUE_MAX_PER_CONVERSATION", "5")
+    monkeypatch.setenv("TRANSLATOR_BATCH_ENABLED", "false")
+    manager = ConnectionManager()
+
+    results = [await manager.enqueue_task(_task(f"n{i}", "room")) for i in range(7)]
+    assert results == [True] * 5 + [False] * 2
+    assert await manager.enqueue_task(_task("q", "dm"))
+
+    stats = manager.get_stats()
+    assert stats["conversation_cap_rejections"] == 2
+    assert stats["fair_queue"]["normal"]["active_conversations"] == 2
+
+    # Une tâche servie libère une place pour la conversation
+    await manager.normal_pool.get()
+    assert await manager.enqueue_task(_task("n7", "room"))
+
+
+@pytest.mark.asyncio
+async def test_mixed_batch_goes_to_quietest_conversation(monkeypatch):
+    monkeypatch.setenv("BATCH_MAX_SIZE", "3")
+    manager = ConnectionManager()
+    for i in range(4):
+        await manager.enqueue_task(_task(f"n{i}", "room"))  # batch bruyant de 3, 1 accumulée
+    await manager.enqueue_task(_task("q", "dm"))
+    await manager.enqueue_task(_task("n4", "room"))  # batch mixte [n3, q, n4]
+
+    assert manager.normal_pool.pending_tasks("room") == 5
+    assert manager.normal_pool.pending_tasks("dm") == 1
+    first = await manager.normal_pool.get()
+    second = await manager.normal_pool.get()
+    assert [t.task_id for t in first._batch_tasks] == ["n0", "n1", "n2"]
+    assert second._flow_key == "dm" and "q" in [t.task_id for t in second._batch_tasks]
+
+
+def test_fair_queue_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("TRANSLATOR_FAIR_QUEUE", "false")
+    manager = ConnectionManager()
+    assert not isinstance(manager.normal_pool, FairQueue)
+    assert manager.get_stats()["fair_queue"] == {}
@@ -0,0 +1,225 @@
+"""
+TDD — Backend d'inférence CPU sélectionnable (torch float32 / int8 / ONNX).
+
+Les pods translator sont CPU-only : `quantization_level` n'agissait que sur
+GPU et les modèles NLLB tournaient toujours en float32. TRANSLATOR_INFERENCE_BACKEND
+permet de charger `basic`/`premium` en int8 dynamique (couches Linear) ou en
+ONNX Runtime ; Seq2SeqTranslator s'adapte au backend sans changer d'API.
+
+Les tests de parité BLEU (int8 puis ONNX vs float32 sur un corpus fixe)
+téléchargent le modèle : ils ne sont exécutés que si TRANSLATOR_PARITY_MODEL
+est défini (et, pour ONNX, si optimum[onnxruntime] est installé).
+
+L'export ONNX part des poids locaux (copie sous models_path ou cache
+HuggingFace, hors ligne) et n'est publié qu'une fois complet : un export
+partiel n'est jamais réutilisé.
+"""
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from services.translation_ml import model_loader as ml
+from services.translation_ml.model_loader import ModelLoader, is_complete_onnx_export, resolve_inference_backend
+from services.translation_ml.seq2seq_translator import Seq2SeqTranslator
+
+
+@pytest.mark.parametrize("requested,device,onnx,expected", [
+    ("torch", "cpu", True, "torch"),
+    ("int8", "cpu", False, "int8"),
+    ("onnx", "cpu", True, "onnx"),
+    ("ONNX", "cpu", True, "onnx"),
+    # Dépendance absente → démarrage quand même, en float32
+    ("onnx", "cpu", False, "torch"),
+    # Backends CPU uniquement : sur GPU on garde torch (float16)
+    ("int8", "cuda", True, "torch"),
+    ("bogus", "cpu", True, "torch"),
+])
+def test_resolve_inference_backend(requested, device, onnx, expected):
+    assert resolve_inference_backend(requested, device, onnx_available=onnx) == expected
+
+
+class _Tokenizer:
+    src_lang = None
+
+    def convert_tokens_to_ids(self, token):
+        return token
+
+
+def _model_of_module(module_name):
+    cls = type("FakeModel", (), {"__module__": module_name})
+    model = cls()
+    model.config = SimpleNamespace(model_type="m2m_100")
+    return model
+
+
+def test_seq2seq_detects_onnx_backend_and_stays_on_cpu():
+    model = _model_of_module("optimum.onnxruntime.modeling_seq2seq")
+    model.to = lambda *a, **kw: pytest.fail("un modèle ONNX ne doit pas être déplacé")
+
+    translator = Seq2SeqTranslator(model, _Tokenizer(), "fra_Latn", "eng_Latn", device=0)
+
+    assert translator.backend == "onnx"
+    assert translator.get_model_info()["device"] == "cpu"
+
+
+def test_seq2seq_detects_dynamic_int8_modules():
+    quantized_linear = _model_of_module("torch.ao.nn.quantized.dynamic.modules.linear")
+    model = _model_of_module("transformers.models.m2m_100.modeling_m2m_100")
+    model.modules = lambda: iter([model, quantized_linear])
+
+    translator = Seq2SeqTranslator(model, _Tokenizer(), "fra_Latn", "eng_Latn")
+
+    assert translator.backend == "int8"
+    assert translator.get_model_info()["backend"] == "int8"
+
+
+PARITY_CORPUS = [
+    "Bonjour, comment allez-vous aujourd'hui ?",
+    "Le rendez-vous est reporté à jeudi prochain.",
+    "Merci pour votre message, je vous réponds dès que possible.",
+    "La réunion commence à neuf heures dans la grande salle.",
+    "Il fait très beau ce week-end, on pourrait aller à la plage.",
+    "Peux-tu m'envoyer le document avant ce soir ?",
+    "Nous avons reçu votre commande et elle sera expédiée demain.",
+    "Je suis désolé, je ne comprends pas ta question.",
+]
+
+
+@pytest.mark.slow
+def test_int8_bleu_parity_against_float32():
+    model_name = os.getenv("TRANSLATOR_PARITY_MODEL")
+    if not model_name:
+        pytest.skip("TRANSLATOR_PARITY_MODEL non défini (ex: facebook/nllb-200-distilled-600M)")
+    torch = pytest.importorskip("torch")
+    transformers = pytest.importorskip("transformers")
+    sacrebleu = pytest.importorskip("sacrebleu")
+
+    from services.translation_ml.model_loader import quantize_dynamic_int8
+
+    tokenizer = transformers.AutoTokenizer.from_pretrained(model_name)
+
+    def translate_all(model):
+        translator = Seq2SeqTranslator(model, tokenizer, "fra_Latn", "eng_Latn")
+        with torch.inference_mode():
+            return [r["translation_text"] for r in translator(PARITY_CORPUS, max_length=128)]
+
+    reference = translate_all(
+        transformers.AutoModelForSeq2SeqLM.from_pretrained(model_name).eval()
+    )
+    quantized = translate_all(quantize_dynamic_int8(
+        transformers.AutoModelForSeq2SeqLM.from_pretrained(model_name).eval()
+    ))
+
+    bleu = sacrebleu.corpus_bleu(quantized, [reference]).score
+    assert bleu >= 80.0, f"dérive int8 trop forte: BLEU={bleu:.1f} vs float32"
+
+
+class _FakeORTModel:
+    """ORTModelForSeq2SeqLM factice: enregistre les sources, écrit un export"""
+
+    sources = []
+    save_files = ("encoder_model.onnx", "decoder_model_merged.onnx", "config.json")
+
+    @classmethod
+    def from_pretrained(cls, source, **kwargs):
+        cls.sources.append((source, kwargs.get("export", False)))
+        return cls()
+
+    def save_pretrained(self, path):
+        os.makedirs(path, exist_ok=True)
+        for name in self.save_files:
+            with open(os.path.join(path, name), "w") as f:
+                f.write("x")
+
+
+@pytest.fixture
+def onnx_loader(tmp_path, monkeypatch):
+    _FakeORTModel.sources = []
+    monkeypatch.setattr(ml, "ORTModelForSeq2SeqLM", _FakeORTModel, raising=False)
+    loader = ModelLoader.__new__(ModelLoader)
+    loader.models_path = tmp_path / "models"
+    loader.huggingface_cache = tmp_path / "hf"
+    return loader
+
+
+def test_onnx_export_starts_from_local_weights(onnx_loader, monkeypatch):
+    # Copie locale sous models_path
+    local = onnx_loader.models_path / "org" / "nllb"
+    local.mkdir(parents=True)
+    (local / "config.json").write_text("{}")
+    onnx_loader._load_onnx_model("org/nllb")
+    assert _FakeORTModel.sources == [(str(local), True)]
+
+    # Sinon l'instantané du cache HuggingFace, sans réseau
+    snapshot_calls = []
+
+    def snapshot_download(**kwargs):
+        snapshot_calls.append(kwargs)
+        return "/hf/snapshots/abc"
+
+    monkeypatch.setitem(sys.modules, "huggingface_hub", SimpleNamespace(snapshot_download=snapshot_download))
+    onnx_loader._load_onnx_model("org/other")
+    assert _FakeORTModel.sources[-1] == ("/hf/snapshots/abc", True)
+    assert snapshot_calls[0]["local_files_only"] is True
+
+
+def test_partial_onnx_export_is_neither_reused_nor_published(onnx_loader):
+    onnx_path = onnx_loader.models_path / "org" / "nllb-onnx"
+    onnx_path.mkdir(parents=True)
+    (onnx_path / "config.json").write_text("{}")  # Export interrompu
+    assert not is_complete_onnx_export(onnx_path)
+
+    # Ré-exporté, puis publié complet
+    onnx_loader._load_onnx_model("org/nllb")
+    assert _FakeORTModel.sources[-1][1] is True
+    assert is_complete_onnx_export(onnx_path)
+    assert os.listdir(onnx_loader.models_path / "org") == ["nllb-onnx"]
+
+    # Réutilisé au démarrage suivant (pas de nouvel export)
+    onnx_loader._load_onnx_model("org/nllb")
+    assert _FakeORTModel.sources[-1] == (str(onnx_path), False)
+
+    # Sauvegarde incomplète: rien n'est publié, le temporaire est nettoyé
+    _FakeORTModel.save_files = ("config.json",)
+    try:
+        onnx_loader._load_onnx_model("org/broken")
+    finally:
+        _FakeORTModel.save_files = ("encoder_model.onnx", "decoder_model_merged.onnx", "config.json")
+    assert sorted(os.listdir(onnx_loader.models_path / "org")) == ["nllb-onnx"]
+
+
+@pytest.mark.slow
+def test_onnx_bleu_parity_against_float32(tmp_path):
+    model_name = os.getenv("TRANSLATOR_PARITY_MODEL")
+    if not model_name:
+        pytest.skip("TRANSLATOR_PARITY_MODEL non défini (ex: facebook/nllb-200-distilled-600M)")
+    pytest.importorskip("optimum.onnxruntime")
+    torch = pytest.importorskip("torch")
+    transformers = pytest.importorskip("transformers")
+    sacrebleu = pytest.importorskip("sacrebleu")
+
+    tokenizer = transformers.AutoTokenizer.from_pretrained(model_name)
+
+    def translate_all(model):
+        translator = Seq2SeqTranslator(model, tokenizer, "fra_Latn", "eng_Latn")
+        with torch.inference_mode():
+            return [r["translation_text"] for r in translator(PARITY_CORPUS, max_length=128)]
+
+    reference = translate_all(
+        transformers.AutoModelForSeq2SeqLM.from_pretrained(model_name).eval()
+    )
+
+    # Chemin de production: export au premier chargement, puis réutilisation
+    loader = ModelLoader.__new__(ModelLoader)
+    loader.models_path = tmp_path
+    loader.huggingface_cache = tmp_path / "hf"
+    onnx_model = loader._load_onnx_model(model_name)
+    assert Seq2SeqTranslator(onnx_model, tokenizer, "fra_Latn", "eng_Latn").backend == "onnx"
+    exported = translate_all(onnx_model)
+    reloaded = translate_all(loader._load_onnx_model(model_name))
+
+    bleu = sacrebleu.corpus_bleu(exported, [reference]).score
+    assert bleu >= 80.0, f"dérive ONNX trop forte: BLEU={bleu:.1f} vs float32"
+    assert reloaded == exported
@@ -0,0 +1,155 @@
+"""
+TDD — Micro-batching continu de l'inférence (InferenceScheduler).
+
+Avant : chaque `_translate_single_chunk` prenait le lock modèle et lançait
+son propre `generate()` pour UN texte — sous charge (40 workers ZMQ) les
+inférences étaient sérialisées phrase par phrase.
+
+Le scheduler collecte les chunks concurrents de tous les appelants pendant
+quelques ms, les groupe par paire de langues et lance un seul `generate()`
+paddé par groupe.
+"""
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from services.translation_ml.inference_scheduler import InferenceScheduler, PendingChunk
+from services.translation_ml.translator_engine import TranslatorEngine
+
+
+class _RecordingRunner:
+    """run_batch factice qui enregistre chaque passe d'inférence."""
+
+    def __init__(self, fail_on=None):
+        self.calls = []
+        self.fail_on = fail_on
+        self._lock = threading.Lock()
+
+    def __call__(self, src, tgt, texts):
+        with self._lock:
+            self.calls.append((src, tgt, list(texts)))
+        if self.fail_on and self.fail_on in texts:
+            raise RuntimeError("boom")
+        return [f"{tgt}:{t}" for t in texts]
+
+
+def test_concurrent_chunks_are_grouped_by_language_pair():
+    runner = _RecordingRunner()
+    scheduler = InferenceScheduler("basic", runner, window_ms=50, max_batch_size=16)
+    try:
+        futures = [
+            scheduler.submit("un", "fra_Latn", "eng_Latn"),
+            scheduler.submit("deux", "fra_Latn", "spa_Latn"),
+            scheduler.submit("trois", "fra_Latn", "eng_Latn"),
+        ]
+        results = [f.result(timeout=5) for f in futures]
+    finally:
+        scheduler.stop()
+
+    assert results == ["eng_Latn:un", "spa_Latn:deux", "eng_Latn:trois"]
+    # Une passe par paire de langues, ordre d'arrivée conservé dans le groupe
+    assert sorted(runner.calls) == [
+        ("fra_Latn", "eng_Latn", ["un", "trois"]),
+        ("fra_Latn", "spa_Latn", ["deux"]),
+    ]
+    assert scheduler.get_stats()['batches_run'] == 1
+
+
+def test_max_batch_size_flushes_early():
+    runner = _RecordingRunner()
+    scheduler = InferenceScheduler("basic", runner, window_ms=10_000, max_batch_size=2)
+    try:
+        futures = [scheduler.submit(f"t{i}", "fra_Latn", "eng_Latn") for i in range(2)]
+        # La fenêtre de 10 s n'est pas attendue : le batch plein part tout de suite
+        assert [f.result(timeout=5) for f in futures] == ["eng_Latn:t0", "eng_Latn:t1"]
+    finally:
+        scheduler.stop()
+
+
+def test_error_is_propagated_only_to_failing_group():
+    runner = _RecordingRunner(fail_on="bad")
+    scheduler = InferenceScheduler("basic", runner, window_ms=50)
+    try:
+        bad = scheduler.submit("bad", "fra_Latn", "eng_Latn")
+        good = scheduler.submit("good", "fra_Latn", "deu_Latn")
+        with pytest.raises(RuntimeError):
+            bad.result(timeout=5)
+        assert good.result(timeout=5) == "deu_Latn:good"
+    finally:
+        scheduler.stop()
+
+    assert scheduler.get_stats()['errors'] == 1
+
+
+def test_future_cancelled_after_done_check_is_ignored():
+    class _CancelledAfterCheck(Future):
+        """L'appelant annule entre le contrôle done() et la résolution"""
+
+        def set_result(self, result):
+            self.cancel()
+            super().set_result(result)
+
+    scheduler = InferenceScheduler("basic", _RecordingRunner(), window_ms=1)
+    raced = PendingChunk("lent", "fra_Latn", "eng_Latn", _CancelledAfterCheck())
+    served = PendingChunk("suite", "fra_Latn", "eng_Latn", Future())
+
+    scheduler._process_batch([raced, served])
+
+    assert raced.future.cancelled()
+    assert served.future.result(timeout=0) == "eng_Latn:suite"
+
+
+def test_unexpected_error_fails_the_batch_and_keeps_serving():
+    runner = _RecordingRunner()
+    scheduler = InferenceScheduler("basic", runner, window_ms=1)
+    original = scheduler._process_batch
+    calls = []
+
+    def flaky(batch):
+        calls.append(len(batch))
+        if len(calls) == 1:
+            raise KeyError("bug")
+        original(batch)
+
+    scheduler._process_batch = flaky
+    try:
+        with pytest.raises(KeyError):
+            scheduler.submit("a", "fra_Latn", "eng_Latn").result(timeout=5)
+        assert scheduler.submit("b", "fra_Latn", "eng_Latn").result(timeout=5) == "eng_Latn:b"
+    finally:
+        scheduler.stop()
+
+    assert scheduler.get_stats()['errors'] == 1
+
+
+@pytest.mark.asyncio
+async def test_engine_coalesces_concurrent_translate_text_into_one_generate():
+    model_loader = MagicMock()
+    model_loader.is_model_loaded.return_value = True
+    model_loader.get_model_inference_lock.return_value = threading.Lock()
+
+    engine = TranslatorEngine(model_loader, ThreadPoolExecutor(max_workers=2))
+    engine.perf_config.enable_micro_batching = True
+    engine.perf_config.micro_batch_window_ms = 50
+
+    pipeline_calls = []
+
+    def fake_pipeline(texts, **kwargs):
+        pipeline_calls.append(list(texts))
+        return [{"translation_text": f"T:{t}"} for t in texts]
+
+    engine._get_or_create_pipeline = MagicMock(return_value=(fake_pipeline, True))
+
+    try:
+        results = await asyncio.gather(*[
+            engine.translate_text(f"message {i}", "fr", "en", "basic") for i in range(5)
+        ])
+    finally:
+        engine.cleanup()
+
+    assert results == [f"T:message {i}" for i in range(5)]
+    assert len(pipeline_calls) == 1
+    assert len(pipeline_calls[0]) == 5
@@ -0,0 +1,180 @@
+"""
+TDD — Cache L1 en mémoire (W-TinyLFU borné en octets) devant Redis.
+
+Avant : chaque hit du cache de traduction dans _translate_single_language
+coûtait un GET réseau + json.loads ; RedisService.memory_cache ne servait
+que Redis en panne.
+
+Après : L1 toujours actif devant Redis pour les entrées (texte, src, tgt,
+modèle) chaudes — borné en octets, admission TinyLFU (un balayage de clés
+uniques ne chasse pas les entrées chaudes), alimenté par les hits Redis et
+les écritures, statistiques exposées par /debug/cache.
+"""
+import pytest
+
+from services.redis_service import RedisService, TranslationCacheService
+from utils.l1_cache import FrequencySketch, TinyLFUCache, estimate_size
+
+
+def test_frequency_sketch_counts_and_ages():
+    sketch = FrequencySketch(width=256, sample_size=100)
+    for _ in range(8):
+        sketch.increment("hot")
+    sketch.increment("cold")
+    assert sketch.frequency("hot") >= 8
+    assert sketch.frequency("cold") >= 1
+    assert sketch.frequency("hot") > sketch.frequency("never-seen")
+
+    for i in range(100):
+        sketch.increment(f"noise-{i}")
+    # Vieillissement: les compteurs ont été divisés par deux
+    assert sketch.frequency("hot") <= 4
+
+
+def test_cache_is_bounded_in_bytes():
+    cache = TinyLFUCache(max_bytes=20_000)
+    for i in range(200):
+        key = f"key-{i}"
+        cache.get(key)
+        cache.put(key, {"translated_text": "x" * 100})
+
+    stats = cache.get_stats()
+    assert stats["bytes"] <= cache.max_bytes
+    assert stats["evictions"] + stats["rejections"] > 0
+    assert stats["entries"] < 200
+
+    # Entrée plus grosse que tout le budget: refusée
+    assert not cache.put("huge", {"translated_text": "y" * 50_000})
+
+
+def test_scan_of_unique_keys_does_not_evict_hot_entries():
+    cache = TinyLFUCache(max_bytes=40_000)
+    hot = [f"bonjour-{i}" for i in range(20)]
+    for key in hot:
+        cache.get(key)
+        cache.put(key, {"translated_text": key.upper()})
+    for _ in range(5):
+        for key in hot:
+            assert cache.get(key) is not None
+
+    # Balayage: des milliers de messages uniques vus une seule fois
+    for i in range(2000):
+        key = f"unique-{i}"
+        cache.get(key)
+        cache.put(key, {"translated_text": "z" * 80})
+
+    assert all(cache.get(key) is not None for key in hot)
+    assert cache.get_stats()["rejections"] > 0
+
+
+def test_ttl_expires_entries(monkeypatch):
+    import utils.l1_cache as l1
+
+    cache = TinyLFUCache(max_bytes=10_000, ttl_s=60)
+    cache.put("k", {"translated_text": "v"})
+    assert cache.get("k") == {"translated_text": "v"}
+
+    now = l1.time.monotonic()
+    monkeypatch.setattr(l1.time, "monotonic", lambda: now + 61)
+    assert cache.get("k") is None
+    assert cache.get_stats()["expired"] == 1
+
+
+def test_estimate_size_counts_utf8_bytes():
+    assert estimate_size("k", {"translated_text": "é"}) > estimate_size("k", {"translated_text": "e"})
+
+
+class CountingRedis:
+    def __init__(self):
+        self.store = {}
+        self.gets = 0
+
+    async def get(self, key, binary=False):
+        self.gets += 1
+        return self.store.get(key)
+
+    async def mget(self, keys, binary=False):
+        self.gets += 1
+        return [self.store.get(key) for key in keys]
+
+    async def setex(self, key, seconds, value):
+        self.store[key] = value
+        return True
+
+    async def delete(self, key):
+        self.store.pop(key, None)
+        return True
+
+    def get_stats(self):
+        return {"mode": "fake"}
+
+
+@pytest.mark.asyncio
+async def test_translation_cache_serves_hot_entries_from_l1():
+    redis = CountingRedis()
+    l1 = TinyLFUCache(max_bytes=1 << 20)
+    cache = TranslationCacheService(redis, l1_cache=l1)
+
+    # Entrée déjà en Redis (autre worker): le premier hit alimente le L1
+    writer = TranslationCacheService(redis, l1_cache=TinyLFUCache(max_bytes=1 << 20))
+    await writer.set_translation("Salut", "fr", "en", "Hi", model_type="basic")
+
+    for _ in range(5):
+        cached = await cache.get_translation("Salut", "fr", "en", "basic")
+        assert cached["translated_text"] == "Hi"
+    assert redis.gets == 1
+
+    # La copie retournée peut être modifiée sans corrompre le L1
+    cached["translated_text"] = "mutated"
+    assert (await cache.get_translation("Salut", "fr", "en", "basic"))["translated_text"] == "Hi"
+
+    batch = await cache.get_batch_translations(["Salut", "Inconnu"], "fr", "en", "basic")
+    assert batch["Salut"]["translated_text"] == "Hi" and batch["Inconnu"] is None
+
+    await cache.invalidate_translation("Salut", "fr", "en", "basic")
+    assert await cache.get_translation("Salut", "fr", "en", "basic") is None
+
+    stats = cache.get_stats()["l1"]
+    assert stats["hits"] >= 6 and stats["misses"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_premium_fallback_is_cached_in_l1():
+    RedisService._instance = None
+    try:
+        service = RedisService()
+        service.permanently_disabled = True
+        l1 = TinyLFUCache(max_bytes=1 << 20)
+        cache = TranslationCacheService(service, l1_cache=l1)
+
+        await cache.set_translation("Merci", "fr", "en", "Thank you", model_type="premium")
+        service.memory_cache.clear()  # Redis vidé: seul le L1 répond
+
+        cached = await cache.get_translation("Merci", "fr", "en", "basic")
+        assert cached["translated_text"] == "Thank you"
+    finally:
+        RedisService._instance = None
+
+
+def test_debug_cache_route_reports_l1_stats():
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from fastapi import APIRouter
+    from fastapi.testclient import TestClient
+
+    translation_service = MagicMock()
+    translation_service.cache_service.get_stats = AsyncMock(return_value={"mode": "Memory"})
+    with patch('api.translation_api.set_services'), \
+            patch('api.translation_api.health_router', APIRouter()), \
+            patch('api.translation_api.AUDIO_API_AVAILABLE', False):
+        from api.translation_api import TranslationAPI
+
+        api = TranslationAPI(
+            translation_service=translation_service,
+            database_service=MagicMock(),
+            zmq_server=MagicMock()
+        )
+        data = TestClient(api.app).get("/debug/cache").json()
+
+    assert data["cache_stats"] == {"mode": "Memory"}
+    assert {"hits", "misses", "evictions", "bytes", "max_bytes"} <= set(data["l1_cache"])
@@ -0,0 +1,179 @@
+"""
+TDD — Détecteur de langue enfichable, API batch et priors par conversation.
+
+Avant : TranslatorEngine.detect_language appelait langdetect.detect_langs
+(Python pur) à chaque requête, à nouveau dans translate_with_structure ;
+le batch ZMQ 'auto' passait 'auto' tel quel au modèle ; /detect-language
+instanciait son propre langdetect.
+
+Après :
+1. écritures non ambiguës (hangul, kana, thaï, grec...) détectées sans modèle ;
+2. backends essayés dans l'ordre (fastText si modèle présent, langdetect),
+   un appel par batch, résultats mémorisés par texte ;
+3. prior par conversation : "ok", "merci" reprennent la langue récente
+   de la conversation quand le backend n'est pas assez confiant ; une
+   détection fiable l'emporte toujours (conversations de groupe) ;
+4. le batch ZMQ 'auto' est résolu par une détection batch puis découpé
+   en sous-batches par langue.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from services.translation_ml.language_detector import (
+    LanguageDetector,
+    LanguagePriorCache,
+    detect_script_language,
+)
+from services.zmq_pool import translation_processor as tp
+
+
+class CountingBackend:
+    name = "fake"
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.calls = []
+
+    def is_available(self):
+        return True
+
+    def detect_batch(self, texts):
+        self.calls.append(list(texts))
+        return [[self.answers[t]] if t in self.answers else [] for t in texts]
+
+
+def test_unambiguous_scripts_are_detected_without_a_model():
+    assert detect_script_language("안녕하세요")[0] == "ko"
+    assert detect_script_language("こんにちは、元気ですか")[0] == "ja"
+    assert detect_script_language("你好，你好吗")[0] == "zh"
+    assert detect_script_language("Καλημέρα")[0] == "el"
+    assert detect_script_language("Bonjour tout le monde") is None
+    # Cyrillique partagé par ru/uk/bg: laissé au backend statistique
+    assert detect_script_language("Привет") is None
+
+    backend = CountingBackend({})
+    detector = LanguageDetector(backends=[backend])
+    assert detector.detect("สวัสดี") == "th"
+    assert backend.calls == []
+
+
+def test_batch_uses_one_backend_call_and_caches_results():
+    backend = CountingBackend({
+        "Bonjour tout le monde": ("fr", 0.99),
+        "How are you doing today": ("en", 0.97),
+        "hmm peut-être": ("fr", 0.55),
+    })
+    detector = LanguageDetector(backends=[backend], default_language="fr")
+
+    languages = detector.detect_batch(
+        ["Bonjour tout le monde", "How are you doing today", "hmm peut-être", "안녕"],
+        fallback="es"
+    )
+    assert languages == ["fr", "en", "es", "ko"]
+    assert len(backend.calls) == 1 and len(backend.calls[0]) == 3
+
+    assert detector.detect("How are you doing today") == "en"
+    assert len(backend.calls) == 1
+
+
+def test_backends_are_tried_in_order_for_unresolved_texts():
+    first = CountingBackend({"Guten Tag zusammen": ("de", 0.95)})
+    second = CountingBackend({"Hola a todos amigos": ("es", 0.9)})
+    detector = LanguageDetector(backends=[first, second])
+
+    assert detector.detect_batch(["Guten Tag zusammen", "Hola a todos amigos"]) == ["de", "es"]
+    assert second.calls == [["Hola a todos amigos"]]
+
+
+def test_conversation_prior_only_breaks_ties():
+    backend = CountingBackend({
+        "Ciao a tutti, come state oggi?": ("it", 0.99),
+        "grazie": ("it", 0.4),
+        "thanks a lot": ("en", 0.99),
+    })
+    priors = LanguagePriorCache(max_size=10)
+    detector = LanguageDetector(backends=[backend], prior_cache=priors)
+
+    assert detector.detect("Ciao a tutti, come state oggi?", context_key="conv-1") == "it"
+
+    # Backend peu confiant: le prior de la conversation départage
+    result = detector.detect_with_confidence("grazie", context_key="conv-1")
+    assert (result.language, result.method) == ("it", "prior")
+    # Trop court pour un backend: prior seul
+    assert detector.detect_with_confidence("ok", context_key="conv-1").method == "prior"
+
+    # Groupe multilingue: une détection fiable l'emporte sur le prior, et le remplace
+    result = detector.detect_with_confidence("thanks a lot", context_key="conv-1")
+    assert (result.language, result.method) == ("en", "fake")
+    assert priors.get("conv-1") == "en"
+
+    # Sans prior pour le contexte: jamais la langue d'une autre conversation
+    assert detector.detect("xy", fallback="fr", context_key="conv-2") == "fr"
+
+
+def test_engine_delegates_to_shared_detector():
+    from concurrent.futures import ThreadPoolExecutor
+    from unittest.mock import MagicMock
+
+    from services.translation_ml.translator_engine import TranslatorEngine
+
+    engine = TranslatorEngine(model_loader=MagicMock(), executor=ThreadPoolExecutor(max_workers=1))
+    try:
+        engine.language_detector = LanguageDetector(backends=[CountingBackend({"Bom dia a todos": ("pt", 0.99)})])
+        assert engine.detect_languages(["Bom dia a todos", "Ok"], fallback="fr") == ["pt", "fr"]
+    finally:
+        engine.cleanup()
+
+
+def _task(task_id, text, conversation_id="conv-1"):
+    return SimpleNamespace(
+        task_id=task_id,
+        message_id=f"msg-{task_id}",
+        text=text,
+        source_language="auto",
+        target_languages=["en"],
+        model_type="basic",
+        conversation_id=conversation_id,
+        created_at=1_700_000_000.0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_auto_batch_is_split_by_detected_language(monkeypatch):
+    backend = CountingBackend({
+        "Bonjour tout le monde": ("fr", 0.99),
+        "Buenos días a todos": ("es", 0.99),
+        "Comment ça va ce matin": ("fr", 0.99),
+    })
+    detector = LanguageDetector(backends=[backend], prior_cache=LanguagePriorCache())
+    monkeypatch.setattr(tp, "get_language_detector", lambda: detector)
+
+    seen = []
+
+    class Service:
+        async def _ml_translate_batch(self, texts, source_lang, target_lang, model_type):
+            seen.append((source_lang, list(texts)))
+            return [f"<{target_lang}> {t}" for t in texts]
+
+    published = []
+
+    async def publish(task_id, result, target_language):
+        published.append((task_id, result["sourceLanguage"]))
+
+    tasks = [
+        _task("a", "Bonjour tout le monde"),
+        _task("b", "Buenos días a todos", conversation_id="conv-2"),
+        _task("c", "Comment ça va ce matin"),
+    ]
+    completed = await tp.process_batch_translation(tasks, "w", Service(), publish)
+
+    assert completed == 3
+    assert len(backend.calls) == 1
+    assert seen == [
+        ("fr", ["Bonjour tout le monde", "Comment ça va ce matin"]),
+        ("es", ["Buenos días a todos"]),
+    ]
+    assert sorted(published) == [("a", "fr"), ("b", "es"), ("c", "fr")]
+    # Les tâches d'origine ne sont pas modifiées
+    assert all(t.source_language == "auto" for t in tasks)
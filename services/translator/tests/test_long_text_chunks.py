@@ -0,0 +1,55 @@
+"""
+TDD — Les morceaux d'un texte long partent en batch, pas en séquence.
+
+Avant : un message de 1500 caractères découpé en 8 morceaux coûtait 8
+allers-retours executor, 8 prises de lock et 8 generate() séquentiels —
+principale source de latence de queue sur le pool `normal`.
+
+Après : tous les morceaux d'un message sont traduits dans la même passe
+d'inférence paddée puis recollés dans l'ordre.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from services.translation_ml.translator_engine import TranslatorEngine, smart_split_text
+
+LONG_TEXT = " ".join(f"Phrase numéro {i} du message, assez longue pour compter." for i in range(20))
+
+
+def _make_engine(micro_batching):
+    model_loader = MagicMock()
+    model_loader.is_model_loaded.return_value = True
+    model_loader.get_model_inference_lock.return_value = threading.Lock()
+
+    engine = TranslatorEngine(model_loader, ThreadPoolExecutor(max_workers=2))
+    engine.perf_config.enable_micro_batching = micro_batching
+    engine.perf_config.micro_batch_window_ms = 20
+
+    calls = []
+
+    def fake_pipeline(texts, **kwargs):
+        calls.append(list(texts))
+        return [{"translation_text": f"<{t}>"} for t in texts]
+
+    engine._get_or_create_pipeline = MagicMock(return_value=(fake_pipeline, True))
+    return engine, calls
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("micro_batching", [True, False])
+async def test_long_text_chunks_are_translated_together_in_order(micro_batching):
+    engine, calls = _make_engine(micro_batching)
+    try:
+        result = await engine.translate_text(LONG_TEXT, "fr", "en", "basic")
+    finally:
+        engine.cleanup()
+
+    chunks = smart_split_text(LONG_TEXT, max_chars=200)
+    assert len(chunks) > 4
+    # Un seul generate() pour tout le message, morceaux recollés dans l'ordre
+    assert len(calls) == 1
+    assert sorted(calls[0]) == sorted(chunks)
+    assert result == " ".join(f"<{c}>" for c in chunks)
@@ -0,0 +1,173 @@
+"""
+TDD — Opérations Redis groupées (MGET / SETEX pipelinés / EXISTS multiple).
+
+Avant : get_batch_translations attendait get_translation texte par texte,
+check_cache_batch lançait une coroutine (un aller-retour Redis) par segment,
+cache_batch_results écrivait un setex à la fois : un message structuré de
+60 segments coûtait 120 allers-retours, la latence des hits croissait
+linéairement avec le nombre de segments.
+
+Après : RedisService.mget / setex_many / exists_many (un aller-retour, avec
+équivalents en cache mémoire) ; caches traduction et audio reconstruits
+dessus → 2 allers-retours pour 60 segments.
+"""
+import asyncio
+
+import pytest
+
+from services.redis_service import AudioCacheService, RedisService, TranslationCacheService
+from services.translation_ml.translation_cache import TranslationCache
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def setex(self, key, seconds, value):
+        self.commands.append(("setex", key, seconds, value))
+
+    def exists(self, key):
+        self.commands.append(("exists", key))
+
+    async def execute(self):
+        self.client.round_trips += 1
+        results = []
+        for command in self.commands:
+            if command[0] == "setex":
+                self.client.store[command[1]] = command[3]
+                results.append(True)
+            else:
+                results.append(1 if command[1] in self.client.store else 0)
+        return results
+
+
+class FakeRedis:
+    """Client redis.asyncio minimal qui compte les allers-retours"""
+
+    def __init__(self):
+        self.store = {}
+        self.round_trips = 0
+
+    async def get(self, key):
+        self.round_trips += 1
+        return self.store.get(key)
+
+    async def setex(self, key, seconds, value):
+        self.round_trips += 1
+        self.store[key] = value
+
+    async def mget(self, keys):
+        self.round_trips += 1
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+@pytest.fixture
+def redis_service():
+    RedisService._instance = None
+    service = RedisService()
+    service.redis = FakeRedis()
+    service.is_redis_available = True
+    service.permanently_disabled = False
+    yield service
+    RedisService._instance = None
+
+
+@pytest.fixture
+def memory_service():
+    RedisService._instance = None
+    service = RedisService()
+    service.permanently_disabled = True
+    service.is_redis_available = False
+    yield service
+    RedisService._instance = None
+
+
+@pytest.mark.asyncio
+async def test_bulk_operations_use_one_round_trip(redis_service):
+    assert await redis_service.setex_many({"a": "1", "b": "2"}, 60)
+    assert await redis_service.mget(["a", "missing", "b"]) == ["1", None, "2"]
+    assert await redis_service.exists_many(["a", "missing"]) == [True, False]
+    assert redis_service.redis.round_trips == 3
+    assert await redis_service.mget([]) == []
+
+
+@pytest.mark.asyncio
+async def test_bulk_operations_memory_fallback(memory_service):
+    await memory_service.setex_many({"a": "1", "b": "2"}, 60)
+    memory_service.memory_cache["b"].expires_at = 0  # expirée
+
+    assert await memory_service.mget(["a", "b", "c"]) == ["1", None, None]
+    assert await memory_service.exists_many(["a", "b", "c"]) == [True, False, False]
+
+
+@pytest.mark.asyncio
+async def test_sixty_segments_cost_two_round_trips(redis_service):
+    cache_service = TranslationCacheService(redis_service)
+    texts = [f"Phrase numéro {i}." for i in range(60)]
+
+    await cache_service.set_translations_batch(
+        [(text, "fr", "en", f"Sentence {i}.") for i, text in enumerate(texts[:30])],
+        model_type="premium"
+    )
+    assert redis_service.redis.round_trips == 1
+
+    redis_service.redis.round_trips = 0
+    cached = await cache_service.get_batch_translations(texts, "fr", "en", "basic")
+
+    # MGET des 60 clés 'basic' + MGET premium pour les misses
+    assert redis_service.redis.round_trips == 2
+    assert cached[texts[0]]["translated_text"] == "Sentence 0."
+    assert cached[texts[59]] is None
+    assert sum(1 for v in cached.values() if v) == 30
+
+    # Même format d'entrée que set_translation / get_translation
+    single = await cache_service.get_translation(texts[1], "fr", "en", "premium")
+    assert single["translated_text"] == "Sentence 1." and single["model_type"] == "premium"
+
+
+@pytest.mark.asyncio
+async def test_check_cache_batch_single_lookup_and_batched_write(redis_service):
+    cache = TranslationCache()
+    cache._cache_service = TranslationCacheService(redis_service)
+    cache._initialized = True
+
+    segments = [
+        {"type": "line", "text": "Bonjour"},
+        {"type": "paragraph_break", "text": ""},
+        {"type": "line", "text": "Au revoir"},
+        {"type": "line", "text": "   "},
+    ]
+    await cache.cache_batch_results([("Bonjour", "Hello")], "fr", "en", "premium")
+    await asyncio.sleep(0)  # écriture fire-and-forget
+    assert redis_service.redis.round_trips == 1
+
+    redis_service.redis.round_trips = 0
+    cached, to_translate = await cache.check_cache_batch(segments, "fr", "en", "premium")
+
+    assert redis_service.redis.round_trips == 1
+    assert cached[0] == {"type": "line", "text": "Hello"}
+    assert cached[1] == segments[1] and cached[3] == segments[3]
+    assert to_translate == [(2, "Au revoir")]
+
+
+@pytest.mark.asyncio
+async def test_audio_translations_for_all_languages_in_one_mget(redis_service):
+    audio_cache = AudioCacheService(redis_service)
+    await audio_cache.set_translated_audio_by_hash("abc123", "en", {"url": "en.mp3"})
+    await audio_cache.set_translated_audio_by_hash("abc123", "es", {"url": "es.mp3"})
+
+    redis_service.redis.round_trips = 0
+    result = await audio_cache.get_all_translated_audio_by_hash("abc123", ["en", "es", "de"])
+
+    assert redis_service.redis.round_trips == 1
+    assert result == {"en": {"url": "en.mp3"}, "es": {"url": "es.mp3"}, "de": None}
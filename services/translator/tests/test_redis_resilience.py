@@ -0,0 +1,200 @@
+"""
+TDD — Connexion Redis auto-réparatrice: pool, disjoncteur, write-behind.
+
+Avant : RedisService.initialize abandonnait après max_connection_attempts et
+posait permanently_disabled ; trois erreurs d'opération faisaient de même.
+Un Redis redémarré au boot (ou un simple blip) laissait le traducteur sur un
+cache mémoire par processus jusqu'au recyclage du pod.
+
+Après : utils.circuit_breaker.CircuitBreaker (fermé → ouvert → semi-ouvert,
+backoff exponentiel) ; RedisService bascule en mémoire quand le circuit
+s'ouvre, se reconnecte en arrière-plan, rejoue dans Redis les clés écrites en
+mémoire entre-temps (TTL restant conservé) et expose la latence par opération.
+"""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from services.redis_service import RedisService
+from utils.circuit_breaker import CircuitBreaker
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def setex(self, key, seconds, value):
+        self.commands.append(("setex", key, seconds, value))
+
+    def delete(self, key):
+        self.commands.append(("delete", key))
+
+    def zadd(self, key, mapping):
+        self.commands.append(("zadd", key, dict(mapping)))
+
+    def zrem(self, key, *members):
+        self.commands.append(("zrem", key, set(members)))
+
+    async def execute(self):
+        if self.client.down:
+            raise ConnectionError("down")
+        for command in self.commands:
+            self.client.replayed.append(command)
+        return [True] * len(self.commands)
+
+
+class FakeRedis:
+    """Client redis.asyncio minimal, coupable à la demande"""
+
+    def __init__(self):
+        self.down = False
+        self.replayed = []
+        self.store = {}
+
+    async def ping(self):
+        if self.down:
+            raise ConnectionError("down")
+        return True
+
+    async def get(self, key):
+        if self.down:
+            raise ConnectionError("down")
+        return self.store.get(key)
+
+    async def setex(self, key, seconds, value):
+        if self.down:
+            raise ConnectionError("down")
+        self.store[key] = value
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def redis_service():
+    RedisService._instance = None
+    service = RedisService()
+    service.permanently_disabled = False
+    service.breaker = CircuitBreaker("REDIS", failure_threshold=2, reset_timeout_s=0.01, max_reset_timeout_s=0.04)
+    yield service
+    RedisService._instance = None
+
+
+def test_breaker_half_open_probe_and_backoff():
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout_s=0.0, max_reset_timeout_s=10.0)
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    # Délai échu: une seule sonde passe
+    assert breaker.allow_request() and breaker.state == "half_open"
+    assert not breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert breaker.get_stats()["reset_timeout_s"] == 0.0  # 0 doublé reste 0, plafonné
+
+    assert breaker.allow_request()
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.get_stats()["closed"] == 1
+
+
+def test_breaker_backoff_is_capped():
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout_s=1.0, max_reset_timeout_s=3.0)
+    breaker.record_failure()
+    assert 0 < breaker.time_until_retry() <= 1.0
+    for _ in range(3):
+        breaker._opened_at = 0.0  # échéance passée
+        assert breaker.allow_request()
+        breaker.record_failure()
+    assert breaker.get_stats()["reset_timeout_s"] == 3.0
+
+
+@pytest.mark.asyncio
+async def test_redis_down_at_boot_reconnects_and_replays(redis_service):
+    service = redis_service
+    fake = FakeRedis()
+    fake.down = True
+
+    with patch("services.redis_service.aioredis.from_url", return_value=fake) as from_url:
+        assert await service.initialize() is True
+        assert service.is_available() is False and service.permanently_disabled is False
+        assert from_url.call_args.kwargs["max_connections"] == service.max_connections
+
+        # Écritures pendant la coupure: mémoire + write-behind
+        await service.set("translation:a", "A", ex=600)
+        await service.delete("translation:gone")
+        await service.zadd("idx:profiles", {"u1": 1.0, "u2": 2.0})
+        await service.zrem("idx:profiles", ["u2"])
+        assert service.get_stats()["pending_replay"] == 3
+
+        fake.down = False
+        for _ in range(100):
+            if service.is_available() and service.get_stats()["pending_replay"] == 0:
+                break
+            await asyncio.sleep(0.01)
+
+    assert service.is_available()
+    stats = service.get_stats()
+    assert stats["circuit"]["state"] == "closed"
+    assert stats["reconnects"] == 1 and stats["replayed"] == 3
+
+    commands = {command[0]: command for command in fake.replayed}
+    assert commands["setex"][1] == "translation:a" and 0 < commands["setex"][2] <= 600
+    assert commands["delete"][1] == "translation:gone"
+    assert commands["zadd"][2] == {"u1": 1.0}
+    assert commands["zrem"][2] == {"u2"}
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_blip_opens_circuit_then_recovers_with_metrics(redis_service):
+    service = redis_service
+    fake = FakeRedis()
+    service.redis = service.redis_raw = fake
+    service.is_redis_available = True
+
+    assert await service.set("k", "v", ex=60)
+    assert await service.get("k") == "v"
+
+    fake.down = True
+    await service.get("k")
+    assert service.is_available()  # une erreur isolée ne bascule pas
+    await service.set("k2", "v2", ex=60)
+    assert not service.is_available()
+    assert await service.get("k2") == "v2"  # servi par la mémoire
+
+    fake.down = False
+    for _ in range(100):
+        if service.is_available() and fake.replayed:
+            break
+        await asyncio.sleep(0.01)
+    assert service.is_available()
+    assert ("setex", "k2") == fake.replayed[0][:2]
+
+    ops = service.get_stats()["operations"]
+    assert ops["get"]["count"] == 2 and ops["get"]["errors"] == 1
+    assert ops["set"]["errors"] == 1 and ops["set"]["avg_ms"] >= 0
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_replay_is_bounded(redis_service):
+    service = redis_service
+    service.replay_max_keys = 2
+    for key in ("a", "b", "c"):
+        await service.set(key, key, ex=60)
+    assert list(service._pending_replay) == ["b", "c"]
+    assert service.replay_stats["dropped"] == 1
@@ -0,0 +1,180 @@
+"""
+TDD — Cache de traduction shardé sur plusieurs nœuds Redis.
+
+Avant : RedisService ne connaissait qu'un REDIS_URL ; tout le keyspace du
+cache de traduction (TTL 30 jours, toutes langues) tenait sur une instance.
+
+Après : utils.consistent_hash.HashRing (nœuds virtuels) et
+ShardedRedisService — chaque clé routée vers son nœud, MGET/SETEX groupés
+découpés par nœud et exécutés en parallèle, un nœud perdu ne dégrade que son
+shard (fallback mémoire et disjoncteur propres au nœud).
+"""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from services.redis_service import RedisService, ShardedRedisService, TranslationCacheService
+from utils.circuit_breaker import CircuitBreaker
+from utils.consistent_hash import HashRing
+
+NODES = ["redis://a:6379", "redis://b:6379", "redis://c:6379"]
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def setex(self, key, seconds, value):
+        self.commands.append((key, value))
+
+    async def execute(self):
+        if self.client.down:
+            raise ConnectionError("down")
+        for key, value in self.commands:
+            self.client.store[key] = value
+        return [True] * len(self.commands)
+
+
+class FakeRedis:
+    """Client redis.asyncio minimal par nœud, MGET concurrents comptés"""
+
+    in_flight = 0
+    max_in_flight = 0
+
+    def __init__(self):
+        self.down = False
+        self.store = {}
+        self.mget_calls = []
+
+    async def ping(self):
+        if self.down:
+            raise ConnectionError("down")
+        return True
+
+    async def get(self, key):
+        if self.down:
+            raise ConnectionError("down")
+        return self.store.get(key)
+
+    async def setex(self, key, seconds, value):
+        if self.down:
+            raise ConnectionError("down")
+        self.store[key] = value
+
+    async def mget(self, keys):
+        if self.down:
+            raise ConnectionError("down")
+        self.mget_calls.append(list(keys))
+        FakeRedis.in_flight += 1
+        FakeRedis.max_in_flight = max(FakeRedis.max_in_flight, FakeRedis.in_flight)
+        await asyncio.sleep(0.01)
+        FakeRedis.in_flight -= 1
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def sharded():
+    clients = {}
+
+    def from_url(url, **kwargs):
+        # Client texte et client binaire d'un même nœud partagent le stockage
+        return clients.setdefault(url, FakeRedis())
+
+    with patch("services.redis_service.aioredis.from_url", side_effect=from_url):
+        service = ShardedRedisService(NODES, vnodes=64)
+        for node in service.nodes.values():
+            node.permanently_disabled = False
+            node.breaker = CircuitBreaker("REDIS", failure_threshold=1, reset_timeout_s=60.0)
+        yield service, clients
+    RedisService._instance = None
+
+
+def test_ring_is_stable_and_moves_few_keys():
+    keys = [f"translation:text:{i}" for i in range(3000)]
+    ring = HashRing(NODES, vnodes=160)
+    before = {key: ring.get_node(key) for key in keys}
+
+    counts = {node: list(before.values()).count(node) for node in NODES}
+    assert all(700 < count < 1300 for count in counts.values()), counts
+
+    # Même placement d'un processus à l'autre (pas de hash() randomisé)
+    assert {key: HashRing(NODES, vnodes=160).get_node(key) for key in keys} == before
+
+    ring.add_node("redis://d:6379")
+    moved = [key for key in keys if ring.get_node(key) != before[key]]
+    assert all(ring.get_node(key) == "redis://d:6379" for key in moved)
+    assert len(moved) < len(keys) * 0.4
+
+
+def test_nodes_are_independent_of_singleton(sharded):
+    service, _ = sharded
+    assert RedisService() not in service.nodes.values()
+    assert len({id(node) for node in service.nodes.values()}) == len(NODES)
+
+
+@pytest.mark.asyncio
+async def test_batches_split_per_node_and_run_concurrently(sharded):
+    service, clients = sharded
+    await service.initialize()
+    mapping = {f"translation:text:{i}": f"v{i}" for i in range(60)}
+
+    assert await service.setex_many(mapping, 600)
+    for key, value in mapping.items():
+        assert clients[service.ring.get_node(key)].store[key] == value
+
+    FakeRedis.max_in_flight = 0
+    keys = list(mapping) + ["translation:text:missing"]
+    values = await service.mget(keys, binary=True)
+    assert values == list(mapping.values()) + [None]
+
+    assert all(len(client.mget_calls) == 1 for client in clients.values())
+    assert FakeRedis.max_in_flight == len(NODES)
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_lost_node_degrades_only_its_shard(sharded):
+    service, clients = sharded
+    await service.initialize()
+    cache = TranslationCacheService(service, l1_cache=None)
+    cache.l1 = None
+
+    items = [(f"texte {i}", "fr", "en", f"text {i}") for i in range(30)]
+    for text, source, target, translated in items:
+        await cache.set_translation(text, source, target, translated)
+
+    down_url = NODES[0]
+    clients[down_url].down = True
+    results = await cache.get_translations_batch([(text, source, target) for text, source, target, _ in items])
+
+    on_down = [
+        item for item in items
+        if service.ring.get_node(cache.key_pattern.format(hash=cache._compute_hash(item[0], "fr", "en"))) == down_url
+    ]
+    assert on_down, "aucune clé sur le nœud coupé"
+    found = [result for result in results if result]
+    assert len(found) == len(items) - len(on_down)
+
+    stats = service.get_stats()
+    assert stats["mode"] == "Degraded" and stats["nodes_available"] == len(NODES) - 1
+    assert not stats["nodes"][down_url]["redis_available"]
+
+    # Les écritures du shard coupé partent en mémoire, les autres restent dans Redis
+    await cache.set_translation(*on_down[0])
+    assert await cache.get_translation(*on_down[0][:3]) is not None
+    assert stats["nodes"][NODES[1]]["mode"] == "Redis"
+    await service.close()
@@ -0,0 +1,203 @@
+"""
+TDD — Pool de réplicas d'inférence multi-processus.
+
+Avant : tous les workers du pool ZMQ sont des tâches asyncio d'un seul
+processus, funnelées dans un ThreadPoolExecutor et un lock par modèle —
+l'orchestration Python plafonne à ~1 cœur sur des machines 32 cœurs.
+
+Après : TRANSLATOR_USE_PROCESS_POOL=true forke N réplicas après le
+chargement des modèles (poids en mémoire partagée), chacun avec son moteur
+et son lock ; le processus front leur dispatche les traductions par IPC.
+Un réplica mort est re-forké par un zygote forké au démarrage, jamais par le
+front en plein trafic (locks tenus par ses threads hérités par l'enfant).
+"""
+import asyncio
+import os
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.translation_ml.replica_pool import (
+    ReplicaPool,
+    resolve_replica_count,
+    share_model_weights,
+)
+
+
+# Lock module-level pris à la création du moteur (cf. TokenCache, tokenizers)
+_ENGINE_INIT_LOCK = threading.Lock()
+
+
+class _PidEngine:
+    """Moteur factice: chaque réplica signe ses traductions avec son pid."""
+
+    def __init__(self, model_loader):
+        with _ENGINE_INIT_LOCK:
+            pass
+        self.prefix = model_loader.prefix
+        self.lock = threading.Lock()
+
+    async def translate_text(self, text, source_lang, target_lang, model_type):
+        # Inférence bloquante sous le lock du réplica (comme generate())
+        with self.lock:
+            time.sleep(0.2)
+        return f"{os.getpid()}|{self.prefix}{target_lang}:{text}"
+
+    async def translate_batch(self, texts, source_lang, target_lang, model_type):
+        raise ValueError("generate() crash")
+
+    async def translate_multilingual(self, texts, source_lang, target_langs, model_type):
+        if texts == ["segfault"]:
+            os._exit(1)  # Réplica tué en pleine inférence (OOM killer, segfault)
+        await asyncio.sleep(2.0)
+        return {lang: list(texts) for lang in target_langs}
+
+    def warmup_pair(self, model_type, nllb_source, nllb_target, token_lengths):
+        # Bloquant, comme TranslatorEngine.warmup_pair
+        time.sleep(0.1)
+        self.prefix = "W-"
+        return True
+
+    def cleanup(self):
+        pass
+
+
+def _make_pool(num_replicas=2, **kwargs):
+    loader = SimpleNamespace(models={}, prefix="T-")
+    return ReplicaPool(loader, num_replicas, engine_factory=_PidEngine, start_timeout=30, **kwargs)
+
+
+def test_resolve_replica_count_falls_back_to_in_process():
+    assert resolve_replica_count(4, "cpu", ["torch", "int8"], fork_available=True) == 4
+    assert resolve_replica_count(4, "cuda", ["torch"], fork_available=True) == 0
+    assert resolve_replica_count(4, "cpu", ["onnx"], fork_available=True) == 0
+    assert resolve_replica_count(4, "cpu", ["torch"], fork_available=False) == 0
+    assert resolve_replica_count(1, "cpu", ["torch"], fork_available=True) == 0
+
+
+def test_share_model_weights_is_best_effort():
+    calls = []
+    assert share_model_weights(SimpleNamespace(share_memory=lambda: calls.append(1)))
+    assert calls == [1]
+    assert not share_model_weights(object())
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork requis")
+@pytest.mark.asyncio
+async def test_requests_run_in_parallel_across_replica_processes():
+    pool = _make_pool(num_replicas=2)
+    assert await asyncio.get_running_loop().run_in_executor(None, pool.start)
+    try:
+        start = time.monotonic()
+        results = await asyncio.gather(*[
+            pool.translate_text(f"msg{i}", "fr", "en", "basic") for i in range(4)
+        ])
+        elapsed = time.monotonic() - start
+
+        pids = {r.split("|")[0] for r in results}
+        assert [r.split("|")[1] for r in results] == [f"T-en:msg{i}" for i in range(4)]
+        assert len(pids) == 2 and str(os.getpid()) not in pids
+        # 4 × 0.2s sérialisés par lock: ~0.8s dans un seul processus
+        assert elapsed < 0.7
+
+        with pytest.raises(RuntimeError, match="generate\\(\\) crash"):
+            await pool.translate_batch(["a"], "fr", "en", "basic")
+        assert pool.get_stats()["failed"] == 1
+    finally:
+        pool.stop()
+
+    assert not pool.is_running
+    assert pool.get_stats()["alive"] == 0
+    with pytest.raises(RuntimeError):
+        await pool.translate_text("x", "fr", "en", "basic")
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork requis")
+@pytest.mark.asyncio
+async def test_dead_replica_fails_its_requests_and_is_respawned():
+    pool = _make_pool(num_replicas=1, dispatch_timeout=10)
+    assert await asyncio.get_running_loop().run_in_executor(None, pool.start)
+    try:
+        old_pid = pool._processes[0].pid
+        with pytest.raises(RuntimeError, match="réplica 0 arrêté"):
+            await pool.translate_multilingual(["segfault"], "fr", ["en"], "basic")
+
+        # Re-forké: le pool reste actif et sert les requêtes suivantes
+        result = await pool.translate_text("encore", "fr", "en", "basic")
+        assert result.endswith("T-en:encore") and not result.startswith(str(old_pid))
+        stats = pool.get_stats()
+        assert stats["restarts"] == 1 and stats["alive"] == 1 and stats["in_flight"] == 0
+    finally:
+        pool.stop()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork requis")
+@pytest.mark.asyncio
+async def test_respawn_does_not_inherit_locks_held_by_front_threads():
+    pool = _make_pool(num_replicas=1, dispatch_timeout=5)
+    assert await asyncio.get_running_loop().run_in_executor(None, pool.start)
+    # Un thread du front tient un lock module-level au moment du re-fork
+    _ENGINE_INIT_LOCK.acquire()
+    try:
+        with pytest.raises(RuntimeError, match="réplica 0 arrêté"):
+            await pool.translate_multilingual(["segfault"], "fr", ["en"], "basic")
+
+        result = await pool.translate_text("encore", "fr", "en", "basic")
+        assert result.endswith("T-en:encore")
+    finally:
+        _ENGINE_INIT_LOCK.release()
+        pool.stop()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork requis")
+@pytest.mark.asyncio
+async def test_warmup_pair_warms_every_replica():
+    pool = _make_pool(num_replicas=2)
+    assert await asyncio.get_running_loop().run_in_executor(None, pool.start)
+    try:
+        assert await pool.warmup_pair("basic", "fra_Latn", "eng_Latn", [8]) is True
+
+        # Les deux réplicas servent, tous deux préchauffés
+        results = await asyncio.gather(*[
+            pool.translate_text(f"msg{i}", "fr", "en", "basic") for i in range(4)
+        ])
+        assert len({r.split("|")[0] for r in results}) == 2
+        assert all(r.split("|")[1].startswith("W-") for r in results)
+    finally:
+        pool.stop()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork requis")
+@pytest.mark.asyncio
+async def test_dispatch_times_out_without_answer():
+    pool = _make_pool(num_replicas=2, dispatch_timeout=0.3)
+    assert await asyncio.get_running_loop().run_in_executor(None, pool.start)
+    try:
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.translate_multilingual(["lent"], "fr", ["en"], "basic")
+        assert pool.get_stats()["timeouts"] == 1 and pool.get_stats()["in_flight"] == 0
+
+        # La réponse tardive est ignorée, le lecteur continue de servir
+        await asyncio.sleep(2.0)
+        assert (await pool.translate_text("ok", "fr", "en", "basic")).endswith("T-en:ok")
+    finally:
+        pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_ml_service_batches_go_through_the_inference_engine():
+    from services.translation_ml_service import TranslationMLService
+
+    replicas = SimpleNamespace(
+        translate_batch=AsyncMock(return_value=["b"]),
+        translate_multilingual=AsyncMock(return_value={"en": ["m"]}),
+    )
+    service = TranslationMLService.__new__(TranslationMLService)
+    service.translator_engine = SimpleNamespace()
+    service.translation_service = SimpleNamespace(_inference_engine=replicas)
+
+    assert await service._ml_translate_batch(["a"], "fr", "en", "basic") == ["b"]
+    assert await service._ml_translate_batch_multilingual(["a"], "fr", ["en"], "basic") == {"en": ["m"]}
@@ -0,0 +1,171 @@
+"""
+TDD — Fast path des messages de chat très courts.
+
+Avant : "ok", "merci", "à demain" (la majorité du trafic ZMQ) suivaient le
+chemin complet translate_with_structure → executor → generate() avec
+max_length=256 fixe, soit des centaines de ms pour 2-3 tokens.
+
+Après :
+1. table de phrases exacte, promue depuis les hits du cache Redis, servie
+   dès l'enqueue (ni file, ni Redis, ni inférence) ;
+2. max_new_tokens proportionnel au nombre de tokens d'entrée ;
+3. petit modèle distillé optionnel (FAST_MODEL) pour les textes de la fast_pool.
+
+get_phrase_table, appelé à chaque message court, ne relit pas la
+configuration une fois la table créée ou désactivée.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from services.translation_ml.translation_service import TranslationService
+from services.translation_ml.translator_engine import TranslatorEngine, compute_max_new_tokens
+from services.zmq_pool import translation_processor as tp
+import utils.phrase_table as phrase_table_module
+from utils.performance import PerformanceConfig
+from utils.phrase_table import PhraseTable, get_phrase_table
+
+
+def test_disabled_phrase_table_reads_config_once(monkeypatch):
+    configs = []
+
+    def counting_config():
+        configs.append(1)
+        return PerformanceConfig()
+
+    monkeypatch.setenv("TRANSLATOR_PHRASE_TABLE", "false")
+    monkeypatch.setattr(phrase_table_module, "PerformanceConfig", counting_config)
+    monkeypatch.setattr(phrase_table_module, "_phrase_table", None)
+    monkeypatch.setattr(phrase_table_module, "_phrase_table_resolved", False, raising=False)
+
+    assert [get_phrase_table() for _ in range(5)] == [None] * 5
+    assert len(configs) == 1
+
+
+def test_phrase_table_promotes_short_phrases_after_min_hits():
+    table = PhraseTable(max_size=2, min_hits=3, max_chars=30)
+    cached = {"translated_text": "thanks", "source_lang": "fr"}
+
+    assert [table.record_hit("merci", "fr", "en", "basic", cached) for _ in range(3)] == [False, False, True]
+    assert table.lookup(" merci ", "fr", "en", "basic") == cached
+    assert table.lookup("merci", "fr", "es", "basic") is None
+
+    # Trop long pour la table: jamais promu
+    long_text = "un message bien plus long que trente caractères"
+    for _ in range(5):
+        table.record_hit(long_text, "fr", "en", "basic", cached)
+    assert table.lookup(long_text, "fr", "en", "basic") is None
+
+    table.record_hit("ok", "fr", "en", "basic", {"translated_text": "ok"})
+    assert table.get_stats()["size"] == 1 and table.get_stats()["candidates"] == 1
+
+
+def _make_task(text, languages):
+    return SimpleNamespace(
+        task_id="task-short-1",
+        message_id="msg-short-1",
+        text=text,
+        source_language="fr",
+        target_languages=list(languages),
+        model_type="basic",
+        conversation_id="conv-1",
+        created_at=1_700_000_000.0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_repeated_cache_hits_are_then_served_without_queue(monkeypatch):
+    table = PhraseTable(max_size=100, min_hits=2, max_chars=30)
+    monkeypatch.setattr(tp, "get_phrase_table", lambda: table)
+
+    cache = MagicMock()
+
+    async def get_translation(text, source_lang, target_lang, model_type):
+        return {"translated_text": f"<{target_lang}> {text}", "source_lang": source_lang}
+
+    cache.get_translation = get_translation
+    published = []
+
+    async def publish(task_id, result, target_language):
+        published.append((target_language, result["translatedText"], result["workerName"]))
+
+    task = _make_task("à demain", ["en", "es"])
+    assert not await tp.serve_from_phrase_table(task, publish)
+
+    for _ in range(2):
+        await tp.process_single_translation(
+            task=task, worker_name="w", translation_service=None,
+            translation_cache=cache, publish_func=publish,
+        )
+    published.clear()
+
+    assert await tp.serve_from_phrase_table(task, publish)
+    assert published == [
+        ("en", "<en> à demain", "phrase_table"),
+        ("es", "<es> à demain", "phrase_table"),
+    ]
+
+    # Une langue inconnue de la table → rien n'est publié, chemin normal
+    published.clear()
+    assert not await tp.serve_from_phrase_table(_make_task("à demain", ["en", "de"]), publish)
+    assert published == []
+
+
+def test_max_new_tokens_follows_input_length():
+    assert compute_max_new_tokens(4, ratio=2.0, floor=16) == 24
+    assert compute_max_new_tokens(500, ratio=2.0, floor=16) == 256
+
+    engine = TranslatorEngine(MagicMock(), ThreadPoolExecutor(max_workers=1))
+    engine.perf_config.max_new_tokens_ratio = 2.0
+    engine.perf_config.max_new_tokens_floor = 16
+    pipeline = SimpleNamespace(encode=lambda texts: [[0] * len(t.split()) for t in texts])
+    try:
+        assert engine._generation_length_kwargs(pipeline, ["ok", "à demain"]) == {"max_new_tokens": 20}
+        # Pipeline sans comptage de tokens: ancien max_length fixe
+        assert engine._generation_length_kwargs(object(), ["ok"]) == {"max_length": 256}
+    finally:
+        engine.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_run_inference_batch_passes_generation_budget():
+    model_loader = MagicMock()
+    model_loader.get_model_inference_lock.return_value = threading.Lock()
+    engine = TranslatorEngine(model_loader, ThreadPoolExecutor(max_workers=1))
+    seen = {}
+
+    def fake_pipeline(texts, **kwargs):
+        seen.update(kwargs)
+        return [{"translation_text": t} for t in texts]
+
+    fake_pipeline.encode = lambda texts: [[0, 0, 0] for _ in texts]
+    engine._get_or_create_pipeline = MagicMock(return_value=(fake_pipeline, True))
+    try:
+        engine._run_inference_batch("basic", "fra_Latn", "eng_Latn", ["ok"])
+    finally:
+        engine.cleanup()
+
+    assert "max_length" not in seen
+    assert seen["max_new_tokens"] == compute_max_new_tokens(
+        3, engine.perf_config.max_new_tokens_ratio, engine.perf_config.max_new_tokens_floor
+    )
+
+
+def test_short_texts_use_distilled_fast_model_when_loaded():
+    TranslationService._instance = None
+    model_loader = MagicMock()
+    loaded = {"basic", "premium", "medium"}
+    model_loader.is_model_loaded.side_effect = lambda mt: mt in loaded
+    service = TranslationService(model_loader, MagicMock(), MagicMock())
+    try:
+        assert service._select_model_type("merci", "basic") == "basic"
+
+        loaded.add("fast")
+        assert service._select_model_type("merci", "basic") == "fast"
+        assert service._select_model_type("merci", "premium") == "premium"
+        assert service._select_model_type("x" * 150, "basic") == "medium"
+    finally:
+        TranslationService._instance = None
@@ -0,0 +1,249 @@
+"""
+TDD — Coalescence des traductions identiques en vol + cache négatif.
+
+Avant : un message populaire diffusé dans une grande conversation déclenchait
+N lectures Redis, N inférences et N écritures identiques en parallèle ; une
+entrée qui échoue ("[ML-Pipeline-Error] ...") était retentée en boucle serrée
+et son marqueur d'erreur mis en cache Redis pour 30 jours.
+
+Après :
+1. SingleFlight : un seul calcul par clé, les appelants concurrents partagent
+   le résultat ; le timeout d'un appelant n'annule pas le calcul partagé ;
+2. cache négatif à TTL court pour les traductions en échec ;
+   les calculs en vol sont propres à leur boucle : une boucle de thread
+   fermée en plein calcul ne bloque plus les appelants des autres boucles ;
+3. coalescence branchée dans TranslatorEngine.translate_text et dans le
+   processeur ZMQ (Redis + inférence + écriture) ; les échecs ne sont plus
+   écrits dans Redis.
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from services.translation_ml.translator_engine import TranslatorEngine
+from services.zmq_pool import translation_processor as tp
+import utils.single_flight as sf
+from utils.single_flight import SingleFlight
+from utils.translation_validation import is_failed_translation
+
+
+def test_is_failed_translation_matches_engine_markers():
+    assert is_failed_translation("[ML-Pipeline-Error] Bonjour")
+    assert is_failed_translation("[NLLB-No-Result] Bonjour")
+    assert is_failed_translation("   ")
+    assert is_failed_translation(None)
+    assert not is_failed_translation("Hello [world]")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_run_once():
+    flight = SingleFlight("test")
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "hello"
+
+    results = await asyncio.gather(*(flight.do("k", compute) for _ in range(10)))
+
+    assert results == ["hello"] * 10
+    assert calls == 1
+    stats = flight.get_stats()
+    assert stats["executed"] == 1 and stats["coalesced"] == 9 and stats["in_flight"] == 0
+
+    # Une fois terminé, la clé est recalculée (pas de cache positif)
+    assert await flight.do("k", compute) == "hello"
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_caller_timeout_does_not_cancel_shared_computation():
+    flight = SingleFlight("test")
+    calls = 0
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.1)
+        return "done"
+
+    impatient = asyncio.ensure_future(asyncio.wait_for(flight.do("k", compute), timeout=0.01))
+    patient = asyncio.ensure_future(flight.do("k", compute))
+
+    with pytest.raises(asyncio.TimeoutError):
+        await impatient
+    assert await patient == "done"
+    assert calls == 1
+
+
+def test_closed_leader_loop_does_not_strand_other_loops():
+    flight = SingleFlight("test")
+
+    async def stuck():
+        await asyncio.sleep(3600)
+
+    async def compute():
+        return "ok"
+
+    # Leader sur une boucle de thread arrêtée puis fermée en plein calcul
+    thread_loop = asyncio.new_event_loop()
+    thread_loop.create_task(flight.do("k", stuck))
+    thread_loop.run_until_complete(asyncio.sleep(0.01))
+    thread_loop.close()
+
+    assert asyncio.run(asyncio.wait_for(flight.do("k", compute), timeout=1.0)) == "ok"
+    assert flight.get_stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_exceptions_are_shared_and_not_cached():
+    flight = SingleFlight("test", negative_ttl=30.0)
+    calls = 0
+
+    async def boom():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(flight.do("k", boom), flight.do("k", boom), return_exceptions=True)
+    assert all(isinstance(r, ValueError) for r in results)
+    assert calls == 1
+
+    with pytest.raises(ValueError):
+        await flight.do("k", boom)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_result_is_served_from_negative_cache(monkeypatch):
+    flight = SingleFlight("test", negative_ttl=30.0)
+    calls = 0
+
+    async def failing():
+        nonlocal calls
+        calls += 1
+        return "[ML-Pipeline-Error] Bonjour"
+
+    for _ in range(3):
+        assert await flight.do("k", failing, is_failure=is_failed_translation) == "[ML-Pipeline-Error] Bonjour"
+    assert calls == 1
+    assert flight.get_stats()["negative_hits"] == 2
+
+    # TTL écoulé → nouvel essai
+    real_monotonic = sf.time.monotonic
+    monkeypatch.setattr(sf.time, "monotonic", lambda: real_monotonic() + 31.0)
+    await flight.do("k", failing, is_failure=is_failed_translation)
+    assert calls == 2
+
+    # Les succès ne sont jamais mémorisés
+    async def ok():
+        return "Hello"
+
+    flight.clear()
+    assert await flight.do("other", ok, is_failure=is_failed_translation) == "Hello"
+    assert flight.get_stats()["negative_size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_engine_coalesces_identical_translate_text_calls():
+    model_loader = MagicMock()
+    model_loader.is_model_loaded.return_value = True
+    model_loader.get_model_inference_lock.return_value = threading.Lock()
+    engine = TranslatorEngine(model_loader, ThreadPoolExecutor(max_workers=2))
+    assert engine._single_flight is not None
+
+    calls = 0
+
+    async def fake_translate(text, source_lang, target_lang, model_type):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return f"<{target_lang}> {text}"
+
+    engine._translate_text = fake_translate
+    try:
+        results = await asyncio.gather(*(
+            engine.translate_text("Bonjour", "fr", "en", "basic") for _ in range(5)
+        ))
+        other = await engine.translate_text("Bonjour", "fr", "es", "basic")
+    finally:
+        engine.cleanup()
+
+    assert results == ["<en> Bonjour"] * 5
+    assert other == "<es> Bonjour"
+    assert calls == 2
+    assert engine.get_single_flight_stats()["coalesced"] == 4
+
+
+def _make_task(task_id, text="Un message populaire"):
+    return SimpleNamespace(
+        task_id=task_id,
+        message_id=f"msg-{task_id}",
+        text=text,
+        source_language="fr",
+        target_languages=["en"],
+        model_type="basic",
+        conversation_id="conv-1",
+        created_at=1_700_000_000.0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_processor_coalesces_identical_tasks_and_skips_caching_failures(monkeypatch):
+    monkeypatch.setattr(tp, "_translation_flight", SingleFlight("test", negative_ttl=30.0))
+
+    cache = MagicMock()
+    written = []
+
+    async def get_translation(**kwargs):
+        return None
+
+    async def set_translation(**kwargs):
+        written.append(kwargs["translated_text"])
+
+    cache.get_translation = get_translation
+    cache.set_translation = set_translation
+
+    service = MagicMock()
+    calls = []
+
+    async def translate_with_structure(text, source_language, target_language, model_type, source_channel):
+        calls.append(text)
+        await asyncio.sleep(0.05)
+        if text.startswith("casse"):
+            return {"translated_text": f"[ML-Pipeline-Error] {text}", "model_used": model_type}
+        return {"translated_text": "A popular message", "model_used": model_type, "confidence": 0.9}
+
+    service.translate_with_structure = translate_with_structure
+    published = []
+
+    async def publish(task_id, result, target_language):
+        published.append((task_id, result["translatedText"]))
+
+    await asyncio.gather(*(
+        tp.process_single_translation(
+            task=_make_task(f"t{i}"), worker_name="w", translation_service=service,
+            translation_cache=cache, publish_func=publish,
+        )
+        for i in range(4)
+    ))
+
+    assert calls == ["Un message populaire"]
+    assert written == ["A popular message"]
+    assert sorted(published) == [(f"t{i}", "A popular message") for i in range(4)]
+
+    # Échec : ni écrit dans Redis, ni retenté pendant le TTL
+    for i in range(2):
+        await tp.process_single_translation(
+            task=_make_task(f"b{i}", text="casse tout"), worker_name="w", translation_service=service,
+            translation_cache=cache, publish_func=publish,
+        )
+    assert calls.count("casse tout") == 1
+    assert written == ["A popular message"]
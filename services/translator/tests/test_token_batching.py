@@ -0,0 +1,59 @@
+"""
+TDD — Batching par longueur de tokens dans translate_batch.
+
+Avant : les textes étaient découpés en tranches fixes de `batch_size` dans
+l'ordre d'arrivée ; une ligne de 5 tokens et un paragraphe de 200 tokens
+dans la même tranche étaient paddés tous deux à 200 tokens.
+
+Après : tri par nombre de tokens, batches remplis sous un budget de tokens
+paddés, ordre d'origine restauré.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from services.translation_ml.translator_engine import TranslatorEngine, build_token_batches
+
+
+def test_batches_group_similar_lengths_under_budget():
+    counts = [200, 5, 6, 190, 7]
+    batches = build_token_batches(counts, max_tokens=400)
+
+    assert batches == [[1, 2, 4], [3, 0]]
+    for batch in batches:
+        assert len(batch) * max(counts[i] for i in batch) <= 400
+
+
+def test_oversized_text_gets_its_own_batch_and_item_cap_applies():
+    assert build_token_batches([1000, 3, 3], max_tokens=100) == [[1, 2], [0]]
+    assert build_token_batches([3] * 5, max_tokens=10_000, max_items=2) == [[0, 1], [2, 3], [4]]
+    assert build_token_batches([], max_tokens=100) == []
+
+
+@pytest.mark.asyncio
+async def test_translate_batch_sorts_by_length_and_restores_order():
+    model_loader = MagicMock()
+    model_loader.is_model_loaded.return_value = True
+    model_loader.get_model_inference_lock.return_value = threading.Lock()
+
+    engine = TranslatorEngine(model_loader, ThreadPoolExecutor(max_workers=1))
+    engine.perf_config.batch_size = 2
+    engine.perf_config.enable_micro_batching = False
+
+    batches_seen = []
+
+    def fake_pipeline(texts, **kwargs):
+        batches_seen.append([len(t.split()) for t in texts])
+        return [{"translation_text": f"T:{t}"} for t in texts]
+
+    fake_pipeline.encode = lambda texts: [[0] * len(t.split()) for t in texts]
+    engine._get_or_create_pipeline = MagicMock(return_value=(fake_pipeline, True))
+
+    texts = ["mot " * 40, "court", "mot " * 38, "deux mots"]
+    results = await engine.translate_batch(texts, "fr", "en", "basic")
+
+    assert results == [f"T:{t}" for t in texts]
+    # Les deux textes courts ensemble, les deux longs ensemble
+    assert batches_seen == [[1, 2], [38, 40]]
@@ -0,0 +1,121 @@
+"""
+TDD — Cache LRU des token ids et chemin pré-tokenisé.
+
+Avant : chaque chemin (planification des batches, Seq2SeqTranslator.__call__,
+fallback après un miss du cache Redis) relançait le tokenizer HF sur le même
+texte — 10-15 % de la latence d'un message court.
+
+Après : les token ids sont mis en cache par (tokenizer, langue source, texte)
+et __call__ accepte des `input_ids` déjà calculés. La taille vient de
+PerformanceConfig (TRANSLATOR_TOKEN_CACHE_SIZE) ; les locks par tokenizer
+disparaissent avec leur tokenizer.
+"""
+import gc
+from types import SimpleNamespace
+
+import utils.token_cache as token_cache_module
+from services.translation_ml import seq2seq_translator
+from services.translation_ml.seq2seq_translator import Seq2SeqTranslator
+from utils.token_cache import TokenCache, get_token_cache
+
+
+def test_lru_eviction_and_namespaces():
+    cache = TokenCache(max_size=2)
+    cache.put("nllb|fra_Latn", "a", [1, 2])
+    cache.put("nllb|fra_Latn", "b", [3])
+    assert cache.get_many("nllb|fra_Latn", ["a"]) == [[1, 2]]  # "a" redevient récent
+
+    cache.put("nllb|fra_Latn", "c", [4])
+
+    assert cache.get_many("nllb|fra_Latn", ["a", "b", "c"]) == [[1, 2], None, [4]]
+    # Même texte, autre langue source : autre token de langue préfixé
+    assert cache.get_many("nllb|eng_Latn", ["a"]) == [None]
+    assert cache.get_stats().evictions == 1
+
+
+class _CountingTokenizer:
+    name_or_path = "test/token-cache-tokenizer"
+
+    def __init__(self):
+        self.src_lang = None
+        self.tokenized = []
+
+    def __call__(self, texts, **kwargs):
+        self.tokenized.extend(texts)
+        lang_token = 1 if self.src_lang == "fra_Latn" else 2
+        return {'input_ids': [[lang_token] + [len(w) for w in t.split()] for t in texts]}
+
+    def pad(self, encoded, **kwargs):
+        return {'input_ids': encoded['input_ids'], 'attention_mask': None}
+
+    def convert_tokens_to_ids(self, token):
+        return token
+
+    def batch_decode(self, outputs, skip_special_tokens=True):
+        return list(outputs)
+
+
+class _RecordingModel:
+    config = SimpleNamespace(model_type="m2m_100")
+
+    def __init__(self):
+        self.inputs = []
+
+    def generate(self, input_ids, attention_mask, **kwargs):
+        self.inputs.append(input_ids)
+        return [str(ids) for ids in input_ids]
+
+
+def test_seq2seq_tokenizes_each_text_once_across_calls():
+    get_token_cache().clear()
+    tokenizer, model = _CountingTokenizer(), _RecordingModel()
+    translator = Seq2SeqTranslator(model, tokenizer, "fra_Latn", "eng_Latn")
+
+    # Planification (longueurs) puis inférence: une seule tokenisation
+    lengths = [len(ids) for ids in translator.encode(["bonjour le monde", "salut"])]
+    translator(["bonjour le monde", "salut"])
+    translator(["salut"])
+
+    assert lengths == [4, 2]
+    assert tokenizer.tokenized == ["bonjour le monde", "salut"]
+    assert model.inputs[-1] == [[1, 5]]
+
+    # Autre langue source → autre entrée de cache (token de langue différent)
+    translator(["salut"], src_lang="eng_Latn")
+    assert model.inputs[-1] == [[2, 5]]
+
+
+def test_seq2seq_accepts_pretokenized_input_ids():
+    tokenizer, model = _CountingTokenizer(), _RecordingModel()
+    translator = Seq2SeqTranslator(model, tokenizer, "fra_Latn", "eng_Latn")
+
+    translator(["ignoré"], input_ids=[[1, 42]])
+
+    assert tokenizer.tokenized == []
+    assert model.inputs == [[[1, 42]]]
+
+
+def test_shared_cache_size_comes_from_performance_config(monkeypatch):
+    from utils.performance import PerformanceConfig
+
+    monkeypatch.setenv("TRANSLATOR_TOKEN_CACHE_SIZE", "123")
+    assert PerformanceConfig().token_cache_size == 123
+
+    monkeypatch.setattr(token_cache_module, "PerformanceConfig", lambda: SimpleNamespace(token_cache_size=77))
+    monkeypatch.setattr(token_cache_module, "_token_cache", None)
+    assert get_token_cache().max_size == 77
+
+
+def test_tokenizer_locks_are_released_with_their_tokenizer():
+    class Tokenizer:
+        pass
+
+    tokenizer = Tokenizer()
+    lock = seq2seq_translator._get_tokenizer_lock(tokenizer)
+    assert seq2seq_translator._get_tokenizer_lock(tokenizer) is lock
+
+    before = len(seq2seq_translator._tokenizer_locks)
+    del tokenizer
+    gc.collect()
+    # Plus d'entrée périmée qu'un id() réutilisé pourrait retrouver
+    assert len(seq2seq_translator._tokenizer_locks) == before - 1
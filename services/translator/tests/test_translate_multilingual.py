@@ -0,0 +1,322 @@
+"""
+TDD — Traduction multi-cibles avec encodage source unique.
+
+Avant : un message de groupe vers N langues relançait N fois le pipeline
+complet (tokenisation + encodeur + décodeur) pour la MÊME source.
+
+Après : la source est tokenisée et encodée une fois ; seul le décodage
+(forced_bos_token_id) est répété par langue cible.
+"""
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.translation_ml.seq2seq_translator import Seq2SeqTranslator
+from services.translation_ml.translator_engine import TranslatorEngine
+from services.zmq_pool import translation_processor as tp
+
+
+class _EncoderOutput(dict):
+    """Imite ModelOutput: reconstructible via type(out)(**out)."""
+
+
+class _FakeTokenizer:
+    """Un texte = un token ; `words[id]` redonne le texte."""
+
+    def __init__(self):
+        self.src_lang = None
+        self.calls = 0
+        self.words = []
+
+    def __call__(self, texts, **kwargs):
+        self.calls += 1
+        self.words.extend(texts)
+        start = len(self.words) - len(texts)
+        return {'input_ids': [[start + i] for i in range(len(texts))]}
+
+    def pad(self, encoded, **kwargs):
+        ids = encoded['input_ids']
+        return {'input_ids': ids, 'attention_mask': [[1] * len(i) for i in ids]}
+
+    def convert_tokens_to_ids(self, token):
+        return token
+
+    def batch_decode(self, outputs, skip_special_tokens=True):
+        return list(outputs)
+
+
+class _FakeModel:
+    def __init__(self, tokenizer):
+        self.tokenizer = tokenizer
+        self.config = SimpleNamespace(model_type="m2m_100")
+        self.encoder_calls = 0
+        self.generate_calls = []
+
+    def get_encoder(self):
+        def encode(input_ids, attention_mask, return_dict=True):
+            self.encoder_calls += 1
+            return _EncoderOutput(last_hidden_state=list(input_ids))
+        return encode
+
+    def generate(self, encoder_outputs, forced_bos_token_id, **kwargs):
+        self.generate_calls.append(forced_bos_token_id)
+        return [
+            f"{forced_bos_token_id}:{self.tokenizer.words[ids[0]]}"
+            for ids in encoder_outputs['last_hidden_state']
+        ]
+
+
+def test_seq2seq_encodes_source_once_for_all_targets():
+    tokenizer = _FakeTokenizer()
+    model = _FakeModel(tokenizer)
+    translator = Seq2SeqTranslator(model, tokenizer, "fra_Latn", "eng_Latn")
+    tokenizer.calls = 0
+
+    results = translator.translate_multi_target(
+        ["bonjour", "salut"], tgt_langs=["eng_Latn", "spa_Latn", "deu_Latn"]
+    )
+
+    assert tokenizer.calls == 1
+    assert model.encoder_calls == 1
+    assert model.generate_calls == ["eng_Latn", "spa_Latn", "deu_Latn"]
+    assert results["spa_Latn"] == ["spa_Latn:bonjour", "spa_Latn:salut"]
+
+
+@pytest.mark.asyncio
+async def test_engine_translate_multilingual_calls_pipeline_once_per_batch():
+    model_loader = MagicMock()
+    model_loader.is_model_loaded.return_value = True
+    model_loader.get_model_inference_lock.return_value = threading.Lock()
+
+    engine = TranslatorEngine(model_loader, ThreadPoolExecutor(max_workers=1))
+    pipeline = MagicMock()
+    pipeline.translate_multi_target.side_effect = lambda texts, tgt_langs, **kw: {
+        tgt: [f"{tgt}:{t}" for t in texts] for tgt in tgt_langs
+    }
+    engine._get_or_create_pipeline = MagicMock(return_value=(pipeline, True))
+
+    try:
+        results = await engine.translate_multilingual(
+            ["Bonjour", "Voir https://meeshy.me"], "fr", ["en", "es", "en"], "basic"
+        )
+    finally:
+        engine.cleanup()
+
+    assert pipeline.translate_multi_target.call_count == 1
+    assert list(results) == ["en", "es"]
+    assert results["en"][0] == "eng_Latn:Bonjour"
+    # Les URLs sont masquées avant l'inférence et restaurées après
+    assert "https://meeshy.me" in results["es"][1]
+
+
+class _MultilingualService:
+    def __init__(self):
+        self.multilingual_calls = []
+        self.single_calls = []
+
+    async def translate_multilingual(self, text, source_language, target_languages,
+                                     model_type, source_channel):
+        self.multilingual_calls.append(list(target_languages))
+        return {
+            lang: {"translated_text": f"[{lang}] {text}", "detected_language": source_language}
+            for lang in target_languages
+        }
+
+    async def translate_with_structure(self, text, source_language, target_language,
+                                       model_type, source_channel):
+        self.single_calls.append(target_language)
+        return {"translated_text": f"[{target_language}] {text}"}
+
+
+def _make_task(languages):
+    return SimpleNamespace(
+        task_id="task-multi-1",
+        message_id="msg-multi-1",
+        text="Bonjour tout le monde.",
+        source_language="fr",
+        target_languages=list(languages),
+        model_type="basic",
+        conversation_id="conv-1",
+        created_at="2026-07-04T00:00:00Z",
+    )
+
+
+@pytest.mark.asyncio
+async def test_processor_translates_cache_misses_in_one_multilingual_call():
+    service = _MultilingualService()
+    cache = MagicMock()
+
+    async def get_translation(text, source_lang, target_lang, model_type):
+        return {"translated_text": "Hallo zusammen."} if target_lang == "de" else None
+
+    async def set_translation(**kwargs):
+        return True
+
+    cache.get_translation = get_translation
+    cache.set_translation = set_translation
+    published = []
+
+    async def publish(task_id, result, target_language):
+        published.append((target_language, result["translatedText"], result["fromCache"]))
+
+    results = await tp.process_single_translation(
+        task=_make_task(["en", "de", "pt"]),
+        worker_name="test_worker",
+        translation_service=service,
+        translation_cache=cache,
+        publish_func=publish,
+    )
+
+    assert service.multilingual_calls == [["en", "pt"]]
+    assert service.single_calls == []
+    assert published == [
+        ("en", "[en] Bonjour tout le monde.", False),
+        ("de", "Hallo zusammen.", True),
+        ("pt", "[pt] Bonjour tout le monde.", False),
+    ]
+    assert len(results) == 3
+
+
+@pytest.mark.asyncio
+async def test_processor_falls_back_per_language_when_multilingual_fails():
+    class BrokenService(_MultilingualService):
+        async def translate_multilingual(self, *args, **kwargs):
+            raise RuntimeError("encoder crash")
+
+    service = BrokenService()
+    published = []
+
+    async def publish(task_id, result, target_language):
+        published.append(target_language)
+
+    await tp.process_single_translation(
+        task=_make_task(["en", "pt"]),
+        worker_name="test_worker",
+        translation_service=service,
+        translation_cache=None,
+        publish_func=publish,
+    )
+
+    assert service.single_calls == ["en", "pt"]
+    assert published == ["en", "pt"]
+
+
+@pytest.mark.asyncio
+async def test_engine_failure_raises_instead_of_returning_markers():
+    model_loader = MagicMock()
+    model_loader.is_model_loaded.return_value = True
+    model_loader.get_model_inference_lock.return_value = threading.Lock()
+
+    engine = TranslatorEngine(model_loader, ThreadPoolExecutor(max_workers=1))
+    pipeline = MagicMock()
+    pipeline.translate_multi_target.side_effect = RuntimeError("CUDA out of memory")
+    engine._get_or_create_pipeline = MagicMock(return_value=(pipeline, True))
+
+    try:
+        with pytest.raises(RuntimeError):
+            await engine.translate_multilingual(["Bonjour"], "fr", ["en", "es"], "basic")
+    finally:
+        engine.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_processor_never_caches_engine_error_markers():
+    class MarkerService(_MultilingualService):
+        async def translate_multilingual(self, text, source_language, target_languages,
+                                         model_type, source_channel):
+            self.multilingual_calls.append(list(target_languages))
+            return {
+                lang: {"translated_text": f"[ML-Multilingual-Error] {text}"}
+                for lang in target_languages
+            }
+
+    service = MarkerService()
+    cache = MagicMock()
+    written = []
+
+    async def get_translation(text, source_lang, target_lang, model_type):
+        return None
+
+    async def set_translation(**kwargs):
+        written.append(kwargs["translated_text"])
+        return True
+
+    cache.get_translation = get_translation
+    cache.set_translation = set_translation
+    published = []
+
+    async def publish(task_id, result, target_language):
+        published.append((target_language, result["translatedText"]))
+
+    await tp.process_single_translation(
+        task=_make_task(["en", "pt"]),
+        worker_name="test_worker",
+        translation_service=service,
+        translation_cache=cache,
+        publish_func=publish,
+    )
+
+    # Les langues en échec repassent par le chemin par langue
+    assert service.single_calls == ["en", "pt"]
+    assert all("Error" not in text for text in written)
+    assert published == [("en", "[en] Bonjour tout le monde."), ("pt", "[pt] Bonjour tout le monde.")]
+
+
+@pytest.mark.asyncio
+async def test_batch_cache_write_drops_failed_translations():
+    from services.translation_ml.translation_cache import TranslationCache
+
+    cache = TranslationCache.__new__(TranslationCache)
+    cache_service = MagicMock()
+    stored = []
+
+    async def set_translations_batch(items, model_type):
+        stored.extend(items)
+
+    cache_service.set_translations_batch = set_translations_batch
+    cache._cache_service = cache_service
+    cache.is_available = lambda: True
+
+    await cache.cache_batch_results(
+        [("Bonjour", "Hello"), ("Salut", "[ML-Multilingual-Error] Salut"), ("Oui", "")],
+        "fr", "en", "basic"
+    )
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    assert stored == [("Bonjour", "fr", "en", "Hello")]
+
+
+@pytest.mark.asyncio
+async def test_story_text_object_retries_failed_languages_one_by_one():
+    from services.zmq_translation_handler import TranslationHandler
+
+    class _PartlyFailing(_MultilingualService):
+        async def translate_multilingual(self, text, source_language, target_languages,
+                                         model_type, source_channel):
+            results = await super().translate_multilingual(
+                text, source_language, target_languages, model_type, source_channel
+            )
+            results["de"] = {"translated_text": "[ML-Multilingual-Error] Bonjour"}
+            del results["es"]
+            return results
+
+    service = _PartlyFailing()
+    handler = TranslationHandler.__new__(TranslationHandler)
+    handler.pool_manager = SimpleNamespace(translation_service=service)
+    handler.pub_socket = MagicMock()
+    handler.pub_socket.send = AsyncMock()
+
+    await handler._handle_story_text_object_translation({
+        "postId": "post-1", "textObjectIndex": 0, "text": "Bonjour",
+        "sourceLanguage": "fr", "targetLanguages": ["en", "de", "es"],
+    })
+
+    assert sorted(service.single_calls) == ["de", "es"]
+    event = json.loads(handler.pub_socket.send.call_args[0][0])
+    assert event["translations"] == {"en": "[en] Bonjour", "de": "[de] Bonjour", "es": "[es] Bonjour"}
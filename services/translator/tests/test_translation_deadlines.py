@@ -0,0 +1,175 @@
+"""
+TDD — Échéances des traductions: ordonnancement EDF et abandon des tâches expirées.
+
+Avant : TranslationTask portait created_at mais les pools du ConnectionManager
+étaient des asyncio.Queue FIFO. Pendant un backlog, les workers traduisaient
+des messages dont la requête gateway avait déjà expiré, et chacun attendait
+encore plus longtemps.
+
+Après : l'échéance de la gateway (`deadline`, `timeoutMs`, `timestamp` + délai
+par défaut) est propagée à la tâche ; fast/normal/any sont servies par
+échéance la plus proche (y compris entre fast_pool et pool régulière) ; une
+tâche expirée est abandonnée avant inférence avec un événement
+`translation_expired`, et comptée. Le délai par défaut dépend du type de
+requête : 30 s pour le texte, le deadman voix (15 min) pour l'audio, dont la
+requête expirée en file d'admission est abandonnée avant Whisper/TTS.
+"""
+import json
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.zmq_models import (
+    DEFAULT_AUDIO_DEADLINE_S,
+    DEFAULT_TRANSLATION_DEADLINE_S,
+    TranslationTask,
+    deadline_from_request,
+)
+from services.zmq_pool.connection_manager import DeadlineQueue
+
+
+def _task(task_id, deadline=None, text="hello world", conv_id="c1", targets=("fr",)):
+    return TranslationTask(
+        task_id=task_id,
+        message_id=f"m-{task_id}",
+        text=text,
+        source_language="en",
+        target_languages=list(targets),
+        conversation_id=conv_id,
+        deadline=deadline,
+    )
+
+
+def test_deadline_from_gateway_request():
+    now = 1_700_000_000.0
+    assert deadline_from_request({"deadline": (now + 12) * 1000}, now=now) == now + 12
+    assert deadline_from_request({"timestamp": (now - 5) * 1000, "timeoutMs": 20_000}, now=now) == now + 15
+    assert deadline_from_request({"timestamp": (now - 5) * 1000}, default_s=30, now=now) == now + 25
+    # Horloge gateway aberrante: réception + délai par défaut
+    assert deadline_from_request({"timestamp": 1000}, default_s=30, now=now) == now + 30
+    assert deadline_from_request({}, default_s=30, now=now) == now + 30
+
+
+def test_default_deadline_depends_on_request_type():
+    now = 1_700_000_000.0
+    sent = {"timestamp": (now - 60) * 1000}
+    assert DEFAULT_AUDIO_DEADLINE_S > DEFAULT_TRANSLATION_DEADLINE_S
+    assert deadline_from_request({"type": "translation", **sent}, now=now) == now - 60 + DEFAULT_TRANSLATION_DEADLINE_S
+    assert deadline_from_request({"type": "audio_process", **sent}, now=now) == now - 60 + DEFAULT_AUDIO_DEADLINE_S
+    assert deadline_from_request({"type": "transcription_only", **sent}, now=now) == now - 60 + DEFAULT_AUDIO_DEADLINE_S
+    # Un timeoutMs explicite reste prioritaire
+    assert deadline_from_request({"type": "audio_process", "timeoutMs": 10_000, **sent}, now=now) == now - 50
+
+
+@pytest.mark.asyncio
+async def test_audio_request_expired_in_admission_queue_is_dropped():
+    from services.zmq_audio_handler import AudioHandler
+
+    handler = AudioHandler.__new__(AudioHandler)
+    handler.pub_socket = AsyncMock()
+    request = {
+        "type": "audio_process",
+        "messageId": "m1",
+        "attachmentId": "a1",
+        "timestamp": (time.time() - DEFAULT_AUDIO_DEADLINE_S - 5) * 1000,
+    }
+
+    await handler._handle_audio_process_request(request)
+
+    event = handler.pub_socket.send.call_args[0][0]
+    assert b'"audio_process_error"' in event and b'"deadline_expired"' in event
+
+
+def test_task_gets_default_deadline():
+    task = _task("t1")
+    assert task.deadline > task.created_at
+    assert not task.is_expired()
+    assert _task("t2", deadline=time.time() - 1).is_expired()
+
+
+@pytest.mark.asyncio
+async def test_deadline_queue_is_edf_and_fifo_on_ties():
+    queue = DeadlineQueue(maxsize=10)
+    now = time.time()
+    for task_id, deadline in (("late", now + 30), ("a", now + 5), ("urgent", now + 1), ("b", now + 5)):
+        await queue.put(_task(task_id, deadline=deadline))
+
+    assert queue.peek_deadline() == now + 1
+    order = [(await queue.get()).task_id for _ in range(4)]
+    assert order == ["urgent", "a", "b", "late"]
+
+
+def _manager():
+    from services.zmq_pool.zmq_pool_manager import TranslationPoolManager
+
+    manager = TranslationPoolManager(normal_workers=2, any_workers=2, enable_dynamic_scaling=False)
+    manager.translation_cache = None
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_regular_pool_head_with_earlier_deadline_beats_fast_pool():
+    manager = _manager()
+    cm = manager.connection_manager
+    now = time.time()
+    await cm.fast_pool.put(_task("short", deadline=now + 20, text="hi"))
+    await cm.normal_pool.put(_task("old", deadline=now + 2))
+
+    first = await manager._get_next_task(cm.fast_pool, cm.normal_pool)
+    second = await manager._get_next_task(cm.fast_pool, cm.normal_pool)
+    assert [first.task_id, second.task_id] == ["old", "short"]
+
+
+@pytest.mark.asyncio
+async def test_expired_tasks_dropped_before_inference():
+    manager = _manager()
+    manager._process_single_translation = AsyncMock()
+    manager._process_batch_translation = AsyncMock()
+    manager._publish_translation_expired = AsyncMock()
+
+    expired = _task("expired", deadline=time.time() - 2, targets=("fr", "de"))
+    await manager._process_task(expired, "w1")
+    manager._process_single_translation.assert_not_awaited()
+    published_task, late_ms = manager._publish_translation_expired.call_args[0]
+    assert published_task is expired and late_ms >= 2000
+
+    # Batch: seules les tâches encore dans les temps sont traduites
+    live = _task("live")
+    batch = _task("batch")
+    batch._batch_tasks = [_task("gone", deadline=time.time() - 1), live]
+    await manager._process_task(batch, "w1")
+    manager._process_single_translation.assert_awaited_once_with(live, "w1")
+
+    stats = manager.get_stats()
+    assert stats["tasks_expired"] == 2 and stats["translations_expired"] == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_inherits_earliest_deadline():
+    from services.zmq_pool.connection_manager import ConnectionManager
+
+    cm = ConnectionManager()
+    now = time.time()
+    await cm._enqueue_batch([_task("a", deadline=now + 30), _task("b", deadline=now + 3)])
+    batch = await cm.normal_pool.get()
+    assert batch.deadline == now + 3
+
+
+@pytest.mark.asyncio
+async def test_expired_event_releases_inflight_claim():
+    from services.zmq_translation_handler import TranslationHandler
+
+    handler = TranslationHandler.__new__(TranslationHandler)
+    handler._inflight_tasks = {}
+    handler.pub_socket = AsyncMock()
+    assert handler.claim_inflight("t1", ttl_s=60)
+
+    deadline = time.time() - 1
+    await handler._publish_translation_expired(_task("t1", deadline=deadline), late_ms=1500)
+
+    event = json.loads(handler.pub_socket.send.call_args[0][0])
+    assert event["type"] == "translation_expired" and event["lateByMs"] == 1500
+    assert event["deadline"] == int(deadline * 1000)
+    # La relance gateway du même taskId sera traitée
+    assert handler.claim_inflight("t1", ttl_s=60)
@@ -0,0 +1,157 @@
+"""
+TDD — Mémoire de traduction au niveau segment avec réutilisation approximative.
+
+Avant : seul le cache Redis exact (hash du texte) évitait l'inférence ; un
+message de bot « Votre code est 4521 » puis « Votre code est 9876 », ou un
+« Bonjour Marie » → « Bonjour Paul », repassaient chacun par le modèle.
+
+Après : services.translation_ml.translation_memory masque nombres, URLs,
+emojis et mentions (gabarit réutilisé avec les nouvelles valeurs), indexe les
+segments par MinHash/LSH et réutilise un quasi-doublon au-dessus d'un seuil
+de similarité lorsqu'il ne diffère que par la casse, la ponctuation ou des
+hashtags recopiés tels quels ; un mot ordinaire différent n'est jamais
+substitué. Branchée dans translate / translate_with_structure /
+translate_multilingual, avec statistiques de réutilisation.
+"""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.translation_ml.translation_memory import TranslationMemory, mask_placeholders
+from services.translation_ml.translation_service import TranslationService
+
+
+def test_masking_covers_numbers_urls_emojis_and_mentions():
+    masked, values = mask_placeholders("Colis 42 livré 🔹EMOJI_0🔹  https://track.io/x 🎉 @marie")
+    assert "42" not in masked and "https" not in masked and "marie" not in masked
+    assert values == ["42", "🔹EMOJI_0🔹", "https://track.io/x", "🎉", "@marie"]
+    # Même gabarit, valeurs différentes → même clé
+    assert mask_placeholders("Colis 7 livré 🔹EMOJI_3🔹 https://a.b/c 😀 @paul")[0] == masked
+    # Une adresse email n'est pas une mention
+    assert mask_placeholders("Écris à marie@exemple.fr")[1] == []
+
+
+def test_template_reuse_refills_masked_values():
+    memory = TranslationMemory()
+    assert memory.remember("Votre code est 4521, valable 10 minutes", "Your code is 4521, valid for 10 minutes",
+                           "fr", "en", "basic")
+
+    match = memory.lookup("Votre code est 9876, valable 5 minutes", "fr", "en", "basic")
+    assert match.match_type == "template"
+    assert match.translated_text == "Your code is 9876, valid for 5 minutes"
+
+    assert memory.lookup("Votre code est 4521, valable 10 minutes", "fr", "en", "basic").match_type == "exact"
+    # Autre langue cible / autre modèle: espace séparé
+    assert memory.lookup("Votre code est 9876, valable 5 minutes", "fr", "es", "basic") is None
+
+    # Nombre localisé dans la traduction: pas de gabarit sûr, rien n'est mémorisé
+    assert not memory.remember("Il est 17:30", "It is 5:30 pm", "fr", "en", "basic")
+    assert memory.get_stats()["untemplatable"] == 1
+
+
+def test_fuzzy_reuse_never_substitutes_ordinary_words():
+    memory = TranslationMemory(threshold=0.8)
+    memory.remember("Bonjour @marie, rendez-vous à 5 heures demain", "Hello @marie, see you at 5 tomorrow",
+                    "fr", "en", "basic")
+
+    # Mention masquée: gabarit, pas de substitution de mot
+    match = memory.lookup("Bonjour @paul, rendez-vous à 7 heures demain", "fr", "en", "basic")
+    assert match.match_type == "template"
+    assert match.translated_text == "Hello @paul, see you at 7 tomorrow"
+
+    # Casse et ponctuation seulement: quasi-doublon servi
+    match = memory.lookup("bonjour @paul rendez-vous à 7 heures demain !", "fr", "en", "basic")
+    assert match.match_type == "fuzzy" and match.similarity == 1.0
+    assert match.translated_text == "Hello @paul, see you at 7 tomorrow"
+
+    # Mot ordinaire qui change, même recopié tel quel dans la traduction: rejeté
+    memory.remember("Le film était top hier soir", "The movie was top last night", "fr", "en", "basic")
+    assert memory.lookup("Le film était nul hier soir", "fr", "en", "basic") is None
+    # Insertion de mot: rejeté
+    assert memory.lookup("Bonjour @marie, rendez-vous à 5 heures demain soir", "fr", "en", "basic") is None
+
+    # Hashtag recopié: substitué
+    memory.remember("Soirée jeux ce soir chez moi #vendredi", "Game night tonight at my place #vendredi",
+                    "fr", "en", "basic")
+    match = memory.lookup("Soirée jeux ce soir chez moi #samedi", "fr", "en", "basic")
+    assert match.match_type == "fuzzy"
+    assert match.translated_text == "Game night tonight at my place #samedi"
+
+    # Seuil plus strict: le quasi-doublon n'est plus servi
+    strict = TranslationMemory(threshold=0.95)
+    strict.remember("Soirée jeux ce soir chez moi #vendredi", "Game night tonight at my place #vendredi",
+                    "fr", "en", "basic")
+    assert strict.lookup("Soirée jeux ce soir chez moi #samedi", "fr", "en", "basic") is None
+
+
+def test_lru_eviction_and_hit_rate():
+    memory = TranslationMemory(max_size=2)
+    for text, translated in [
+        ("Merci pour ton aide hier soir", "Thanks for your help last night"),
+        ("On se voit demain au bureau", "See you tomorrow at the office"),
+        ("Bonne soirée à toute la famille", "Have a nice evening, everyone"),
+    ]:
+        memory.remember(text, translated, "fr", "en", "basic")
+
+    assert len(memory) == 2
+    assert memory.lookup("Merci pour ton aide hier soir", "fr", "en", "basic") is None
+    assert memory.lookup("on se voit demain au bureau !", "fr", "en", "basic").translated_text == \
+        "See you tomorrow at the office"
+    # Aucun bucket LSH orphelin après éviction
+    indexed = {key for bucket in memory._buckets.values() for key in bucket}
+    assert indexed == {key for _, key in memory._entries}
+
+    stats = memory.get_stats()
+    assert stats["evictions"] == 1 and stats["fuzzy_hits"] == 1 and stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+    # Traduction en échec jamais mémorisée
+    assert not memory.remember("Salut", "", "fr", "en", "basic")
+
+
+@pytest.fixture
+def service():
+    TranslationService._instance = None
+    model_loader = MagicMock()
+    model_loader.is_model_loaded.return_value = True
+
+    async def no_cache(segments, source, target, model_type):
+        # Cache vide: seuls les séparateurs sont conservés tels quels
+        cached = [s if s["type"] != "line" else None for s in segments]
+        return cached, [(i, s["text"]) for i, s in enumerate(segments) if s["type"] == "line"]
+
+    cache = MagicMock()
+    cache.check_cache_batch = AsyncMock(side_effect=no_cache)
+    cache.cache_batch_results = AsyncMock()
+
+    engine = MagicMock()
+    engine.translate_text = AsyncMock(side_effect=lambda text, *a: text.replace("Commande", "Order"))
+    engine.translate_batch = AsyncMock(side_effect=lambda texts, *a: [t.replace("Commande", "Order") for t in texts])
+
+    svc = TranslationService(model_loader, engine, cache)
+    svc.translation_memory = TranslationMemory()
+    svc.is_initialized = True
+    yield svc
+    TranslationService._instance = None
+
+
+@pytest.mark.asyncio
+async def test_service_serves_templates_without_inference(service):
+    engine = service.translator_engine
+
+    first = await service.translate("Commande 1042 expédiée", "fr", "en")
+    second = await service.translate("Commande 2077 expédiée", "fr", "en")
+    assert first["from_cache"] is False
+    assert second["translated_text"] == "Order 2077 expédiée"
+    assert second["from_cache"] is True and second["translation_memory"] == "template"
+    assert engine.translate_text.await_count == 1
+
+    text = "Commande 1 expédiée 🎉\n\nCommande 2 en cours de préparation pour Marie"
+    await service.translate_with_structure(text, "fr", "en")
+    result = await service.translate_with_structure(text.replace("1", "8").replace("2", "9"), "fr", "en")
+
+    assert result["translated_text"] == "Order 8 expédiée 🎉\n\nOrder 9 en cours de préparation pour Marie"
+    assert engine.translate_batch.await_count == 1
+    # Les sorties de la mémoire ne sont pas écrites dans le cache exact Redis
+    assert service.translation_cache.cache_batch_results.await_count == 1
+    assert (await service.get_stats())["translation_memory"]["template_hits"] >= 3
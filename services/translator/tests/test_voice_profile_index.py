@@ -0,0 +1,151 @@
+"""
+TDD — Index secondaire des profils vocaux (sorted sets) au lieu de KEYS.
+
+Avant : VoiceCloneCacheManager.list_all_cached_models faisait
+redis.keys("voice:profile:*") puis un GET + json.loads séquentiel par clé,
+et schedule_quarterly_recalibration chargeait tous les profils pour n'en
+garder que les échus : KEYS bloque Redis pour tous les clients dès quelques
+dizaines de milliers de profils.
+
+Après : set_voice_profile maintient voice:index:updated et
+voice:index:recalibration ; parcours par pages (ZRANGEBYSCORE à curseur de
+score + MGET), générateur async iter_cached_models, recalibration limitée aux
+profils échus, reconstruction de l'index par SCAN pour les profils existants.
+"""
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from services.redis_service import AudioCacheService, RedisService
+from services.voice_clone.voice_clone_cache import VoiceCloneCacheManager
+from services.voice_clone.voice_metadata import VoiceModel
+
+
+@pytest.fixture
+def audio_cache():
+    RedisService._instance = None
+    service = RedisService()
+    service.permanently_disabled = True
+
+    async def no_keys(pattern):
+        raise AssertionError("KEYS ne doit plus être utilisé")
+
+    service.keys = no_keys
+    yield AudioCacheService(service)
+    RedisService._instance = None
+
+
+def _profile(user_id, updated, next_recalibration=None):
+    return {
+        "userId": user_id,
+        "updatedAt": updated.isoformat(),
+        "createdAt": updated.isoformat(),
+        "nextRecalibrationAt": next_recalibration.isoformat() if next_recalibration else None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_pages_follow_updated_at_and_skip_stale_members(audio_cache):
+    base = datetime.now() - timedelta(days=1)
+    for i in range(25):
+        await audio_cache.set_voice_profile(f"user{i:02d}", _profile(f"user{i:02d}", base + timedelta(minutes=i)))
+
+    # Profil expiré/supprimé hors index: retiré au passage
+    del audio_cache.redis.memory_cache["voice:profile:user03"]
+
+    pages = [page async for page in audio_cache.iter_voice_profiles(page_size=10)]
+    user_ids = [profile["userId"] for page in pages for profile in page]
+
+    assert len(pages) == 3 and all(len(page) <= 10 for page in pages)
+    assert user_ids == [f"user{i:02d}" for i in range(25) if i != 3]
+    assert await audio_cache.count_voice_profiles() == 24
+
+
+@pytest.mark.asyncio
+async def test_equal_scores_are_neither_lost_nor_repeated(audio_cache):
+    same = datetime.now() - timedelta(hours=1)
+    for i in range(7):
+        await audio_cache.set_voice_profile(f"tie{i}", _profile(f"tie{i}", same))
+
+    pages = [page async for page in audio_cache.iter_voice_profiles(page_size=3)]
+    user_ids = [profile["userId"] for page in pages for profile in page]
+    assert sorted(user_ids) == [f"tie{i}" for i in range(7)]
+    assert len(user_ids) == 7
+
+
+@pytest.mark.asyncio
+async def test_due_profiles_only_and_rescheduling_does_not_skip(audio_cache):
+    now = datetime.now()
+    for i in range(6):
+        await audio_cache.set_voice_profile(f"due{i}", _profile(f"due{i}", now, now - timedelta(days=i + 1)))
+    await audio_cache.set_voice_profile("later", _profile("later", now, now + timedelta(days=30)))
+    await audio_cache.set_voice_profile("never", _profile("never", now))
+
+    seen = []
+    async for page in audio_cache.iter_voice_profiles(page_size=2, due_before=now.timestamp()):
+        for profile in page:
+            seen.append(profile["userId"])
+            # Recalibration pendant l'itération: le profil sort de la plage
+            await audio_cache.set_voice_profile(
+                profile["userId"], _profile(profile["userId"], now, now + timedelta(days=90))
+            )
+
+    assert sorted(seen) == [f"due{i}" for i in range(6)]
+
+
+@pytest.mark.asyncio
+async def test_rebuild_indexes_profiles_written_before_the_index(audio_cache):
+    from services.redis_service import _encode_entry
+
+    now = datetime.now()
+    for i in range(5):
+        await audio_cache.redis.setex(f"voice:profile:legacy{i}", 3600, _encode_entry(_profile(f"legacy{i}", now)))
+
+    assert await audio_cache.count_voice_profiles() == 5  # SCAN au premier usage
+
+    await audio_cache.delete_voice_profile("legacy0")
+    assert await audio_cache.count_voice_profiles() == 4
+
+
+@pytest.mark.asyncio
+async def test_cache_manager_pages_and_recalibrates_only_due_models(audio_cache, tmp_path):
+    manager = VoiceCloneCacheManager(audio_cache=audio_cache, voice_cache_dir=tmp_path)
+    now = datetime.now()
+    for i, delta in enumerate([-5, -1, 10]):
+        await manager.save_model_to_cache(VoiceModel(
+            user_id=f"voice{i}",
+            embedding_path="",
+            audio_count=1,
+            total_duration_ms=10000,
+            quality_score=0.8,
+            created_at=now,
+            updated_at=now,
+            next_recalibration_at=now + timedelta(days=delta),
+            embedding=np.zeros(4, dtype=np.float32),
+        ))
+
+    pages = [page async for page in manager.iter_cached_models(page_size=2)]
+    assert [len(page) for page in pages] == [2, 1]
+    assert len(await manager.list_all_cached_models()) == 3
+    assert (await manager.get_stats())["models_count"] == 3
+
+    recalibrated = []
+
+    class BestAudio:
+        file_path = "/tmp/best.wav"
+        duration_ms = 12000
+        attachment_id = "att"
+        overall_score = 0.9
+
+    async def best_audio(user_id):
+        return BestAudio()
+
+    async def history(user_id):
+        return []
+
+    async def create_model(user_id, paths, duration_ms):
+        recalibrated.append(user_id)
+
+    await manager.schedule_quarterly_recalibration(best_audio, history, create_model)
+    assert sorted(recalibrated) == ["voice0", "voice1"]
@@ -0,0 +1,237 @@
+"""
+TDD — Préchauffage au démarrage à partir des paires chaudes enregistrées.
+
+Avant : après chaque déploiement, LRUPipelineCache et le L1 repartaient
+vides ; les premières requêtes de chaque paire payaient la construction du
+pipeline, le premier generate() torch et un aller-retour Redis, alors que
+/ready annonçait le service prêt.
+
+Après : services.translation_ml.warmup.WarmupManager écrit périodiquement
+les paires les plus demandées (LRUPipelineCache.get_hot_pairs) et les clés
+L1 les plus fréquentes ; au démarrage, il reconstruit et exerce ces
+pipelines, recharge le L1, et /ready attend la fin du préchauffage.
+
+Les paires sont comptées par TranslationService (le moteur local est
+contourné quand les réplicas servent) et le préchauffage passe par le moteur
+d'inférence courant : chaque réplica construit ses propres pipelines. /ready
+ne passe à prêt qu'une fois l'étape en cours réellement terminée, même après
+expiration du délai.
+"""
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.translation_ml.translation_service import TranslationService
+from services.translation_ml.warmup import STATE_VERSION, WarmupManager, parse_token_lengths
+from utils.l1_cache import TinyLFUCache
+from utils.performance import PerformanceConfig
+from utils.pipeline_cache import LRUPipelineCache
+
+
+def _manager(tmp_path, service=None, cache=None, **overrides):
+    config = PerformanceConfig()
+    config.enable_warmup = True
+    config.warmup_token_lengths = "8,32"
+    for name, value in overrides.items():
+        setattr(config, name, value)
+    service = service or MagicMock()
+    cache = cache or MagicMock()
+    return WarmupManager(service, cache, str(tmp_path / "warmup_state.json"), config)
+
+
+def test_hot_pairs_count_requests_across_evictions():
+    cache = LRUPipelineCache(max_size=1)
+    for _ in range(3):
+        if cache.get("basic", "fra_Latn", "eng_Latn") is None:
+            cache.put("basic", "fra_Latn", "eng_Latn", object())
+    cache.get("basic", "eng_Latn", "spa_Latn")
+    cache.put("basic", "eng_Latn", "spa_Latn", object())
+
+    assert cache.get_hot_pairs(2) == [
+        ("basic", "fra_Latn", "eng_Latn", 3),
+        ("basic", "eng_Latn", "spa_Latn", 1),
+    ]
+
+
+def test_l1_hot_keys_ranked_by_frequency():
+    l1 = TinyLFUCache(max_bytes=1 << 20)
+    for key, hits in (("a", 1), ("b", 5), ("c", 3)):
+        l1.put(key, {"v": key})
+        for _ in range(hits):
+            l1.get(key)
+    assert l1.hot_keys(2) == ["b", "c"]
+
+
+def test_parse_token_lengths_ignores_garbage():
+    assert parse_token_lengths("16, 64,x,-3,0,192") == [16, 64, 192]
+    assert parse_token_lengths("") == []
+
+
+def test_snapshot_round_trip_and_empty_process_keeps_previous(tmp_path):
+    service = MagicMock()
+    service.get_hot_language_pairs.return_value = [("basic", "fra_Latn", "eng_Latn", 12)]
+    cache = MagicMock()
+    cache.hot_keys.return_value = ["translation:abc"]
+    manager = _manager(tmp_path, service, cache)
+
+    assert manager.save_snapshot()
+    state = manager.load_snapshot()
+    assert state["version"] == STATE_VERSION
+    assert state["pairs"] == [["basic", "fra_Latn", "eng_Latn", 12]]
+    assert state["cache_keys"] == ["translation:abc"]
+
+    # Processus qui n'a encore rien servi: l'instantané précédent est conservé
+    service.get_hot_language_pairs.return_value = []
+    cache.hot_keys.return_value = []
+    assert not manager.save_snapshot()
+    assert manager.load_snapshot()["pairs"] == state["pairs"]
+
+
+def test_unreadable_or_foreign_snapshot_is_ignored(tmp_path):
+    manager = _manager(tmp_path)
+    assert manager.load_snapshot() is None
+    (tmp_path / "warmup_state.json").write_text("{not json")
+    assert manager.load_snapshot() is None
+    (tmp_path / "warmup_state.json").write_text(json.dumps({"version": STATE_VERSION + 1, "pairs": []}))
+    assert manager.load_snapshot() is None
+
+
+@pytest.mark.asyncio
+async def test_run_warms_pairs_and_preloads_l1(tmp_path):
+    (tmp_path / "warmup_state.json").write_text(json.dumps({
+        "version": STATE_VERSION,
+        "pairs": [["basic", "fra_Latn", "eng_Latn", 9], ["premium", "eng_Latn", "deu_Latn", 4]],
+        "cache_keys": ["translation:a", "translation:b"],
+    }))
+    service = MagicMock()
+    service.warmup_pair = AsyncMock(side_effect=[True, False])
+    cache = MagicMock()
+    cache.preload_hot_keys = AsyncMock(return_value=2)
+    manager = _manager(tmp_path, service, cache)
+
+    assert not manager.is_ready
+    assert await manager.run() == "done"
+    assert manager.is_ready
+
+    cache.preload_hot_keys.assert_awaited_once_with(["translation:a", "translation:b"])
+    service.warmup_pair.assert_any_await("basic", "fra_Latn", "eng_Latn", [8, 32])
+    status = manager.get_status()
+    assert (status["pairs_warmed"], status["pairs_failed"], status["keys_preloaded"]) == (1, 1, 2)
+
+
+@pytest.mark.asyncio
+async def test_run_without_snapshot_or_disabled_is_ready(tmp_path):
+    assert await _manager(tmp_path).run() == "done"
+    assert await _manager(tmp_path, enable_warmup=False).run() == "disabled"
+
+
+@pytest.fixture
+def service_with_replicas():
+    TranslationService._instance = None
+    model_loader = MagicMock()
+    model_loader.is_model_loaded.return_value = True
+    engine = MagicMock()
+    engine.lang_codes = {"fr": "fra_Latn", "en": "eng_Latn", "es": "spa_Latn"}
+    cache = MagicMock()
+    svc = TranslationService(model_loader, engine, cache)
+    svc.translation_memory = None
+    svc.is_initialized = True
+    svc.replica_pool = MagicMock(is_running=True)
+    svc.replica_pool.translate_text = AsyncMock(return_value="hello")
+    svc.replica_pool.warmup_pair = AsyncMock(return_value=True)
+    yield svc
+    TranslationService._instance = None
+
+
+@pytest.mark.asyncio
+async def test_hot_pairs_are_counted_when_replicas_serve(service_with_replicas):
+    svc = service_with_replicas
+    for _ in range(3):
+        await svc.translate("bonjour", "fr", "en")
+    await svc.translate("hola", "es", "en")
+
+    # Le moteur local n'a rien servi: seul le compte du service voit les paires
+    svc.translator_engine.translate_text.assert_not_called()
+    assert svc.get_hot_language_pairs(2) == [
+        ("basic", "fra_Latn", "eng_Latn", 3),
+        ("basic", "spa_Latn", "eng_Latn", 1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_warmup_goes_to_the_replicas(service_with_replicas):
+    svc = service_with_replicas
+    assert await svc.warmup_pair("basic", "fra_Latn", "eng_Latn", [8]) is True
+    svc.replica_pool.warmup_pair.assert_awaited_once_with("basic", "fra_Latn", "eng_Latn", [8])
+    svc.translator_engine.warmup_pair.assert_not_called()
+
+    # Sans pool actif: le moteur local, dans un thread
+    svc.replica_pool.is_running = False
+    svc.translator_engine.warmup_pair.return_value = True
+    assert await svc.warmup_pair("basic", "fra_Latn", "eng_Latn", [8]) is True
+    svc.translator_engine.warmup_pair.assert_called_once_with("basic", "fra_Latn", "eng_Latn", [8])
+
+
+@pytest.mark.asyncio
+async def test_timeout_waits_for_the_running_warmup_thread(tmp_path):
+    (tmp_path / "warmup_state.json").write_text(json.dumps({
+        "version": STATE_VERSION,
+        "pairs": [["basic", "fra_Latn", "eng_Latn", 9], ["basic", "eng_Latn", "spa_Latn", 4]],
+        "cache_keys": [],
+    }))
+    finished = threading.Event()
+
+    def slow_warmup(*args):
+        time.sleep(0.5)
+        finished.set()
+        return True
+
+    async def warmup_pair(*args):
+        return await asyncio.to_thread(slow_warmup, *args)
+
+    service = MagicMock()
+    service.warmup_pair = AsyncMock(side_effect=warmup_pair)
+    manager = _manager(tmp_path, service, warmup_timeout_s=0.1)
+
+    assert await manager.run() == "timeout"
+    # Prêt seulement une fois le thread réellement terminé; la paire suivante n'est pas lancée
+    assert finished.is_set()
+    assert service.warmup_pair.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_ready_endpoint_waits_for_warmup(tmp_path, monkeypatch):
+    HTTPException = pytest.importorskip("fastapi.exceptions").HTTPException
+    from api import health
+
+    manager = _manager(tmp_path)
+    monkeypatch.setattr(health, "check_database_health", AsyncMock(return_value={"connected": True}))
+    monkeypatch.setattr(health, "check_zmq_health", AsyncMock(return_value={"running": True}))
+    monkeypatch.setattr(health, "warmup_manager", manager)
+
+    with pytest.raises(HTTPException) as exc:
+        await health.readiness_check()
+    assert exc.value.status_code == 503
+    assert exc.value.detail["warmup_ready"] is False
+
+    await manager.run()
+    assert (await health.readiness_check())["warmup_ready"] is True
+
+
+@pytest.mark.asyncio
+async def test_model_loading_crash_marks_warmup_failed(tmp_path):
+    main = pytest.importorskip("main")
+
+    server = main.MeeshyTranslationServer.__new__(main.MeeshyTranslationServer)
+    server.translation_service = MagicMock()
+    server.translation_service.initialize = AsyncMock(side_effect=RuntimeError("CUDA OOM"))
+    server.warmup_manager = _manager(tmp_path)
+
+    await server.initialize_models_background()
+
+    # /ready ne reste pas bloqué sur 'pending'
+    assert server.warmup_manager.status == "failed" and server.warmup_manager.is_ready
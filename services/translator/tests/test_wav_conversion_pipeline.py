@@ -9,10 +9,15 @@ Validates that:
 4. Conversion failure falls back to original path gracefully
 5. No redundant conversion in diarization (_apply_diarization)
 6. Unit behavior of convert_to_wav_if_needed itself
+7. The converted WAV stays pinned in the artifact store for the whole pipeline
+8. Concurrent conversions of the same content run once; the async variant
+   hashes and converts off the event loop
 """
 
 import sys
 import os
+import threading
+import time
 import pytest
 import tempfile
 import shutil
@@ -94,6 +99,33 @@ def converted_wav_path(temp_dir):
     return str(p)
 
 
+@pytest.fixture(autouse=True)
+def artifact_store(temp_dir):
+    """Artifact store under temp_dir for the pipeline (pinning)."""
+    from utils.artifact_store import ArtifactStore
+
+    store = ArtifactStore(str(temp_dir / "artifacts"), max_bytes=1 << 20)
+    with patch("services.audio_pipeline.audio_message_pipeline.get_artifact_store", return_value=store):
+        yield store
+
+
+def _mock_pydub(export_delay: float = 0.0):
+    """pydub mock whose export writes a small WAV file."""
+    mock_pydub = MagicMock()
+    mock_audio = MagicMock()
+    mock_audio.channels = 2
+    mock_audio.set_sample_width.return_value = mock_audio
+    mock_audio.set_channels.return_value = mock_audio
+
+    def export(path, format):
+        time.sleep(export_delay)
+        Path(path).write_bytes(b"RIFF" + b"\x00" * 40)
+
+    mock_audio.export.side_effect = export
+    mock_pydub.AudioSegment.from_file.return_value = mock_audio
+    return mock_pydub
+
+
 @pytest.fixture(autouse=True)
 def reset_pipeline_singleton():
     """Reset AudioMessagePipeline singleton between tests."""
@@ -166,7 +198,8 @@ class TestWavConversionCalledOnce:
     async def test_m4a_triggers_single_conversion(self, m4a_audio_path, converted_wav_path):
         """An m4a file should be converted exactly once at pipeline entry."""
         with patch(
-            "services.audio_pipeline.audio_message_pipeline.convert_to_wav_if_needed",
+            "services.audio_pipeline.audio_message_pipeline.convert_to_wav_if_needed_async",
+            new_callable=AsyncMock,
             return_value=converted_wav_path,
         ) as mock_convert:
             pipeline = _make_mock_pipeline()
@@ -182,13 +215,14 @@ class TestWavConversionCalledOnce:
                 target_languages=["en"],
             )
 
-            mock_convert.assert_called_once_with(m4a_audio_path)
+            mock_convert.assert_awaited_once_with(m4a_audio_path)
 
     @pytest.mark.asyncio
     async def test_wav_still_calls_conversion_once(self, wav_audio_path):
         """Even for WAV files, convert_to_wav_if_needed is called (returns same path)."""
         with patch(
-            "services.audio_pipeline.audio_message_pipeline.convert_to_wav_if_needed",
+            "services.audio_pipeline.audio_message_pipeline.convert_to_wav_if_needed_async",
+            new_callable=AsyncMock,
             return_value=wav_audio_path,
         ) as mock_convert:
             pipeline = _make_mock_pipeline()
@@ -203,7 +237,7 @@ class TestWavConversionCalledOnce:
                 target_languages=["en"],
             )
 
-            mock_convert.assert_called_once_with(wav_audio_path)
+            mock_convert.assert_awaited_once_with(wav_audio_path)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -217,7 +251,8 @@ class TestConvertedPathPropagation:
     async def test_transcription_stage_receives_wav(self, m4a_audio_path, converted_wav_path):
         """Transcription stage should receive the converted WAV, not the original m4a."""
         with patch(
-            "services.audio_pipeline.audio_message_pipeline.convert_to_wav_if_needed",
+            "services.audio_pipeline.audio_message_pipeline.convert_to_wav_if_needed_async",
+            new_callable=AsyncMock,
             return_value=converted_wav_path,
         ):
             pipeline = _make_mock_pipeline()
@@ -246,7 +281,8 @@ class TestConvertedPathPropagation:
     async def test_translation_stage_receives_wav(self, m4a_audio_path, converted_wav_path):
         """Translation stage should receive the converted WAV as source_audio_path."""
         with patch(
-            "services.audio_pipeline.audio_message_pipeline.convert_to_wav_if_needed",
+            "services.audio_pipeline.audio_message_pipeline.convert_to_wav_if_needed_async",
+            new_callable=AsyncMock,
             return_value=converted_wav_path,
         ):
             pipeline = _make_mock_pipeline()
@@ -280,7 +316,8 @@ class TestConvertedPathPropagation:
             callback_data.update(data)
 
         with patch(
-            "services.audio_pipeline.audio_message_pipeline.convert_to_wav_if_needed",
+            "services.audio_pipeline.audio_message_pipeline.convert_to_wav_if_needed_async",
+            new_callable=AsyncMock,
             return_value=converted_wav_path,
         ):
             pipeline = _make_mock_pipeline()
@@ -314,7 +351,8 @@ class TestConversionFailureFallback:
     async def test_conversion_error_uses_original_path(self, m4a_audio_path):
         """If convert_to_wav_if_needed raises, pipeline should use original path."""
         with patch(
-            "services.audio_pipeline.audio_message_pipeline.convert_to_wav_if_needed",
+            "services.audio_pipeline.audio_message_pipeline.convert_to_wav_if_needed_async",
+            new_callable=AsyncMock,
             side_effect=RuntimeError("ffmpeg not found"),
         ):
             pipeline = _make_mock_pipeline()
@@ -377,10 +415,7 @@ class TestConvertToWavIfNeeded:
         m4a_path = temp_dir / "test_conv.m4a"
         m4a_path.write_bytes(b"\x00" * 100)
 
-        from utils.audio_format_converter import convert_to_wav_if_needed, _conversion_cache
-
-        # Clear any stale cache entry
-        _conversion_cache.pop(str(m4a_path), None)
+        from utils.audio_format_converter import convert_to_wav_if_needed
 
         # Mock the pydub module injected via sys.modules
         # (converter does `from pydub import AudioSegment as PydubAudioSegment` inside the function)
@@ -400,19 +435,117 @@ class TestConvertToWavIfNeeded:
             assert result.endswith('.converted.wav')
 
     def test_cache_avoids_reconversion(self, temp_dir):
-        """Second call with same path should use cache and skip conversion."""
-        m4a_path = temp_dir / "cached_test.m4a"
-        m4a_path.write_bytes(b"\x00" * 100)
-        cached_wav = temp_dir / "cached_test.converted.wav"
-        cached_wav.write_bytes(b"RIFF" + b"\x00" * 40)
+        """Same content (even under another path) is converted once, via the artifact store."""
+        from utils.artifact_store import ArtifactStore
+        from utils.audio_format_converter import convert_to_wav_if_needed
 
-        from utils.audio_format_converter import convert_to_wav_if_needed, _conversion_cache
+        first = temp_dir / "cached_test.m4a"
+        first.write_bytes(b"\x01" * 100)
+        second = temp_dir / "same_content_elsewhere.m4a"
+        second.write_bytes(b"\x01" * 100)
+        store = ArtifactStore(str(temp_dir / "artifacts"), max_bytes=1 << 20)
 
-        # Prime the cache — converter returns early if path is in cache + file exists
-        _conversion_cache[str(m4a_path)] = str(cached_wav)
+        mock_pydub = MagicMock()
+        mock_audio = MagicMock()
+        mock_audio.channels = 2
+        mock_audio.set_sample_width.return_value = mock_audio
+        mock_audio.set_channels.return_value = mock_audio
+        mock_audio.export.side_effect = lambda path, format: Path(path).write_bytes(b"RIFF" + b"\x00" * 40)
+        mock_pydub.AudioSegment.from_file.return_value = mock_audio
+
+        with patch.dict(sys.modules, {'pydub': mock_pydub}), \
+                patch("utils.audio_format_converter.get_artifact_store", return_value=store):
+            result = convert_to_wav_if_needed(str(first), cache=True)
+            again = convert_to_wav_if_needed(str(second), cache=True)
+
+        assert result == again, "Should return the stored conversion"
+        assert result.startswith(store.root_dir) and os.path.exists(result)
+        mock_pydub.AudioSegment.from_file.assert_called_once_with(str(first))
+        mock_audio.set_channels.assert_called_once_with(1)
+
+    @pytest.mark.asyncio
+    async def test_async_conversion_uses_the_artifact_store(self, temp_dir, artifact_store):
+        """The async variant returns the same stored conversion as the sync one."""
+        from utils.audio_format_converter import (
+            convert_to_wav_if_needed,
+            convert_to_wav_if_needed_async,
+        )
+
+        m4a_path = temp_dir / "async_test.m4a"
+        m4a_path.write_bytes(b"\x02" * 100)
+        mock_pydub = _mock_pydub()
+
+        with patch.dict(sys.modules, {'pydub': mock_pydub}), \
+                patch("utils.audio_format_converter.get_artifact_store", return_value=artifact_store):
+            result = await convert_to_wav_if_needed_async(str(m4a_path))
+            again = convert_to_wav_if_needed(str(m4a_path))
+
+        assert result == again and result.startswith(artifact_store.root_dir)
+        mock_pydub.AudioSegment.from_file.assert_called_once_with(str(m4a_path))
+
+    def test_concurrent_conversions_run_once(self, temp_dir, artifact_store):
+        """Concurrent requests for the same content share a single ffmpeg run."""
+        from utils.audio_format_converter import convert_to_wav_if_needed
+
+        m4a_path = temp_dir / "concurrent.m4a"
+        m4a_path.write_bytes(b"\x03" * 100)
+        mock_pydub = _mock_pydub(export_delay=0.2)
+        results = []
+
+        with patch.dict(sys.modules, {'pydub': mock_pydub}), \
+                patch("utils.audio_format_converter.get_artifact_store", return_value=artifact_store):
+            threads = [
+                threading.Thread(target=lambda: results.append(convert_to_wav_if_needed(str(m4a_path))))
+                for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(results) == 4 and len(set(results)) == 1
+        mock_pydub.AudioSegment.from_file.assert_called_once_with(str(m4a_path))
+
+
+# ═══════════════════════════════════════════════════════════════
+# TEST 6: Converted WAV pinned for the whole pipeline
+# ═══════════════════════════════════════════════════════════════
+
+class TestConvertedWavPinned:
+    """The stored WAV must not be evicted while the pipeline reads it."""
+
+    @pytest.mark.asyncio
+    async def test_stored_wav_pinned_until_pipeline_ends(self, m4a_audio_path, artifact_store):
+        stored_wav = artifact_store.put_bytes("hash-m4a", "wav-s16-mono", b"RIFF" + b"\x00" * 40, ".wav")
+        pins_during_stages = []
+
+        pipeline = _make_mock_pipeline()
+
+        async def transcribe(**kwargs):
+            pins_during_stages.append(artifact_store.get_stats()["pinned"])
+            return _make_fake_transcription()
+
+        async def translate(**kwargs):
+            pins_during_stages.append(artifact_store.get_stats()["pinned"])
+            return {}
+
+        pipeline.transcription_stage.process = AsyncMock(side_effect=transcribe)
+        pipeline.translation_stage.process_languages = AsyncMock(side_effect=translate)
+
+        with patch(
+            "services.audio_pipeline.audio_message_pipeline.convert_to_wav_if_needed_async",
+            new_callable=AsyncMock,
+            return_value=stored_wav,
+        ):
+            await pipeline.process_audio_message(
+                audio_path=m4a_audio_path,
+                audio_url="http://example.com/audio.m4a",
+                sender_id="user1",
+                conversation_id="conv1",
+                message_id="msg1",
+                attachment_id="att1",
+                target_languages=["en"],
+            )
 
-        try:
-            result = convert_to_wav_if_needed(str(m4a_path), cache=True)
-            assert result == str(cached_wav), "Should return cached path"
-        finally:
-            _conversion_cache.pop(str(m4a_path), None)
+        assert pins_during_stages == [1, 1]
+        assert artifact_store.get_stats()["pinned"] == 0
@@ -0,0 +1,218 @@
+"""
+TDD — Contrôle d'admission et backpressure de la boucle de réception ZMQ.
+
+Avant : ZMQTranslationServer lisait le socket PULL et lançait une tâche par
+message, sans borne sur active_tasks : une rafale d'audio_process démarrait
+autant de tâches Whisper/TTS concurrentes que de messages (OOM).
+
+Après : services.zmq_admission.AdmissionController — budget de tâches et file
+bornée par classe (translation, audio_process, transcription, voice_api).
+Une classe saturée reçoit aussitôt un événement `overloaded` tant que
+d'autres ont de la place (un audio saturé ne bloque pas les traductions qui
+le suivent dans le socket) ; toutes saturées, la boucle de réception attend
+(le socket n'est plus lu, la HWM ZMQ repousse) au plus max_wait_s.
+Les profondeurs de file sont exposées dans get_stats.
+"""
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.zmq_admission import SHED, AdmissionController, parse_admission_budgets
+
+
+class Spawner:
+    def __init__(self):
+        self.tasks = []
+
+    def __call__(self, coro, task_type):
+        task = asyncio.get_running_loop().create_task(coro)
+        self.tasks.append((task_type, task))
+        return task
+
+
+def test_parse_budgets_ignores_invalid_entries():
+    budgets = parse_admission_budgets("translation=256:2048, audio_process=4:32,bad=x:1,voice_api=2")
+    assert budgets == {"translation": (256, 2048), "audio_process": (4, 32), "voice_api": (2, 0)}
+
+
+@pytest.mark.asyncio
+async def test_budget_then_queue_then_shed():
+    spawn = Spawner()
+    admission = AdmissionController({"audio_process": (2, 1)}, spawn=spawn, policy=SHED)
+    gate = asyncio.Event()
+    started = []
+
+    async def job(i):
+        started.append(i)
+        await gate.wait()
+
+    results = [await admission.submit("audio_process", job(i)) for i in range(4)]
+    await asyncio.sleep(0)
+
+    assert results == [True, True, True, False]
+    assert started == [0, 1]
+    stats = admission.get_stats()["classes"]["audio_process"]
+    assert stats["running"] == 2 and stats["queued"] == 1 and stats["rejected"] == 1
+
+    gate.set()
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert started == [0, 1, 2]
+    assert admission.get_stats()["classes"]["audio_process"]["running"] == 0
+
+
+@pytest.mark.asyncio
+async def test_backpressure_waits_for_a_slot():
+    admission = AdmissionController({"transcription": (1, 0)}, spawn=Spawner(), max_wait_s=1.0)
+    gate = asyncio.Event()
+
+    async def job():
+        await gate.wait()
+
+    assert await admission.submit("transcription", job())
+    asyncio.get_running_loop().call_later(0.05, gate.set)
+    # La 2e soumission bloque l'appelant (plus de lecture du socket) jusqu'à la place libre
+    assert await admission.submit("transcription", job())
+    stats = admission.get_stats()["classes"]["transcription"]
+    assert stats["backpressure_waits"] == 1 and stats["rejected"] == 0 and stats["backpressure_ms"] > 0
+
+
+@pytest.mark.asyncio
+async def test_backpressure_gives_up_after_max_wait():
+    admission = AdmissionController({"voice_api": (1, 0)}, spawn=Spawner(), max_wait_s=0.05)
+    gate = asyncio.Event()
+
+    async def job():
+        await gate.wait()
+
+    assert await admission.submit("voice_profile", job())  # classe voice_api
+    assert not await admission.submit("voice_api", job())
+    gate.set()
+
+
+@pytest.mark.asyncio
+async def test_saturated_audio_does_not_delay_translation():
+    admission = AdmissionController(
+        {"translation": (1, 0), "audio_process": (1, 0)}, spawn=Spawner(), max_wait_s=5.0
+    )
+    gate = asyncio.Event()
+    translated = []
+
+    async def job():
+        await gate.wait()
+
+    async def translate():
+        translated.append(True)
+
+    assert await admission.submit("audio_process", job())
+
+    # Ordre du socket: un audio de trop, puis une traduction
+    start = time.monotonic()
+    assert not await admission.submit("audio_process", job())
+    assert await admission.submit("translation", translate())
+    assert time.monotonic() - start < 0.5
+    await asyncio.sleep(0)
+    assert translated == [True]
+    stats = admission.get_stats()["classes"]["audio_process"]
+    assert stats["rejected"] == 1 and stats["backpressure_waits"] == 0
+    gate.set()
+
+
+@pytest.mark.asyncio
+async def test_backpressure_stops_once_another_class_frees_up():
+    admission = AdmissionController(
+        {"translation": (1, 0), "audio_process": (1, 0)}, spawn=Spawner(), max_wait_s=5.0
+    )
+    audio_gate, translation_gate = asyncio.Event(), asyncio.Event()
+
+    async def audio():
+        await audio_gate.wait()
+
+    async def translation():
+        await translation_gate.wait()
+
+    assert await admission.submit("audio_process", audio())
+    assert await admission.submit("translation", translation())
+
+    # Tout saturé: l'audio attend, puis reprend la lecture dès qu'une traduction finit
+    asyncio.get_running_loop().call_later(0.05, translation_gate.set)
+    start = time.monotonic()
+    assert not await admission.submit("audio_process", audio())
+    assert time.monotonic() - start < 1.0
+    assert admission.get_stats()["classes"]["audio_process"]["backpressure_waits"] == 1
+    audio_gate.set()
+
+
+@pytest.mark.asyncio
+async def test_failing_task_releases_its_slot():
+    admission = AdmissionController({"translation": (1, 1)}, spawn=Spawner(), policy=SHED)
+    ran = []
+
+    async def boom():
+        raise RuntimeError("handler")
+
+    async def ok():
+        ran.append(True)
+
+    assert await admission.submit("translation", boom())
+    assert await admission.submit("story_text_object_translation", ok())
+    for _ in range(10):
+        await asyncio.sleep(0)
+    assert ran == [True]
+
+
+@pytest.fixture
+def server():
+    """`ZMQTranslationServer` réduit au routage, admission réelle"""
+    from services.zmq_server_core import ZMQTranslationServer
+
+    instance = ZMQTranslationServer.__new__(ZMQTranslationServer)
+    instance.active_tasks = set()
+    instance.task_counters = {}
+    instance.translation_handler = MagicMock()
+    instance.audio_handler = MagicMock()
+    instance.transcription_handler = MagicMock()
+    instance.voice_handler = None
+    instance.pub_socket = MagicMock()
+    instance.pub_socket.send = AsyncMock()
+    instance.admission = AdmissionController(
+        {"audio_process": (1, 0)}, spawn=instance._create_tracked_task, policy=SHED
+    )
+    return instance
+
+
+@pytest.mark.asyncio
+async def test_saturated_server_publishes_overloaded(server):
+    gate = asyncio.Event()
+
+    async def audio_job(request_data):
+        await gate.wait()
+
+    server.audio_handler._handle_audio_process_request = audio_job
+
+    def frames(task_id):
+        return [json.dumps({"type": "audio_process", "taskId": task_id, "messageId": "m"}).encode()]
+
+    await server._handle_translation_request_multipart(frames("t1"))
+    await server._handle_translation_request_multipart(frames("t2"))
+
+    server.pub_socket.send.assert_awaited_once()
+    event = json.loads(server.pub_socket.send.call_args[0][0])
+    assert event["type"] == "overloaded" and event["taskId"] == "t2" and event["requestType"] == "audio_process"
+    assert len(server.active_tasks) == 1
+    assert server.admission.get_stats()["classes"]["audio_process"]["rejected"] == 1
+
+    gate.set()
+    await asyncio.gather(*server.active_tasks)
+
+
+@pytest.mark.asyncio
+async def test_overloaded_voice_profile_is_correlated_by_request_id(server):
+    # La gateway corrèle les requêtes voice profile par request_id, pas taskId
+    await server._publish_overloaded("voice_profile", {"type": "voice_profile_analyze", "request_id": "r1"})
+
+    event = json.loads(server.pub_socket.send.call_args[0][0])
+    assert event["taskId"] == "r1" and event["requestType"] == "voice_profile_analyze"